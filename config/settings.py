@@ -69,6 +69,9 @@ class Settings:
     token_warning_threshold_percent: float
     default_field_selection: List[str]
     tokenizer_model: str
+    # Doc write verification: "receipt" (stat + write-time hash) or "deep" (re-read)
+    doc_verify_mode: str
+    doc_verify_sample_every: int
 
     @classmethod
     def load(cls) -> "Settings":
@@ -157,6 +160,12 @@ class Settings:
         # Tokenizer model
         tokenizer_model = os.environ.get("SCRIBE_TOKENIZER_MODEL", "gpt-4")
 
+        # Doc write verification; every Nth receipt-verified write is re-read anyway (0 disables)
+        doc_verify_mode = os.environ.get("SCRIBE_DOC_VERIFY_MODE", "receipt").strip().lower()
+        if doc_verify_mode not in {"receipt", "deep"}:
+            doc_verify_mode = "receipt"
+        doc_verify_sample_every = max(0, _int_env("SCRIBE_DOC_VERIFY_SAMPLE_EVERY", 50))
+
         return cls(
             project_root=project_root,
             default_state_path=state_path,
@@ -191,6 +200,8 @@ class Settings:
             token_warning_threshold_percent=token_warning_threshold_percent,
             default_field_selection=default_field_selection,
             tokenizer_model=tokenizer_model,
+            doc_verify_mode=doc_verify_mode,
+            doc_verify_sample_every=doc_verify_sample_every,
         )
 
 
@@ -17,6 +17,7 @@ class VectorConfig:
     enabled: bool = True
     backend: str = "faiss"
     dimension: int = 384
+    # sentence-transformers model name, or a built-in backend such as "hashed-ngram"
     model: str = "all-MiniLM-L6-v2"
     gpu: bool = False
     queue_max: int = 1024
@@ -27,13 +28,39 @@ class VectorConfig:
     queue_timeout_seconds: int = 1
     # Model settings
     model_device: str = "auto"  # "auto", "cpu", "cuda", "mps"
-    cache_size: int = 1000  # Number of cached embeddings
+    cache_size: int = 1000  # Number of cached query embeddings (0 disables)
     # Index settings
     index_type: str = "IndexFlatIP"  # FAISS index type
     metric: str = "cosine"  # "cosine" or "euclidean"
     # Thresholds
     min_similarity_threshold: float = 0.0
     search_k_limit: int = 100  # Maximum results per search
+    # Inference executor
+    encode_executor: str = "thread"  # "thread", "process", or "inline"
+    encode_workers: int = 1
+    max_batch_size: int = 256  # Upper bound for queue-depth adaptive batching
+    # Filtered search
+    prefilter_flat_threshold: int = 4096  # Exact-score candidate sets up to this size
+    # Compact storage
+    compression: str = "none"  # "none", "fp16", "int8", or "pq"
+    pq_subquantizers: int = 16
+    pq_bits: int = 8
+    pq_train_size: int = 4096  # Vectors collected before PQ replaces the flat index
+    rerank_k: int = 0  # Re-score top candidates with exact float32 vectors (0 disables)
+    store_text_content: bool = True  # False stores a preview plus a content pointer
+    text_preview_chars: int = 240
+    # Startup
+    lazy_load: bool = True  # Load the model/index on background warm-up, not at startup
+    warmup_timeout_seconds: float = 30.0  # How long searches wait for warm-up
+    # Multi-process sharing
+    index_access: str = "auto"  # "auto" (one writer, others read), "writer", or "reader"
+    mmap_readers: bool = True  # Readers memory-map the persisted index read-only
+    # Sharding
+    shard_by: str = "none"  # "none" (one repo-wide index) or "project"
+    shard_search_workers: int = 4  # Parallel shard searches for cross-project queries
+    # Search result cache
+    result_cache_size: int = 256  # Cached result lists (0 disables)
+    result_cache_ttl_seconds: float = 30.0  # Also dropped as soon as the index changes
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "VectorConfig":
@@ -73,7 +100,26 @@ class VectorConfig:
             "index_type": self.index_type,
             "metric": self.metric,
             "min_similarity_threshold": self.min_similarity_threshold,
-            "search_k_limit": self.search_k_limit
+            "search_k_limit": self.search_k_limit,
+            "encode_executor": self.encode_executor,
+            "encode_workers": self.encode_workers,
+            "max_batch_size": self.max_batch_size,
+            "prefilter_flat_threshold": self.prefilter_flat_threshold,
+            "compression": self.compression,
+            "pq_subquantizers": self.pq_subquantizers,
+            "pq_bits": self.pq_bits,
+            "pq_train_size": self.pq_train_size,
+            "rerank_k": self.rerank_k,
+            "store_text_content": self.store_text_content,
+            "text_preview_chars": self.text_preview_chars,
+            "lazy_load": self.lazy_load,
+            "warmup_timeout_seconds": self.warmup_timeout_seconds,
+            "index_access": self.index_access,
+            "mmap_readers": self.mmap_readers,
+            "shard_by": self.shard_by,
+            "shard_search_workers": self.shard_search_workers,
+            "result_cache_size": self.result_cache_size,
+            "result_cache_ttl_seconds": self.result_cache_ttl_seconds
         }
 
     def save_to_file(self, config_path: Path) -> bool:
@@ -190,6 +236,20 @@ def merge_with_env_overrides(config: VectorConfig) -> VectorConfig:
         'SCRIBE_VECTOR_METRIC': ('metric', str),
         'SCRIBE_VECTOR_MIN_SIMILARITY': ('min_similarity_threshold', float),
         'SCRIBE_VECTOR_SEARCH_K_LIMIT': ('search_k_limit', int),
+        'SCRIBE_VECTOR_ENCODE_EXECUTOR': ('encode_executor', str),
+        'SCRIBE_VECTOR_ENCODE_WORKERS': ('encode_workers', int),
+        'SCRIBE_VECTOR_MAX_BATCH_SIZE': ('max_batch_size', int),
+        'SCRIBE_VECTOR_PREFILTER_FLAT_THRESHOLD': ('prefilter_flat_threshold', int),
+        'SCRIBE_VECTOR_COMPRESSION': ('compression', str),
+        'SCRIBE_VECTOR_RERANK_K': ('rerank_k', int),
+        'SCRIBE_VECTOR_STORE_TEXT': ('store_text_content', lambda x: x.lower() in ['true', '1', 'yes']),
+        'SCRIBE_VECTOR_LAZY_LOAD': ('lazy_load', lambda x: x.lower() in ['true', '1', 'yes']),
+        'SCRIBE_VECTOR_WARMUP_TIMEOUT': ('warmup_timeout_seconds', float),
+        'SCRIBE_VECTOR_INDEX_ACCESS': ('index_access', str),
+        'SCRIBE_VECTOR_MMAP': ('mmap_readers', lambda x: x.lower() in ['true', '1', 'yes']),
+        'SCRIBE_VECTOR_SHARD_BY': ('shard_by', str),
+        'SCRIBE_VECTOR_RESULT_CACHE_SIZE': ('result_cache_size', int),
+        'SCRIBE_VECTOR_RESULT_CACHE_TTL': ('result_cache_ttl_seconds', float),
     }
 
     for env_var, (field, converter) in env_mapping.items():
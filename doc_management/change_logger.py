@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import difflib
 import hashlib
 import json
 import logging
@@ -12,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from scribe_mcp.doc_management.line_diff import diff_texts
+from scribe_mcp.doc_management.version_store import DocumentVersionStore
 from scribe_mcp.storage.base import StorageBackend
 from scribe_mcp.utils.time import utcnow
 
@@ -59,6 +60,7 @@ class ChangeLogger:
         self.project_root = Path(project_root)
         self.max_history = max_history
         self.enable_diff_calculation = enable_diff_calculation
+        self.versions = DocumentVersionStore(storage, self.project_root)
 
         self._logger = logging.getLogger(__name__)
 
@@ -109,6 +111,9 @@ class ChangeLogger:
             metadata=metadata or {}
         )
 
+        # Keep both sides so history and diffs can be rebuilt later
+        await self._store_versions(file_path, old_content, new_content)
+
         # Store in database
         await self._store_change_record(change_record)
 
@@ -116,6 +121,17 @@ class ChangeLogger:
 
         return change_record
 
+    async def _store_versions(
+        self, file_path: Path, old_content: Optional[str], new_content: Optional[str]
+    ):
+        """Record old/new content in the version store; history is best-effort."""
+        try:
+            for content in (old_content, new_content):
+                if content:
+                    await self.versions.put(file_path, content)
+        except Exception as e:
+            self._logger.warning(f"Failed to store document versions for {file_path}: {e}")
+
     async def _store_change_record(self, change_record: ChangeRecord):
         """Store a change record in the database."""
         try:
@@ -236,10 +252,17 @@ class ChangeLogger:
             return []
 
     async def _get_content_at_hash(self, file_path: Path, content_hash: Optional[str]) -> Optional[str]:
-        """Get content for a file at a specific hash from document_sections."""
+        """Get content for a file at a specific hash from the version store or document_sections."""
         if not content_hash:
             return None
 
+        try:
+            content = await self.versions.get(content_hash)
+            if content is not None:
+                return content
+        except Exception as e:
+            self._logger.debug(f"Version store lookup failed for {content_hash}: {e}")
+
         try:
             result = await self.storage._fetchone(
                 """
@@ -279,47 +302,16 @@ class ChangeLogger:
 
     def _calculate_diff(self, old_content: str, new_content: str) -> DiffResult:
         """Calculate diff between two content strings."""
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
-
-        # Calculate unified diff
-        unified_diff = ''.join(difflib.unified_diff(
-            old_lines, new_lines,
-            fromfile='old', tofile='new',
-            lineterm=''
-        ))
-
-        # Calculate line-based changes
-        differ = difflib.Differ()
-        diff_lines = list(differ.compare(old_lines, new_lines))
-
-        additions = 0
-        deletions = 0
-        modifications = 0
-        lines_added = []
-        lines_removed = []
-
-        for line in diff_lines:
-            if line.startswith('+ ') and not line.startswith('+++'):
-                additions += 1
-                lines_added.append(line[2:])
-            elif line.startswith('- ') and not line.startswith('---'):
-                deletions += 1
-                lines_removed.append(line[2:])
-            elif line.startswith('? '):
-                modifications += 1
-
-        # Calculate similarity ratio
-        similarity_ratio = difflib.SequenceMatcher(None, old_content, new_content).ratio()
+        diff = diff_texts(old_content, new_content)
 
         return DiffResult(
-            additions=additions,
-            deletions=deletions,
-            modifications=modifications,
-            lines_added=lines_added,
-            lines_removed=lines_removed,
-            unified_diff=unified_diff,
-            similarity_ratio=similarity_ratio
+            additions=diff.additions,
+            deletions=diff.deletions,
+            modifications=diff.modifications,
+            lines_added=diff.lines_added,
+            lines_removed=diff.lines_removed,
+            unified_diff=diff.unified_diff(fromfile='old', tofile='new', lineterm=''),
+            similarity_ratio=diff.ratio
         )
 
     async def get_file_statistics(self, file_path: Path) -> Dict[str, Any]:
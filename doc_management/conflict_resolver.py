@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from scribe_mcp.doc_management.change_logger import ChangeLogger
 from scribe_mcp.doc_management.diff_visualizer import DiffVisualizer
+from scribe_mcp.doc_management.line_diff import similarity as content_similarity
 from scribe_mcp.doc_management.sync_manager import ConflictResolution, SyncConflict
 from scribe_mcp.utils.time import utcnow
 
@@ -303,8 +304,7 @@ class ConflictResolver:
         if not conflict.file_content or not conflict.database_content:
             return 0.0
 
-        import difflib
-        return difflib.SequenceMatcher(None, conflict.file_content, conflict.database_content).ratio()
+        return content_similarity(conflict.file_content, conflict.database_content)
 
     def _calculate_size_difference(self, conflict: SyncConflict) -> int:
         """Calculate size difference between file and database content."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import difflib
 import html
 import json
 import logging
@@ -12,6 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from scribe_mcp.doc_management.change_logger import ChangeLogger, ChangeRecord, DiffResult
+from scribe_mcp.doc_management.line_diff import diff_texts
 
 
 @dataclass
@@ -120,11 +120,9 @@ class DiffVisualizer:
         old_lines = old_content.splitlines()
         new_lines = new_content.splitlines()
 
-        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
-
         sections = []
 
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        for tag, i1, i2, j1, j2 in diff_texts(old_content, new_content).opcodes:
             section = {
                 'type': tag,
                 'old_lines': old_lines[i1:i2] if tag != 'insert' else [],
@@ -253,16 +251,9 @@ class DiffVisualizer:
 
     def _generate_text_diff(self, old_content: str, new_content: str) -> str:
         """Generate plain text diff."""
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
-
-        diff_lines = list(difflib.unified_diff(
-            old_lines, new_lines,
-            fromfile='old', tofile='new',
-            lineterm='', n=3
-        ))
-
-        return ''.join(diff_lines)
+        return diff_texts(old_content, new_content).unified_diff(
+            fromfile='old', tofile='new', n=3, lineterm=''
+        )
 
     async def create_history_timeline(
         self,
@@ -485,6 +476,19 @@ class DiffVisualizer:
                 'files_between_commits': len(set(c.file_path for c in timeline))
             }
 
+            # Content diff, when both versions are in the version store
+            if file_path is not None:
+                diff_result = await self.change_logger.get_diff_between_versions(
+                    file_path, commit_hash1, commit_hash2
+                )
+                if diff_result is not None:
+                    comparison['diff'] = {
+                        'additions': diff_result.additions,
+                        'deletions': diff_result.deletions,
+                        'similarity_ratio': diff_result.similarity_ratio,
+                        'unified_diff': diff_result.unified_diff,
+                    }
+
             return comparison
 
         except Exception as e:
@@ -0,0 +1,207 @@
+"""Process-wide cache of parsed documents for manage_docs operations.
+
+Entries are validated against ``(mtime_ns, size)`` on every lookup and carry
+the SHA-256 of the text they were parsed from. Like git's racy-clean check,
+an entry whose file was modified within ``RACY_WINDOW_NS`` of being cached is
+re-read and compared by hash, since a same-size edit inside the filesystem's
+timestamp granularity would otherwise go unnoticed.
+
+Derived structures (frontmatter, header list, section anchors and line
+offsets) are computed on first use and shared, so callers must treat them as
+read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from scribe_mcp.utils.frontmatter import FrontmatterResult, parse_frontmatter
+
+HEADER_LINE_PATTERN = re.compile(r"^(#{1,6})\s+(.*\S.*)$")
+ANCHOR_PREFIX = "<!-- ID:"
+
+# Documents kept in memory at once
+DOC_CACHE_MAX_ENTRIES = 64
+
+# Entries modified this close to being cached are re-verified by hash
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def hash_text(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def collect_markdown_headers(text: str) -> List[Dict[str, Any]]:
+    """Return metadata for every Markdown header in `text`, skipping fenced code blocks."""
+    headers: List[Dict[str, Any]] = []
+    lines = text.splitlines(keepends=True)
+    in_fence = False
+    position = 0
+
+    for idx, line in enumerate(lines):
+        line_start = position
+        stripped = line.lstrip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            position += len(line)
+            continue
+        if in_fence:
+            position += len(line)
+            continue
+
+        match = HEADER_LINE_PATTERN.match(stripped)
+        if match:
+            level = len(match.group(1))
+            title = match.group(2).strip()
+            if title:
+                headers.append(
+                    {
+                        "level": level,
+                        "title": title,
+                        "start": line_start,
+                        "line_number": idx + 1,
+                    }
+                )
+
+        position += len(line)
+
+    return headers
+
+
+@dataclass
+class CachedDocument:
+    """A document's text plus lazily derived structure of its body."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    sha: str
+    text: str
+    cached_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def stamp(self) -> Tuple[int, int]:
+        return self.mtime_ns, self.size
+
+    @cached_property
+    def parsed(self) -> FrontmatterResult:
+        """Frontmatter and body; raises ValueError for malformed frontmatter."""
+        return parse_frontmatter(self.text)
+
+    @property
+    def body(self) -> str:
+        return self.parsed.body
+
+    @cached_property
+    def headers(self) -> List[Dict[str, Any]]:
+        """Markdown headers of the body, as returned by collect_markdown_headers."""
+        return collect_markdown_headers(self.body)
+
+    @cached_property
+    def anchor_lines(self) -> List[Tuple[int, str]]:
+        """(line index, stripped line) of every ``<!-- ID: -->`` marker in the body."""
+        return [
+            (idx, stripped)
+            for idx, line in enumerate(self.body.splitlines())
+            if (stripped := line.strip()).startswith(ANCHOR_PREFIX)
+        ]
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Start offset of each body line (``splitlines(keepends=True)``), then the body length."""
+        offsets = [0]
+        position = 0
+        for line in self.body.splitlines(keepends=True):
+            position += len(line)
+            offsets.append(position)
+        return offsets
+
+
+class DocumentCache:
+    """Bounded LRU of parsed documents keyed by resolved path."""
+
+    def __init__(self, max_entries: int = DOC_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Path, CachedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path) -> Path:
+        return Path(path).resolve()
+
+    def _put(self, key: Path, document: CachedDocument) -> None:
+        with self._lock:
+            self._entries[key] = document
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, path: Path) -> CachedDocument:
+        """The current document at ``path``, reading it only when it changed.
+
+        Raises OSError/UnicodeDecodeError like ``Path.read_text``.
+        """
+        key = self._key(path)
+        stat = key.stat()
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached.stamp == (stat.st_mtime_ns, stat.st_size):
+            if cached.cached_at_ns - cached.mtime_ns >= RACY_WINDOW_NS:
+                self.hits += 1
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                return cached
+            text = key.read_text(encoding="utf-8")
+            if hash_text(text) == cached.sha:
+                self.hits += 1
+                cached.cached_at_ns = time.time_ns()
+                return cached
+        else:
+            text = key.read_text(encoding="utf-8")
+
+        self.misses += 1
+        document = CachedDocument(key, stat.st_mtime_ns, stat.st_size, hash_text(text), text)
+        self._put(key, document)
+        return document
+
+    def store(self, path: Path, text: str, sha: Optional[str] = None) -> Optional[CachedDocument]:
+        """Record text Scribe just wrote to ``path`` so the next load skips parsing it.
+
+        A fresh write is racily clean, so loads still re-read the file and
+        compare hashes until one verifies it ``RACY_WINDOW_NS`` after its
+        mtime; later loads skip the read as well.
+        """
+        key = self._key(path)
+        try:
+            stat = key.stat()
+        except OSError:
+            self.invalidate(key)
+            return None
+        document = CachedDocument(key, stat.st_mtime_ns, stat.st_size, sha or hash_text(text), text)
+        self._put(key, document)
+        return document
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(self._key(path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+document_cache = DocumentCache()
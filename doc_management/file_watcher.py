@@ -1,14 +1,25 @@
-"""File system watcher for detecting manual document edits."""
+"""File system watcher for detecting manual document edits.
+
+Polling is stat-first: files are only hashed when their ``(mtime, size)``
+changes, or while their mtime is too recent to trust (the racy window).
+Directory listings are cached by directory mtime, so a poll of an unchanged
+tree costs one ``stat`` per directory and per watched file. Watchdog events
+are coalesced per path and delivered as one batch once the path goes quiet.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
     from watchdog.observers import Observer
@@ -21,6 +32,13 @@ except ImportError:
 
 from scribe_mcp.utils.time import utcnow
 
+# Threads used to hash changed files
+DEFAULT_HASH_WORKERS = 4
+
+# A file modified this close to its last check may change again without a
+# visible mtime/size change, so it is re-hashed until it ages out
+RACY_WINDOW_SECONDS = 2.0
+
 
 @dataclass
 class FileChangeEvent:
@@ -33,95 +51,189 @@ class FileChangeEvent:
     metadata: Dict[str, any] = field(default_factory=dict)
 
 
+def _calculate_checksum(file_path: Path) -> Optional[str]:
+    """Calculate SHA-256 checksum of file content (first 64KB for consistency)."""
+    try:
+        h = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            content = f.read(65536)  # 64KB for consistency with integrity verifier
+            h.update(content)
+        return h.hexdigest()
+    except (OSError, IOError):
+        return None
+
+
+def _coalesce_event_type(previous: str, current: str) -> Optional[str]:
+    """Net effect of two events on one path; None when they cancel out."""
+    if previous == 'created':
+        if current == 'deleted':
+            return None
+        if current == 'modified':
+            return 'created'
+    if previous == 'deleted' and current == 'created':
+        return 'modified'
+    return current
+
+
 class DocumentFileHandler(FileSystemEventHandler):
-    """Handles file system events for document files."""
+    """Handles file system events for document files.
+
+    Events are held per path until no new event has arrived for
+    ``debounce_seconds``; the surviving changes are then hashed in parallel
+    and delivered together to ``batch_callback`` (or one by one to
+    ``callback`` when no batch callback is given).
+    """
 
     def __init__(
         self,
         callback: Callable[[FileChangeEvent], None],
         watched_extensions: Set[str] = None,
-        debounce_seconds: float = 1.0
+        debounce_seconds: float = 1.0,
+        batch_callback: Optional[Callable[[List[FileChangeEvent]], None]] = None,
+        hash_executor: Optional[ThreadPoolExecutor] = None,
     ):
         super().__init__()
         self.callback = callback
+        self.batch_callback = batch_callback
         self.watched_extensions = watched_extensions or {'.md', '.txt', '.json'}
         self.debounce_seconds = debounce_seconds
-        self._pending_events: Dict[str, float] = {}
+        self._hash_executor = hash_executor
+        # path -> (event type, last event time, dest path)
+        self._pending_events: Dict[str, Tuple[str, float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
         self._logger = logging.getLogger(__name__)
 
     def _should_process_file(self, file_path: str) -> bool:
         """Check if file should be processed based on extension."""
         return Path(file_path).suffix.lower() in self.watched_extensions
 
-    def _debounce_event(self, file_path: str) -> bool:
-        """Check if event should be debounced (ignored due to recent activity)."""
-        now = time.time()
-        last_time = self._pending_events.get(file_path, 0)
-
-        if now - last_time < self.debounce_seconds:
-            return True  # Debounce this event
-
-        self._pending_events[file_path] = now
-        return False
-
-    def _create_change_event(self, event: FileSystemEvent) -> Optional[FileChangeEvent]:
-        """Create a FileChangeEvent from a watchdog event."""
-        file_path = Path(event.src_path)
-
-        if not self._should_process_file(str(file_path)):
-            return None
-
-        # Debounce rapid successive events
-        if self._debounce_event(str(file_path)):
-            return None
-
-        try:
-            # Calculate file size and checksum for file content changes
+    def _record_event(self, event: FileSystemEvent) -> None:
+        """Fold `event` into the pending change for its path."""
+        src_path = str(event.src_path)
+        dest_path = getattr(event, 'dest_path', None) or None
+        with self._lock:
+            previous = self._pending_events.get(src_path)
+            event_type = event.event_type
+            if previous is not None:
+                event_type = _coalesce_event_type(previous[0], event_type)
+            if event_type is None:
+                self._pending_events.pop(src_path, None)
+            else:
+                self._pending_events[src_path] = (event_type, time.monotonic(), dest_path)
+            self._schedule_flush(self.debounce_seconds)
+
+    def _schedule_flush(self, delay: float) -> None:
+        # Caller holds self._lock
+        if self._timer is None and self._pending_events:
+            self._timer = threading.Timer(max(delay, 0.0), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _take_quiet_events(self, force: bool) -> List[Tuple[str, str, Optional[str]]]:
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            ready = [
+                (path, event_type, dest_path)
+                for path, (event_type, last_seen, dest_path) in self._pending_events.items()
+                if force or now - last_seen >= self.debounce_seconds
+            ]
+            for path, _, _ in ready:
+                del self._pending_events[path]
+            if self._pending_events:
+                oldest = min(last_seen for _, last_seen, _ in self._pending_events.values())
+                self._schedule_flush(oldest + self.debounce_seconds - now)
+        return ready
+
+    def flush(self, force: bool = False) -> List[FileChangeEvent]:
+        """Deliver every pending change that has gone quiet (all of them if `force`)."""
+        ready = self._take_quiet_events(force)
+        events = self._build_change_events(ready)
+        if events:
+            self._deliver(events)
+        return events
+
+    def close(self) -> None:
+        """Cancel the pending flush and drop undelivered events."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending_events.clear()
+
+    def _build_change_events(
+        self, pending: List[Tuple[str, str, Optional[str]]]
+    ) -> List[FileChangeEvent]:
+        """Create FileChangeEvents, hashing created/modified files in parallel."""
+        to_hash = [Path(path) for path, event_type, _ in pending if event_type in ('created', 'modified')]
+        mapper = self._hash_executor.map if self._hash_executor is not None else map
+        checksums = dict(zip(to_hash, mapper(_calculate_checksum, to_hash)))
+
+        events: List[FileChangeEvent] = []
+        for path, event_type, dest_path in pending:
+            file_path = Path(path)
             size_bytes = None
             checksum = None
-
-            if event.event_type in ['created', 'modified'] and file_path.exists():
-                size_bytes = file_path.stat().st_size
-                # Calculate simple checksum for change detection
-                checksum = self._calculate_checksum(file_path)
-
-            return FileChangeEvent(
-                file_path=file_path,
-                event_type=event.event_type,
-                size_bytes=size_bytes,
-                checksum=checksum,
-                metadata={
-                    'is_directory': event.is_directory,
-                    'dest_path': getattr(event, 'dest_path', None)
-                }
+            if file_path in checksums:
+                try:
+                    size_bytes = file_path.stat().st_size
+                except OSError:
+                    # Gone again before the flush; the delete event follows
+                    continue
+                checksum = checksums[file_path]
+            events.append(
+                FileChangeEvent(
+                    file_path=file_path,
+                    event_type=event_type,
+                    size_bytes=size_bytes,
+                    checksum=checksum,
+                    metadata={
+                        'is_directory': False,
+                        'dest_path': dest_path,
+                    },
+                )
             )
+        return events
 
-        except (OSError, IOError) as e:
-            self._logger.warning(f"Failed to process file event for {file_path}: {e}")
-            return None
+    def _deliver(self, events: List[FileChangeEvent]) -> None:
+        try:
+            if self.batch_callback is not None:
+                self.batch_callback(events)
+            else:
+                for change_event in events:
+                    self.callback(change_event)
+        except Exception as e:
+            self._logger.error(f"Error in file change callback: {e}")
 
     def _calculate_checksum(self, file_path: Path) -> Optional[str]:
         """Calculate SHA-256 checksum of file content (first 64KB for consistency)."""
-        try:
-            h = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                content = f.read(65536)  # 64KB for consistency with integrity verifier
-                h.update(content)
-            return h.hexdigest()
-        except (OSError, IOError):
-            return None
+        return _calculate_checksum(file_path)
 
     def on_any_event(self, event: FileSystemEvent):
         """Handle any file system event."""
         if event.is_directory:
             return
-
-        change_event = self._create_change_event(event)
-        if change_event:
-            try:
-                self.callback(change_event)
-            except Exception as e:
-                self._logger.error(f"Error in file change callback: {e}")
+        if event.event_type not in ('created', 'modified', 'deleted', 'moved'):
+            return
+        if not self._should_process_file(str(event.src_path)):
+            return
+        self._record_event(event)
+
+
+def _match_pattern_parts(path_parts: Tuple[str, ...], pattern_parts: Tuple[str, ...]) -> bool:
+    """Match a relative path against a glob split on '/', with '**' spanning directories."""
+    if not pattern_parts:
+        return not path_parts
+    head = pattern_parts[0]
+    if head == '**':
+        return any(
+            _match_pattern_parts(path_parts[skip:], pattern_parts[1:])
+            for skip in range(len(path_parts) + 1)
+        )
+    if not path_parts or not fnmatchcase(path_parts[0], head):
+        return False
+    return _match_pattern_parts(path_parts[1:], pattern_parts[1:])
 
 
 class FileSystemWatcher:
@@ -133,21 +245,31 @@ class FileSystemWatcher:
         change_callback: Callable[[FileChangeEvent], None],
         watched_patterns: List[str] = None,
         debounce_seconds: float = 1.0,
-        enable_watchdog: bool = True
+        enable_watchdog: bool = True,
+        batch_callback: Optional[Callable[[List[FileChangeEvent]], None]] = None,
+        hash_workers: int = DEFAULT_HASH_WORKERS,
     ):
         self.project_root = Path(project_root)
         self.change_callback = change_callback
+        self.batch_callback = batch_callback
         self.watched_patterns = watched_patterns or ['**/*.md', '**/*.txt', '**/*.json']
         self.debounce_seconds = debounce_seconds
         self.enable_watchdog = enable_watchdog and WATCHDOG_AVAILABLE
+        self.hash_workers = max(1, hash_workers)
         self._observer = None
+        self._handler: Optional[DocumentFileHandler] = None
         self._polling_task = None
         self._is_running = False
+        self._hash_executor: Optional[ThreadPoolExecutor] = None
         self._logger = logging.getLogger(__name__)
 
         # Track file states for change detection
         self._file_states: Dict[str, Dict[str, any]] = {}
         self._watched_paths: Set[Path] = set()
+        self._pattern_parts = [tuple(p.split('/')) for p in self.watched_patterns]
+
+        # directory -> (mtime_ns, file names, subdirectory names)
+        self._dir_listings: Dict[str, Tuple[int, List[str], List[str]]] = {}
 
     async def start(self) -> bool:
         """Start the file system watcher."""
@@ -189,6 +311,10 @@ class FileSystemWatcher:
             await asyncio.to_thread(self._observer.join, 2.0)
             self._observer = None
 
+        if self._handler:
+            self._handler.close()
+            self._handler = None
+
         if self._polling_task:
             self._polling_task.cancel()
             try:
@@ -197,8 +323,19 @@ class FileSystemWatcher:
                 pass
             self._polling_task = None
 
+        if self._hash_executor:
+            self._hash_executor.shutdown(wait=False)
+            self._hash_executor = None
+
         self._logger.info("File watcher stopped")
 
+    def _get_hash_executor(self) -> ThreadPoolExecutor:
+        if self._hash_executor is None:
+            self._hash_executor = ThreadPoolExecutor(
+                max_workers=self.hash_workers, thread_name_prefix="scribe-watch-hash"
+            )
+        return self._hash_executor
+
     async def _start_watchdog(self) -> bool:
         """Start watchdog-based file monitoring."""
         if not WATCHDOG_AVAILABLE:
@@ -209,13 +346,15 @@ class FileSystemWatcher:
             self._observer = Observer()
 
             # Create event handler
-            handler = DocumentFileHandler(
+            self._handler = DocumentFileHandler(
                 callback=self._handle_file_change,
-                debounce_seconds=self.debounce_seconds
+                debounce_seconds=self.debounce_seconds,
+                batch_callback=self._handle_file_changes,
+                hash_executor=self._get_hash_executor(),
             )
 
             # Add recursive watch for project root
-            self._observer.schedule(handler, str(self.project_root), recursive=True)
+            self._observer.schedule(self._handler, str(self.project_root), recursive=True)
 
             # Start the observer
             self._observer.start()
@@ -244,47 +383,118 @@ class FileSystemWatcher:
             self._logger.error(f"Failed to start polling watcher: {e}")
             return False
 
+    def _list_directory(self, directory: str) -> Tuple[List[str], List[str]]:
+        """(file names, subdirectory names) of `directory`, relisted only when its mtime changes."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._dir_listings.pop(directory, None)
+            return [], []
+        cached = self._dir_listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            self._dir_listings.pop(directory, None)
+            return [], []
+        self._dir_listings[directory] = (mtime_ns, files, subdirs)
+        return files, subdirs
+
+    def _matches_watched_patterns(self, relative_parts: Tuple[str, ...]) -> bool:
+        return any(_match_pattern_parts(relative_parts, parts) for parts in self._pattern_parts)
+
+    def _scan_files(self) -> Dict[str, os.stat_result]:
+        """Stat every watched file under the project root."""
+        found: Dict[str, os.stat_result] = {}
+        root = str(self.project_root)
+        visited: Set[str] = set()
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(root, ())]
+        while stack:
+            directory, relative = stack.pop()
+            visited.add(directory)
+            files, subdirs = self._list_directory(directory)
+            for name in files:
+                if not self._matches_watched_patterns(relative + (name,)):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    found[path] = os.stat(path)
+                except OSError:
+                    continue
+            for name in subdirs:
+                stack.append((os.path.join(directory, name), relative + (name,)))
+
+        # Forget listings of directories that no longer exist
+        for directory in [d for d in self._dir_listings if d not in visited]:
+            del self._dir_listings[directory]
+        return found
+
+    async def _hash_files(self, paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Checksum `paths` in parallel on the hash thread pool."""
+        paths = list(paths)
+        if not paths:
+            return {}
+        loop = asyncio.get_running_loop()
+        executor = self._get_hash_executor()
+        checksums = await asyncio.gather(
+            *(loop.run_in_executor(executor, _calculate_checksum, Path(path)) for path in paths)
+        )
+        return dict(zip(paths, checksums))
+
     async def _initialize_file_states(self):
         """Initialize tracking of current file states."""
-        for pattern in self.watched_patterns:
-            # glob off the loop
-            paths = await asyncio.to_thread(lambda: list(self.project_root.glob(pattern)))
-            for file_path in paths:
-                if file_path.is_file():
-                    await self._update_file_state(file_path)
+        stats = await asyncio.to_thread(self._scan_files)
+        checksums = await self._hash_files(stats)
+        now = time.time()
+        for path, stat in stats.items():
+            self._file_states[path] = self._state_from_stat(stat, checksums[path], now)
+
+    @staticmethod
+    def _state_from_stat(stat: os.stat_result, checksum: Optional[str], checked_at: float) -> Dict[str, any]:
+        return {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'checksum': checksum,
+            'checked_at': checked_at,
+        }
 
     async def _update_file_state(self, file_path: Path):
         """Update the tracked state of a file."""
         try:
             stat = file_path.stat()
-            self._file_states[str(file_path)] = {
-                'mtime': stat.st_mtime,
-                'size': stat.st_size,
-                'checksum': self._calculate_checksum(file_path)
-            }
         except (OSError, IOError):
             # File might be inaccessible
-            pass
+            return
+        checksum = (await self._hash_files([str(file_path)]))[str(file_path)]
+        self._file_states[str(file_path)] = self._state_from_stat(stat, checksum, time.time())
 
     def _calculate_checksum(self, file_path: Path) -> Optional[str]:
         """Calculate SHA-256 checksum of file content (first 64KB for consistency)."""
-        try:
-            h = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                content = f.read(65536)  # 64KB for consistency with integrity verifier
-                h.update(content)
-            return h.hexdigest()
-        except (OSError, ImportError):
-            return None
+        return _calculate_checksum(file_path)
+
+    def _add_project_metadata(self, change_event: FileChangeEvent) -> None:
+        change_event.metadata.update({
+            'project_root': str(self.project_root),
+            'relative_path': str(change_event.file_path.relative_to(self.project_root))
+        })
 
     def _handle_file_change(self, change_event: FileChangeEvent):
         """Handle a detected file change."""
         try:
             # Add project-specific metadata
-            change_event.metadata.update({
-                'project_root': str(self.project_root),
-                'relative_path': str(change_event.file_path.relative_to(self.project_root))
-            })
+            self._add_project_metadata(change_event)
 
             # Call the user-provided callback
             self.change_callback(change_event)
@@ -292,6 +502,21 @@ class FileSystemWatcher:
         except Exception as e:
             self._logger.error(f"Error handling file change: {e}")
 
+    def _handle_file_changes(self, change_events: List[FileChangeEvent]):
+        """Handle a batch of detected changes, as one call when a batch callback is set."""
+        if not change_events:
+            return
+        if self.batch_callback is None:
+            for change_event in change_events:
+                self._handle_file_change(change_event)
+            return
+        try:
+            for change_event in change_events:
+                self._add_project_metadata(change_event)
+            self.batch_callback(change_events)
+        except Exception as e:
+            self._logger.error(f"Error handling file changes: {e}")
+
     async def _polling_loop(self):
         """Main polling loop for file change detection."""
         poll_interval = max(1.0, self.debounce_seconds)
@@ -309,42 +534,35 @@ class FileSystemWatcher:
 
     async def _check_for_changes(self):
         """Check for file changes via polling."""
-        current_files = set()
-
-        # Discover current files
-        for pattern in self.watched_patterns:
-            for file_path in self.project_root.glob(pattern):
-                if file_path.is_file():
-                    current_files.add(str(file_path))
-                    await self._check_file_changes(file_path)
-
-        # Check for deleted files
-        for file_path_str in list(self._file_states.keys()):
-            if file_path_str not in current_files:
-                await self._handle_file_deletion(file_path_str)
-
-    async def _check_file_changes(self, file_path: Path):
-        """Check if a specific file has changed."""
-        file_path_str = str(file_path)
-        previous_state = self._file_states.get(file_path_str)
+        current = await asyncio.to_thread(self._scan_files)
+        now = time.time()
 
-        try:
-            current_stat = file_path.stat()
-            current_state = {
-                'mtime': current_stat.st_mtime,
-                'size': current_stat.st_size,
-                'checksum': self._calculate_checksum(file_path)
-            }
-
-            if previous_state:
-                # Check for changes
-                if (current_state['mtime'] != previous_state['mtime'] or
-                    current_state['size'] != previous_state['size'] or
-                    current_state['checksum'] != previous_state['checksum']):
-
-                    # File has changed
-                    change_event = FileChangeEvent(
-                        file_path=file_path,
+        # Hash only files whose stat changed, plus racily-clean ones
+        to_hash: List[str] = []
+        for path, stat in current.items():
+            previous_state = self._file_states.get(path)
+            if (
+                previous_state is None
+                or stat.st_mtime != previous_state['mtime']
+                or stat.st_size != previous_state['size']
+                or previous_state.get('checked_at', 0.0) - previous_state['mtime'] < RACY_WINDOW_SECONDS
+            ):
+                to_hash.append(path)
+        checksums = await self._hash_files(to_hash)
+
+        change_events: List[FileChangeEvent] = []
+        for path in to_hash:
+            stat = current[path]
+            previous_state = self._file_states.get(path)
+            current_state = self._state_from_stat(stat, checksums[path], now)
+            if previous_state and (
+                current_state['mtime'] != previous_state['mtime']
+                or current_state['size'] != previous_state['size']
+                or current_state['checksum'] != previous_state['checksum']
+            ):
+                change_events.append(
+                    FileChangeEvent(
+                        file_path=Path(path),
                         event_type='modified',
                         size_bytes=current_state['size'],
                         checksum=current_state['checksum'],
@@ -353,14 +571,24 @@ class FileSystemWatcher:
                             'detection_method': 'polling'
                         }
                     )
-                    self._handle_file_change(change_event)
+                )
+            self._file_states[path] = current_state
 
-            # Update tracked state
-            self._file_states[file_path_str] = current_state
+        # Check for deleted files
+        for file_path_str in list(self._file_states.keys()):
+            if file_path_str not in current:
+                change_events.append(
+                    FileChangeEvent(
+                        file_path=Path(file_path_str),
+                        event_type='deleted',
+                        metadata={
+                            'previous_state': self._file_states.pop(file_path_str),
+                            'detection_method': 'polling'
+                        }
+                    )
+                )
 
-        except (OSError, IOError):
-            # File might be inaccessible or deleted
-            pass
+        self._handle_file_changes(change_events)
 
     async def _handle_file_deletion(self, file_path_str: str):
         """Handle file deletion detected via polling."""
@@ -382,4 +610,4 @@ class FileSystemWatcher:
 
     def get_method(self) -> str:
         """Get the monitoring method being used."""
-        return "watchdog" if self.enable_watchdog else "polling"
\ No newline at end of file
+        return "watchdog" if self.enable_watchdog else "polling"
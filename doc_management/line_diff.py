@@ -0,0 +1,345 @@
+"""Shared line-level diff engine for doc_management.
+
+Change logging, diff visualization, the version store and conflict analysis
+all diff the same document pairs, so results are computed once here and kept
+in a small LRU keyed by the two texts.
+
+The diff is a patience diff: lines unique to both sides anchor the
+alignment, and the gaps between anchors are filled with Myers' O(ND)
+algorithm. A gap whose edit distance exceeds ``MYERS_MAX_COST`` is reported
+as a single replace instead of being searched exhaustively. Opcodes use
+difflib's ``(tag, i1, i2, j1, j2)`` format, so existing consumers keep working.
+"""
+
+from __future__ import annotations
+
+import difflib
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+
+# Edit distance beyond which a gap between anchors is treated as one replace
+MYERS_MAX_COST = 1024
+
+# Replaced blocks up to this many characters are compared character by
+# character when computing the similarity ratio
+REFINE_MAX_CHARS = 4096
+
+# Diffs kept for reuse across callers
+DIFF_CACHE_MAX = 32
+
+# Bound on the ratio below which similarity() skips the exact diff
+EARLY_EXIT_SIMILARITY = 0.3
+
+
+def _myers_matches(a: Sequence[int], b: Sequence[int], max_cost: int) -> Optional[List[Tuple[int, int]]]:
+    """Matched (i, j) pairs of a shortest edit script, or None past `max_cost` edits."""
+    n, m = len(a), len(b)
+    limit = min(n + m, max_cost)
+    offset = limit + 1
+    v = [0] * (2 * limit + 3)
+    trace: List[List[int]] = []
+
+    for d in range(limit + 1):
+        # v for k in [-d-1, d+1] before this round, indexed k + d + 1
+        trace.append(v[offset - d - 1:offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m)
+    return None
+
+
+def _myers_backtrack(trace: List[List[int]], n: int, m: int) -> List[Tuple[int, int]]:
+    matches: List[Tuple[int, int]] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        window = trace[d]
+        base = d + 1
+        k = x - y
+        if k == -d or (k != d and window[base + k - 1] < window[base + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = window[base + prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def _unique_anchors(
+    a: Sequence[int], b: Sequence[int], a_lo: int, a_hi: int, b_lo: int, b_hi: int
+) -> List[Tuple[int, int]]:
+    """Longest increasing run of lines that occur exactly once on each side."""
+    counts: Dict[int, List[int]] = {}
+    for i in range(a_lo, a_hi):
+        entry = counts.setdefault(a[i], [0, i, 0, 0])
+        entry[0] += 1
+    for j in range(b_lo, b_hi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[2] += 1
+            entry[3] = j
+    pairs = sorted((i, j) for count_a, i, count_b, j in counts.values() if count_a == 1 and count_b == 1)
+    if not pairs:
+        return []
+
+    # Patience sorting on the b positions
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous: List[int] = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[pile] = j
+            tail_index[pile] = index
+        previous[index] = tail_index[pile - 1] if pile else -1
+
+    anchors: List[Tuple[int, int]] = []
+    index = tail_index[-1]
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _patience_matches(a: Sequence[int], b: Sequence[int], max_cost: int) -> List[Tuple[int, int]]:
+    matches: List[Tuple[int, int]] = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        a_lo, a_hi, b_lo, b_hi = regions.pop()
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            matches.append((a_lo, b_lo))
+            a_lo += 1
+            b_lo += 1
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+            matches.append((a_hi, b_hi))
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _unique_anchors(a, b, a_lo, a_hi, b_lo, b_hi)
+        if anchors:
+            for anchor_a, anchor_b in anchors:
+                matches.append((anchor_a, anchor_b))
+                regions.append((a_lo, anchor_a, b_lo, anchor_b))
+                a_lo, b_lo = anchor_a + 1, anchor_b + 1
+            regions.append((a_lo, a_hi, b_lo, b_hi))
+            continue
+
+        found = _myers_matches(a[a_lo:a_hi], b[b_lo:b_hi], max_cost)
+        for i, j in found or ():
+            matches.append((a_lo + i, b_lo + j))
+    matches.sort()
+    return matches
+
+
+def _matches_to_opcodes(matches: List[Tuple[int, int]], n: int, m: int) -> List[Opcode]:
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for match_i, match_j in matches + [(n, m)]:
+        if match_i > i or match_j > j:
+            tag = "replace" if match_i > i and match_j > j else ("delete" if match_i > i else "insert")
+            opcodes.append((tag, i, match_i, j, match_j))
+        if match_i < n or match_j < m:
+            last = opcodes[-1] if opcodes else None
+            if last and last[0] == "equal" and last[2] == match_i and last[4] == match_j:
+                opcodes[-1] = ("equal", last[1], match_i + 1, last[3], match_j + 1)
+            else:
+                opcodes.append(("equal", match_i, match_i + 1, match_j, match_j + 1))
+        i, j = match_i + 1, match_j + 1
+    return opcodes
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+@dataclass(frozen=True)
+class LineDiff:
+    """Line-level diff of two texts (lines keep their line endings)."""
+
+    old_lines: Tuple[str, ...]
+    new_lines: Tuple[str, ...]
+    opcodes: Tuple[Opcode, ...]
+
+    @cached_property
+    def additions(self) -> int:
+        return sum(j2 - j1 for tag, _, _, j1, j2 in self.opcodes if tag in ("insert", "replace"))
+
+    @cached_property
+    def deletions(self) -> int:
+        return sum(i2 - i1 for tag, i1, i2, _, _ in self.opcodes if tag in ("delete", "replace"))
+
+    @cached_property
+    def modifications(self) -> int:
+        """Lines rewritten in place (paired old/new lines of replace blocks)."""
+        return sum(min(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in self.opcodes if tag == "replace")
+
+    @property
+    def lines_added(self) -> List[str]:
+        return [line for tag, _, _, j1, j2 in self.opcodes if tag in ("insert", "replace") for line in self.new_lines[j1:j2]]
+
+    @property
+    def lines_removed(self) -> List[str]:
+        return [line for tag, i1, i2, _, _ in self.opcodes if tag in ("delete", "replace") for line in self.old_lines[i1:i2]]
+
+    @cached_property
+    def ratio(self) -> float:
+        """Character-weighted similarity in [0, 1], comparable to SequenceMatcher.ratio().
+
+        Unchanged lines count in full; small replaced blocks are compared
+        character by character, larger ones count as entirely different.
+        """
+        total = sum(map(len, self.old_lines)) + sum(map(len, self.new_lines))
+        if not total:
+            return 1.0
+        matched = 0
+        for tag, i1, i2, j1, j2 in self.opcodes:
+            if tag == "equal":
+                matched += sum(map(len, self.old_lines[i1:i2]))
+            elif tag == "replace":
+                old_block = "".join(self.old_lines[i1:i2])
+                new_block = "".join(self.new_lines[j1:j2])
+                if len(old_block) + len(new_block) <= REFINE_MAX_CHARS:
+                    matcher = difflib.SequenceMatcher(None, old_block, new_block, autojunk=False)
+                    matched += sum(block.size for block in matcher.get_matching_blocks())
+        return 2.0 * matched / total
+
+    def grouped_opcodes(self, n: int = 3) -> Iterator[List[Opcode]]:
+        """Hunks with up to `n` lines of context, as difflib.SequenceMatcher.get_grouped_opcodes."""
+        codes = list(self.opcodes) or [("equal", 0, 1, 0, 1)]
+        if codes[0][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[0]
+            codes[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+        if codes[-1][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[-1]
+            codes[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+        group: List[Opcode] = []
+        for tag, i1, i2, j1, j2 in codes:
+            if tag == "equal" and i2 - i1 > n + n:
+                group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+                yield group
+                group = []
+                i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+            group.append((tag, i1, i2, j1, j2))
+        if group and not (len(group) == 1 and group[0][0] == "equal"):
+            yield group
+
+    def unified_diff(self, fromfile: str = "old", tofile: str = "new", n: int = 3, lineterm: str = "\n") -> str:
+        """Unified diff text, formatted like difflib.unified_diff."""
+        parts: List[str] = []
+        for group in self.grouped_opcodes(n):
+            if not parts:
+                parts.append(f"--- {fromfile}{lineterm}")
+                parts.append(f"+++ {tofile}{lineterm}")
+            first, last = group[0], group[-1]
+            old_range = _format_range_unified(first[1], last[2])
+            new_range = _format_range_unified(first[3], last[4])
+            parts.append(f"@@ -{old_range} +{new_range} @@{lineterm}")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    parts.extend(" " + line for line in self.old_lines[i1:i2])
+                    continue
+                if tag in ("replace", "delete"):
+                    parts.extend("-" + line for line in self.old_lines[i1:i2])
+                if tag in ("replace", "insert"):
+                    parts.extend("+" + line for line in self.new_lines[j1:j2])
+        return "".join(parts)
+
+
+def diff_lines(old_lines: Sequence[str], new_lines: Sequence[str], max_cost: int = MYERS_MAX_COST) -> LineDiff:
+    """Diff two line sequences (uncached)."""
+    ids: Dict[str, int] = {}
+    a = [ids.setdefault(line, len(ids)) for line in old_lines]
+    b = [ids.setdefault(line, len(ids)) for line in new_lines]
+    opcodes = _matches_to_opcodes(_patience_matches(a, b, max_cost), len(a), len(b))
+    return LineDiff(tuple(old_lines), tuple(new_lines), tuple(opcodes))
+
+
+_DIFF_CACHE: "OrderedDict[Tuple[str, str], LineDiff]" = OrderedDict()
+_DIFF_CACHE_LOCK = threading.Lock()
+
+
+def diff_texts(old_text: str, new_text: str) -> LineDiff:
+    """Line diff of two texts, shared through an LRU so callers reuse each other's work."""
+    key = (old_text, new_text)
+    with _DIFF_CACHE_LOCK:
+        cached = _DIFF_CACHE.get(key)
+        if cached is not None:
+            _DIFF_CACHE.move_to_end(key)
+            return cached
+    result = diff_lines(old_text.splitlines(keepends=True), new_text.splitlines(keepends=True))
+    with _DIFF_CACHE_LOCK:
+        _DIFF_CACHE[key] = result
+        while len(_DIFF_CACHE) > DIFF_CACHE_MAX:
+            _DIFF_CACHE.popitem(last=False)
+    return result
+
+
+def similarity_bound(old_text: str, new_text: str) -> float:
+    """Upper bound on ``diff_texts(old_text, new_text).ratio``, in O(lines).
+
+    Equal opcodes pair identical lines, so they match at most the characters
+    of the lines both texts share. Other characters only match inside replace
+    blocks of up to ``REFINE_MAX_CHARS``, at most one per shared line plus
+    one, each matching at most half of its characters.
+    """
+    total = len(old_text) + len(new_text)
+    if not total:
+        return 1.0
+    shared = Counter(old_text.splitlines(keepends=True)) & Counter(new_text.splitlines(keepends=True))
+    shared_chars = sum(len(line) * count for line, count in shared.items())
+    refined_chars = (sum(shared.values()) + 1) * (REFINE_MAX_CHARS // 2)
+    matched = min(shared_chars + refined_chars, len(old_text), len(new_text))
+    return 2.0 * matched / total
+
+
+def similarity(old_text: str, new_text: str) -> float:
+    """Similarity ratio of two texts, skipping the full diff when they are clearly unrelated.
+
+    When the diff is skipped the returned value is an upper bound below
+    ``EARLY_EXIT_SIMILARITY``, so comparisons against thresholds at or above
+    it agree with the exact ratio.
+    """
+    if old_text == new_text:
+        return 1.0
+    if not old_text or not new_text:
+        return 0.0
+    with _DIFF_CACHE_LOCK:
+        cached = _DIFF_CACHE.get((old_text, new_text))
+    if cached is not None:
+        return cached.ratio
+    bound = similarity_bound(old_text, new_text)
+    if bound < EARLY_EXIT_SIMILARITY:
+        return bound
+    return diff_texts(old_text, new_text).ratio
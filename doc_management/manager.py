@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import ast
+import itertools
 import difflib
 import hashlib
 import json
@@ -14,8 +15,10 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 # Import with absolute paths from scribe_mcp root
-from scribe_mcp.utils.files import async_atomic_write, ensure_parent, preflight_backup
+from scribe_mcp.config.settings import settings
+from scribe_mcp.utils.files import WriteReceipt, async_atomic_write, ensure_parent, preflight_backup
 from scribe_mcp.config.repo_config import RepoDiscovery
+from scribe_mcp.doc_management.doc_cache import CachedDocument, collect_markdown_headers, document_cache
 from scribe_mcp.utils.frontmatter import (
     apply_frontmatter_updates,
     build_frontmatter,
@@ -42,6 +45,9 @@ PATCH_MODE_UNIFIED = "unified"
 PATCH_MODE_ALIASES = {"diff": PATCH_MODE_UNIFIED}
 PATCH_MODE_ALLOWED = {PATCH_MODE_STRUCTURED, PATCH_MODE_UNIFIED}
 
+# Receipt-verified writes counted towards the periodic deep (re-read) verification
+_VERIFIED_WRITES = itertools.count(1)
+
 
 def _log_operation(
     level: str,
@@ -162,19 +168,21 @@ async def apply_doc_change(
         repo_root = Path(project["root"]).resolve()
         await ensure_parent(doc_path, repo_root=repo_root)
 
-        # Get original content and metadata
+        # Get original content and metadata (parsed structure is cached per file version)
         original_text = ""
         file_size_before = 0
+        cached_doc: Optional[CachedDocument] = None
         if doc_path.exists():
             try:
-                original_text = await asyncio.to_thread(doc_path.read_text, encoding="utf-8")
-                file_size_before = doc_path.stat().st_size
+                cached_doc = await asyncio.to_thread(document_cache.load, doc_path)
             except (OSError, UnicodeDecodeError) as e:
                 raise DocumentOperationError(f"Failed to read existing document {doc_path}: {e}")
+            original_text = cached_doc.text
+            file_size_before = cached_doc.size
 
-        before_hash = _hash_text(original_text)
+        before_hash = cached_doc.sha if cached_doc else _hash_text(original_text)
         try:
-            original_parsed = parse_frontmatter(original_text)
+            original_parsed = cached_doc.parsed if cached_doc else parse_frontmatter(original_text)
         except ValueError as exc:
             raise DocumentOperationError(str(exc))
         original_body = original_parsed.body
@@ -213,7 +221,12 @@ async def apply_doc_change(
                     position=str(position_value),
                 )
             elif action == "status_update":
-                updated_body = _toggle_checklist_status(original_body, section, metadata or {})
+                updated_body = _toggle_checklist_status(
+                    original_body,
+                    section,
+                    metadata or {},
+                    anchor_lines=cached_doc.anchor_lines if cached_doc else None,
+                )
             elif action == "apply_patch":
                 patch_text = patch or content
                 current_hash = _hash_text(original_body)
@@ -263,6 +276,7 @@ async def apply_doc_change(
                         original_body,
                         edit,
                         allow_append=allow_append,
+                        cached_doc=cached_doc,
                     )
                     patch_used = compile_unified_diff(
                         original_body,
@@ -294,6 +308,7 @@ async def apply_doc_change(
                         latest_text = original_text
                         if doc_path.exists():
                             latest_text = await asyncio.to_thread(doc_path.read_text, encoding="utf-8")
+                            document_cache.invalidate(doc_path)
                         latest_parsed = parse_frontmatter(latest_text)
                         if latest_parsed.body != original_body:
                             original_body = latest_parsed.body
@@ -367,43 +382,28 @@ async def apply_doc_change(
                     resolved_start,
                     resolved_end,
                     content or "",
+                    headers=cached_doc.headers if cached_doc else None,
+                    line_offsets=cached_doc.line_offsets if cached_doc else None,
                 )
             elif action == "replace_text":
                 if not isinstance(metadata, dict):
                     raise DocumentOperationError(
                         "REPLACE_TEXT_MISSING_METADATA: provide metadata with find/replace values"
                     )
-                find_text = metadata.get("find")
-                if not isinstance(find_text, str) or not find_text:
-                    raise DocumentOperationError("REPLACE_TEXT_MISSING_FIND: metadata.find is required")
-                replace_text = metadata.get("replace")
-                if replace_text is None:
-                    replace_text = ""
-                match_mode = str(metadata.get("match_mode") or "literal").strip().lower()
-                if match_mode not in {"literal", "regex"}:
-                    raise DocumentOperationError(
-                        "REPLACE_TEXT_MATCH_MODE_INVALID: use literal or regex"
-                    )
-                replace_all = bool(metadata.get("replace_all", True))
-                scope = metadata.get("scope")
-                allow_no_match = bool(metadata.get("allow_no_match", False))
-
-                updated_body, hits = _replace_text_with_scope(
+                updated_body, extra["replace_text"] = _replace_text_from_spec(original_body, metadata)
+            elif action == "multi_edit":
+                allow_append = False
+                edits = None
+                if isinstance(metadata, dict):
+                    allow_append = bool(metadata.get("allow_append") or metadata.get("scaffold"))
+                    edits = metadata.get("edits")
+                updated_body, applied_edits = _apply_multi_edit(
                     original_body,
-                    find_text=find_text,
-                    replace_text=str(replace_text),
-                    match_mode=match_mode,
-                    replace_all=replace_all,
-                    scope=str(scope) if scope else None,
-                    allow_no_match=allow_no_match,
+                    edits,
+                    allow_append=allow_append,
+                    cached_doc=cached_doc,
                 )
-                extra["replace_text"] = {
-                    "find": find_text,
-                    "replace_all": replace_all,
-                    "match_mode": match_mode,
-                    "scope": scope,
-                    "matches": hits,
-                }
+                extra["multi_edit"] = {"edits_applied": len(applied_edits), "edits": applied_edits}
             elif action == "create_doc":
                 overwrite = bool(metadata.get("overwrite")) if isinstance(metadata, dict) else False
                 if doc_path.exists() and not overwrite:
@@ -512,12 +512,20 @@ async def apply_doc_change(
                             f"DOC_SNAPSHOT_FAILED: {exc}"
                         ) from exc
                 # Write the file
-                await async_atomic_write(doc_path, updated_text, mode="w", repo_root=repo_root)
+                receipt = await async_atomic_write(doc_path, updated_text, mode="w", repo_root=repo_root)
 
                 # Verify the write was successful
-                verification_passed = await _verify_file_write(doc_path, updated_text, after_hash)
+                verification_passed = await _verify_file_write(
+                    doc_path,
+                    updated_text,
+                    after_hash,
+                    receipt=receipt,
+                    deep=_should_deep_verify(metadata),
+                )
                 if not verification_passed:
+                    document_cache.invalidate(doc_path)
                     raise DocumentVerificationError(f"File write verification failed for {doc_path}")
+                document_cache.store(doc_path, updated_text, after_hash)
 
                 file_size_after = doc_path.stat().st_size
 
@@ -544,6 +552,7 @@ async def apply_doc_change(
             except Exception as e:
                 # Attempt rollback if write failed
                 try:
+                    document_cache.invalidate(doc_path)
                     if original_text and doc_path.exists():
                         await async_atomic_write(doc_path, original_text, mode="w", repo_root=repo_root)
                         duration_ms = (time.time() - start_time) * 1000
@@ -830,10 +839,10 @@ async def _render_content(
     if template_name:
         try:
             # Import template engine dynamically to avoid circular imports
-            from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+            from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 
             # Initialize template engine
-            engine = Jinja2TemplateEngine(
+            engine = get_template_engine(
                 project_root=Path(project.get("root", "")),
                 project_name=project.get("name", ""),
                 security_mode="sandbox"
@@ -866,9 +875,9 @@ async def _render_content(
         normalized = content.replace("\r\n", "\n")
         if "{{" in normalized or "{%" in normalized or "{#" in normalized:
             try:
-                from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+                from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 
-                engine = Jinja2TemplateEngine(
+                engine = get_template_engine(
                     project_root=Path(project.get("root", "")),
                     project_name=project.get("name", ""),
                     security_mode="sandbox",
@@ -960,6 +969,41 @@ def _replace_text_regex(
     return updated, hits
 
 
+def _replace_text_from_spec(text: str, spec: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+    """Run a replace_text specification (find/replace/match_mode/...) against `text`."""
+    find_text = spec.get("find")
+    if not isinstance(find_text, str) or not find_text:
+        raise DocumentOperationError("REPLACE_TEXT_MISSING_FIND: metadata.find is required")
+    replace_text = spec.get("replace")
+    if replace_text is None:
+        replace_text = ""
+    match_mode = str(spec.get("match_mode") or "literal").strip().lower()
+    if match_mode not in {"literal", "regex"}:
+        raise DocumentOperationError(
+            "REPLACE_TEXT_MATCH_MODE_INVALID: use literal or regex"
+        )
+    replace_all = bool(spec.get("replace_all", True))
+    scope = spec.get("scope")
+    allow_no_match = bool(spec.get("allow_no_match", False))
+
+    updated, hits = _replace_text_with_scope(
+        text,
+        find_text=find_text,
+        replace_text=str(replace_text),
+        match_mode=match_mode,
+        replace_all=replace_all,
+        scope=str(scope) if scope else None,
+        allow_no_match=allow_no_match,
+    )
+    return updated, {
+        "find": find_text,
+        "replace_all": replace_all,
+        "match_mode": match_mode,
+        "scope": scope,
+        "matches": hits,
+    }
+
+
 def _replace_text_with_scope(
     text: str,
     *,
@@ -1140,52 +1184,113 @@ def _collect_hunk_original_lines(hunk_lines: list[str]) -> list[str]:
     return original_lines
 
 
-def _find_sequence_indices(haystack: list[str], needle: list[str]) -> list[int]:
+def _normalize_patch_line(line: str) -> str:
+    # Lines that differ only by one trailing newline satisfy _line_matches
+    return line[:-1] if line.endswith("\n") else line
+
+
+class _LineIndex:
+    """Hash index over a document's lines for anchoring patch hunks.
+
+    Each distinct normalised line gets a small integer id with the list of its
+    positions; prefix hashes over the id sequence (Rabin-Karp) give any
+    window's hash in O(1). Built once per patch and shared by all its hunks.
+    """
+
+    _BASE = 1_000_003
+    _MOD = (1 << 61) - 1
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self.ids: list[int] = []
+        self._id_of: Dict[str, int] = {}
+        self.positions: list[list[int]] = []
+        self._prefix = [0]
+        self._powers = [1]
+        for index, line in enumerate(lines):
+            line_id = self._id_of.setdefault(_normalize_patch_line(line), len(self._id_of))
+            if line_id == len(self.positions):
+                self.positions.append([])
+            self.positions[line_id].append(index)
+            self.ids.append(line_id)
+            self._prefix.append((self._prefix[-1] * self._BASE + line_id + 1) % self._MOD)
+
+    def line_id(self, line: str) -> Optional[int]:
+        return self._id_of.get(_normalize_patch_line(line))
+
+    def _power(self, length: int) -> int:
+        while len(self._powers) <= length:
+            self._powers.append(self._powers[-1] * self._BASE % self._MOD)
+        return self._powers[length]
+
+    def _window_hash(self, start: int, length: int) -> int:
+        return (self._prefix[start + length] - self._prefix[start] * self._power(length)) % self._MOD
+
+    def find(self, needle: list[str]) -> list[int]:
+        """Start indexes where `needle` occurs exactly (same result as a slice scan)."""
+        if not needle or len(needle) > len(self.lines):
+            return []
+        needle_ids = [self.line_id(line) for line in needle]
+        if None in needle_ids:
+            return []
+        target = 0
+        for line_id in needle_ids:
+            target = (target * self._BASE + line_id + 1) % self._MOD
+        length = len(needle)
+        limit = len(self.lines) - length
+        return [
+            start
+            for start in self.positions[needle_ids[0]]
+            if start <= limit
+            and self._window_hash(start, length) == target
+            and self.lines[start : start + length] == needle
+        ]
+
+
+def _find_sequence_indices(
+    haystack: list[str], needle: list[str], index: Optional[_LineIndex] = None
+) -> list[int]:
     if not needle:
         return []
-    matches: list[int] = []
-    limit = len(haystack) - len(needle)
-    for idx in range(limit + 1):
-        if haystack[idx: idx + len(needle)] == needle:
-            matches.append(idx)
-    return matches
+    return (index or _LineIndex(haystack)).find(needle)
 
 
 def _find_alignment_with_one_line_gaps(
-    original_lines: list[str], target_lines: list[str]
+    original_lines: list[str], target_lines: list[str], index: Optional[_LineIndex] = None
 ) -> Optional[list[int]]:
     """Find a unique alignment allowing a single skipped line between matches."""
     if not target_lines:
         return None
-    alignments: list[list[int]] = []
-
-    def dfs(target_index: int, next_start: int, positions: list[int]) -> None:
-        if len(alignments) > 1:
-            return
-        if target_index >= len(target_lines):
-            alignments.append(positions)
-            return
-        for offset in (0, 1):
-            candidate_index = next_start + offset
-            if candidate_index >= len(original_lines):
-                continue
-            if _line_matches(target_lines[target_index], original_lines[candidate_index]):
-                dfs(target_index + 1, candidate_index + 1, positions + [candidate_index])
-        return
-
-    for index, line in enumerate(original_lines):
-        if _line_matches(target_lines[0], line):
-            dfs(1, index + 1, [index])
-            if len(alignments) > 1:
-                break
+    index = index or _LineIndex(original_lines)
+    target_ids = [index.line_id(line) for line in target_lines]
+    if None in target_ids:
+        return None
 
-    if len(alignments) == 1:
-        return alignments[0]
-    return None
+    # counts[t][p]: alignments (capped at 2) of target_lines[t:] with target t at line p
+    counts: list[Dict[int, int]] = [{} for _ in target_ids]
+    last = len(target_ids) - 1
+    counts[last] = {position: 1 for position in index.positions[target_ids[last]]}
+    for target_index in range(last - 1, -1, -1):
+        following = counts[target_index + 1]
+        row: Dict[int, int] = {}
+        for position in index.positions[target_ids[target_index]]:
+            total = following.get(position + 1, 0) + following.get(position + 2, 0)
+            if total:
+                row[position] = min(total, 2)
+        counts[target_index] = row
+
+    if sum(counts[0].values()) != 1:
+        return None
+    alignment = [next(iter(counts[0]))]
+    for target_index in range(1, len(target_ids)):
+        previous = alignment[-1]
+        row = counts[target_index]
+        alignment.append(previous + 1 if previous + 1 in row else previous + 2)
+    return alignment
 
 
 def _expand_hunk_with_one_line_gaps(
-    original_lines: list[str], hunk_lines: list[str]
+    original_lines: list[str], hunk_lines: list[str], index: Optional[_LineIndex] = None
 ) -> Optional[tuple[list[str], Dict[str, Any]]]:
     """Insert missing single-gap context lines into hunk when alignment is unique."""
     effective_line_indices = [
@@ -1197,7 +1302,7 @@ def _expand_hunk_with_one_line_gaps(
     if not target_lines:
         return None
 
-    alignment = _find_alignment_with_one_line_gaps(original_lines, target_lines)
+    alignment = _find_alignment_with_one_line_gaps(original_lines, target_lines, index)
     if alignment is None:
         return None
 
@@ -1238,6 +1343,7 @@ def _rebase_patch_to_current_context(
     """Rebase patch hunk headers to current file context using exact matches."""
     header_lines, hunks = _parse_patch_hunks(patch_text)
     original_lines = original_text.splitlines(keepends=True)
+    line_index = _LineIndex(original_lines)
     rebased_lines: list[str] = []
     if header_lines:
         rebased_lines.extend(header_lines)
@@ -1246,16 +1352,16 @@ def _rebase_patch_to_current_context(
     for hunk in hunks:
         hunk_lines = hunk["lines"]
         original_hunk_lines = _collect_hunk_original_lines(hunk_lines)
-        matches = _find_sequence_indices(original_lines, original_hunk_lines)
+        matches = _find_sequence_indices(original_lines, original_hunk_lines, line_index)
         context_expanded = False
         expansion_info: Dict[str, Any] = {}
         if len(matches) != 1:
-            expanded = _expand_hunk_with_one_line_gaps(original_lines, hunk_lines)
+            expanded = _expand_hunk_with_one_line_gaps(original_lines, hunk_lines, line_index)
             if expanded:
                 hunk_lines, expansion_info = expanded
                 context_expanded = True
                 original_hunk_lines = _collect_hunk_original_lines(hunk_lines)
-                matches = _find_sequence_indices(original_lines, original_hunk_lines)
+                matches = _find_sequence_indices(original_lines, original_hunk_lines, line_index)
 
         if len(matches) != 1:
             reason = "ambiguous" if matches else "missing"
@@ -1330,10 +1436,11 @@ def _build_patch_failure_diagnostics(
     try:
         _, hunks = _parse_patch_hunks(patch_text)
         original_lines = original_text.splitlines(keepends=True)
+        line_index = _LineIndex(original_lines)
         ranges: list[Dict[str, Any]] = []
         for hunk in hunks:
             original_hunk_lines = _collect_hunk_original_lines(hunk["lines"])
-            matches = _find_sequence_indices(original_lines, original_hunk_lines)
+            matches = _find_sequence_indices(original_lines, original_hunk_lines, line_index)
             if len(matches) == 1:
                 start = matches[0] + 1
                 end = start + max(len(original_hunk_lines) - 1, 0)
@@ -1502,11 +1609,21 @@ def _replace_range_text(
     start_line: Optional[int],
     end_line: Optional[int],
     replacement: str,
+    *,
+    headers: Optional[list[dict[str, Any]]] = None,
+    line_offsets: Optional[list[int]] = None,
 ) -> str:
-    """Replace inclusive line range [start_line, end_line] (1-based) or homologous section."""
+    """Replace inclusive line range [start_line, end_line] (1-based) or homologous section.
+
+    `headers` and `line_offsets` may be passed pre-computed for `original_text`
+    (see CachedDocument) to avoid rescanning it.
+    """
     allow_header_fallback = start_line is not None and end_line is not None
     header_replacement = _replace_section_by_header(
-        original_text, replacement, allow_missing_header_fallback=allow_header_fallback
+        original_text,
+        replacement,
+        allow_missing_header_fallback=allow_header_fallback,
+        headers=headers,
     )
     if header_replacement is not None:
         return header_replacement
@@ -1517,17 +1634,20 @@ def _replace_range_text(
     if start_line < 1 or end_line < start_line:
         raise DocumentOperationError(f"Invalid range: start_line={start_line} end_line={end_line}")
 
-    lines = original_text.splitlines(keepends=True)
-    if start_line > len(lines) + 1:
+    if line_offsets is None:
+        line_offsets = [0]
+        for line in original_text.splitlines(keepends=True):
+            line_offsets.append(line_offsets[-1] + len(line))
+    line_count = len(line_offsets) - 1
+    if start_line > line_count + 1:
         raise DocumentOperationError("start_line out of range")
-    if end_line > len(lines):
+    if end_line > line_count:
         raise DocumentOperationError("end_line out of range")
 
     repl = replacement.replace("\r\n", "\n")
     if repl and not repl.endswith("\n"):
         repl += "\n"
-    new_lines = lines[: start_line - 1] + ([repl] if repl else []) + lines[end_line:]
-    return "".join(new_lines)
+    return original_text[: line_offsets[start_line - 1]] + repl + original_text[line_offsets[end_line]:]
 
 
 def _replace_section_by_header(
@@ -1535,6 +1655,7 @@ def _replace_section_by_header(
     replacement: str,
     *,
     allow_missing_header_fallback: bool = False,
+    headers: Optional[list[dict[str, Any]]] = None,
 ) -> Optional[str]:
     """Replace a Markdown header section when the replacement starts with a header.
 
@@ -1550,7 +1671,8 @@ def _replace_section_by_header(
 
     level, title = header_info
     header_repr = f"{('#' * level)} {title}"
-    headers = _collect_markdown_headers(original_text)
+    if headers is None:
+        headers = _collect_markdown_headers(original_text)
     matching_sections = [
         header for header in headers if header["level"] == level and header["title"] == title
     ]
@@ -1583,39 +1705,7 @@ def _replace_section_by_header(
 
 def _collect_markdown_headers(text: str) -> list[dict[str, Any]]:
     """Return metadata for every Markdown header in `text`, skipping fenced code blocks."""
-    headers: list[dict[str, Any]] = []
-    lines = text.splitlines(keepends=True)
-    in_fence = False
-    position = 0
-
-    for idx, line in enumerate(lines):
-        line_start = position
-        stripped = line.lstrip()
-        if stripped.startswith("```") or stripped.startswith("~~~"):
-            in_fence = not in_fence
-            position += len(line)
-            continue
-        if in_fence:
-            position += len(line)
-            continue
-
-        match = _HEADER_LINE_PATTERN.match(stripped)
-        if match:
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            if title:
-                headers.append(
-                    {
-                        "level": level,
-                        "title": title,
-                        "start": line_start,
-                        "line_number": idx + 1,
-                    }
-                )
-
-        position += len(line)
-
-    return headers
+    return collect_markdown_headers(text)
 
 
 def _extract_replacement_header(content: str) -> Optional[tuple[int, str]]:
@@ -1853,8 +1943,13 @@ def _apply_structured_edit(
     edit: Dict[str, Any],
     *,
     allow_append: bool = False,
+    cached_doc: Optional[CachedDocument] = None,
 ) -> str:
-    """Apply a structured edit specification to text and return updated content."""
+    """Apply a structured edit specification to text and return updated content.
+
+    `cached_doc`, when its body is `original_text`, supplies pre-computed
+    headers and line offsets.
+    """
     edit_type = str(edit.get("type") or "").strip().lower()
     if not edit_type:
         raise DocumentOperationError("STRUCTURED_EDIT_TYPE_REQUIRED: edit.type is required")
@@ -1867,7 +1962,10 @@ def _apply_structured_edit(
             raise DocumentOperationError(
                 "STRUCTURED_EDIT_RANGE_REQUIRED: start_line and end_line are required"
             )
-        return _replace_range_text(original_text, int(start_line), int(end_line), str(content))
+        structure: Dict[str, Any] = {}
+        if cached_doc is not None and cached_doc.body is original_text:
+            structure = {"headers": cached_doc.headers, "line_offsets": cached_doc.line_offsets}
+        return _replace_range_text(original_text, int(start_line), int(end_line), str(content), **structure)
 
     if edit_type == "replace_block":
         anchor = str(edit.get("anchor") or "").strip()
@@ -1884,7 +1982,163 @@ def _apply_structured_edit(
     raise DocumentOperationError(f"STRUCTURED_EDIT_UNSUPPORTED: {edit_type}")
 
 
-def _toggle_checklist_status(text: str, section: Optional[str], metadata: Dict[str, Any]) -> str:
+MULTI_EDIT_TYPES = {"replace_range", "replace_block", "replace_section", "status_update", "replace_text", "apply_patch"}
+
+
+def _changed_line_span(old_lines: list[str], new_lines: list[str]) -> tuple[int, int, int]:
+    """Return (start, old_end, new_end): old_lines[start:old_end] became new_lines[start:new_end]."""
+    limit = min(len(old_lines), len(new_lines))
+    start = 0
+    while start < limit and old_lines[start] == new_lines[start]:
+        start += 1
+    suffix = 0
+    while suffix < limit - start and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    return start, len(old_lines) - suffix, len(new_lines) - suffix
+
+
+def _rebase_line_range(
+    origin: list[Optional[int]],
+    snapshot_lines: int,
+    start_line: int,
+    end_line: int,
+) -> tuple[int, int]:
+    """Map a 1-based inclusive snapshot line range onto the current lines.
+
+    `origin` holds the snapshot index of each current line, or None for lines
+    written by an earlier edit.
+    """
+    if start_line < 1 or end_line < start_line:
+        return start_line, end_line  # _replace_range_text reports the invalid range
+    if end_line > snapshot_lines:
+        raise DocumentOperationError("end_line out of range")
+    length = end_line - start_line + 1
+    current_start = next(
+        (current for current, snapshot in enumerate(origin) if snapshot == start_line - 1),
+        None,
+    )
+    if current_start is None or origin[current_start : current_start + length] != list(
+        range(start_line - 1, end_line)
+    ):
+        raise DocumentOperationError(
+            f"MULTI_EDIT_OVERLAP: lines {start_line}-{end_line} were already changed by an earlier edit"
+        )
+    return current_start + 1, current_start + length
+
+
+def _rebase_patch_hunk(origin: list[Optional[int]], snapshot_lines: int, hunk: Dict[str, Any]) -> str:
+    """Rewrite one snapshot-relative hunk so its header points at the current lines."""
+    match = _HUNK_HEADER.match(hunk["header"])
+    old_start, new_start = int(match.group(1)), int(match.group(3))
+    old_count = sum(1 for line in hunk["lines"] if line[:1] in (" ", "-"))
+    new_count = sum(1 for line in hunk["lines"] if line[:1] in (" ", "+"))
+    target = old_start - 1
+    if old_count:
+        current_start, _ = _rebase_line_range(origin, snapshot_lines, old_start, old_start + old_count - 1)
+        current = current_start - 1
+    elif target >= snapshot_lines:
+        current = len(origin)
+    else:
+        current = next((index for index, snapshot in enumerate(origin) if snapshot == target), None)
+        if current is None:
+            raise DocumentOperationError(
+                f"MULTI_EDIT_OVERLAP: insertion point line {old_start} was already changed by an earlier edit"
+            )
+    shift = current - target
+    header = _format_hunk_header(old_start + shift, old_count, new_start + shift, new_count)
+    return "\n".join([header, *hunk["lines"]]) + "\n"
+
+
+def _mark_changed_lines(origin: list[Optional[int]], old_lines: list[str], new_lines: list[str]) -> None:
+    """Record that the lines differing between old_lines and new_lines no longer come from the snapshot."""
+    start, old_end, new_end = _changed_line_span(old_lines, new_lines)
+    origin[start:old_end] = [None] * (new_end - start)
+
+
+def _apply_multi_edit(
+    original_text: str,
+    edits: Any,
+    *,
+    allow_append: bool = False,
+    cached_doc: Optional[CachedDocument] = None,
+) -> tuple[str, list[Dict[str, Any]]]:
+    """Apply an ordered list of edits to one snapshot of `original_text`.
+
+    Line numbers in replace_range edits and apply_patch hunk headers refer to
+    the snapshot and are rebased past lines that earlier edits inserted or
+    removed; an edit that targets lines an earlier edit already rewrote is
+    rejected rather than guessed at.
+    """
+    if not isinstance(edits, list) or not edits:
+        raise DocumentOperationError("MULTI_EDIT_REQUIRES_EDITS: provide metadata.edits as a non-empty list")
+
+    text = original_text
+    lines = text.splitlines(keepends=True)
+    snapshot_lines = len(lines)
+    origin: list[Optional[int]] = list(range(snapshot_lines))
+    applied: list[Dict[str, Any]] = []
+
+    for index, edit in enumerate(edits):
+        if not isinstance(edit, dict):
+            raise DocumentOperationError(f"MULTI_EDIT_INVALID: edit {index} is not an object")
+        edit_type = str(edit.get("type") or "").strip().lower()
+        if edit_type not in MULTI_EDIT_TYPES:
+            raise DocumentOperationError(
+                f"MULTI_EDIT_UNSUPPORTED: edit {index} has type '{edit_type}'; "
+                f"use one of {', '.join(sorted(MULTI_EDIT_TYPES))}"
+            )
+        try:
+            if edit_type == "replace_range":
+                start_line = edit.get("start_line")
+                end_line = edit.get("end_line")
+                if start_line is None or end_line is None:
+                    raise DocumentOperationError(
+                        "STRUCTURED_EDIT_RANGE_REQUIRED: start_line and end_line are required"
+                    )
+                start_line, end_line = _rebase_line_range(origin, snapshot_lines, int(start_line), int(end_line))
+                structure: Dict[str, Any] = {}
+                if cached_doc is not None and text is original_text and cached_doc.body is original_text:
+                    structure = {"headers": cached_doc.headers, "line_offsets": cached_doc.line_offsets}
+                updated = _replace_range_text(text, start_line, end_line, str(edit.get("content", "")), **structure)
+            elif edit_type == "status_update":
+                section = str(edit.get("section") or "").strip() or None
+                updated = _toggle_checklist_status(text, section, edit)
+            elif edit_type == "replace_text":
+                updated, _details = _replace_text_from_spec(text, edit)
+            elif edit_type == "apply_patch":
+                patch_text = edit.get("patch")
+                if not isinstance(patch_text, str) or not patch_text.strip():
+                    raise DocumentOperationError("PATCH_MODE_UNIFIED_REQUIRES_PATCH: provide patch content")
+                # Hunks go in one at a time so lines between them keep their snapshot origin
+                updated = text
+                for hunk in _parse_patch_hunks(patch_text)[1]:
+                    patched, _count = _apply_unified_patch(updated, _rebase_patch_hunk(origin, snapshot_lines, hunk))
+                    _mark_changed_lines(origin, updated.splitlines(keepends=True), patched.splitlines(keepends=True))
+                    updated = patched
+            else:
+                updated = _apply_structured_edit(text, edit, allow_append=allow_append)
+        except DocumentOperationError as exc:
+            raise DocumentOperationError(
+                f"MULTI_EDIT_FAILED: edit {index} ({edit_type}): {exc}",
+                extra={**exc.extra, "failed_edit_index": index, "edits_applied": len(applied)},
+            )
+
+        new_lines = updated.splitlines(keepends=True)
+        if edit_type != "apply_patch":
+            _mark_changed_lines(origin, lines, new_lines)
+        applied.append({"index": index, "type": edit_type, "line_delta": len(new_lines) - len(lines)})
+        text, lines = updated, new_lines
+
+    return text, applied
+
+
+def _toggle_checklist_status(
+    text: str,
+    section: Optional[str],
+    metadata: Dict[str, Any],
+    *,
+    anchor_lines: Optional[list[tuple[int, str]]] = None,
+) -> str:
     desired_raw = metadata.get("status")
     desired = desired_raw.lower().strip() if isinstance(desired_raw, str) else None
     proof = metadata.get("proof")
@@ -1908,17 +2162,20 @@ def _toggle_checklist_status(text: str, section: Optional[str], metadata: Dict[s
     section_end_idx: int = len(lines)
 
     if section_marker:
-        for idx, line in enumerate(lines):
-            if line.strip() == section_marker:
-                section_start_idx = idx
+        if anchor_lines is None:
+            anchor_lines = [
+                (idx, stripped)
+                for idx, line in enumerate(lines)
+                if (stripped := line.strip()).startswith("<!-- ID:")
+            ]
+        for idx, stripped in anchor_lines:
+            if section_start_idx is None:
+                if stripped == section_marker:
+                    section_start_idx = idx
+            elif stripped != section_marker:
+                section_end_idx = idx
                 break
-        if section_start_idx is not None:
-            for idx in range(section_start_idx + 1, len(lines)):
-                stripped = lines[idx].strip()
-                if stripped.startswith("<!-- ID:") and stripped != section_marker:
-                    section_end_idx = idx
-                    break
-        else:
+        if section_start_idx is None:
             # Auto-heal missing anchor: append new section with checklist entry.
             doc_logger.warning(
                 "Checklist section anchor '%s' missing; creating new block.",
@@ -2253,7 +2510,7 @@ def _validate_and_correct_inputs(
             "type": str,
             "required": True,
             "allowed_values": {"replace_section", "append", "status_update", "list_sections", "batch",
-                             "apply_patch", "replace_range", "replace_text", "normalize_headers", "generate_toc", "create_doc", "validate_crosslinks",
+                             "multi_edit", "apply_patch", "replace_range", "replace_text", "normalize_headers", "generate_toc", "create_doc", "validate_crosslinks",
                              "search", "create_research_doc", "create_bug_report", "create_review_report", "create_agent_report_card"},
             "default": "append"
         },
@@ -2304,6 +2561,7 @@ def _validate_and_correct_inputs(
     # Special handling for different actions
     strict_doc_actions = {
         "apply_patch",
+        "multi_edit",
         "replace_range",
         "replace_text",
         "normalize_headers",
@@ -2367,7 +2625,7 @@ def _validate_and_correct_inputs(
         corrected_template = None
     else:
         # For other actions, ensure we have either content or template
-        if corrected_action in {"apply_patch", "replace_range", "replace_text", "normalize_headers", "generate_toc", "create_doc", "validate_crosslinks"}:
+        if corrected_action in {"apply_patch", "multi_edit", "replace_range", "replace_text", "normalize_headers", "generate_toc", "create_doc", "validate_crosslinks"}:
             if corrected_action == "apply_patch" and edit is not None:
                 if corrected_content in {"No message provided", "Empty message"}:
                     corrected_content = None
@@ -2383,8 +2641,42 @@ def _validate_and_correct_inputs(
     return corrected_doc, corrected_action, corrected_section, corrected_content, corrected_template, corrected_metadata
 
 
-async def _verify_file_write(file_path: Path, expected_content: str, expected_hash: str) -> bool:
-    """Verify that the file was written correctly."""
+def _should_deep_verify(metadata: Optional[Dict[str, Any]]) -> bool:
+    """Whether this write is verified by re-reading it rather than from its receipt.
+
+    Callers opt in with metadata.verify_write="deep"; SCRIBE_DOC_VERIFY_MODE=deep
+    makes it the default, and otherwise every Nth write is sampled.
+    """
+    if isinstance(metadata, dict):
+        requested = metadata.get("verify_write")
+        if requested is True or str(requested).strip().lower() == "deep":
+            return True
+    if settings.doc_verify_mode == "deep":
+        return True
+    sample_every = settings.doc_verify_sample_every
+    return bool(sample_every) and next(_VERIFIED_WRITES) % sample_every == 0
+
+
+async def _verify_file_write(
+    file_path: Path,
+    expected_content: str,
+    expected_hash: str,
+    *,
+    receipt: Optional[WriteReceipt] = None,
+    deep: bool = True,
+) -> bool:
+    """Verify that the file was written correctly.
+
+    With a write receipt and `deep` unset, this is a cheap check: the file
+    must still be the written inode at the written size. The content is not
+    read back or re-hashed; that only happens on the deep path.
+    """
+    if receipt is not None and not deep:
+        if not await asyncio.to_thread(receipt.matches_disk):
+            doc_logger.error(f"File {file_path} no longer matches the written inode/size")
+            return False
+        return True
+
     try:
         # Check if file exists
         if not file_path.exists():
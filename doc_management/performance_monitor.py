@@ -6,14 +6,40 @@ import asyncio
 import json
 import logging
 import time
+from bisect import bisect_right, insort
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Deque, Dict, List, Optional, Callable, Tuple
 
 from scribe_mcp.storage.base import StorageBackend
 from scribe_mcp.utils.time import utcnow
 
+# Most recent samples kept per operation; counts, averages and extremes
+# cover these samples within the retention window
+OPERATION_SAMPLE_WINDOW = 1024
+
+# Most recent errors and custom metrics kept in memory
+ERROR_SAMPLE_WINDOW = 64
+CUSTOM_METRIC_WINDOW = 1024
+
+# Seconds between bulk writes of buffered metrics
+METRIC_FLUSH_INTERVAL = 5.0
+
+# Buffered metric rows kept while the database is unreachable
+METRIC_BUFFER_MAX = 10000
+
+# Quantiles tracked for operation durations, streamed over every sample since
+# the operation was first seen (or last dropped by retention cleanup)
+DURATION_QUANTILES = (0.5, 0.95, 0.99)
+
+# The performance_metrics table only accepts its fixed categories, so the
+# monitor's own source is recorded in the row metadata instead
+METRIC_CATEGORY = "operations"
+
+MetricRow = Tuple[str, str, float, str, Dict[str, Any]]
+
 
 @dataclass
 class PerformanceMetric:
@@ -39,6 +65,9 @@ class OperationMetrics:
     last_operation_time: Optional[datetime]
     error_rate: float
     throughput: float  # operations per second
+    p50_duration: float = 0.0
+    p95_duration: float = 0.0
+    p99_duration: float = 0.0
 
 
 @dataclass
@@ -54,6 +83,66 @@ class SystemMetrics:
     database_connections: int = 0
 
 
+class StreamingQuantile:
+    """Constant-space running estimate of one quantile (the P-squared algorithm)."""
+
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        heights = self._heights
+        if not heights:
+            return 0.0
+        if len(heights) < 5:
+            return heights[round(self.quantile * (len(heights) - 1))]
+        return heights[2]
+
+
 class PerformanceMonitor:
     """Comprehensive performance monitoring for document management operations."""
 
@@ -73,13 +162,20 @@ class PerformanceMonitor:
         self._is_collecting = False
         self._collection_task: Optional[asyncio.Task] = None
 
-        # Performance tracking
-        self._operation_metrics: Dict[str, List[float]] = {}
-        self._operation_errors: Dict[str, List[Exception]] = {}
-        self._operation_times: Dict[str, List[float]] = {}          # durations (s)
-        self._operation_end_times: Dict[str, List[float]] = {}       # epoch seconds
+        # Performance tracking: ring buffers of recent samples plus running totals
+        self._operation_metrics: Dict[str, Deque[float]] = {}
+        self._operation_errors: Dict[str, Deque[Exception]] = {}
+        self._operation_times: Dict[str, Deque[float]] = {}          # durations (s)
+        self._operation_end_times: Dict[str, Deque[float]] = {}       # epoch seconds
+        self._operation_quantiles: Dict[str, Dict[float, StreamingQuantile]] = {}
         self._active_operations: Dict[str, float] = {}
-        self._custom_metrics: List[PerformanceMetric] = []
+        self._custom_metrics: Deque[PerformanceMetric] = deque(maxlen=CUSTOM_METRIC_WINDOW)
+
+        # Metric rows waiting for the next bulk write
+        self._pending_metrics: Deque[MetricRow] = deque(maxlen=METRIC_BUFFER_MAX)
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flush_interval = METRIC_FLUSH_INTERVAL
+        self._project_id: Optional[int] = None
 
         # Callbacks for custom metrics
         self._metric_callbacks: List[Callable[[], List[PerformanceMetric]]] = []
@@ -101,7 +197,16 @@ class PerformanceMonitor:
             return False
 
     async def stop_collection(self):
-        """Stop metrics collection."""
+        """Stop metrics collection and write out any buffered metrics."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush_metrics()
+
         if not self._is_collecting:
             return
 
@@ -145,71 +250,76 @@ class PerformanceMonitor:
         start_time = self._active_operations.pop(operation_id)
         duration = end_time - start_time
 
-        # Record duration + end timestamp
+        # Record duration, end timestamp and success in aligned ring buffers
         if operation_name not in self._operation_times:
-            self._operation_times[operation_name] = []
+            self._operation_times[operation_name] = deque(maxlen=OPERATION_SAMPLE_WINDOW)
+            self._operation_end_times[operation_name] = deque(maxlen=OPERATION_SAMPLE_WINDOW)
+            self._operation_metrics[operation_name] = deque(maxlen=OPERATION_SAMPLE_WINDOW)
+            self._operation_quantiles[operation_name] = {q: StreamingQuantile(q) for q in DURATION_QUANTILES}
         self._operation_times[operation_name].append(duration)
-
-        if operation_name not in self._operation_end_times:
-            self._operation_end_times[operation_name] = []
         self._operation_end_times[operation_name].append(end_time)
-
-        # Record success/failure
-        if operation_name not in self._operation_metrics:
-            self._operation_metrics[operation_name] = []
         self._operation_metrics[operation_name].append(1.0 if success else 0.0)
+        for sketch in self._operation_quantiles[operation_name].values():
+            sketch.add(duration)
 
         # Record errors
         if not success and error:
             if operation_name not in self._operation_errors:
-                self._operation_errors[operation_name] = []
+                self._operation_errors[operation_name] = deque(maxlen=ERROR_SAMPLE_WINDOW)
             self._operation_errors[operation_name].append(error)
 
-        # Store in database periodically
-        asyncio.create_task(self._store_operation_metric(
-            operation_name, duration, success, metadata
-        ))
+        # Queue for the next bulk write
+        metric_metadata = {"source": "document_management", **(metadata or {})}
+        self._queue_metric(f"{operation_name}_duration", duration, "seconds", metric_metadata)
+        if success:
+            self._queue_metric(f"{operation_name}_success", 1.0, "boolean", metric_metadata)
 
         self._logger.debug(f"Completed operation: {operation_name} in {duration:.3f}s")
 
-    async def _store_operation_metric(
-        self,
-        operation_name: str,
-        duration: float,
-        success: bool,
-        metadata: Optional[Dict[str, Any]]
-    ):
-        """Store operation metric in database."""
+    def _queue_metric(self, name: str, value: float, unit: str, metadata: Dict[str, Any]) -> None:
+        """Buffer a metric row and make sure the flush task is running."""
+        self._pending_metrics.append((METRIC_CATEGORY, name, value, unit, metadata))
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+            except RuntimeError:
+                # No event loop yet; the rows go out with the next flush
+                pass
+
+    async def _flush_loop(self):
+        """Write buffered metrics every flush_interval until the buffer drains."""
+        while self._pending_metrics:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_metrics()
+
+    async def flush_metrics(self) -> int:
+        """Write all buffered metrics in one batch; returns the number stored."""
+        if not self._pending_metrics:
+            return 0
+        rows = list(self._pending_metrics)
+        self._pending_metrics.clear()
         try:
-            # Store in performance_metrics table
-            await self.storage.store_performance_metric(
+            await self.storage.store_performance_metrics(
                 project_id=await self._get_project_id(),
-                metric_category="document_management",
-                metric_name=f"{operation_name}_duration",
-                metric_value=duration,
-                metric_unit="seconds",
-                metadata=metadata or {}
+                metrics=rows
             )
-
-            if success:
-                await self.storage.store_performance_metric(
-                    project_id=await self._get_project_id(),
-                    metric_category="document_management",
-                    metric_name=f"{operation_name}_success",
-                    metric_value=1.0,
-                    metric_unit="boolean",
-                    metadata=metadata or {}
-                )
-
+            return len(rows)
         except Exception as e:
-            self._logger.debug(f"Failed to store operation metric: {e}")
+            # Put the rows back ahead of anything queued meanwhile; maxlen still bounds the buffer
+            self._pending_metrics.extendleft(reversed(rows))
+            self._logger.warning(f"Failed to store {len(rows)} performance metrics, will retry: {e}")
+            return 0
 
     async def _get_project_id(self) -> int:
         """Get project ID for metrics storage."""
+        if self._project_id is not None:
+            return self._project_id
+
         try:
             project = await self.storage.fetch_project(self.project_root.name)
             if project:
-                return project.id
+                self._project_id = project.id
+                return self._project_id
         except Exception:
             pass
 
@@ -219,35 +329,25 @@ class PerformanceMonitor:
             repo_root=str(self.project_root),
             progress_log_path=str(self.project_root / "PROGRESS_LOG.md")
         )
-        return project.id
+        self._project_id = project.id
+        return self._project_id
 
     def add_custom_metric(self, metric: PerformanceMetric):
         """Add a custom performance metric."""
         self._custom_metrics.append(metric)
 
-        # Store in database asynchronously
-        asyncio.create_task(self._store_custom_metric(metric))
-
-    async def _store_custom_metric(self, metric: PerformanceMetric):
-        """Store custom metric in database."""
-        try:
-            await self.storage.store_performance_metric(
-                project_id=await self._get_project_id(),
-                metric_category="custom",
-                metric_name=metric.name,
-                metric_value=metric.value,
-                metric_unit=metric.unit,
-                metadata=metric.metadata
-            )
-        except Exception as e:
-            self._logger.debug(f"Failed to store custom metric: {e}")
+        self._queue_metric(metric.name, metric.value, metric.unit, {"source": "custom", **metric.metadata})
 
     def register_metric_callback(self, callback: Callable[[], List[PerformanceMetric]]):
         """Register a callback for collecting custom metrics."""
         self._metric_callbacks.append(callback)
 
     async def get_operation_metrics(self, operation_name: Optional[str] = None) -> Dict[str, OperationMetrics]:
-        """Get metrics for operations."""
+        """Get metrics for operations over their retained samples.
+
+        Counts, rates, averages and extremes cover the ring buffers after
+        retention cleanup; quantiles come from the streaming sketches.
+        """
         metrics = {}
 
         operations = [operation_name] if operation_name else list(self._operation_times.keys())
@@ -257,19 +357,19 @@ class PerformanceMonitor:
                 continue
 
             durations = self._operation_times[op_name]
-            ends = self._operation_end_times.get(op_name, [])
-            successes = self._operation_metrics.get(op_name, [])
+            ends = self._operation_end_times.get(op_name, ())
+            successes = self._operation_metrics.get(op_name, ())
+            quantiles = self._operation_quantiles.get(op_name, {})
 
             if not durations:
                 continue
 
             total_ops = len(durations)
-            successful_ops = sum(successes)
+            successful_ops = int(sum(successes))
             failed_ops = total_ops - successful_ops
 
-            avg = sum(durations) / len(durations)
             total = sum(durations)
-            window = (max(ends) - min(ends)) if len(ends) > 1 else sum(durations)
+            window = (ends[-1] - ends[0]) if len(ends) > 1 else total
             tp = (total_ops / window) if window > 0 else 0.0
 
             metrics[op_name] = OperationMetrics(
@@ -277,13 +377,16 @@ class PerformanceMonitor:
                 total_operations=total_ops,
                 successful_operations=successful_ops,
                 failed_operations=failed_ops,
-                average_duration=avg,
+                average_duration=total / total_ops,
                 min_duration=min(durations),
                 max_duration=max(durations),
                 total_duration=total,
-                last_operation_time=datetime.fromtimestamp(max(ends)) if ends else None,
-                error_rate=failed_ops / total_ops if total_ops > 0 else 0.0,
-                throughput=tp
+                last_operation_time=datetime.fromtimestamp(ends[-1]) if ends else None,
+                error_rate=failed_ops / total_ops,
+                throughput=tp,
+                p50_duration=quantiles[0.5].value() if 0.5 in quantiles else 0.0,
+                p95_duration=quantiles[0.95].value() if 0.95 in quantiles else 0.0,
+                p99_duration=quantiles[0.99].value() if 0.99 in quantiles else 0.0
             )
 
         return metrics
@@ -387,6 +490,9 @@ class PerformanceMonitor:
                     name: {
                         'total_operations': m.total_operations,
                         'average_duration': m.average_duration,
+                        'p50_duration': m.p50_duration,
+                        'p95_duration': m.p95_duration,
+                        'p99_duration': m.p99_duration,
                         'error_rate': m.error_rate,
                         'throughput': m.throughput
                     }
@@ -427,31 +533,24 @@ class PerformanceMonitor:
         """Clean up old metrics to prevent memory buildup."""
         cutoff_time = time.time() - (self.metrics_retention_hours * 3600)
 
-        # Clean up using **end timestamps**, keep aligned durations by index
+        # Drop samples by end timestamp; the three buffers stay aligned by index
         for op_name in list(self._operation_end_times.keys()):
             ends = self._operation_end_times[op_name]
-            durs = self._operation_times.get(op_name, [])
-            keep = [i for i, ts in enumerate(ends) if ts >= cutoff_time]
-            self._operation_end_times[op_name] = [ends[i] for i in keep]
-            self._operation_times[op_name] = [durs[i] for i in keep] if durs else []
-            if not self._operation_end_times[op_name]:
-                self._operation_end_times.pop(op_name, None)
-                self._operation_times.pop(op_name, None)
-
-        # Clean up operation success/failure vectors to match remaining samples
-        for op_name in list(self._operation_metrics.keys()):
-            if op_name not in self._operation_times:
-                self._operation_metrics.pop(op_name, None)
-                continue
-            keep_count = len(self._operation_times[op_name])
-            self._operation_metrics[op_name] = self._operation_metrics[op_name][-keep_count:]
+            durations = self._operation_times[op_name]
+            successes = self._operation_metrics[op_name]
+            while ends and ends[0] < cutoff_time:
+                ends.popleft()
+                durations.popleft()
+                successes.popleft()
+            if not ends:
+                for samples in (self._operation_end_times, self._operation_times,
+                                self._operation_metrics, self._operation_quantiles, self._operation_errors):
+                    samples.pop(op_name, None)
 
         # Clean up custom metrics
         cutoff_datetime = datetime.fromtimestamp(cutoff_time)
-        self._custom_metrics = [
-            m for m in self._custom_metrics
-            if m.timestamp > cutoff_datetime
-        ]
+        while self._custom_metrics and self._custom_metrics[0].timestamp <= cutoff_datetime:
+            self._custom_metrics.popleft()
 
     def reset_metrics(self):
         """Reset all collected metrics."""
@@ -459,6 +558,7 @@ class PerformanceMonitor:
         self._operation_errors.clear()
         self._operation_times.clear()
         self._operation_end_times.clear()
+        self._operation_quantiles.clear()
         self._custom_metrics.clear()
         self._active_operations.clear()
 
@@ -498,6 +598,9 @@ class PerformanceMonitor:
                     safe_name = op_name.replace(" ", "_").replace("-", "_").lower()
                     lines.extend([
                         f"scribe_operation_duration_seconds{{operation=\"{op_name}\"}} {metrics.average_duration}",
+                        f"scribe_operation_duration_seconds{{operation=\"{op_name}\",quantile=\"0.5\"}} {metrics.p50_duration}",
+                        f"scribe_operation_duration_seconds{{operation=\"{op_name}\",quantile=\"0.95\"}} {metrics.p95_duration}",
+                        f"scribe_operation_duration_seconds{{operation=\"{op_name}\",quantile=\"0.99\"}} {metrics.p99_duration}",
                         f"scribe_operations_total{{operation=\"{op_name}\"}} {metrics.total_operations}",
                         f"scribe_operation_errors_total{{operation=\"{op_name}\"}} {metrics.failed_operations}",
                         f"scribe_operation_error_rate{{operation=\"{op_name}\"}} {metrics.error_rate}"
@@ -6,16 +6,28 @@ import asyncio
 import hashlib
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from scribe_mcp.storage.base import StorageBackend
 from scribe_mcp.utils.time import utcnow
+from scribe_mcp.doc_management.doc_cache import document_cache
 from scribe_mcp.doc_management.file_watcher import FileChangeEvent, FileSystemWatcher
+from scribe_mcp.utils.repo_files import get_repo_file_index
+
+
+# Files read concurrently while syncing a batch
+DEFAULT_MAX_CONCURRENT_READS = 8
+
+# Paths per IN (...) lookup, below SQLite's bound-parameter limit
+DB_STATE_CHUNK_SIZE = 500
+
+DOCUMENT_EXTENSIONS = ('.md', '.txt', '.json')
 
 
 class ConflictResolution(Enum):
@@ -62,21 +74,30 @@ class SyncManager:
         project_root: Path,
         conflict_resolution: ConflictResolution = ConflictResolution.LATEST_WINS,
         sync_interval: float = 5.0,
-        enable_watcher: bool = True
+        enable_watcher: bool = True,
+        max_concurrent_reads: int = DEFAULT_MAX_CONCURRENT_READS,
     ):
         self.storage = storage
         self.project_root = Path(project_root)
         self.conflict_resolution = conflict_resolution
         self.sync_interval = sync_interval
         self.enable_watcher = enable_watcher
+        self.max_concurrent_reads = max(1, max_concurrent_reads)
 
         self._logger = logging.getLogger(__name__)
         self._is_running = False
         self._watcher: Optional[FileSystemWatcher] = None
         self._sync_task: Optional[asyncio.Task] = None
-        self._pending_syncs: Dict[str, asyncio.Event] = {}
+        # path -> time.time() of the first change not yet synced; watchdog
+        # delivers changes from its own thread, hence the threading lock
+        self._pending_syncs: Dict[str, float] = {}
+        self._pending_lock = threading.Lock()
         self._sync_lock = asyncio.Lock()
 
+        # Seconds from first detected change to sync, per file
+        self._sync_lag: Dict[str, float] = {}
+        self._sync_lag_samples = 0
+
         # Performance tracking
         self._sync_stats = {
             'operations_total': 0,
@@ -84,7 +105,10 @@ class SyncManager:
             'conflicts_detected': 0,
             'conflicts_resolved': 0,
             'average_sync_time': 0.0,
-            'last_sync_time': None
+            'last_sync_time': None,
+            'batches_total': 0,
+            'average_sync_lag': 0.0,
+            'max_sync_lag': 0.0,
         }
 
     async def start(self) -> bool:
@@ -142,7 +166,8 @@ class SyncManager:
             self._watcher = FileSystemWatcher(
                 project_root=self.project_root,
                 change_callback=self._handle_file_change,
-                debounce_seconds=1.0
+                debounce_seconds=1.0,
+                batch_callback=self._handle_file_changes,
             )
 
             return await self._watcher.start()
@@ -153,16 +178,30 @@ class SyncManager:
 
     def _handle_file_change(self, change_event: FileChangeEvent):
         """Handle file system change events."""
+        self._handle_file_changes([change_event])
+
+    def _handle_file_changes(self, change_events: List[FileChangeEvent]):
+        """Queue a batch of changes; each path is synced at most once per tick."""
+        for change_event in change_events:
+            self._note_file_change(change_event)
+
+    def _note_file_change(self, change_event: FileChangeEvent):
         try:
             self._logger.debug(f"File change detected: {change_event.file_path} ({change_event.event_type})")
 
-            # Trigger sync for the changed file
-            file_path_str = str(change_event.file_path)
-            if file_path_str not in self._pending_syncs:
-                self._pending_syncs[file_path_str] = asyncio.Event()
+            # External edits invalidate the parsed copy manage_docs works from
+            document_cache.invalidate(change_event.file_path)
+
+            # Keep the shared file-presence index current between mtime sweeps
+            get_repo_file_index(self.project_root).note_change(
+                change_event.file_path,
+                change_event.event_type,
+                change_event.metadata.get('dest_path'),
+            )
 
-            # Signal that sync is needed
-            self._pending_syncs[file_path_str].set()
+            # Queue the changed file, keeping the earliest change time for lag
+            with self._pending_lock:
+                self._pending_syncs.setdefault(str(change_event.file_path), change_event.timestamp)
 
         except Exception as e:
             self._logger.error(f"Error handling file change: {e}")
@@ -181,132 +220,187 @@ class SyncManager:
                 await asyncio.sleep(self.sync_interval)
 
     async def _process_pending_syncs(self):
-        """Process all pending sync operations."""
+        """Sync every queued file once, as a single batch."""
         if not self._pending_syncs:
             return
 
         async with self._sync_lock:
-            # Snapshot keys to avoid mutating while iterating
-            for file_path_str, event in list(self._pending_syncs.items()):
-                if not event.is_set():
-                    continue
-                event.clear()
-                self._pending_syncs.pop(file_path_str, None)
-                await self._sync_file(Path(file_path_str))
+            with self._pending_lock:
+                pending = self._pending_syncs
+                self._pending_syncs = {}
+            await self._sync_files([Path(p) for p in pending], changed_at=pending)
 
     async def _sync_file(self, file_path: Path) -> SyncOperation:
         """Sync a specific file between file system and database."""
-        start_time = time.time()
+        return (await self._sync_files([file_path]))[0]
+
+    async def _read_for_sync(
+        self, file_path: Path, semaphore: asyncio.Semaphore
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """(content, skip reason) for a file, reading under `semaphore`."""
+        if file_path.suffix.lower() not in DOCUMENT_EXTENSIONS:
+            return None, "non-document"
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(file_path.read_text, encoding='utf-8'), None
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                return None, "missing"
 
-        operation = SyncOperation(
-            operation_type='sync_to_db',
-            file_path=file_path,
-            metadata={'start_time': start_time}
+    async def _sync_files(
+        self,
+        file_paths: List[Path],
+        changed_at: Optional[Dict[str, float]] = None,
+    ) -> List[SyncOperation]:
+        """Sync files between file system and database in one batch.
+
+        Contents are read with bounded concurrency, database state for all
+        paths is fetched together, and every resulting write is committed in
+        a single transaction. Returns one operation per input path.
+        """
+        start_time = time.time()
+        operations = [
+            SyncOperation(operation_type='sync_to_db', file_path=path, metadata={'start_time': start_time})
+            for path in file_paths
+        ]
+        if not operations:
+            return operations
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_reads)
+        reads = await asyncio.gather(
+            *(self._read_for_sync(path, semaphore) for path in file_paths),
+            return_exceptions=True,
         )
 
-        try:
-            # Check if file exists and is a document we should track
-            if not file_path.exists() or not file_path.is_file():
-                self._logger.debug(f"Skipping non-existent or non-file: {file_path}")
-                operation.success = True
-                return operation
-
-            # Check file extension
-            if file_path.suffix.lower() not in ['.md', '.txt', '.json']:
-                self._logger.debug(f"Skipping non-document file: {file_path}")
+        readable: List[Tuple[SyncOperation, str]] = []
+        for operation, read in zip(operations, reads):
+            if isinstance(read, BaseException):
+                self._logger.error(f"Error syncing file {operation.file_path}: {read}")
+                operation.error_message = str(read)
+                continue
+            content, skip_reason = read
+            if skip_reason is not None:
+                self._logger.debug(f"Skipping {skip_reason} file: {operation.file_path}")
                 operation.success = True
-                return operation
-
-            # Read current file content off the loop
-            file_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+                continue
+            operation.checksum_before = self._calculate_checksum(content)
+            readable.append((operation, content))
 
-            # Calculate checksum off the loop
-            file_checksum = await asyncio.to_thread(self._calculate_checksum, file_content)
-            operation.checksum_before = file_checksum
+        db_states = await self._get_database_states(op.file_path for op, _ in readable)
 
-            # Get database state for this file
-            db_state = await self._get_database_state(file_path)
-
-            # Check for conflicts
-            conflict = await self._detect_conflict(file_path, file_content, db_state)
-
-            if conflict:
-                operation.operation_type = 'resolve_conflict'
-                self._sync_stats['conflicts_detected'] += 1
-
-                resolved_content = await self._resolve_conflict(conflict)
-                if resolved_content is not None:
-                    # Update database with resolved content
-                    await self._update_database_record(file_path, resolved_content)
-                    operation.success = True
+        records: List[Tuple[Path, str]] = []
+        to_commit: List[SyncOperation] = []
+        for operation, file_content in readable:
+            try:
+                db_state = db_states.get(str(operation.file_path))
+                conflict = await self._detect_conflict(operation.file_path, file_content, db_state)
+
+                if conflict:
+                    operation.operation_type = 'resolve_conflict'
+                    self._sync_stats['conflicts_detected'] += 1
+
+                    resolved_content = await self._resolve_conflict(conflict)
+                    if resolved_content is None:
+                        operation.error_message = "Failed to resolve conflict"
+                        continue
+                    records.append((operation.file_path, resolved_content))
                     operation.checksum_after = self._calculate_checksum(resolved_content)
-                    self._sync_stats['conflicts_resolved'] += 1
+                    operation.metadata['conflict_resolved'] = True
                 else:
-                    operation.success = False
-                    operation.error_message = "Failed to resolve conflict"
-            else:
-                # No conflict, sync to database
-                await self._update_database_record(file_path, file_content)
-                operation.success = True
-                operation.checksum_after = file_checksum
+                    # No conflict, sync to database
+                    records.append((operation.file_path, file_content))
+                    operation.checksum_after = operation.checksum_before
+                to_commit.append(operation)
+            except Exception as e:
+                self._logger.error(f"Error syncing file {operation.file_path}: {e}")
+                operation.error_message = str(e)
 
-        except Exception as e:
-            self._logger.error(f"Error syncing file {file_path}: {e}")
-            operation.success = False
-            operation.error_message = str(e)
+        if records:
+            try:
+                await self._update_database_records(records)
+            except Exception as e:
+                for operation in to_commit:
+                    operation.error_message = str(e)
+                to_commit = []
+        for operation in to_commit:
+            operation.success = True
+            if operation.metadata.pop('conflict_resolved', False):
+                self._sync_stats['conflicts_resolved'] += 1
 
         # Update statistics
-        self._update_sync_stats(operation, time.time() - start_time)
+        finished = time.time()
+        self._sync_stats['batches_total'] += 1
+        share = (finished - start_time) / len(operations)
+        for operation in operations:
+            self._update_sync_stats(operation, share)
+            if changed_at and operation.success:
+                first_change = changed_at.get(str(operation.file_path))
+                if first_change is not None:
+                    self._record_sync_lag(str(operation.file_path), finished - first_change)
 
-        return operation
+        return operations
 
     async def _get_database_state(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Get the current database state for a file."""
-        try:
-            # Try to get from sync_status table first
-            query = """
-                SELECT last_file_hash, last_db_hash, last_sync_at, sync_status
-                FROM sync_status
-                WHERE file_path = ? AND project_root = ?
-                ORDER BY updated_at DESC
-                LIMIT 1
-            """
-
-            # Use the existing query method from storage backend
-            results = await self.storage._fetchall(query, (str(file_path), str(self.project_root)))
-
-            if results:
-                row = results[0]
-                return {
-                    'file_hash': row['last_file_hash'],
-                    'db_hash': row['last_db_hash'],
-                    'last_sync': row['last_sync_at'],
-                    'sync_status': row['sync_status']
-                }
+        return (await self._get_database_states([file_path])).get(str(file_path))
 
-            # If no sync status, try document_sections
-            query = """
-                SELECT content, updated_at, file_hash
-                FROM document_sections
-                WHERE file_path = ? AND project_root = ?
-                ORDER BY updated_at DESC
-                LIMIT 1
-            """
-
-            results = await self.storage._fetchall(query, (str(file_path), str(self.project_root)))
-
-            if results:
-                row = results[0]
-                return {
-                    'content': row['content'],
-                    'timestamp': row['updated_at'],
-                    'checksum': row['file_hash']
-                }
+    async def _get_database_states(self, file_paths: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+        """Current database state for many files, keyed by path string.
+
+        sync_status rows take precedence; files without one fall back to their
+        document_sections row. Files with neither are absent from the result.
+        """
+        paths = list(dict.fromkeys(str(p) for p in file_paths))
+        states: Dict[str, Dict[str, Any]] = {}
+        if not paths:
+            return states
+
+        try:
+            for chunk_start in range(0, len(paths), DB_STATE_CHUNK_SIZE):
+                chunk = paths[chunk_start:chunk_start + DB_STATE_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                # Try to get from sync_status table first
+                rows = await self.storage._fetchall(
+                    f"""
+                    SELECT file_path, last_file_hash, last_db_hash, last_sync_at, sync_status
+                    FROM sync_status
+                    WHERE project_root = ? AND file_path IN ({placeholders})
+                    ORDER BY updated_at DESC
+                    """,
+                    (str(self.project_root), *chunk),
+                )
+                for row in rows or []:
+                    states.setdefault(row['file_path'], {
+                        'file_hash': row['last_file_hash'],
+                        'db_hash': row['last_db_hash'],
+                        'last_sync': row['last_sync_at'],
+                        'sync_status': row['sync_status']
+                    })
+
+                # If no sync status, try document_sections
+                missing = [path for path in chunk if path not in states]
+                if not missing:
+                    continue
+                placeholders = ", ".join("?" for _ in missing)
+                rows = await self.storage._fetchall(
+                    f"""
+                    SELECT file_path, content, updated_at, file_hash
+                    FROM document_sections
+                    WHERE project_root = ? AND file_path IN ({placeholders})
+                    ORDER BY updated_at DESC
+                    """,
+                    (str(self.project_root), *missing),
+                )
+                for row in rows or []:
+                    states.setdefault(row['file_path'], {
+                        'content': row['content'],
+                        'timestamp': row['updated_at'],
+                        'checksum': row['file_hash']
+                    })
 
         except Exception as e:
-            self._logger.debug(f"Error getting database state for {file_path}: {e}")
+            self._logger.debug(f"Error getting database state for {len(paths)} files: {e}")
 
-        return None
+        return states
 
     async def _detect_conflict(
         self,
@@ -402,33 +496,45 @@ class SyncManager:
 
     async def _update_database_record(self, file_path: Path, content: str):
         """Update the database record for a file."""
+        await self._update_database_records([(file_path, content)])
+
+    async def _update_database_records(self, records: List[Tuple[Path, str]]):
+        """Write document_sections and sync_status rows for many files in one transaction."""
         try:
             now = utcnow()
-            checksum = self._calculate_checksum(content)
-            relative_path = str(file_path.relative_to(self.project_root))
-
-            # Update document_sections table
-            await self.storage._execute(
-                """
-                INSERT OR REPLACE INTO document_sections
-                (project_root, file_path, relative_path, content, file_hash, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [str(self.project_root), str(file_path), relative_path, content, checksum, now, now]
-            )
-
-            # Update sync_status table
-            await self.storage._execute(
-                """
-                INSERT OR REPLACE INTO sync_status
-                (project_root, file_path, last_sync_at, last_file_hash, last_db_hash, sync_status, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [str(self.project_root), str(file_path), now, checksum, checksum, 'synced', now]
-            )
+            section_rows = []
+            status_rows = []
+            for file_path, content in records:
+                checksum = self._calculate_checksum(content)
+                relative_path = str(file_path.relative_to(self.project_root))
+                section_rows.append(
+                    (str(self.project_root), str(file_path), relative_path, content, checksum, now, now)
+                )
+                status_rows.append(
+                    (str(self.project_root), str(file_path), now, checksum, checksum, 'synced', now)
+                )
+
+            await self.storage._execute_batch([
+                (
+                    """
+                    INSERT OR REPLACE INTO document_sections
+                    (project_root, file_path, relative_path, content, file_hash, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    section_rows,
+                ),
+                (
+                    """
+                    INSERT OR REPLACE INTO sync_status
+                    (project_root, file_path, last_sync_at, last_file_hash, last_db_hash, sync_status, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    status_rows,
+                ),
+            ])
 
         except Exception as e:
-            self._logger.error(f"Error updating database record for {file_path}: {e}")
+            self._logger.error(f"Error updating database records for {len(records)} files: {e}")
             raise
 
     def _calculate_checksum(self, content: str) -> str:
@@ -447,16 +553,24 @@ class SyncManager:
         self._sync_stats['average_sync_time'] = total_time / self._sync_stats['operations_total']
         self._sync_stats['last_sync_time'] = time.time()
 
+    def _record_sync_lag(self, file_path: str, lag: float):
+        """Record the delay between a file's first detected change and its sync."""
+        self._sync_lag[file_path] = lag
+        self._sync_lag_samples += 1
+        average = self._sync_stats['average_sync_lag']
+        self._sync_stats['average_sync_lag'] = average + (lag - average) / self._sync_lag_samples
+        self._sync_stats['max_sync_lag'] = max(self._sync_stats['max_sync_lag'], lag)
+
     async def sync_all_files(self) -> List[SyncOperation]:
         """Manually trigger sync for all tracked files."""
-        operations = []
-
         # Find all document files
+        file_paths: List[Path] = []
         for pattern in ['**/*.md', '**/*.txt', '**/*.json']:
             for file_path in await asyncio.to_thread(lambda: list(self.project_root.glob(pattern))):
                 if file_path.is_file():
-                    operation = await self._sync_file(file_path)
-                    operations.append(operation)
+                    file_paths.append(file_path)
+
+        operations = await self._sync_files(file_paths)
 
         self._logger.info(f"Synced {len(operations)} files")
         return operations
@@ -470,6 +584,7 @@ class SyncManager:
             'conflict_resolution': self.conflict_resolution.value,
             'pending_syncs': len(self._pending_syncs),
             'statistics': self._sync_stats.copy(),
+            'sync_lag_seconds': dict(self._sync_lag),
             'last_sync': self._sync_stats.get('last_sync_time')
         }
 
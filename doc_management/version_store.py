@@ -0,0 +1,162 @@
+"""Content-addressed history of document versions.
+
+Every version is stored once, keyed by the SHA-256 of its text, in the
+``document_versions`` table. Most versions are zlib-compressed line deltas
+against the previous version of the same file. A full snapshot is written
+every ``SNAPSHOT_INTERVAL`` versions, or whenever the delta would not be
+smaller, so a read replays a short chain fetched with one recursive query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Union
+
+from scribe_mcp.doc_management.line_diff import diff_texts
+from scribe_mcp.storage.base import StorageBackend
+
+# Longest delta chain before a full snapshot is stored
+SNAPSHOT_INTERVAL = 16
+
+# Reconstructed texts kept in memory per store
+VERSION_CACHE_MAX = 64
+
+# A delta op copies base lines [start, end) or inserts literal text
+DeltaOp = Union[List[int], str]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compute_delta(base_text: str, new_text: str) -> List[DeltaOp]:
+    """Line-level delta that rebuilds `new_text` from `base_text`."""
+    diff = diff_texts(base_text, new_text)
+    ops: List[DeltaOp] = []
+    for tag, i1, i2, j1, j2 in diff.opcodes:
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(diff.new_lines[j1:j2]))
+    return ops
+
+
+def apply_delta(base_text: str, ops: Sequence[DeltaOp]) -> str:
+    base_lines = base_text.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_lines[op[0]:op[1]])
+    return "".join(parts)
+
+
+class DocumentVersionStore:
+    """Stores and reconstructs document versions by content hash."""
+
+    def __init__(self, storage: StorageBackend, project_root: Path):
+        self.storage = storage
+        self.project_root = Path(project_root)
+        self._texts: "OrderedDict[str, str]" = OrderedDict()
+        self._logger = logging.getLogger(__name__)
+
+    def _remember(self, digest: str, text: str) -> None:
+        self._texts[digest] = text
+        self._texts.move_to_end(digest)
+        while len(self._texts) > VERSION_CACHE_MAX:
+            self._texts.popitem(last=False)
+
+    async def _latest_for_file(self, file_path: Path) -> Optional[Any]:
+        return await self.storage._fetchone(
+            """
+            SELECT content_hash, depth FROM document_versions
+            WHERE project_root = ? AND file_path = ?
+            ORDER BY rowid DESC
+            LIMIT 1
+            """,
+            (str(self.project_root), str(file_path)),
+        )
+
+    async def put(self, file_path: Path, text: str) -> str:
+        """Record `text` as the newest version of `file_path`; returns its hash."""
+        digest = content_hash(text)
+        exists = await self.storage._fetchone(
+            "SELECT 1 FROM document_versions WHERE content_hash = ?", (digest,)
+        )
+        if exists:
+            self._remember(digest, text)
+            return digest
+
+        full_payload = zlib.compress(text.encode("utf-8"))
+        payload, base_hash, depth = full_payload, None, 0
+
+        latest = await self._latest_for_file(file_path)
+        if latest is not None and latest["depth"] + 1 < SNAPSHOT_INTERVAL:
+            base_text = await self.get(latest["content_hash"])
+            if base_text is not None:
+                delta = zlib.compress(
+                    json.dumps(compute_delta(base_text, text), separators=(",", ":")).encode("utf-8")
+                )
+                if len(delta) < len(full_payload):
+                    payload, base_hash, depth = delta, latest["content_hash"], latest["depth"] + 1
+
+        await self.storage._execute(
+            """
+            INSERT OR IGNORE INTO document_versions
+            (content_hash, project_root, file_path, base_hash, depth, size, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (digest, str(self.project_root), str(file_path), base_hash, depth, len(text), payload),
+        )
+        self._remember(digest, text)
+        return digest
+
+    async def get(self, digest: Optional[str]) -> Optional[str]:
+        """Text of the version with hash `digest`, or None if it was never stored."""
+        if not digest:
+            return None
+        cached = self._texts.get(digest)
+        if cached is not None:
+            self._texts.move_to_end(digest)
+            return cached
+
+        # The version and its bases down to the nearest snapshot, newest first
+        chain = await self.storage._fetchall(
+            """
+            WITH RECURSIVE chain(content_hash, base_hash, payload, depth) AS (
+                SELECT content_hash, base_hash, payload, depth
+                FROM document_versions WHERE content_hash = ?
+                UNION ALL
+                SELECT v.content_hash, v.base_hash, v.payload, v.depth
+                FROM document_versions v JOIN chain c ON v.content_hash = c.base_hash
+            )
+            SELECT content_hash, base_hash, payload FROM chain ORDER BY depth DESC
+            """,
+            (digest,),
+        )
+        if not chain or chain[-1]["base_hash"] is not None:
+            return None
+
+        # Start from the newest ancestor already in memory, if any
+        start = len(chain) - 1
+        text: Optional[str] = None
+        for index, row in enumerate(chain):
+            if row["content_hash"] in self._texts:
+                start, text = index, self._texts[row["content_hash"]]
+                break
+        if text is None:
+            text = zlib.decompress(chain[start]["payload"]).decode("utf-8")
+        for row in reversed(chain[:start]):
+            text = apply_delta(text, json.loads(zlib.decompress(row["payload"])))
+
+        if content_hash(text) != digest:
+            self._logger.error(f"Version {digest} failed its hash check after reconstruction")
+            return None
+        self._remember(digest, text)
+        return text
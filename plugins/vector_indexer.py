@@ -5,6 +5,11 @@ enabling semantic search capabilities while maintaining repository isolation.
 
 Features:
 - Background embedding generation with asyncio queue
+- Embedding inference on a thread or process pool, off the event loop
+- Deferred model/index loading with a background warm-up
+- Single writer per index; other processes memory-map it read-only
+- Optional per-project shards with parallel fan-out search
+- Optional compact encodings (fp16/int8 scalar quantization, PQ) with exact re-ranking
 - Repository-scoped FAISS index management
 - Deterministic UUID-based entry indexing
 - Graceful fallback when dependencies unavailable
@@ -13,28 +18,62 @@ Features:
 
 from __future__ import annotations
 
+import abc
 import asyncio
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import math
+import multiprocessing
+import os
+import re
 import sqlite3
 import time
+import unicodedata
+import zlib
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
+from functools import partial
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import threading
 
 # Vector processing imports (optional)
 try:
     import faiss
     import numpy as np
-    from sentence_transformers import SentenceTransformer
     FAISS_AVAILABLE = True
 except ImportError:
     FAISS_AVAILABLE = False
     faiss = None
     np = None
+
+# Transformer models are optional too; built-in embedding backends need only NumPy
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
     SentenceTransformer = None
 
+# Writer lease locking (same platform fallbacks as utils.files)
+try:
+    import msvcrt
+    HAS_WINDOWS_LOCK = True
+except ImportError:
+    HAS_WINDOWS_LOCK = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 from scribe_mcp.plugins.registry import HookPlugin
 from scribe_mcp.config.repo_config import RepoConfig
 from scribe_mcp.config.settings import settings
@@ -45,6 +84,232 @@ from scribe_mcp.utils.time import utcnow
 # Setup logging
 plugin_logger = logging.getLogger(__name__)
 
+ENCODE_EXECUTORS = ("thread", "process", "inline")
+
+# How this process may touch the persisted index; readers re-try the writer lease periodically.
+INDEX_ACCESS_MODES = ("auto", "writer", "reader")
+WRITER_LEASE_RETRY_SECONDS = 5.0
+
+# Compact encodings and the FAISS index type each one produces.
+COMPRESSION_INDEX_TYPES = {
+    "none": "IndexFlatIP",
+    "fp16": "IndexScalarQuantizer:fp16",
+    "int8": "IndexScalarQuantizer:int8",
+    "pq": "IndexPQ",
+}
+
+# Filter keys that can be resolved to candidate rowids with an indexed SQL query.
+PREFILTER_KEYS = {
+    'project_slug', 'project_slugs', 'project_slug_prefix', 'agent_name',
+    'content_type', 'doc_type', 'file_path', 'time_range',
+}
+
+# Upper bound on query terms used for lexical (full-text) retrieval
+LEXICAL_MAX_TERMS = 32
+
+# Minimum interval between writes of embedding backend state (document frequencies)
+EMBEDDING_STATE_SAVE_SECONDS = 30.0
+
+# Embedding model owned by a process-pool worker (never pickled from the parent).
+_WORKER_MODEL = None
+
+
+def _process_worker_init(model_name: str) -> None:
+    """Load the embedding model once per process-pool worker."""
+    global _WORKER_MODEL
+    _WORKER_MODEL = SentenceTransformer(model_name)
+
+
+def _process_encode_into_shm(
+    texts: List[str],
+    shm_name: str,
+    row_offset: int,
+    total_rows: int,
+    dimension: int,
+) -> int:
+    """Encode texts in a worker process and write rows into a shared output buffer."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        output = np.ndarray((total_rows, dimension), dtype=np.float32, buffer=shm.buf)
+        embeddings = _WORKER_MODEL.encode(texts, batch_size=len(texts), convert_to_numpy=True)
+        output[row_offset:row_offset + len(texts)] = embeddings
+        del output
+    finally:
+        shm.close()
+    return len(texts)
+
+
+class EmbeddingBackend(abc.ABC):
+    """Interface for embedding models the indexer can load by name.
+
+    ``SentenceTransformer`` models satisfy ``encode`` as-is; a backend only
+    subclasses this to be selectable through ``VectorConfig.model``, to
+    encode queries differently from documents, or to persist state.
+    """
+
+    name = "backend"
+    # Backends cheap enough to run on the thread executor skip the process pool
+    supports_process_pool = False
+    # Bumped whenever state that affects query encodings changes
+    state_version = 0
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = int(dimension)
+
+    @abc.abstractmethod
+    def encode(self, texts: List[str], **_kwargs: Any) -> np.ndarray:
+        """Encode documents into a (len(texts), dimension) float32 array."""
+
+    def encode_query(self, texts: List[str]) -> np.ndarray:
+        """Encode search queries; defaults to the document encoding."""
+        return self.encode(texts)
+
+    def load_state(self, path: Path) -> None:
+        """Restore persisted state, if the backend keeps any."""
+
+    def reset_state(self) -> None:
+        """Discard state gathered from documents, e.g. before a full rebuild."""
+
+    def forget(self, texts: List[str]) -> None:
+        """Remove previously encoded documents that left the index from the state."""
+
+    def save_state(self, path: Path) -> None:
+        """Persist state next to the index, if the backend keeps any."""
+
+
+class HashedNgramBackend(EmbeddingBackend):
+    """Model-free TF-IDF embeddings from hashed word and character n-grams.
+
+    Features are signed-hashed straight into ``dimension`` buckets, so there
+    is no vocabulary and nothing to download. Documents are encoded with
+    sublinear term frequencies only; document frequencies are counted in a
+    fixed hash table as documents are encoded and applied on the query side,
+    which keeps stored vectors valid as the corpus grows.
+    """
+
+    name = "hashed-ngram"
+    DF_BUCKETS = 1 << 16
+    CHAR_NGRAMS = (3, 4, 5)
+    _TOKEN_RE = re.compile(r"\w+")
+
+    def __init__(self, dimension: int) -> None:
+        super().__init__(dimension)
+        self._df = np.zeros(self.DF_BUCKETS, dtype=np.int64)
+        self._docs = 0
+        self._df_lock = threading.Lock()
+        self._dirty = False
+
+    def _features(self, text: str) -> Counter:
+        tokens = self._TOKEN_RE.findall(text.lower())
+        features: Counter = Counter(tokens)
+        features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        for token in tokens:
+            padded = f"<{token}>"
+            for n in self.CHAR_NGRAMS:
+                if len(padded) > n:
+                    features.update(f"#{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+        return features
+
+    @staticmethod
+    def _hashes(features: Counter) -> np.ndarray:
+        return np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features), dtype=np.int64, count=len(features))
+
+    def _vectorize(self, texts: List[str], *, query: bool) -> np.ndarray:
+        out = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = self._features(text or "")
+            if not features:
+                out[row, 0] = 1.0
+                continue
+            hashes = self._hashes(features)
+            weights = 1.0 + np.log(np.fromiter(features.values(), dtype=np.float64, count=len(features)))
+            if query:
+                with self._df_lock:
+                    df, docs = self._df[hashes & (self.DF_BUCKETS - 1)], self._docs
+                weights = weights * (np.log((1.0 + docs) / (1.0 + df)) + 1.0)
+            else:
+                self._count_document(hashes)
+            signs = np.where((hashes >> 31) & 1, -1.0, 1.0)
+            np.add.at(out[row], hashes % self.dimension, (weights * signs).astype(np.float32))
+            norm = np.linalg.norm(out[row])
+            if norm > 0:
+                out[row] /= norm
+            else:
+                out[row, 0] = 1.0
+        return out
+
+    def _count_document(self, hashes: np.ndarray) -> None:
+        with self._df_lock:
+            self._df[np.unique(hashes & (self.DF_BUCKETS - 1))] += 1
+            self._docs += 1
+            self._dirty = True
+            self.state_version += 1
+
+    def forget(self, texts: List[str]) -> None:
+        # Empty documents were never counted, so they are not uncounted either
+        buckets = [
+            np.unique(self._hashes(features) & (self.DF_BUCKETS - 1))
+            for features in (self._features(text or "") for text in texts)
+            if features
+        ]
+        if not buckets:
+            return
+        with self._df_lock:
+            for document in buckets:
+                self._df[document] -= 1
+            np.maximum(self._df, 0, out=self._df)
+            self._docs = max(0, self._docs - len(buckets))
+            self._dirty = True
+            self.state_version += 1
+
+    def reset_state(self) -> None:
+        with self._df_lock:
+            self._df = np.zeros(self.DF_BUCKETS, dtype=np.int64)
+            self._docs = 0
+            self._dirty = True
+            self.state_version += 1
+
+    def encode(self, texts: List[str], **_kwargs: Any) -> np.ndarray:
+        return self._vectorize(list(texts), query=False)
+
+    def encode_query(self, texts: List[str]) -> np.ndarray:
+        return self._vectorize(list(texts), query=True)
+
+    def load_state(self, path: Path) -> None:
+        try:
+            with np.load(path) as data:
+                df = data["df"]
+                if df.shape == self._df.shape:
+                    with self._df_lock:
+                        self._df = df.astype(np.int64)
+                        self._docs = int(data["docs"])
+                        self.state_version += 1
+        except (OSError, KeyError, ValueError):
+            return
+
+    def save_state(self, path: Path) -> None:
+        with self._df_lock:
+            if not self._dirty:
+                return
+            df, docs = self._df.copy(), self._docs
+            self._dirty = False
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(f, df=df, docs=np.int64(docs))
+        os.replace(temp_path, path)
+
+
+# Embedding backends selectable by VectorConfig.model; any other name is
+# loaded as a sentence-transformers model.
+EMBEDDING_BACKENDS: Dict[str, Callable[[int], EmbeddingBackend]] = {
+    HashedNgramBackend.name: HashedNgramBackend,
+}
+
+
+def register_embedding_backend(name: str, factory: Callable[[int], EmbeddingBackend]) -> None:
+    """Make an embedding backend selectable through ``VectorConfig.model``."""
+    EMBEDDING_BACKENDS[name] = factory
+
 
 class VectorIndexer(HookPlugin):
     """Vector indexing plugin for Scribe log entries."""
@@ -61,10 +326,26 @@ class VectorIndexer(HookPlugin):
         self.vector_config: Optional[VectorConfig] = None
 
         # Vector processing components
-        self.embedding_model: Optional[SentenceTransformer] = None
+        self.embedding_model: Optional[Any] = None  # SentenceTransformer or EmbeddingBackend
         self.vector_index: Optional[faiss.Index] = None
         self.index_metadata: Optional[VectorShardMetadata] = None
 
+        # Inference executors
+        self._encode_mode: str = "inline"
+        self._encode_executor: Optional[Executor] = None
+        self._batch_process_pool: Optional[ProcessPoolExecutor] = None
+        self._encode_stats: Dict[str, float] = {
+            'batches': 0,
+            'items': 0,
+            'last_batch_size': 0,
+            'queue_wait_ms_total': 0.0,
+            'queue_wait_ms_max': 0.0,
+            'inference_ms_total': 0.0,
+            'inference_ms_max': 0.0,
+            'queries': 0,
+            'query_encode_ms_total': 0.0,
+        }
+
         # Background processing
         self.embedding_queue: Optional[asyncio.Queue] = None
         self.queue_worker_task: Optional[asyncio.Task] = None
@@ -74,9 +355,56 @@ class VectorIndexer(HookPlugin):
         self._loop_ready = threading.Event()
         self._owns_loop = False
 
+        # Deferred model/index loading (None when loaded eagerly)
+        self._warmup_future: Optional[Future] = None
+        self._warmup_lock = threading.Lock()
+        self._warmup_stats: Dict[str, Any] = {'duration_ms': None, 'error': None}
+
+        # Single-writer coordination between server processes sharing an index
+        self._index_role: str = "writer"
+        self._index_mmapped = False
+        self._index_generation = 0
+        self._metadata_mtime_ns: Optional[int] = None
+        self._writer_lease_fd: Optional[int] = None
+        self._lease_checked_at = 0.0
+        self._remap_lock = threading.Lock()
+        self._remap_count = 0
+
+        # Per-project shards (shard_by="project"); shards share this indexer's model and database
+        self._shard_parent: Optional[VectorIndexer] = None
+        self._shard_key = ""  # '' is the repo-wide index
+        self._shards: Dict[str, VectorIndexer] = {}
+        self._shards_lock = threading.RLock()
+        self._shard_manifest_mtime_ns: Optional[int] = None
+        self._shard_search_pool: Optional[ThreadPoolExecutor] = None
+
+        # Document chunk manifest bookkeeping (plan_doc_chunks)
+        self._chunk_stats: Dict[str, int] = {
+            'documents': 0, 'embedded': 0, 'skipped': 0, 'tombstoned': 0, 'superseded': 0,
+        }
+
+        self._embedding_state_saved_at = 0.0
+
+        # Query embedding (LRU) and search result (TTL) caches
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_cache_model: Optional[Tuple[int, int]] = None
+        self._result_cache: OrderedDict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = OrderedDict()
+        self._result_cache_generation: Optional[Tuple[Any, ...]] = None
+        self._cache_lock = threading.Lock()
+        self._cache_epoch = 0  # Bumped when mapping rows change without a new index generation
+        self._cache_stats: Dict[str, int] = {
+            'embedding_hits': 0, 'embedding_misses': 0,
+            'result_hits': 0, 'result_misses': 0, 'invalidations': 0,
+        }
+
+        # Exact float32 vectors kept on disk for re-ranking compact indexes
+        self._raw_vectors_enabled = False
+        self._raw_vectors_cache: Optional[Tuple[int, Any]] = None
+
         # Database connection for mapping
         self.mapping_db_path: Optional[Path] = None
         self._db_lock = threading.Lock()
+        self._fts_available = False
 
         # State tracking
         self.initialized = False
@@ -102,15 +430,24 @@ class VectorIndexer(HookPlugin):
             self.repo_config = config
             self.repo_root = config.repo_root
             self.repo_slug = config.repo_slug or self._get_repo_slug(self.repo_root)
+            self._claim_index_role()
 
-            # Initialize vector components
-            self._init_embedding_model()
-            self._init_vector_index()
+            # The mapping database and queue are cheap; the model and index are
+            # loaded by warm-up so appends can queue while the model is cold.
+            lazy = getattr(self.vector_config, 'lazy_load', False) is True
             self._init_mapping_database()
+            if lazy:
+                self._warmup_future = Future()
+                self._peek_index_metadata()
+            else:
+                self._load_model_and_index()
             self._init_background_queue()
 
             self.initialized = True
-            plugin_logger.info(f"VectorIndexer initialized for repository: {self.repo_slug}")
+            plugin_logger.info(
+                f"VectorIndexer initialized for repository: {self.repo_slug}"
+                + (" (model loads on warm-up)" if lazy else "")
+            )
 
         except Exception as e:
             plugin_logger.error(f"Failed to initialize VectorIndexer: {e}", exc_info=True)
@@ -147,6 +484,13 @@ class VectorIndexer(HookPlugin):
                 self.queue_lock = None
                 self._owns_loop = False
 
+            self._save_embedding_state(force=True)
+            self._shutdown_encode_executor()
+            if self._shard_search_pool is not None:
+                self._shard_search_pool.shutdown(wait=False)
+                self._shard_search_pool = None
+            self._release_writer_lease()
+
             # Close database connection
             with self._db_lock:
                 if hasattr(self, '_db_conn') and self._db_conn:
@@ -157,6 +501,127 @@ class VectorIndexer(HookPlugin):
         except Exception as e:
             plugin_logger.error(f"Error during VectorIndexer cleanup: {e}")
 
+    def _load_model_and_index(self) -> None:
+        """Load the embedding model, inference executor and FAISS index."""
+        self._init_embedding_model()
+        self._init_encode_executor()
+        self._init_vector_index()
+        if self._shards_enabled():
+            self._load_shard_manifest()
+
+    def _peek_index_metadata(self) -> None:
+        """Read index metadata ahead of warm-up so status reports real totals."""
+        index_path, metadata_path = self._index_paths()
+        if not (index_path.exists() and metadata_path.exists()):
+            return
+        try:
+            self._load_index_metadata(index_path, metadata_path)
+        except Exception as e:
+            plugin_logger.warning(f"Failed to read vector index metadata: {e}")
+
+    def start_warmup(self) -> Optional[Future]:
+        """Begin loading the model and index on a background thread.
+
+        Safe to call repeatedly; only the first call starts the warm-up.
+        Returns the readiness future, or None when loading is not deferred.
+        """
+        if not self.initialized or not self.enabled:
+            return None
+
+        with self._warmup_lock:
+            future = self._warmup_future
+            if future is None or future.running() or future.done():
+                return future
+            future.set_running_or_notify_cancel()
+            threading.Thread(
+                target=self._run_warmup,
+                args=(future,),
+                name=f"VectorWarmup-{self.repo_slug}",
+                daemon=True,
+            ).start()
+        return future
+
+    def _run_warmup(self, future: Future) -> None:
+        """Warm-up thread body: load everything, then resolve the readiness future."""
+        started = time.monotonic()
+        try:
+            self._load_model_and_index()
+        except Exception as exc:
+            plugin_logger.error(f"Vector warm-up failed: {exc}", exc_info=True)
+            self._warmup_stats['error'] = str(exc)
+            self.enabled = False
+            future.set_exception(exc)
+            return
+        finally:
+            self._warmup_stats['duration_ms'] = round((time.monotonic() - started) * 1000, 2)
+
+        plugin_logger.info(f"Vector warm-up completed in {self._warmup_stats['duration_ms']}ms")
+        future.set_result(True)
+
+    def _warmup_timeout(self) -> float:
+        timeout = getattr(self.vector_config, 'warmup_timeout_seconds', 30.0)
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            return 30.0
+        return max(0.0, float(timeout))
+
+    def is_ready(self) -> bool:
+        """Return True once the model and index are loaded."""
+        future = self._warmup_future
+        if future is not None:
+            return future.done() and not future.cancelled() and future.exception() is None
+        return self.embedding_model is not None and self.vector_index is not None
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Start warm-up if needed and wait for the model and index to load.
+
+        Args:
+            timeout: Seconds to wait; defaults to ``warmup_timeout_seconds``.
+
+        Returns:
+            True when ready, False on timeout or if warm-up failed.
+        """
+        if self._warmup_future is None:
+            return self.is_ready()
+
+        future = self.start_warmup()
+        if future is None:
+            return False
+        try:
+            future.result(timeout=self._warmup_timeout() if timeout is None else timeout)
+        except FutureTimeoutError:
+            return False
+        except Exception:
+            return False
+        return True
+
+    async def _await_warmup(self) -> bool:
+        """Suspend the queue worker until warm-up has finished."""
+        future = self._warmup_future
+        if future is None:
+            return True
+        try:
+            # Shielded so cancelling the worker never cancels the warm-up itself
+            await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+        return True
+
+    def _warmup_status(self) -> Dict[str, Any]:
+        future = self._warmup_future
+        if future is None:
+            state = 'eager'
+        elif not future.running() and not future.done():
+            state = 'cold'
+        elif not future.done():
+            state = 'loading'
+        elif self.is_ready():
+            state = 'ready'
+        else:
+            state = 'failed'
+        return {'state': state, **self._warmup_stats}
+
     def post_append(self, entry_data: Dict[str, Any]) -> None:
         """Called after an entry is appended - queue for vector indexing."""
         if not self.initialized or not self.enabled:
@@ -167,6 +632,10 @@ class VectorIndexer(HookPlugin):
             plugin_logger.warning("Vector indexer shutting down, skipping entry")
             return
 
+        if self._index_role == "reader" and not self._maybe_promote_to_writer():
+            self._spool_entry(entry_data)
+            return
+
         if not self.embedding_queue or not self._loop:
             plugin_logger.warning("Embedding queue not available, skipping entry")
             return
@@ -176,6 +645,8 @@ class VectorIndexer(HookPlugin):
             self._loop.call_soon_threadsafe(
                 lambda: self._loop.create_task(self._queue_entry_for_embedding(entry_data))
             )
+            # Entries wait in the queue until the model is warm
+            self.start_warmup()
         except Exception as e:
             plugin_logger.error(f"Failed to queue entry for vector indexing: {e}")
 
@@ -190,6 +661,9 @@ class VectorIndexer(HookPlugin):
         if not self.initialized or not self.enabled:
             return False
 
+        if self._index_role == "reader" and not self._maybe_promote_to_writer():
+            return self._spool_entry(entry_data)
+
         if not self.embedding_queue or not self._loop:
             plugin_logger.warning("Embedding queue not available, skipping entry")
             return False
@@ -208,6 +682,60 @@ class VectorIndexer(HookPlugin):
             plugin_logger.error(f"Failed to enqueue entry with backpressure: {exc}")
             return False
 
+    # Bulk indexing API (scripts/reindex_vector.py drives these from its own pipeline)
+
+    def owns_index(self) -> bool:
+        """True when this process may write the index directly."""
+        return self._index_role == "writer" or self._maybe_promote_to_writer()
+
+    def prepare_entry(self, entry_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an appended entry into the task shape the embedding stages expect."""
+        return self._prepare_embedding_task(entry_data)
+
+    def encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Encode and normalise a batch on the inference executor, blocking the caller."""
+        if not self.wait_until_ready():
+            raise RuntimeError("Vector model is not ready")
+        if self._batch_process_pool is not None:
+            embeddings = self._encode_in_process_pool(texts)
+        else:
+            encode = partial(self.embedding_model.encode, texts, batch_size=len(texts), convert_to_numpy=True)
+            embeddings = encode() if self._encode_executor is None else self._encode_executor.submit(encode).result()
+        embeddings = np.asarray(embeddings, dtype='float32')
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    def store_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        embeddings: np.ndarray,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """Persist pre-computed embeddings, serialised with the background queue worker.
+
+        Returns the number of entries stored; chunks of superseded document
+        revisions are dropped first.
+        """
+        current = self._drop_superseded_chunks(batch)
+        if len(current) != len(batch):
+            wanted = {id(item) for item in current}
+            rows = [i for i, item in enumerate(batch) if id(item) in wanted]
+            if isinstance(self.embedding_model, EmbeddingBackend):
+                # Already encoded by the caller, so already counted
+                self.embedding_model.forget([item['text_content'] for item in batch if id(item) not in wanted])
+            batch = current
+            embeddings = embeddings[rows]
+        if not batch:
+            return 0
+
+        if self._loop and self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._store_embeddings_batch(batch, embeddings), self._loop)
+            future.result(timeout=timeout)
+        else:
+            if not self.queue_lock:
+                self.queue_lock = asyncio.Lock()
+            asyncio.run(self._store_embeddings_batch(batch, embeddings))
+        return len(batch)
+
     @staticmethod
     def _log_async_error(future: asyncio.Future) -> None:
         """Log exceptions from background scheduling."""
@@ -216,6 +744,369 @@ class VectorIndexer(HookPlugin):
         except Exception as exc:
             plugin_logger.error(f"Vector queue scheduling error: {exc}")
 
+    def _index_access(self) -> str:
+        value = getattr(self.vector_config, 'index_access', 'auto')
+        return value if value in INDEX_ACCESS_MODES else "auto"
+
+    def _claim_index_role(self) -> None:
+        """Decide whether this process owns index updates or maps the index read-only."""
+        access = self._index_access()
+        if access == "reader":
+            self._index_role = "reader"
+        elif self._acquire_writer_lease():
+            self._index_role = "writer"
+        elif access == "writer":
+            plugin_logger.warning("Another process holds the vector writer lease; writing anyway (index_access=writer)")
+            self._index_role = "writer"
+        else:
+            self._index_role = "reader"
+        plugin_logger.info(f"Vector index role: {self._index_role}")
+
+    def _acquire_writer_lease(self) -> bool:
+        """Take the non-blocking writer lock for this index; held until cleanup."""
+        if self._writer_lease_fd is not None:
+            return True
+
+        vectors_dir = self.repo_root / ".scribe_vectors"
+        vectors_dir.mkdir(exist_ok=True)
+        fd = os.open(vectors_dir / f"{self.repo_slug}.writer.lock", os.O_RDWR | os.O_CREAT)
+        try:
+            if HAS_WINDOWS_LOCK and os.name == 'nt':
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            elif HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        # Record the owner for anyone inspecting the lock file
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._writer_lease_fd = fd
+        return True
+
+    def _release_writer_lease(self) -> None:
+        if self._writer_lease_fd is None:
+            return
+        try:
+            os.close(self._writer_lease_fd)
+        except OSError:
+            pass
+        self._writer_lease_fd = None
+
+    def _maybe_promote_to_writer(self) -> bool:
+        """Take over index updates once the previous writer process has exited."""
+        if self._index_role == "writer":
+            return True
+        if self._index_access() == "reader":
+            return False
+
+        now = time.monotonic()
+        if now - self._lease_checked_at < WRITER_LEASE_RETRY_SECONDS:
+            return False
+        self._lease_checked_at = now
+        if not self._acquire_writer_lease():
+            return False
+
+        with self._remap_lock:
+            self._index_role = "writer"
+            if self.is_ready():
+                self._reload_index()
+                for shard in list(self._shards.values()):
+                    shard._index_role = "writer"
+                    shard._reload_index()
+        plugin_logger.info("Acquired vector writer lease; this process now owns index updates")
+        return True
+
+    def _spool_entry(self, entry_data: Dict[str, Any]) -> bool:
+        """Hand an entry to the writer process through the shared mapping database."""
+        try:
+            with self._db_lock:
+                self._db_conn.execute(
+                    "INSERT INTO pending_embeddings (entry_json, queued_at) VALUES (?, ?)",
+                    (json.dumps(entry_data, default=str), utcnow().isoformat()),
+                )
+                self._db_conn.commit()
+            return True
+        except Exception as e:
+            plugin_logger.error(f"Failed to spool entry for the vector writer: {e}")
+            return False
+
+    async def _drain_spool(self) -> int:
+        """Move entries spooled by reader processes onto the embedding queue."""
+        if self._index_role != "writer" or not self.embedding_queue or not getattr(self, '_db_conn', None):
+            return 0
+        room = self.embedding_queue.maxsize - self.embedding_queue.qsize() if self.embedding_queue.maxsize else 256
+        if room <= 0:
+            return 0
+
+        with self._db_lock:
+            rows = self._db_conn.execute(
+                "SELECT id, entry_json FROM pending_embeddings ORDER BY id LIMIT ?", (room,)
+            ).fetchall()
+            if not rows:
+                return 0
+            self._db_conn.executemany(
+                "DELETE FROM pending_embeddings WHERE id = ?", [(row['id'],) for row in rows]
+            )
+            self._db_conn.commit()
+
+        for row in rows:
+            try:
+                entry_data = json.loads(row['entry_json'])
+            except (TypeError, ValueError):
+                continue
+            await self._queue_entry_for_embedding(entry_data)
+        plugin_logger.debug(f"Drained {len(rows)} spooled entries from reader processes")
+        return len(rows)
+
+    def _reload_index(self) -> None:
+        """Reopen the persisted index (memory-mapped for readers) and its sidecar."""
+        index_path, metadata_path = self._index_paths()
+        if not (index_path.exists() and metadata_path.exists()):
+            return
+        self._load_existing_index(index_path, metadata_path)
+        self._init_raw_vectors()
+
+    def _refresh_reader_index(self) -> None:
+        """Remap indexes when the writer has published newer generations."""
+        if self._index_role != "reader" or self._maybe_promote_to_writer():
+            return
+
+        self._remap_if_stale()
+        if self._shards_enabled():
+            try:
+                mtime_ns = self._shard_manifest_path().stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns is not None and mtime_ns != self._shard_manifest_mtime_ns:
+                self._load_shard_manifest()
+            for shard in list(self._shards.values()):
+                shard._remap_if_stale()
+
+    def _remap_if_stale(self) -> None:
+        _index_path, metadata_path = self._index_paths()
+        try:
+            mtime_ns = metadata_path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns == self._metadata_mtime_ns:
+            return
+
+        with self._remap_lock:
+            if mtime_ns == self._metadata_mtime_ns:
+                return
+            try:
+                with open(metadata_path, 'r') as f:
+                    generation = int(json.load(f).get('generation', 0))
+            except (OSError, ValueError, TypeError):
+                return
+            if generation == self._index_generation:
+                self._metadata_mtime_ns = mtime_ns
+                return
+            try:
+                self._reload_index()
+                self._remap_count += 1
+                plugin_logger.debug(f"Remapped vector index at generation {self._index_generation}")
+            except Exception as e:
+                plugin_logger.warning(f"Failed to remap vector index: {e}")
+
+    def _shards_enabled(self) -> bool:
+        """True for the top-level indexer when entries are sharded by project."""
+        return self._shard_parent is None and getattr(self.vector_config, 'shard_by', 'none') == "project"
+
+    def _scope_clause(self) -> Tuple[str, Tuple[Any, ...]]:
+        """SQL restricting mapping rows to this index (repo, plus shard once sharding is in use)."""
+        if self._shard_parent is None and not self._shards_enabled():
+            return "repo_slug = ?", (self.repo_slug,)
+        return "repo_slug = ? AND shard_key = ?", (self.repo_slug, self._shard_key)
+
+    @staticmethod
+    def _shard_file_name(shard_key: str) -> str:
+        safe = re.sub(r'[^a-z0-9_-]', '-', shard_key.lower()).strip('-') or "project"
+        if safe != shard_key:
+            # Keep names distinct when sanitising changed the slug
+            safe = f"{safe}-{hashlib.sha1(shard_key.encode('utf-8')).hexdigest()[:8]}"
+        return safe
+
+    def _shard_manifest_path(self) -> Path:
+        return self.repo_root / ".scribe_vectors" / f"{self.repo_slug}.shards.json"
+
+    def _open_shard(self, shard_key: str) -> VectorIndexer:
+        """Return the index for one project, loading or creating it on first use."""
+        with self._shards_lock:
+            shard = self._shards.get(shard_key)
+            if shard is not None:
+                return shard
+
+            shard = VectorIndexer()
+            shard._shard_parent = self
+            shard._shard_key = shard_key
+            shard.repo_config = self.repo_config
+            shard.repo_root = self.repo_root
+            shard.repo_slug = self.repo_slug
+            shard.vector_config = self.vector_config
+            shard.embedding_model = self.embedding_model
+            shard.mapping_db_path = self.mapping_db_path
+            shard._db_conn = self._db_conn
+            shard._db_lock = self._db_lock
+            shard._fts_available = self._fts_available
+            shard._index_role = self._index_role
+            shard.initialized = True
+            shard.enabled = True
+            shard._init_vector_index()
+            self._shards[shard_key] = shard
+            return shard
+
+    def _load_shard_manifest(self) -> None:
+        """Open every shard listed in the manifest; readers discover new shards this way."""
+        path = self._shard_manifest_path()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            with open(path, 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            plugin_logger.warning(f"Failed to read vector shard manifest: {e}")
+            return
+
+        self._shard_manifest_mtime_ns = mtime_ns
+        for shard_key in manifest.get('shards', {}):
+            try:
+                self._open_shard(shard_key)
+            except Exception as e:
+                plugin_logger.warning(f"Failed to open vector shard {shard_key}: {e}")
+
+    def _save_shard_manifest(self) -> None:
+        """Atomically publish the list of shards and their per-shard metadata."""
+        with self._shards_lock:
+            shards = {
+                key: {
+                    'file': self._shard_file_name(key),
+                    'total_entries': shard.index_metadata.total_entries if shard.index_metadata else 0,
+                    'index_type': shard.index_metadata.index_type if shard.index_metadata else None,
+                    'generation': shard._index_generation,
+                    'last_updated': (
+                        shard.index_metadata.last_updated.isoformat()
+                        if shard.index_metadata and shard.index_metadata.last_updated else None
+                    ),
+                }
+                for key, shard in sorted(self._shards.items())
+            }
+        manifest = {
+            'repo_slug': self.repo_slug,
+            'shard_by': 'project',
+            'updated_at': utcnow().isoformat(),
+            'shards': shards,
+        }
+        path = self._shard_manifest_path()
+        temp_path = path.with_suffix('.json.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        temp_path.replace(path)
+        self._shard_manifest_mtime_ns = path.stat().st_mtime_ns
+
+    def _target_shards(self, filters: Optional[Dict[str, Any]]) -> List[VectorIndexer]:
+        """Pick the shards a query must touch; the repo-wide index is included while it holds entries."""
+        with self._shards_lock:
+            shards = dict(self._shards)
+        filters = filters or {}
+        if 'project_slugs' in filters:
+            keys = [str(slug) for slug in filters['project_slugs'] or [] if str(slug) in shards]
+        elif 'project_slug_prefix' in filters:
+            prefix = str(filters['project_slug_prefix'])
+            keys = [key for key in shards if key.startswith(prefix)]
+        elif 'project_slug' in filters:
+            keys = [str(filters['project_slug'])] if str(filters['project_slug']) in shards else []
+        else:
+            keys = sorted(shards)
+
+        targets = [shards[key] for key in keys]
+        if self.vector_index is not None and int(self.vector_index.ntotal) > 0:
+            targets.insert(0, self)
+        return targets
+
+    def _fan_out_search(
+        self,
+        query_embedding: np.ndarray,
+        k: int,
+        filters: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Search the relevant shards in parallel and k-way merge their ranked hits."""
+        targets = self._target_shards(filters)
+        if not targets:
+            return []
+
+        def _search(shard: VectorIndexer) -> List[Dict[str, Any]]:
+            results = shard._search_encoded(query_embedding, k, filters)
+            for result in results:
+                result['shard'] = shard._shard_key or None
+            results.sort(key=lambda r: r['similarity_score'], reverse=True)
+            return results
+
+        if len(targets) == 1:
+            per_shard = [_search(targets[0])]
+        else:
+            if self._shard_search_pool is None:
+                try:
+                    workers = max(1, int(getattr(self.vector_config, 'shard_search_workers', 4)))
+                except (TypeError, ValueError):
+                    workers = 4
+                self._shard_search_pool = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"VectorShardSearch-{self.repo_slug}",
+                )
+            per_shard = list(self._shard_search_pool.map(_search, targets))
+
+        merged = heapq.merge(*per_shard, key=lambda r: -r['similarity_score'])
+        return list(itertools.islice(merged, max(1, int(k))))
+
+    async def _store_sharded_batch(self, batch: List[Dict[str, Any]], embeddings: np.ndarray) -> None:
+        """Route a batch to per-project shards and store each group there."""
+        groups: Dict[str, List[int]] = {}
+        for position, item in enumerate(batch):
+            groups.setdefault(str(item.get('project_slug') or 'default'), []).append(position)
+
+        for shard_key, positions in groups.items():
+            shard = self._open_shard(shard_key)
+            shard.queue_lock = self.queue_lock
+            await shard._store_embeddings_batch([batch[i] for i in positions], embeddings[positions])
+        self._save_shard_manifest()
+
+    def _shard_status(self) -> Dict[str, Any]:
+        with self._shards_lock:
+            shards = dict(self._shards)
+        return {
+            'shard_by': 'project' if self._shards_enabled() else 'none',
+            'count': len(shards),
+            'shards': {
+                key: {
+                    'total_entries': shard.index_metadata.total_entries if shard.index_metadata else 0,
+                    'index_type': shard.index_metadata.index_type if shard.index_metadata else None,
+                    'generation': shard._index_generation,
+                    'mmapped': shard._index_mmapped,
+                }
+                for key, shard in sorted(shards.items())
+            },
+        }
+
+    def _sharing_status(self) -> Dict[str, Any]:
+        spooled = 0
+        try:
+            with self._db_lock:
+                spooled = int(self._db_conn.execute("SELECT COUNT(*) FROM pending_embeddings").fetchone()[0])
+        except Exception:
+            spooled = 0
+        return {
+            'role': self._index_role,
+            'access': self._index_access(),
+            'mmapped': self._index_mmapped,
+            'generation': self._index_generation,
+            'remaps': self._remap_count,
+            'spooled_entries': spooled,
+        }
+
     def _get_repo_slug(self, repo_root: Path) -> str:
         """Generate repository slug from root path."""
         import re
@@ -225,23 +1116,193 @@ class VectorIndexer(HookPlugin):
         return slug or "unknown-repo"
 
     def _init_embedding_model(self) -> None:
-        """Initialize the sentence transformer model."""
+        """Initialize the embedding backend named by ``VectorConfig.model``."""
         try:
             model_name = self.vector_config.model
-            self.embedding_model = SentenceTransformer(model_name)
+            factory = EMBEDDING_BACKENDS.get(model_name)
+            if factory is not None:
+                self.embedding_model = factory(self.vector_config.dimension)
+                self.embedding_model.load_state(self._embedding_state_path())
+            elif not SENTENCE_TRANSFORMERS_AVAILABLE:
+                raise RuntimeError(
+                    f"sentence-transformers is not installed for model '{model_name}' "
+                    f"(built-in backends: {', '.join(sorted(EMBEDDING_BACKENDS))})"
+                )
+            else:
+                self.embedding_model = SentenceTransformer(model_name)
             plugin_logger.info(f"Loaded embedding model: {model_name}")
         except Exception as e:
             plugin_logger.error(f"Failed to load embedding model: {e}")
             raise
 
+    def _embedding_state_path(self) -> Path:
+        """Backend state is shared by the repo index and all of its shards."""
+        root = self._shard_parent or self
+        stem = root._index_stem()
+        return stem.with_name(stem.name + ".embedding.npz")
+
+    def _save_embedding_state(self, force: bool = False) -> None:
+        """Persist backend state (e.g. document frequencies), at most every few seconds."""
+        model = self.embedding_model
+        if not isinstance(model, EmbeddingBackend) or self._index_role != "writer":
+            return
+        now = time.monotonic()
+        if not force and now - self._embedding_state_saved_at < EMBEDDING_STATE_SAVE_SECONDS:
+            return
+        self._embedding_state_saved_at = now
+        try:
+            model.save_state(self._embedding_state_path())
+        except OSError as e:
+            plugin_logger.warning(f"Failed to save embedding backend state: {e}")
+
+    def _init_encode_executor(self) -> None:
+        """Create the executor that runs embedding inference off the event loop.
+
+        ``thread`` runs the in-process model on a thread pool. ``process`` keeps
+        the thread pool for query encoding and adds a spawn-based process pool
+        (one model per worker) for queue batches, which write their output into
+        a shared-memory buffer instead of pickling arrays back.
+        """
+        mode = str(getattr(self.vector_config, 'encode_executor', 'thread') or 'thread').lower()
+        if mode not in ENCODE_EXECUTORS:
+            plugin_logger.warning(f"Unknown encode_executor '{mode}', falling back to 'thread'")
+            mode = "thread"
+        try:
+            workers = max(1, int(getattr(self.vector_config, 'encode_workers', 1)))
+        except (TypeError, ValueError):
+            workers = 1
+
+        if mode == "process" and isinstance(self.embedding_model, EmbeddingBackend) \
+                and not self.embedding_model.supports_process_pool:
+            plugin_logger.info(f"Embedding backend '{self.vector_config.model}' runs on the thread executor")
+            mode = "thread"
+
+        self._encode_mode = mode
+        if mode == "inline":
+            plugin_logger.info("Embedding inference runs inline on the vector loop")
+            return
+
+        self._encode_executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=f"VectorEncode-{self.repo_slug}",
+        )
+        if mode == "process":
+            self._batch_process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_process_worker_init,
+                initargs=(self.vector_config.model,),
+            )
+        plugin_logger.info(f"Embedding inference executor: {mode} (workers: {workers})")
+
+    def _shutdown_encode_executor(self) -> None:
+        """Stop inference executors without waiting on in-flight batches."""
+        if self._batch_process_pool:
+            self._batch_process_pool.shutdown(wait=False, cancel_futures=True)
+            self._batch_process_pool = None
+        if self._encode_executor:
+            self._encode_executor.shutdown(wait=False, cancel_futures=True)
+            self._encode_executor = None
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Encode a search query on the inference executor and wait for it."""
+        started = time.perf_counter()
+        model = self.embedding_model
+        encode = model.encode_query if isinstance(model, EmbeddingBackend) else model.encode
+        if self._encode_executor is None:
+            embedding = encode([query])
+        else:
+            embedding = self._encode_executor.submit(encode, [query]).result()
+        self._encode_stats['queries'] += 1
+        self._encode_stats['query_encode_ms_total'] += (time.perf_counter() - started) * 1000
+        return embedding
+
+    async def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode a queue batch without blocking the vector event loop."""
+        if self._batch_process_pool is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._encode_in_process_pool, texts)
+        encode = partial(self.embedding_model.encode, texts, batch_size=len(texts), convert_to_numpy=True)
+        if self._encode_executor is None:
+            return encode()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._encode_executor, encode)
+
+    def _encode_in_process_pool(self, texts: List[str]) -> np.ndarray:
+        """Fan a batch out across the process pool into one shared-memory buffer."""
+        dimension = int(self.vector_config.dimension)
+        rows = len(texts)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, rows * dimension * 4))
+        try:
+            workers = max(1, self._batch_process_pool._max_workers)
+            chunk = max(1, math.ceil(rows / workers))
+            futures = [
+                self._batch_process_pool.submit(
+                    _process_encode_into_shm, texts[offset:offset + chunk], shm.name, offset, rows, dimension
+                )
+                for offset in range(0, rows, chunk)
+            ]
+            for future in futures:
+                future.result()
+            output = np.ndarray((rows, dimension), dtype=np.float32, buffer=shm.buf)
+            embeddings = output.copy()
+            del output
+        finally:
+            shm.close()
+            shm.unlink()
+        return embeddings
+
+    def _adaptive_batch_size(self) -> int:
+        """Grow the batch size with queue depth, bounded by ``max_batch_size``."""
+        base = max(1, int(self.vector_config.batch_size))
+        try:
+            ceiling = max(base, int(getattr(self.vector_config, 'max_batch_size', base)))
+        except (TypeError, ValueError):
+            ceiling = base
+        depth = self.embedding_queue.qsize() if self.embedding_queue else 0
+        size = base
+        while size < depth and size < ceiling:
+            size *= 2
+        return min(size, ceiling)
+
+    def _record_batch_timings(self, batch: List[Dict[str, Any]], dequeued_at: float, inference_ms: float) -> None:
+        """Accumulate queue-wait and inference timings for status reporting."""
+        stats = self._encode_stats
+        for item in batch:
+            enqueued_at = item.get('enqueued_at')
+            if enqueued_at is None:
+                continue
+            wait_ms = max(0.0, (dequeued_at - enqueued_at) * 1000)
+            stats['queue_wait_ms_total'] += wait_ms
+            stats['queue_wait_ms_max'] = max(stats['queue_wait_ms_max'], wait_ms)
+        stats['batches'] += 1
+        stats['items'] += len(batch)
+        stats['last_batch_size'] = len(batch)
+        stats['inference_ms_total'] += inference_ms
+        stats['inference_ms_max'] = max(stats['inference_ms_max'], inference_ms)
+
+    def _encode_timings(self) -> Dict[str, Any]:
+        """Summarise queue-wait and inference timings separately."""
+        stats = self._encode_stats
+        items = stats['items'] or 0
+        batches = stats['batches'] or 0
+        queries = stats['queries'] or 0
+        return {
+            'executor': self._encode_mode,
+            'batches': int(batches),
+            'items': int(items),
+            'last_batch_size': int(stats['last_batch_size']),
+            'queue_wait_ms_avg': round(stats['queue_wait_ms_total'] / items, 2) if items else 0.0,
+            'queue_wait_ms_max': round(stats['queue_wait_ms_max'], 2),
+            'inference_ms_avg': round(stats['inference_ms_total'] / batches, 2) if batches else 0.0,
+            'inference_ms_max': round(stats['inference_ms_max'], 2),
+            'query_encode_ms_avg': round(stats['query_encode_ms_total'] / queries, 2) if queries else 0.0,
+        }
+
     def _init_vector_index(self) -> None:
         """Initialize or load the FAISS index."""
         try:
-            vectors_dir = self.repo_root / ".scribe_vectors"
-            vectors_dir.mkdir(exist_ok=True)
-
-            index_path = vectors_dir / f"{self.repo_slug}.faiss"
-            metadata_path = vectors_dir / f"{self.repo_slug}.meta.json"
+            index_path, metadata_path = self._index_paths()
 
             # Load or create index
             if index_path.exists() and metadata_path.exists():
@@ -249,6 +1310,12 @@ class VectorIndexer(HookPlugin):
             else:
                 self._create_new_index(index_path, metadata_path)
 
+            # Apply the configured compact encoding (re-ranking needs exact vectors first)
+            self._init_raw_vectors()
+            if self._index_role == "writer" and self._maybe_compact_index():
+                self._write_index_file(index_path)
+                self._save_index_metadata(metadata_path)
+
             plugin_logger.info(f"Vector index ready: {self.index_metadata.total_entries} entries")
 
         except Exception as e:
@@ -257,7 +1324,44 @@ class VectorIndexer(HookPlugin):
 
     def _load_existing_index(self, index_path: Path, metadata_path: Path) -> None:
         """Load existing FAISS index and metadata."""
-        # Load metadata
+        self._load_index_metadata(index_path, metadata_path)
+
+        # Load FAISS index; readers map the code storage in place so sessions
+        # share the page cache. IO_FLAG_MMAP alone still copies flat/SQ/PQ codes
+        # onto the heap, so only IO_FLAG_MMAP_IFC is used.
+        self._index_mmapped = False
+        self.vector_index = None
+        if (
+            self._index_role == "reader"
+            and getattr(self.vector_config, 'mmap_readers', True) is not False
+            and hasattr(faiss, 'IO_FLAG_MMAP_IFC')
+        ):
+            try:
+                self.vector_index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP_IFC)
+                self._index_mmapped = self._index_codes_mapped(self.vector_index)
+            except Exception as e:
+                plugin_logger.warning(f"Memory-mapped index load failed, reading into memory: {e}")
+        if self.vector_index is None:
+            self.vector_index = faiss.read_index(str(index_path))
+
+        # Load GPU if enabled
+        if self.vector_config.gpu and hasattr(faiss, 'StandardGpuResources'):
+            try:
+                res = faiss.StandardGpuResources()
+                self.vector_index = faiss.index_cpu_to_gpu(res, 0, self.vector_index)
+                plugin_logger.info("GPU acceleration enabled for vector index")
+            except Exception as e:
+                plugin_logger.warning(f"Failed to enable GPU acceleration: {e}")
+
+    @staticmethod
+    def _index_codes_mapped(index: "faiss.Index") -> bool:
+        """True when the index's code storage points into a mapped file rather than owned memory."""
+        index = faiss.downcast_index(index)
+        codes = getattr(index, 'codes', None)
+        return codes is not None and hasattr(codes, 'is_owned') and not codes.is_owned
+
+    def _load_index_metadata(self, index_path: Path, metadata_path: Path) -> None:
+        """Load index metadata and validate it against the configuration."""
         with open(metadata_path, 'r') as f:
             metadata_dict = json.load(f)
 
@@ -274,6 +1378,8 @@ class VectorIndexer(HookPlugin):
             embedding_model_version=metadata_dict.get('embedding_model_version'),
             index_size_bytes=index_path.stat().st_size if index_path.exists() else None
         )
+        self._index_generation = int(metadata_dict.get('generation', 0))
+        self._metadata_mtime_ns = metadata_path.stat().st_mtime_ns
 
         # Validate configuration compatibility
         if (self.index_metadata.dimension != self.vector_config.dimension or
@@ -284,18 +1390,6 @@ class VectorIndexer(HookPlugin):
                 f"model={self.vector_config.model}. Consider rebuilding index."
             )
 
-        # Load FAISS index
-        self.vector_index = faiss.read_index(str(index_path))
-
-        # Load GPU if enabled
-        if self.vector_config.gpu and hasattr(faiss, 'StandardGpuResources'):
-            try:
-                res = faiss.StandardGpuResources()
-                self.vector_index = faiss.index_cpu_to_gpu(res, 0, self.vector_index)
-                plugin_logger.info("GPU acceleration enabled for vector index")
-            except Exception as e:
-                plugin_logger.warning(f"Failed to enable GPU acceleration: {e}")
-
     def _create_new_index(self, index_path: Path, metadata_path: Path) -> None:
         """Create new FAISS index and metadata."""
         dimension = self.vector_config.dimension
@@ -308,7 +1402,7 @@ class VectorIndexer(HookPlugin):
             repo_slug=self.repo_slug,
             dimension=dimension,
             model=self.vector_config.model,
-            scope="repo-local",
+            scope=f"project:{self._shard_key}" if self._shard_key else "repo-local",
             created_at=utcnow(),
             backend="faiss",
             index_type="IndexFlatIP",
@@ -317,19 +1411,230 @@ class VectorIndexer(HookPlugin):
             embedding_model_version=getattr(self.embedding_model, 'version', 'unknown')
         )
 
+        # Readers keep the empty index in memory until the writer publishes one
+        if self._index_role != "writer":
+            return
+
         # Save index and metadata
-        faiss.write_index(self.vector_index, str(index_path))
+        self._write_index_file(index_path)
         self._save_index_metadata(metadata_path)
         plugin_logger.info(f"Created new vector index: {dimension}D")
 
+    def _index_stem(self) -> Path:
+        """Path prefix for this index's files; project shards live under shards/<repo_slug>/."""
+        vectors_dir = self.repo_root / ".scribe_vectors"
+        if self._shard_parent is None:
+            return vectors_dir / self.repo_slug
+        return vectors_dir / "shards" / self.repo_slug / self._shard_file_name(self._shard_key)
+
+    def _index_paths(self) -> Tuple[Path, Path]:
+        """Index and metadata file paths, creating their directory if needed."""
+        stem = self._index_stem()
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        return stem.with_name(stem.name + ".faiss"), stem.with_name(stem.name + ".meta.json")
+
+    def _write_index_file(self, index_path: Path) -> None:
+        """Write the index to a temp file and swap it in, so mapped readers never see a partial file."""
+        temp_path = index_path.with_suffix('.faiss.tmp')
+        faiss.write_index(self.vector_index, str(temp_path))
+        temp_path.replace(index_path)
+
+    def _compression(self) -> str:
+        """Configured compact encoding, defaulting to uncompressed float32."""
+        value = getattr(self.vector_config, 'compression', 'none')
+        return value if value in COMPRESSION_INDEX_TYPES else "none"
+
+    def _rerank_depth(self) -> int:
+        """Number of leading candidates to re-score exactly (0 when not applicable)."""
+        if self._compression() == "none":
+            return 0
+        try:
+            return max(0, int(getattr(self.vector_config, 'rerank_k', 0)))
+        except (TypeError, ValueError):
+            return 0
+
+    def _build_compact_index(self, index_type: str, dimension: int, training: Optional[np.ndarray]) -> faiss.Index:
+        """Create an (already trained) FAISS index for a compact encoding."""
+        metric = faiss.METRIC_INNER_PRODUCT
+        if index_type == "IndexScalarQuantizer:fp16":
+            return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_fp16, metric)
+        if index_type == "IndexScalarQuantizer:int8":
+            index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit_uniform, metric)
+            # Normalized embeddings lie in [-1, 1]; train the uniform range on its bounds.
+            bounds = np.vstack([np.ones(dimension), -np.ones(dimension)]).astype('float32')
+            index.train(bounds)
+            return index
+        if index_type == "IndexPQ":
+            subquantizers = max(1, int(getattr(self.vector_config, 'pq_subquantizers', 16)))
+            while dimension % subquantizers:
+                subquantizers -= 1
+            bits = int(getattr(self.vector_config, 'pq_bits', 8))
+            index = faiss.IndexPQ(dimension, subquantizers, bits, metric)
+            index.train(training)
+            return index
+        return faiss.IndexFlatIP(dimension)
+
+    def _maybe_compact_index(self) -> bool:
+        """Convert a flat index to the configured compact encoding when possible.
+
+        PQ needs training data, so it takes over once ``pq_train_size`` vectors
+        exist. Compact indexes are never converted back; use a rebuild instead.
+        """
+        target = COMPRESSION_INDEX_TYPES[self._compression()]
+        current = self.index_metadata.index_type if self.index_metadata else "IndexFlatIP"
+        if current == target:
+            return False
+        if current != "IndexFlatIP":
+            plugin_logger.warning(
+                f"Vector index encoding {current} differs from configured {target}; rebuild the index to change it"
+            )
+            return False
+
+        total = int(self.vector_index.ntotal)
+        if target == "IndexPQ":
+            try:
+                train_size = int(getattr(self.vector_config, 'pq_train_size', 4096))
+            except (TypeError, ValueError):
+                train_size = 4096
+            if total < max(train_size, 1 << int(getattr(self.vector_config, 'pq_bits', 8))):
+                return False
+
+        dimension = int(self.index_metadata.dimension)
+        vectors = self.vector_index.reconstruct_n(0, total) if total else np.empty((0, dimension), dtype='float32')
+        compact = self._build_compact_index(target, dimension, vectors)
+        if total:
+            compact.add(vectors)
+        self.vector_index = compact
+        self.index_metadata.index_type = target
+        plugin_logger.info(f"Vector index converted to {target} ({total} vectors)")
+        return True
+
+    def _raw_vectors_path(self) -> Path:
+        stem = self._index_stem()
+        return stem.with_name(stem.name + ".f32")
+
+    def _raw_vector_rows(self) -> int:
+        path = self._raw_vectors_path()
+        if not path.exists():
+            return 0
+        return path.stat().st_size // (int(self.index_metadata.dimension) * 4)
+
+    def _init_raw_vectors(self) -> None:
+        """Make sure the exact-vector sidecar lines up with the index rowids."""
+        self._raw_vectors_enabled = self._rerank_depth() > 0
+        self._raw_vectors_cache = None
+        if not self._raw_vectors_enabled:
+            return
+
+        total = int(self.vector_index.ntotal)
+        if self._raw_vector_rows() == total:
+            return
+        if self._index_role != "writer":
+            # The writer may already have appended past our mapped generation
+            if self._raw_vector_rows() < total:
+                self._raw_vectors_enabled = False
+            return
+        if self.index_metadata.index_type != "IndexFlatIP":
+            plugin_logger.warning("Exact vectors unavailable for re-ranking; rebuild the index to enable rerank_k")
+            self._raw_vectors_enabled = False
+            return
+
+        path = self._raw_vectors_path()
+        vectors = self.vector_index.reconstruct_n(0, total) if total else np.empty((0, 0), dtype='float32')
+        temp_path = path.with_suffix('.f32.tmp')
+        temp_path.write_bytes(np.ascontiguousarray(vectors, dtype='float32').tobytes())
+        temp_path.replace(path)
+
+    def _append_raw_vectors(self, start_rowid: int, embeddings: np.ndarray) -> None:
+        if not self._raw_vectors_enabled:
+            return
+        if self._raw_vector_rows() != start_rowid:
+            plugin_logger.warning("Exact-vector sidecar out of sync with index; disabling re-ranking")
+            self._raw_vectors_enabled = False
+            return
+        with open(self._raw_vectors_path(), 'ab') as f:
+            f.write(np.ascontiguousarray(embeddings, dtype='float32').tobytes())
+
+    def _raw_vectors(self) -> Optional[np.ndarray]:
+        """Memory-map the exact-vector sidecar, remapping when it grows."""
+        if not self._raw_vectors_enabled:
+            return None
+        path = self._raw_vectors_path()
+        if not path.exists():
+            return None
+        size = path.stat().st_size
+        if self._raw_vectors_cache is None or self._raw_vectors_cache[0] != size:
+            dimension = int(self.index_metadata.dimension)
+            rows = size // (dimension * 4)
+            if rows == 0:
+                return None
+            self._raw_vectors_cache = (size, np.memmap(path, dtype='float32', mode='r', shape=(rows, dimension)))
+        return self._raw_vectors_cache[1]
+
+    def _rerank_hits(self, query_embedding: np.ndarray, distances: Any, rowids: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Re-score the leading candidates against exact float32 vectors."""
+        distances = np.asarray(distances, dtype='float32')
+        rowids = np.asarray(rowids, dtype='int64')
+        depth = self._rerank_depth()
+        raw = self._raw_vectors() if depth else None
+        if raw is None or rowids.size == 0:
+            return distances, rowids
+
+        head = min(depth, rowids.size)
+        head_ids = rowids[:head]
+        if not ((head_ids >= 0) & (head_ids < raw.shape[0])).all():
+            return distances, rowids
+        exact = np.asarray(raw[head_ids]) @ query_embedding[0]
+        order = np.argsort(-exact)
+        return (
+            np.concatenate([exact[order].astype('float32'), distances[head:]]),
+            np.concatenate([head_ids[order], rowids[head:]]),
+        )
+
+    def _memory_stats(self) -> Dict[str, Any]:
+        """Resident vector bytes versus float32, plus text not stored in the mapping."""
+        dimension = int(self.vector_config.dimension)
+        total = int(self.vector_index.ntotal) if self.vector_index is not None else 0
+        code_size = int(getattr(self.vector_index, 'code_size', dimension * 4) or dimension * 4)
+        float32_bytes = total * dimension * 4
+        index_bytes = total * code_size
+
+        text_saved = 0
+        try:
+            scope_sql, scope_params = self._scope_clause()
+            with self._db_lock:
+                row = self._db_conn.execute(
+                    "SELECT COALESCE(SUM(text_length - LENGTH(text_content)), 0) FROM vector_entries "
+                    f"WHERE {scope_sql} AND content_ref IS NOT NULL",
+                    scope_params,
+                ).fetchone()
+            text_saved = max(0, int(row[0] or 0))
+        except Exception:
+            text_saved = 0
+
+        return {
+            'compression': self._compression(),
+            'index_type': self.index_metadata.index_type if self.index_metadata else None,
+            'bytes_per_vector': code_size,
+            'index_bytes': index_bytes,
+            'float32_bytes': float32_bytes,
+            'index_bytes_saved': max(0, float32_bytes - index_bytes),
+            'text_bytes_saved': text_saved,
+            'rerank_k': self._rerank_depth(),
+            'rerank_available': self._raw_vectors_enabled,
+        }
+
     def _init_mapping_database(self) -> None:
         """Initialize the SQLite database for UUID mapping."""
         vectors_dir = self.repo_root / ".scribe_vectors"
+        vectors_dir.mkdir(exist_ok=True)
         self.mapping_db_path = vectors_dir / "mapping.sqlite"
 
         with self._db_lock:
             self._db_conn = sqlite3.connect(str(self.mapping_db_path), check_same_thread=False)
             self._db_conn.row_factory = sqlite3.Row
+            # INSERT OR REPLACE must fire the delete trigger that keeps the FTS index in sync
+            self._db_conn.execute("PRAGMA recursive_triggers = ON")
 
             # Create tables
             self._db_conn.execute("""
@@ -349,13 +1654,164 @@ class VectorIndexer(HookPlugin):
                 )
             """)
 
+            # Filter columns promoted out of metadata_json for pre-filtered search
+            cursor = self._db_conn.execute("PRAGMA table_info(vector_entries)")
+            existing = {row[1] for row in cursor.fetchall()}
+            added = False
+            for name in ("content_type", "doc_type", "file_path", "timestamp_epoch"):
+                if name in existing:
+                    continue
+                ddl = "REAL" if name == "timestamp_epoch" else "TEXT"
+                self._db_conn.execute(f"ALTER TABLE vector_entries ADD COLUMN {name} {ddl}")
+                added = True
+            if added:
+                self._backfill_filter_columns()
+
+            # Content pointer used instead of text_content when store_text_content is off
+            if "content_ref" not in existing:
+                self._db_conn.execute("ALTER TABLE vector_entries ADD COLUMN content_ref TEXT")
+            if "text_length" not in existing:
+                self._db_conn.execute("ALTER TABLE vector_entries ADD COLUMN text_length INTEGER")
+            # Which index a row's vector_rowid belongs to ('' is the repo-wide index)
+            if "shard_key" not in existing:
+                self._db_conn.execute("ALTER TABLE vector_entries ADD COLUMN shard_key TEXT NOT NULL DEFAULT ''")
+
             # Create indexes
             self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_entry_id ON vector_entries(entry_id)")
             self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_project_slug ON vector_entries(project_slug)")
             self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON vector_entries(timestamp_utc)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_vector_rowid ON vector_entries(repo_slug, vector_rowid)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_project_content ON vector_entries(project_slug, content_type)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_content_doc_type ON vector_entries(content_type, doc_type)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_file_path ON vector_entries(file_path)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp_epoch ON vector_entries(timestamp_epoch)")
+            self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_shard_rowid ON vector_entries(repo_slug, shard_key, vector_rowid)")
+
+            # Per-document chunk manifest: ordinal -> content hash -> entry (and its vector_rowid)
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS doc_chunks (
+                    repo_slug TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    ordinal INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    entry_id TEXT NOT NULL,
+                    PRIMARY KEY (repo_slug, file_path, ordinal)
+                )
+            """)
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS doc_versions (
+                    repo_slug TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    doc_version TEXT NOT NULL,
+                    chunk_total INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (repo_slug, file_path)
+                )
+            """)
+
+            self._init_lexical_index()
+
+            # Entries appended in reader processes, waiting for the writer
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS pending_embeddings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entry_json TEXT NOT NULL,
+                    queued_at TEXT NOT NULL
+                )
+            """)
 
             self._db_conn.commit()
 
+    def _init_lexical_index(self) -> None:
+        """Create the FTS5 index over text_content (caller holds _db_lock).
+
+        The index is external-content, kept in sync by triggers, so text is
+        stored once. Builds without FTS5 fall back to substring retrieval.
+        """
+        exists = self._db_conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'vector_entries_fts'"
+        ).fetchone()
+        try:
+            self._db_conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS vector_entries_fts USING fts5(
+                    text_content, content='vector_entries', content_rowid='id'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            plugin_logger.debug(f"SQLite FTS5 unavailable, lexical search uses substring matching: {e}")
+            self._fts_available = False
+            return
+        self._db_conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS vector_entries_fts_insert AFTER INSERT ON vector_entries BEGIN
+                INSERT INTO vector_entries_fts(rowid, text_content) VALUES (new.id, new.text_content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS vector_entries_fts_delete AFTER DELETE ON vector_entries BEGIN
+                INSERT INTO vector_entries_fts(vector_entries_fts, rowid, text_content)
+                VALUES ('delete', old.id, old.text_content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS vector_entries_fts_update AFTER UPDATE OF text_content ON vector_entries BEGIN
+                INSERT INTO vector_entries_fts(vector_entries_fts, rowid, text_content)
+                VALUES ('delete', old.id, old.text_content);
+                INSERT INTO vector_entries_fts(rowid, text_content) VALUES (new.id, new.text_content);
+            END;
+        """)
+        if not exists:
+            # Index rows written before the FTS table existed
+            self._db_conn.execute("INSERT INTO vector_entries_fts(vector_entries_fts) VALUES ('rebuild')")
+        self._fts_available = True
+
+    def _backfill_filter_columns(self) -> None:
+        """Populate filter columns for rows written before they existed (caller holds _db_lock)."""
+        rows = self._db_conn.execute(
+            "SELECT id, timestamp_utc, metadata_json FROM vector_entries"
+        ).fetchall()
+        updates = []
+        for row in rows:
+            content_type, doc_type, file_path = self._filter_fields_from_meta(row['metadata_json'])
+            updates.append((
+                content_type,
+                doc_type,
+                file_path,
+                self._timestamp_to_epoch(row['timestamp_utc']),
+                row['id'],
+            ))
+        if updates:
+            self._db_conn.executemany(
+                "UPDATE vector_entries SET content_type = ?, doc_type = ?, file_path = ?, timestamp_epoch = ? WHERE id = ?",
+                updates,
+            )
+            plugin_logger.info(f"Backfilled vector filter columns for {len(updates)} entries")
+
+    @staticmethod
+    def _filter_fields_from_meta(metadata_json: Any) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Extract content_type/doc_type/file_path from stored metadata."""
+        meta = metadata_json
+        if isinstance(metadata_json, str):
+            try:
+                meta = json.loads(metadata_json)
+            except (TypeError, json.JSONDecodeError):
+                meta = {}
+        if not isinstance(meta, dict):
+            meta = {}
+
+        def _text(value: Any) -> Optional[str]:
+            return str(value) if value is not None else None
+
+        return _text(meta.get('content_type')), _text(meta.get('doc_type')), _text(meta.get('file_path'))
+
+    @staticmethod
+    def _timestamp_to_epoch(value: Any) -> Optional[float]:
+        """Convert a stored or filter timestamp to UTC epoch seconds (naive = UTC)."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value).replace(' UTC', '').replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
     def _init_background_queue(self) -> None:
         """Initialize the background embedding processing queue."""
         maxsize = self.vector_config.queue_max
@@ -440,6 +1896,9 @@ class VectorIndexer(HookPlugin):
             return False
 
     def _prepare_embedding_task(self, entry_data: Dict[str, Any]) -> Dict[str, Any]:
+        meta = entry_data.get('meta', {})
+        content_type, doc_type, file_path = self._filter_fields_from_meta(meta)
+        chunk_meta = meta if isinstance(meta, dict) and meta.get('chunk_hash') else {}
         return {
             'entry_id': entry_data.get('entry_id'),
             'project_slug': entry_data.get('project_name', '').lower().replace(' ', '-'),
@@ -447,10 +1906,17 @@ class VectorIndexer(HookPlugin):
             'agent_name': entry_data.get('agent', ''),
             'timestamp_utc': entry_data.get('timestamp', ''),
             'metadata_json': json.dumps(entry_data.get('meta', {})),
+            'content_type': content_type,
+            'doc_type': doc_type,
+            'file_path': file_path,
+            'chunk_hash': chunk_meta.get('chunk_hash'),
+            'chunk_index': chunk_meta.get('chunk_index'),
+            'doc_version': chunk_meta.get('sha_after'),
             'embedding_model': self.vector_config.model,
             'vector_dimension': self.vector_config.dimension,
             'retry_count': 0,
-            'queued_at': utcnow()
+            'queued_at': utcnow(),
+            'enqueued_at': time.monotonic()
         }
 
     async def _queue_worker(self) -> None:
@@ -458,9 +1924,14 @@ class VectorIndexer(HookPlugin):
         batch_size = self.vector_config.batch_size
         plugin_logger.info(f"Vector embedding worker started (batch_size: {batch_size})")
 
+        if not await self._await_warmup():
+            plugin_logger.error("Vector embedding worker stopped: model warm-up failed")
+            return
+
         while not self._shutdown_event.is_set():
             try:
-                # Collect batch of entries
+                # Collect batch of entries, growing the batch when the queue backs up
+                batch_size = self._adaptive_batch_size()
                 batch = []
                 timeout = 1.0  # Wait up to 1 second for first item
 
@@ -472,6 +1943,7 @@ class VectorIndexer(HookPlugin):
                     except asyncio.TimeoutError:
                         if batch:  # Process if we have items
                             break
+                        await self._drain_spool()  # Pick up appends from reader processes while idle
                         continue  # Continue waiting for first item
 
                 if batch and not self._shutdown_event.is_set():
@@ -486,15 +1958,18 @@ class VectorIndexer(HookPlugin):
     async def _process_embedding_batch(self, batch: List[Dict[str, Any]]) -> None:
         """Process a batch of entries for embedding."""
         try:
+            # Chunks queued for an older revision of their document need no vector
+            batch = self._drop_superseded_chunks(batch)
+            if not batch:
+                return
+
             # Extract texts for batch embedding
             texts = [item['text_content'] for item in batch]
 
-            # Generate embeddings
-            embeddings = self.embedding_model.encode(
-                texts,
-                batch_size=len(texts),
-                convert_to_numpy=True
-            )
+            # Generate embeddings on the inference executor
+            dequeued_at = time.monotonic()
+            embeddings = await self._encode_batch(texts)
+            self._record_batch_timings(batch, dequeued_at, (time.monotonic() - dequeued_at) * 1000)
 
             # Normalize embeddings for cosine similarity
             embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
@@ -516,6 +1991,10 @@ class VectorIndexer(HookPlugin):
 
     async def _store_embeddings_batch(self, batch: List[Dict[str, Any]], embeddings: np.ndarray) -> None:
         """Store embeddings and update mapping database."""
+        if self._shards_enabled():
+            await self._store_sharded_batch(batch, embeddings)
+            return
+
         if not self.queue_lock:
             raise RuntimeError("Queue lock not initialized")
 
@@ -525,34 +2004,48 @@ class VectorIndexer(HookPlugin):
 
                 # Add embeddings to FAISS index
                 self.vector_index.add(embeddings)
+                self._append_raw_vectors(start_rowid, embeddings)
+                self._maybe_compact_index()
 
                 # Save FAISS index
-                vectors_dir = self.repo_root / ".scribe_vectors"
-                index_path = vectors_dir / f"{self.repo_slug}.faiss"
-                faiss.write_index(self.vector_index, str(index_path))
+                index_path, metadata_path = self._index_paths()
+                self._write_index_file(index_path)
 
                 # Update mapping database
                 with self._db_lock:
+                    self._forget_entries([item['entry_id'] for item in batch])
                     for i, item in enumerate(batch):
                         vector_rowid = start_rowid + i
+                        stored_text, content_ref = self._stored_text(item)
 
                         self._db_conn.execute("""
                             INSERT OR REPLACE INTO vector_entries
                             (entry_id, project_slug, repo_slug, vector_rowid, text_content,
-                             agent_name, timestamp_utc, metadata_json, embedding_model, vector_dimension)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                             agent_name, timestamp_utc, metadata_json, embedding_model, vector_dimension,
+                             content_type, doc_type, file_path, timestamp_epoch,
+                             content_ref, text_length, shard_key)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         """, (
                             item['entry_id'],
                             item['project_slug'],
                             self.repo_slug,
                             vector_rowid,
-                            item['text_content'],
+                            stored_text,
                             item['agent_name'],
                             item['timestamp_utc'],
                             item['metadata_json'],
                             item['embedding_model'],
-                            item['vector_dimension']
+                            item['vector_dimension'],
+                            item.get('content_type'),
+                            item.get('doc_type'),
+                            item.get('file_path'),
+                            self._timestamp_to_epoch(item['timestamp_utc']),
+                            content_ref,
+                            len(item['text_content']),
+                            self._shard_key
                         ))
+                        if item.get('chunk_hash') and item.get('file_path'):
+                            self._record_doc_chunk(item)
 
                     self._db_conn.commit()
 
@@ -560,8 +2053,6 @@ class VectorIndexer(HookPlugin):
                 self.index_metadata.total_entries = self.vector_index.ntotal
                 self.index_metadata.last_updated = utcnow()
                 self.index_metadata.index_size_bytes = index_path.stat().st_size
-
-                metadata_path = vectors_dir / f"{self.repo_slug}.meta.json"
                 self._save_index_metadata(metadata_path)
 
                 plugin_logger.debug(f"Stored {len(batch)} embeddings, total: {self.index_metadata.total_entries}")
@@ -570,6 +2061,172 @@ class VectorIndexer(HookPlugin):
                 plugin_logger.error(f"Failed to store embeddings batch: {e}")
                 raise
 
+    def plan_doc_chunks(
+        self,
+        file_path: str,
+        chunk_hashes: List[str],
+        doc_version: str = "",
+    ) -> Dict[str, Any]:
+        """Diff a document's chunks against its manifest and return what to embed.
+
+        Chunks whose content hash is already indexed for the file are kept, and
+        renumbered in place when an edit moved them. Indexed chunks that no
+        longer appear are tombstoned: their mapping rows are dropped so search
+        skips the vectors. Only the ordinals listed under 'embed' need encoding.
+        """
+        total = len(chunk_hashes)
+        if not getattr(self, '_db_conn', None):
+            return {'embed': list(range(total)), 'kept': 0, 'tombstoned': 0}
+
+        embed: List[int] = []
+        kept: List[Tuple[int, str, str]] = []
+        renumbered = 0
+        with self._db_lock:
+            cursor = self._db_conn.execute("""
+                SELECT m.ordinal, m.content_hash, m.entry_id, e.metadata_json
+                FROM doc_chunks m JOIN vector_entries e ON e.entry_id = m.entry_id
+                WHERE m.repo_slug = ? AND m.file_path = ?
+                ORDER BY m.ordinal
+            """, (self.repo_slug, file_path))
+            indexed: Dict[str, List[sqlite3.Row]] = {}
+            for row in cursor.fetchall():
+                indexed.setdefault(row['content_hash'], []).append(row)
+
+            for ordinal, content_hash in enumerate(chunk_hashes):
+                matches = indexed.get(content_hash)
+                if not matches:
+                    embed.append(ordinal)
+                    continue
+                row = matches.pop(0)
+                kept.append((ordinal, content_hash, row['entry_id']))
+                renumbered += self._renumber_chunk(row, ordinal, total, doc_version)
+
+            removed = [row['entry_id'] for rows in indexed.values() for row in rows]
+            self._forget_entries(removed)
+            for start in range(0, len(removed), 500):
+                ids = removed[start:start + 500]
+                self._db_conn.execute(
+                    f"DELETE FROM vector_entries WHERE entry_id IN ({', '.join('?' for _ in ids)})",
+                    ids,
+                )
+
+            self._db_conn.execute(
+                "DELETE FROM doc_chunks WHERE repo_slug = ? AND file_path = ?",
+                (self.repo_slug, file_path),
+            )
+            self._db_conn.executemany(
+                "INSERT INTO doc_chunks (repo_slug, file_path, ordinal, content_hash, entry_id) VALUES (?, ?, ?, ?, ?)",
+                [(self.repo_slug, file_path, ordinal, content_hash, entry_id) for ordinal, content_hash, entry_id in kept],
+            )
+            self._db_conn.execute("""
+                INSERT OR REPLACE INTO doc_versions (repo_slug, file_path, doc_version, chunk_total, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (self.repo_slug, file_path, doc_version or "", total, utcnow().isoformat()))
+            self._db_conn.commit()
+
+        if removed or renumbered:
+            self._invalidate_result_cache()
+        self._chunk_stats['documents'] += 1
+        self._chunk_stats['embedded'] += len(embed)
+        self._chunk_stats['skipped'] += len(kept)
+        self._chunk_stats['tombstoned'] += len(removed)
+        return {'embed': embed, 'kept': len(kept), 'tombstoned': len(removed)}
+
+    def _renumber_chunk(self, row: sqlite3.Row, ordinal: int, total: int, doc_version: str) -> bool:
+        """Point a kept chunk's stored metadata at its new position (caller holds _db_lock)."""
+        try:
+            meta = json.loads(row['metadata_json'] or '{}')
+        except (TypeError, ValueError):
+            return False
+        if not isinstance(meta, dict):
+            return False
+        updated = dict(meta, chunk_index=ordinal, chunk_total=total)
+        if doc_version:
+            updated['sha_after'] = doc_version
+        if updated == meta:
+            return False
+        self._db_conn.execute(
+            "UPDATE vector_entries SET metadata_json = ? WHERE entry_id = ?",
+            (json.dumps(updated), row['entry_id']),
+        )
+        return True
+
+    def _record_doc_chunk(self, item: Dict[str, Any]) -> None:
+        """Add a freshly stored chunk to its document manifest (caller holds _db_lock)."""
+        self._db_conn.execute("""
+            INSERT OR REPLACE INTO doc_chunks (repo_slug, file_path, ordinal, content_hash, entry_id)
+            VALUES (?, ?, ?, ?, ?)
+        """, (self.repo_slug, item['file_path'], int(item.get('chunk_index') or 0), item['chunk_hash'], item['entry_id']))
+
+    def _drop_superseded_chunks(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Remove document chunks queued for a revision that has since been replaced."""
+        paths = {item['file_path'] for item in batch if item.get('doc_version') and item.get('file_path')}
+        if not paths or not getattr(self, '_db_conn', None):
+            return batch
+        with self._db_lock:
+            cursor = self._db_conn.execute(
+                f"SELECT file_path, doc_version FROM doc_versions WHERE repo_slug = ? "
+                f"AND file_path IN ({', '.join('?' for _ in paths)})",
+                (self.repo_slug, *paths),
+            )
+            current = {row['file_path']: row['doc_version'] for row in cursor.fetchall()}
+
+        kept = [
+            item for item in batch
+            if not item.get('doc_version')
+            or current.get(item.get('file_path'), item['doc_version']) == item['doc_version']
+        ]
+        self._chunk_stats['superseded'] += len(batch) - len(kept)
+        return kept
+
+    def _forget_rows(self, where_sql: str, params: Any) -> None:
+        """Remove mapped entries that are about to be replaced or dropped from backend state.
+
+        Only rows that kept their full text can be re-featurised; entries stored
+        as a preview plus ``content_ref`` stay counted until the next full rebuild.
+        Caller holds ``_db_lock``.
+        """
+        model = self.embedding_model
+        if not isinstance(model, EmbeddingBackend):
+            return
+        cursor = self._db_conn.execute(
+            f"SELECT text_content FROM vector_entries WHERE content_ref IS NULL AND ({where_sql})",
+            params,
+        )
+        texts = [row['text_content'] for row in cursor.fetchall()]
+        if texts:
+            model.forget(texts)
+
+    def _forget_entries(self, entry_ids: List[str]) -> None:
+        for start in range(0, len(entry_ids), 500):
+            ids = entry_ids[start:start + 500]
+            self._forget_rows(f"entry_id IN ({', '.join('?' for _ in ids)})", ids)
+
+    def _stored_text(self, item: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Return the text to persist and, when text storage is off, a content pointer."""
+        text = item['text_content']
+        if getattr(self.vector_config, 'store_text_content', True) is not False:
+            return text, None
+
+        try:
+            preview_chars = max(0, int(getattr(self.vector_config, 'text_preview_chars', 240)))
+        except (TypeError, ValueError):
+            preview_chars = 240
+        try:
+            meta = json.loads(item.get('metadata_json') or '{}')
+        except (TypeError, json.JSONDecodeError):
+            meta = {}
+        if not isinstance(meta, dict):
+            meta = {}
+        content_ref = {
+            'entry_id': item['entry_id'],
+            'project_slug': item['project_slug'],
+            'file_path': item.get('file_path'),
+            'chunk_index': meta.get('chunk_index'),
+            'text_sha256': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+        }
+        return text[:preview_chars], json.dumps(content_ref, sort_keys=True)
+
     def _save_index_metadata(self, metadata_path: Path) -> None:
         """Save index metadata to JSON file."""
         metadata_dict = {
@@ -582,7 +2239,9 @@ class VectorIndexer(HookPlugin):
             'index_type': self.index_metadata.index_type,
             'total_entries': self.index_metadata.total_entries,
             'last_updated': self.index_metadata.last_updated.isoformat() if self.index_metadata.last_updated else None,
-            'embedding_model_version': self.index_metadata.embedding_model_version
+            'embedding_model_version': self.index_metadata.embedding_model_version,
+            # Readers remap whenever the published generation changes
+            'generation': self._index_generation + 1
         }
 
         # Atomic write
@@ -590,6 +2249,9 @@ class VectorIndexer(HookPlugin):
         with open(temp_path, 'w') as f:
             json.dump(metadata_dict, f, indent=2)
         temp_path.rename(metadata_path)
+        self._index_generation += 1
+        self._metadata_mtime_ns = metadata_path.stat().st_mtime_ns
+        self._save_embedding_state()
 
     # Public API methods for MCP tools
     def get_index_status(self) -> Dict[str, Any]:
@@ -607,67 +2269,260 @@ class VectorIndexer(HookPlugin):
             'repo_slug': self.repo_slug,
             'model': self.vector_config.model,
             'dimension': self.vector_config.dimension,
-            'total_entries': self.index_metadata.total_entries if self.index_metadata else 0,
+            'total_entries': (self.index_metadata.total_entries if self.index_metadata else 0) + sum(
+                shard.index_metadata.total_entries for shard in list(self._shards.values()) if shard.index_metadata
+            ),
             'last_updated': self.index_metadata.last_updated.isoformat() if self.index_metadata and self.index_metadata.last_updated else None,
             'queue_depth': self.embedding_queue.qsize() if self.embedding_queue else 0,
             'queue_max': self.vector_config.queue_max,
             'gpu_enabled': self.vector_config.gpu,
-            'faiss_available': FAISS_AVAILABLE
+            'faiss_available': FAISS_AVAILABLE,
+            'ready': self.is_ready(),
+            'warmup': self._warmup_status(),
+            'sharing': self._sharing_status(),
+            'sharding': self._shard_status(),
+            'doc_chunks': dict(self._chunk_stats),
+            'query_cache': self._cache_status(),
+            'timings': self._encode_timings(),
+            'memory': self._memory_stats()
         }
 
     def search_similar(self, query: str, k: int = 10, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Search for similar entries using vector similarity."""
-        if not self.initialized or not self.vector_index or not self.embedding_model:
+        """Search for similar entries using vector similarity.
+
+        Filters are resolved to candidate rowids with an indexed SQL query first,
+        so only that subset is scored. Filters the SQL path cannot express fall
+        back to overfetching and filtering in Python. With project sharding the
+        query is encoded once and only the shards the filters select are searched.
+        """
+        if not self.initialized or not self.wait_until_ready():
+            return []
+        self._refresh_reader_index()
+        if not self.vector_index or not self.embedding_model:
             return []
 
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode([query])
-            query_embedding = query_embedding / np.linalg.norm(query_embedding, axis=1, keepdims=True)
+            normalized = self._normalize_query(query)
+            cache_key = self._result_cache_key(normalized, k, filters)
+            cached = self._cached_results(cache_key)
+            if cached is not None:
+                return cached
+
+            query_embedding = self._query_embedding(normalized)
+            if self._shards_enabled():
+                results = self._fan_out_search(query_embedding, k, filters)
+            else:
+                results = self._search_encoded(query_embedding, k, filters)
+            self._remember_results(cache_key, results)
+            return results
+
+        except Exception as e:
+            plugin_logger.error(f"Vector search failed: {e}")
+            return []
+
+    def search_lexical(self, query: str, k: int = 10, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Keyword search over stored entry text, best matches first.
+
+        Uses the FTS5 index ranked by BM25 (``lexical_score``, higher is
+        better), or case-insensitive substring matching of the query terms
+        when FTS5 is unavailable. Filters use the same SQL conditions as
+        pre-filtered vector search. Covers the whole repository, every shard
+        included; with ``store_text_content`` off only previews are searchable.
+        """
+        if not self.initialized or getattr(self, '_db_conn', None) is None:
+            return []
+        terms = list(dict.fromkeys(re.findall(r"\w+", self._normalize_query(query).lower())))
+        terms = terms[:LEXICAL_MAX_TERMS]
+        target_k = max(1, int(k))
+        if not terms:
+            return []
+
+        filter_sql = self._filter_clauses(filters or {})
+        clauses, params = filter_sql if filter_sql is not None else ([], [])
+        # Filters SQL cannot express are applied afterwards, so overfetch for them
+        limit = target_k if filter_sql is not None or not filters else target_k * 4
+        # Filter columns exist only on vector_entries, so they need no table prefix
+        where = " AND ".join(["v.repo_slug = ?", *clauses])
+
+        if self._fts_available:
+            sql = f"""
+                SELECT v.*, -bm25(vector_entries_fts) AS lexical_score
+                FROM vector_entries_fts JOIN vector_entries v ON v.id = vector_entries_fts.rowid
+                WHERE vector_entries_fts MATCH ? AND {where}
+                ORDER BY lexical_score DESC LIMIT ?
+            """
+            sql_params = [" OR ".join(f'"{term}"' for term in terms), self.repo_slug, *params, limit]
+        else:
+            matched = " + ".join("(instr(lower(v.text_content), ?) > 0)" for _ in terms)
+            sql = f"""
+                SELECT * FROM (
+                    SELECT v.*, CAST({matched} AS REAL) / ? AS lexical_score
+                    FROM vector_entries v WHERE {where}
+                ) WHERE lexical_score > 0
+                ORDER BY lexical_score DESC, timestamp_epoch DESC LIMIT ?
+            """
+            sql_params = [*terms, len(terms), self.repo_slug, *params, limit]
+
+        try:
+            with self._db_lock:
+                rows = self._db_conn.execute(sql, sql_params).fetchall()
+        except sqlite3.Error as e:
+            plugin_logger.error(f"Lexical search failed: {e}")
+            return []
+
+        results: List[Dict[str, Any]] = []
+        for row in rows:
+            if filter_sql is None and filters and not self._apply_filters(row, filters):
+                continue
+            result = self._result_from_row(row)
+            result['lexical_score'] = float(row['lexical_score'])
+            results.append(result)
+            if len(results) >= target_k:
+                break
+        return results
+
+    # Query caches
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Canonical form used as the cache key: NFC, whitespace collapsed."""
+        return " ".join(unicodedata.normalize("NFC", query or "").split())
+
+    def _cache_limit(self, name: str, default: float) -> float:
+        value = getattr(self.vector_config, name, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return default
+        return max(0, value)
+
+    def _query_embedding(self, normalized: str) -> np.ndarray:
+        """Normalised embedding for a query, from the LRU cache when possible."""
+        capacity = int(self._cache_limit('cache_size', 1000))
+        model = self.embedding_model
+        model_key = (id(model), getattr(model, 'state_version', 0))
+        with self._cache_lock:
+            if self._query_cache_model != model_key:
+                # Cached vectors belong to a previous model or backend state
+                self._query_cache.clear()
+                self._query_cache_model = model_key
+            cached = self._query_cache.get(normalized) if capacity else None
+            if cached is not None:
+                self._query_cache.move_to_end(normalized)
+                self._cache_stats['embedding_hits'] += 1
+                return cached
+            self._cache_stats['embedding_misses'] += 1
+
+        embedding = self._encode_query(normalized)
+        embedding = embedding / np.linalg.norm(embedding, axis=1, keepdims=True)
+        if capacity:
+            with self._cache_lock:
+                if self._query_cache_model != model_key:
+                    return embedding
+                self._query_cache[normalized] = embedding
+                while len(self._query_cache) > capacity:
+                    self._query_cache.popitem(last=False)
+        return embedding
+
+    def _cache_generation(self) -> Tuple[Any, ...]:
+        """Identifies the searchable state; any index write or tombstone changes it."""
+        with self._shards_lock:
+            shards = tuple(sorted((key, shard._index_generation) for key, shard in self._shards.items()))
+        return (self._index_generation, self._cache_epoch, shards)
+
+    def _result_cache_key(self, normalized: str, k: int, filters: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        query_hash = hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+        filters_key = json.dumps(filters or {}, sort_keys=True, default=str)
+        return (query_hash, int(k), filters_key, self._cache_generation())
+
+    def _cached_results(self, key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+        if not self._cache_limit('result_cache_size', 256):
+            return None
+        now = time.monotonic()
+        with self._cache_lock:
+            generation = key[-1]
+            if self._result_cache_generation != generation:
+                if self._result_cache:
+                    self._cache_stats['invalidations'] += 1
+                self._result_cache.clear()
+                self._result_cache_generation = generation
+            entry = self._result_cache.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._result_cache[key]
+                self._cache_stats['result_misses'] += 1
+                return None
+            self._result_cache.move_to_end(key)
+            self._cache_stats['result_hits'] += 1
+            return [dict(result) for result in entry[1]]
+
+    def _remember_results(self, key: Tuple[Any, ...], results: List[Dict[str, Any]]) -> None:
+        capacity = int(self._cache_limit('result_cache_size', 256))
+        ttl = self._cache_limit('result_cache_ttl_seconds', 30.0)
+        if not capacity or not ttl:
+            return
+        with self._cache_lock:
+            if self._result_cache_generation != key[-1]:
+                return  # The index moved on while this search ran
+            self._result_cache[key] = (time.monotonic() + ttl, [dict(result) for result in results])
+            while len(self._result_cache) > capacity:
+                self._result_cache.popitem(last=False)
+
+    def _invalidate_result_cache(self) -> None:
+        with self._cache_lock:
+            self._cache_epoch += 1
+
+    def _cache_status(self) -> Dict[str, Any]:
+        stats = self._cache_stats
+
+        def _rate(hits: int, misses: int) -> float:
+            return round(hits / (hits + misses), 4) if hits + misses else 0.0
+
+        return {
+            **stats,
+            'embedding_hit_rate': _rate(stats['embedding_hits'], stats['embedding_misses']),
+            'result_hit_rate': _rate(stats['result_hits'], stats['result_misses']),
+            'embeddings_cached': len(self._query_cache),
+            'results_cached': len(self._result_cache),
+            'result_ttl_seconds': self._cache_limit('result_cache_ttl_seconds', 30.0),
+        }
 
+    def _search_encoded(
+        self,
+        query_embedding: np.ndarray,
+        k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top-k search of this index for an already normalised query embedding."""
+        try:
             total = int(self.vector_index.ntotal)
             if total <= 0:
                 return []
-
-            def _search_with_k(search_k: int) -> List[Dict[str, Any]]:
-                distances, rowids = self.vector_index.search(query_embedding, search_k)
-                results: List[Dict[str, Any]] = []
-                with self._db_lock:
-                    for i, rowid in enumerate(rowids[0]):
-                        distance = float(distances[0][i])
-                        cursor = self._db_conn.execute("""
-                            SELECT entry_id, project_slug, text_content, agent_name,
-                                   timestamp_utc, metadata_json
-                            FROM vector_entries
-                            WHERE vector_rowid = ? AND repo_slug = ?
-                        """, (int(rowid), self.repo_slug))
-                        row = cursor.fetchone()
-                        if not row:
-                            continue
-                        if filters and not self._apply_filters(row, filters):
-                            continue
-                        results.append({
-                            'entry_id': row['entry_id'],
-                            'project_slug': row['project_slug'],
-                            'text_content': row['text_content'],
-                            'agent_name': row['agent_name'],
-                            'timestamp_utc': row['timestamp_utc'],
-                            'metadata_json': row['metadata_json'],
-                            'similarity_score': distance,
-                            'vector_rowid': int(rowid)
-                        })
-                return results
+            target_k = max(1, int(k))
 
             # Default behavior: no filters, standard top-k
             if not filters:
-                search_k = min(max(1, int(k)), total)
-                return _search_with_k(search_k)
-
-            # Filtered search: overfetch to avoid starving filtered results
-            target_k = max(1, int(k))
+                fetch_k = min(max(target_k, self._rerank_depth()), total)
+                while True:
+                    distances, rowids = self.vector_index.search(query_embedding, fetch_k)
+                    distances, rowids = self._rerank_hits(query_embedding, distances[0], rowids[0])
+                    results = self._build_search_results(distances, rowids)
+                    # Tombstoned or replaced vectors have no mapping row; look further down
+                    if len(results) >= target_k or fetch_k >= total:
+                        return results[:target_k]
+                    fetch_k = min(total, max(fetch_k * 2, fetch_k + 50))
+
+            # Pre-filtered search over the matching subset only
+            candidates = self._prefilter_rowids(filters)
+            if candidates is not None:
+                hits = self._search_candidates(query_embedding, candidates, target_k)
+                if hits is not None:
+                    return self._build_search_results(*hits)
+
+            # Fallback: overfetch to avoid starving filtered results
             search_k = min(total, max(target_k, 50))
             while True:
-                results = _search_with_k(search_k)
+                distances, rowids = self.vector_index.search(query_embedding, search_k)
+                distances, rowids = self._rerank_hits(query_embedding, distances[0], rowids[0])
+                results = self._build_search_results(distances, rowids, filters)
                 if len(results) >= target_k or search_k >= total:
                     return results[:target_k]
                 search_k = min(total, max(search_k * 2, search_k + 50))
@@ -676,6 +2531,159 @@ class VectorIndexer(HookPlugin):
             plugin_logger.error(f"Vector search failed: {e}")
             return []
 
+    def _prefilter_rowids(self, filters: Dict[str, Any]) -> Optional[List[int]]:
+        """Resolve filters to matching vector rowids, or None if SQL cannot express them."""
+        filter_sql = self._filter_clauses(filters)
+        if filter_sql is None:
+            return None
+
+        scope_sql, scope_params = self._scope_clause()
+        clauses, params = filter_sql
+        try:
+            with self._db_lock:
+                rows = self._db_conn.execute(
+                    f"SELECT vector_rowid FROM vector_entries WHERE {' AND '.join([scope_sql, *clauses])}",
+                    [*scope_params, *params],
+                ).fetchall()
+        except sqlite3.OperationalError as e:
+            plugin_logger.debug(f"Vector pre-filter unavailable, using overfetch: {e}")
+            return None
+        return [int(row[0]) for row in rows]
+
+    def _filter_clauses(self, filters: Dict[str, Any]) -> Optional[Tuple[List[str], List[Any]]]:
+        """Translate filters to SQL conditions on vector_entries, or None if some cannot be."""
+        if any(key not in PREFILTER_KEYS for key in filters):
+            return None
+
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if 'project_slugs' in filters:
+            slugs = [str(slug) for slug in filters['project_slugs'] or []]
+            if not slugs:
+                return ["0"], []
+            clauses.append(f"project_slug IN ({', '.join('?' for _ in slugs)})")
+            params.extend(slugs)
+        elif 'project_slug_prefix' in filters:
+            prefix = str(filters['project_slug_prefix'])
+            clauses.append("substr(project_slug, 1, ?) = ?")
+            params.extend([len(prefix), prefix])
+        elif 'project_slug' in filters:
+            clauses.append("project_slug = ?")
+            params.append(filters['project_slug'])
+
+        for column in ('agent_name', 'content_type', 'doc_type', 'file_path'):
+            if column in filters:
+                clauses.append(f"{column} = ?")
+                params.append(filters[column])
+
+        time_range = filters.get('time_range')
+        if isinstance(time_range, dict):
+            for key, operator in (('start', '>='), ('end', '<=')):
+                if not time_range.get(key):
+                    continue
+                epoch = self._timestamp_to_epoch(time_range[key])
+                if epoch is None:
+                    return None
+                clauses.append(f"timestamp_epoch {operator} ?")
+                params.append(epoch)
+
+        return clauses, params
+
+    def _search_candidates(
+        self,
+        query_embedding: np.ndarray,
+        rowids: List[int],
+        k: int,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Top-k search restricted to candidate rowids.
+
+        Small subsets are scored exactly against reconstructed vectors; larger
+        ones use a FAISS ID selector. Returns None when the index supports
+        neither, so the caller can fall back.
+        """
+        total = int(self.vector_index.ntotal)
+        ids = np.unique(np.asarray(rowids, dtype='int64'))
+        ids = ids[(ids >= 0) & (ids < total)]
+        if ids.size == 0:
+            return np.empty(0, dtype='float32'), np.empty(0, dtype='int64')
+        k = min(k, int(ids.size))
+        fetch_k = min(max(k, self._rerank_depth()), int(ids.size))
+
+        try:
+            threshold = int(getattr(self.vector_config, 'prefilter_flat_threshold', 4096))
+        except (TypeError, ValueError):
+            threshold = 4096
+
+        if ids.size <= threshold:
+            try:
+                vectors = self.vector_index.reconstruct_batch(ids)
+            except Exception:
+                vectors = None
+            if vectors is not None:
+                scores = vectors @ query_embedding[0]
+                top = np.argpartition(-scores, fetch_k - 1)[:fetch_k] if fetch_k < ids.size else np.arange(ids.size)
+                top = top[np.argsort(-scores[top])]
+                distances, found = self._rerank_hits(query_embedding, scores[top], ids[top])
+                return distances[:k], found[:k]
+
+        if not hasattr(faiss, 'IDSelectorBatch'):
+            return None
+        try:
+            params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(ids))
+            distances, found = self.vector_index.search(query_embedding, fetch_k, params=params)
+        except Exception as e:
+            plugin_logger.debug(f"FAISS ID selector search unavailable: {e}")
+            return None
+        keep = found[0] >= 0
+        distances, found = self._rerank_hits(query_embedding, distances[0][keep], found[0][keep])
+        return distances[:k], found[:k]
+
+    def _build_search_results(
+        self,
+        distances: Any,
+        rowids: Any,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Join search hits with their mapping rows in one query, preserving rank order."""
+        wanted = [int(rowid) for rowid in rowids if int(rowid) >= 0]
+        if not wanted:
+            return []
+        scope_sql, scope_params = self._scope_clause()
+        with self._db_lock:
+            cursor = self._db_conn.execute(f"""
+                SELECT * FROM vector_entries
+                WHERE {scope_sql} AND vector_rowid IN ({', '.join('?' for _ in wanted)})
+            """, (*scope_params, *wanted))
+            rows_by_rowid = {int(row['vector_rowid']): row for row in cursor.fetchall()}
+
+        results: List[Dict[str, Any]] = []
+        for distance, rowid in zip(distances, rowids):
+            row = rows_by_rowid.get(int(rowid))
+            if not row:
+                continue
+            if filters and not self._apply_filters(row, filters):
+                continue
+            result = self._result_from_row(row)
+            result['similarity_score'] = float(distance)
+            result['vector_rowid'] = int(rowid)
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _result_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        result = {
+            'entry_id': row['entry_id'],
+            'project_slug': row['project_slug'],
+            'text_content': row['text_content'],
+            'agent_name': row['agent_name'],
+            'timestamp_utc': row['timestamp_utc'],
+            'metadata_json': row['metadata_json'],
+        }
+        if 'content_ref' in row.keys() and row['content_ref']:
+            result['content_ref'] = json.loads(row['content_ref'])
+        return result
+
     def retrieve_by_uuid(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve entry by UUID."""
         if not self.initialized:
@@ -684,15 +2692,13 @@ class VectorIndexer(HookPlugin):
         try:
             with self._db_lock:
                 cursor = self._db_conn.execute("""
-                    SELECT entry_id, project_slug, text_content, agent_name,
-                           timestamp_utc, metadata_json, vector_rowid
-                    FROM vector_entries
+                    SELECT * FROM vector_entries
                     WHERE entry_id = ? AND repo_slug = ?
                 """, (entry_id, self.repo_slug))
 
                 row = cursor.fetchone()
                 if row:
-                    return {
+                    entry = {
                         'entry_id': row['entry_id'],
                         'project_slug': row['project_slug'],
                         'text_content': row['text_content'],
@@ -701,6 +2707,9 @@ class VectorIndexer(HookPlugin):
                         'metadata_json': row['metadata_json'],
                         'vector_rowid': row['vector_rowid']
                     }
+                    if 'content_ref' in row.keys() and row['content_ref']:
+                        entry['content_ref'] = json.loads(row['content_ref'])
+                    return entry
 
             return None
 
@@ -774,11 +2783,50 @@ class VectorIndexer(HookPlugin):
             plugin_logger.warning(f"Filter application failed: {e}")
             return False  # Default to exclude if filtering fails
 
-    def rebuild_index(self) -> Dict[str, Any]:
-        """Rebuild the entire vector index from scratch."""
+    def _clear_index(self, forget: bool = True) -> int:
+        """Empty this index, its exact-vector sidecar and mapping rows; returns the old entry count.
+
+        ``forget`` also removes the cleared entries from backend state; a full
+        rebuild skips that and resets the state instead.
+        """
+        old_entries = self.index_metadata.total_entries if self.index_metadata else 0
+
+        self.vector_index.reset()
+        if self._raw_vectors_enabled:
+            self._raw_vectors_cache = None
+            self._raw_vectors_path().unlink(missing_ok=True)
+        if getattr(self, '_db_conn', None):
+            scope_sql, scope_params = self._scope_clause()
+            with self._db_lock:
+                if forget:
+                    self._forget_rows(scope_sql, scope_params)
+                self._db_conn.execute(f"DELETE FROM vector_entries WHERE {scope_sql}", scope_params)
+                self._db_conn.commit()
+
+        # Reset metadata
+        if self.index_metadata:
+            self.index_metadata.total_entries = 0
+            self.index_metadata.last_updated = utcnow()
+
+            # Publish the empty index so reader processes remap
+            index_path, metadata_path = self._index_paths()
+            self._write_index_file(index_path)
+            self._save_index_metadata(metadata_path)
+        return old_entries
+
+    def rebuild_index(self, project_slug: Optional[str] = None) -> Dict[str, Any]:
+        """Rebuild the entire vector index from scratch.
+
+        With project sharding, ``project_slug`` clears only that project's shard.
+        """
         if not self.initialized or not self.enabled:
             raise RuntimeError("Vector indexer not initialized or enabled")
 
+        if not self.wait_until_ready():
+            raise RuntimeError("Vector model and index are still loading; retry shortly")
+        if self._index_role != "writer" and not self._maybe_promote_to_writer():
+            raise RuntimeError("Vector index is read-only in this process; rebuild from the writer process")
+
         plugin_logger.info("Starting vector index rebuild")
         rebuild_start = time.time()
 
@@ -786,20 +2834,28 @@ class VectorIndexer(HookPlugin):
             # Stop background processing
             self._stop_background_processing()
 
-            # Get old statistics
-            old_entries = self.index_metadata.total_entries if self.index_metadata else 0
-
-            # Clear existing index
-            self.vector_index.reset()
-            if self._db_conn:
+            if project_slug is None:
+                targets = [self, *self._shards.values()]
+            elif self._shards_enabled():
+                targets = [self._open_shard(project_slug)]
+            else:
+                raise ValueError("Per-project rebuild requires shard_by='project'")
+
+            # Clear the selected indexes and their mapping rows
+            old_entries = sum(target._clear_index(forget=project_slug is not None) for target in targets)
+            if project_slug is None and isinstance(self.embedding_model, EmbeddingBackend):
+                # Shards share the repo's backend, so its state restarts with the index
+                self.embedding_model.reset_state()
+                self._save_embedding_state(force=True)
+            self._invalidate_result_cache()
+            if project_slug is None and self._db_conn:
                 with self._db_lock:
                     self._db_conn.execute("DELETE FROM vector_entries WHERE repo_slug = ?", (self.repo_slug,))
+                    self._db_conn.execute("DELETE FROM doc_chunks WHERE repo_slug = ?", (self.repo_slug,))
+                    self._db_conn.execute("DELETE FROM doc_versions WHERE repo_slug = ?", (self.repo_slug,))
                     self._db_conn.commit()
-
-            # Reset metadata
-            if self.index_metadata:
-                self.index_metadata.total_entries = 0
-                self.index_metadata.last_updated = utcnow()
+            if self._shards_enabled():
+                self._save_shard_manifest()
 
             # Restart background processing
             self._start_background_processing()
@@ -810,6 +2866,7 @@ class VectorIndexer(HookPlugin):
 
             return {
                 "success": True,
+                "project_slug": project_slug,
                 "rebuild_time_seconds": round(rebuild_time, 2),
                 "old_entries_count": old_entries,
                 "new_entries_count": 0,
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Reindex Scribe-managed docs and logs into the vector indexer.
 
-This script queues entries for embedding in the background (non-blocking).
+Files flow through a staged pipeline (discover, read/parse, chunk, embed,
+store) joined by bounded queues, so a slow stage applies backpressure instead
+of dropping entries. Completed files are checkpointed next to the index and an
+interrupted run resumes where it stopped when rerun with the same arguments.
 """
 
 from __future__ import annotations
@@ -11,11 +14,12 @@ import asyncio
 import hashlib
 import json
 import os
-import sqlite3
 import sys
 import time
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -49,7 +53,7 @@ if str(PARENT_ROOT) not in sys.path:
 from scribe_mcp.config.repo_config import RepoDiscovery
 from scribe_mcp.config.log_config import load_log_config, resolve_log_path
 from scribe_mcp.plugins.registry import get_plugin_registry, initialize_plugins
-from scribe_mcp.tools.manage_docs import _index_doc_for_vector
+from scribe_mcp.tools.manage_docs import _doc_vector_entries
 from scribe_mcp.utils.logs import parse_log_line, read_all_lines
 
 
@@ -173,96 +177,116 @@ def _get_vector_indexer():
     return None
 
 
-def _get_mapping_count(db_path: Path, repo_slug: str) -> int:
-    attempts = 5
-    for _ in range(attempts):
-        try:
-            conn = sqlite3.connect(db_path, timeout=2.0)
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT COUNT(*) FROM vector_entries WHERE repo_slug = ?",
-                (repo_slug,),
-            )
-            count = cur.fetchone()[0] or 0
-            conn.close()
-            return int(count)
-        except sqlite3.OperationalError as exc:
-            if "locked" in str(exc).lower():
-                time.sleep(0.1)
-                continue
-            return 0
-        except Exception:
-            return 0
-    return 0
+PIPELINE_STAGES = ("discover", "read", "chunk", "embed", "store")
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL_SECONDS = 2.0
+WARMUP_WAIT_SECONDS = 600.0
 
 
-def _wait_for_embedding_drain(
-    *,
-    vector_indexer,
-    baseline_count: int,
-    expected_new: int,
-    timeout: Optional[float],
-    poll_seconds: float,
-) -> Tuple[bool, int]:
-    if not vector_indexer:
-        return False, baseline_count
-    mapping_path = vector_indexer.mapping_db_path
-    repo_slug = vector_indexer.repo_slug
-    if not mapping_path or not repo_slug:
-        return False, baseline_count
-
-    target = baseline_count + expected_new
-    start = time.time()
-    last_report = start
-    while True:
-        current = _get_mapping_count(mapping_path, repo_slug)
-        meta_entries = 0
-        if getattr(vector_indexer, "index_metadata", None):
-            try:
-                meta_entries = int(vector_indexer.index_metadata.total_entries or 0)
-            except Exception:
-                meta_entries = 0
-        effective = max(current, meta_entries)
-        queue_depth = None
-        if getattr(vector_indexer, "embedding_queue", None):
-            try:
-                queue_depth = vector_indexer.embedding_queue.qsize()
-            except Exception:
-                queue_depth = None
-        now = time.time()
-        if effective >= target:
-            return True, effective
-        if timeout is not None and (now - start) >= timeout:
-            return False, effective
-        if now - last_report >= 5:
-            pending = max(0, target - effective)
-            print(
-                f"[drain] indexed={effective} pending≈{pending} target={target} "
-                f"queue_depth={queue_depth} meta_entries={meta_entries}"
-            )
-            last_report = now
-        time.sleep(poll_seconds)
+class StageStats:
+    """Throughput counters for one pipeline stage."""
 
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.started = time.monotonic()
 
-async def _reindex_docs(
-    *,
+    def add(self, count: int, seconds: float) -> None:
+        self.items += count
+        self.busy_seconds += seconds
+
+    def rate(self) -> float:
+        return self.items / max(0.001, time.monotonic() - self.started)
+
+    def describe(self) -> str:
+        return f"{self.name}={self.items} ({self.rate():.1f}/s, busy {self.busy_seconds:.1f}s)"
+
+
+@dataclass
+class WorkUnit:
+    """One doc or log file moving through the pipeline."""
+
+    kind: str  # "doc" or "log"
+    key: str
+    fingerprint: str
+    project_name: str
+    path: Path
+    label: str  # doc key or log type
+    payload: Any = None
+    pending: int = 0
+    sealed: bool = False
+
+
+class ReindexCheckpoint:
+    """Units a reindex run has fully stored, so an interrupted run can resume."""
+
+    def __init__(self, path: Path, scope: Dict[str, Any]) -> None:
+        self.path = path
+        self.scope = scope
+        self.done: Dict[str, str] = {}
+        self.rebuilt = False
+        self._dirty = False
+        self._saved_at = 0.0
+
+    def load(self) -> bool:
+        """Load a checkpoint written for the same scope; True when there is one to resume."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return False
+        if data.get("version") != CHECKPOINT_VERSION or data.get("scope") != self.scope:
+            return False
+        self.done = {str(k): str(v) for k, v in (data.get("done") or {}).items()}
+        self.rebuilt = bool(data.get("rebuilt"))
+        return True
+
+    def is_done(self, unit: WorkUnit) -> bool:
+        return self.done.get(unit.key) == unit.fingerprint
+
+    def mark_done(self, unit: WorkUnit) -> None:
+        self.done[unit.key] = unit.fingerprint
+        self._dirty = True
+
+    def save(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and (not self._dirty or now - self._saved_at < CHECKPOINT_INTERVAL_SECONDS):
+            return
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "scope": self.scope,
+            "rebuilt": self.rebuilt,
+            "done": self.done,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload), encoding="utf-8")
+        temp_path.replace(self.path)
+        self._dirty = False
+        self._saved_at = now
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def _fingerprint(path: Path) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _discover_doc_units(
     repo_root: Path,
-    config_dev_plans: Path,
     project_exact: Optional[str],
     project_prefix: Optional[str],
-    vector_indexer,
-    wait_for_queue: bool,
-    queue_timeout: Optional[float],
-    progress_every: int,
-) -> tuple[int, int]:
-    indexed = 0
-    skipped = 0
-    last_report = time.time()
-    start_time = last_report
+) -> Iterator[Optional[WorkUnit]]:
+    """Yield doc units, or None for each registry doc that is skipped."""
     registry_docs = _load_registry_docs(repo_root)
     if not registry_docs:
         print("No registry-managed docs found in .scribe/state.json; skipping doc indexing.")
-        return indexed, skipped
+        return
     for project_name, docs in registry_docs.items():
         project_slug = project_name.lower().replace(" ", "-")
         if not _project_filter_match(project_name, project_slug, project_exact, project_prefix):
@@ -271,59 +295,19 @@ async def _reindex_docs(
             path = Path(raw_path)
             if not path.is_absolute():
                 path = (repo_root / path).resolve()
-            if not path.exists():
-                skipped += 1
-                continue
-            if _should_skip_doc_path(doc_key, path):
-                skipped += 1
-                continue
-            try:
-                content = await asyncio.to_thread(path.read_bytes)
-            except OSError:
-                skipped += 1
+            fingerprint = _fingerprint(path)
+            if fingerprint is None or _should_skip_doc_path(doc_key, path):
+                yield None
                 continue
-            after_hash = _hash_bytes(content)
-            await _index_doc_for_vector(
-                project={"name": project_name, "root": str(repo_root)},
-                doc=doc_key,
-                change_path=path,
-                after_hash=after_hash,
-                agent_id="reindex_vector",
-                metadata=None,
-                wait_for_queue=wait_for_queue,
-                queue_timeout=queue_timeout,
-            )
-            indexed += 1
-            if progress_every and indexed % progress_every == 0:
-                queue_depth = vector_indexer.embedding_queue.qsize() if vector_indexer.embedding_queue else None
-                elapsed = max(0.001, time.time() - start_time)
-                rate = indexed / elapsed
-                print(f"[docs] queued={indexed} skipped={skipped} queue_depth={queue_depth} rate={rate:.1f}/s")
-                last_report = time.time()
-            elif progress_every and (time.time() - last_report) > 30:
-                queue_depth = vector_indexer.embedding_queue.qsize() if vector_indexer.embedding_queue else None
-                elapsed = max(0.001, time.time() - start_time)
-                rate = indexed / elapsed
-                print(f"[docs] queued={indexed} skipped={skipped} queue_depth={queue_depth} rate={rate:.1f}/s")
-                last_report = time.time()
-    return indexed, skipped
-
-
-async def _reindex_logs(
-    *,
+            yield WorkUnit("doc", f"doc:{path}", fingerprint, project_name, path, doc_key)
+
+
+def _discover_log_units(
     repo_root: Path,
     config_dev_plans: Path,
     project_exact: Optional[str],
     project_prefix: Optional[str],
-    vector_indexer,
-    wait_for_queue: bool,
-    queue_timeout: Optional[float],
-    progress_every: int,
-) -> tuple[int, int]:
-    indexed = 0
-    skipped = 0
-    last_report = time.time()
-    start_time = last_report
+) -> Iterator[WorkUnit]:
     log_config = load_log_config()
     log_types = [name for name in log_config.keys() if name != "global"]
     for doc_root in _iter_doc_roots(repo_root, config_dev_plans):
@@ -339,47 +323,231 @@ async def _reindex_logs(
                 "progress_log": str(project_dir / "PROGRESS_LOG.md"),
             }
             for log_type in log_types:
-                definition = log_config.get(log_type, {})
-                log_path = resolve_log_path(project_ctx, definition)
-                if not log_path.exists():
+                log_path = resolve_log_path(project_ctx, log_config.get(log_type, {}))
+                fingerprint = _fingerprint(log_path)
+                if fingerprint is None:
                     continue
-                lines = await read_all_lines(log_path)
-                for line in lines:
-                    parsed = parse_log_line(line)
-                    if not parsed:
-                        skipped += 1
-                        continue
-                    meta = dict(parsed.get("meta") or {})
-                    meta.setdefault("log_type", log_type)
-                    meta.setdefault("content_type", "log")
-                    meta.setdefault("file_path", str(log_path))
-                    entry_id = _entry_id_from_log(project_slug, parsed)
-                    entry = {
-                        "entry_id": entry_id,
-                        "project_name": parsed.get("project", project_name),
-                        "message": parsed.get("message", ""),
-                        "agent": parsed.get("agent", ""),
-                        "timestamp": parsed.get("ts", ""),
-                        "meta": meta,
-                    }
-                    if wait_for_queue:
-                        vector_indexer.enqueue_entry(entry, wait=True, timeout=queue_timeout)
-                    else:
-                        vector_indexer.post_append(entry)
-                    indexed += 1
-                    if progress_every and indexed % progress_every == 0:
-                        queue_depth = vector_indexer.embedding_queue.qsize() if vector_indexer.embedding_queue else None
-                        elapsed = max(0.001, time.time() - start_time)
-                        rate = indexed / elapsed
-                        print(f"[logs] queued={indexed} skipped={skipped} queue_depth={queue_depth} rate={rate:.1f}/s")
-                        last_report = time.time()
-                    elif progress_every and (time.time() - last_report) > 30:
-                        queue_depth = vector_indexer.embedding_queue.qsize() if vector_indexer.embedding_queue else None
-                        elapsed = max(0.001, time.time() - start_time)
-                        rate = indexed / elapsed
-                        print(f"[logs] queued={indexed} skipped={skipped} queue_depth={queue_depth} rate={rate:.1f}/s")
-                        last_report = time.time()
-    return indexed, skipped
+                yield WorkUnit("log", f"log:{log_path}", fingerprint, project_name, log_path, log_type)
+
+
+def _log_entries(unit: WorkUnit) -> Tuple[List[Dict[str, Any]], int]:
+    """Build entries from a log unit's parsed lines; returns (entries, skipped)."""
+    project_slug = unit.project_name.lower().replace(" ", "-")
+    entries: List[Dict[str, Any]] = []
+    skipped = 0
+    for parsed in unit.payload:
+        if not parsed:
+            skipped += 1
+            continue
+        meta = dict(parsed.get("meta") or {})
+        meta.setdefault("log_type", unit.label)
+        meta.setdefault("content_type", "log")
+        meta.setdefault("file_path", str(unit.path))
+        entries.append({
+            "entry_id": _entry_id_from_log(project_slug, parsed),
+            "project_name": parsed.get("project", unit.project_name),
+            "message": parsed.get("message", ""),
+            "agent": parsed.get("agent", ""),
+            "timestamp": parsed.get("ts", ""),
+            "meta": meta,
+        })
+    return entries, skipped
+
+
+class ReindexPipeline:
+    """Discover -> read/parse -> chunk -> embed -> store, joined by bounded queues.
+
+    Each stage runs as its own task; a full downstream queue blocks the stage
+    feeding it, so memory stays bounded however large the corpus is. Embedding
+    runs in large batches on the indexer's inference executor and each batch is
+    stored in one bulk write. A unit is checkpointed once all of its entries
+    are stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        vector_indexer: Any,
+        checkpoint: ReindexCheckpoint,
+        batch_size: int,
+        queue_depth: int,
+        progress_seconds: float,
+    ) -> None:
+        self.vector_indexer = vector_indexer
+        self.checkpoint = checkpoint
+        self.batch_size = max(1, batch_size)
+        self.queue_depth = max(1, queue_depth)
+        self.progress_seconds = progress_seconds
+        # Readers hand entries to the server process that owns the index
+        self.direct = vector_indexer.owns_index()
+        self.stats = {name: StageStats(name) for name in PIPELINE_STAGES}
+        self.units_total = 0
+        self.units_done = 0
+        self.units_resumed = 0
+        self.discovery_done = False
+        self.counts = {"doc": 0, "log": 0, "skipped": 0, "entries": 0, "spooled": 0}
+        self._started = time.monotonic()
+
+    async def run(self, units: Iterable[Optional[WorkUnit]]) -> None:
+        read_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        chunk_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        embed_q: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * self.queue_depth)
+        store_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+
+        tasks = [
+            asyncio.create_task(self._discover(units, read_q)),
+            asyncio.create_task(self._read(read_q, chunk_q)),
+            asyncio.create_task(self._chunk(chunk_q, embed_q)),
+            asyncio.create_task(self._embed(embed_q, store_q)),
+            asyncio.create_task(self._store(store_q)),
+        ]
+        reporter = asyncio.create_task(self._report()) if self.progress_seconds > 0 else None
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if reporter:
+                reporter.cancel()
+            self.checkpoint.save(force=True)
+
+    async def _discover(self, units: Iterable[Optional[WorkUnit]], out: asyncio.Queue) -> None:
+        for unit in units:
+            started = time.monotonic()
+            if unit is None:
+                self.counts["skipped"] += 1
+                continue
+            self.units_total += 1
+            if self.checkpoint.is_done(unit):
+                self.units_resumed += 1
+                continue
+            self.stats["discover"].add(1, time.monotonic() - started)
+            await out.put(unit)
+        self.discovery_done = True
+        await out.put(None)
+
+    async def _read(self, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (unit := await inbox.get()) is not None:
+            started = time.monotonic()
+            try:
+                if unit.kind == "doc":
+                    raw = await asyncio.to_thread(unit.path.read_bytes)
+                    unit.payload = (raw.decode("utf-8"), _hash_bytes(raw))
+                else:
+                    lines = await read_all_lines(unit.path)
+                    unit.payload = await asyncio.to_thread(lambda: [parse_log_line(line) for line in lines])
+            except (OSError, UnicodeDecodeError):
+                self.counts["skipped"] += 1
+                continue
+            self.stats["read"].add(1, time.monotonic() - started)
+            await out.put(unit)
+        await out.put(None)
+
+    async def _chunk(self, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (unit := await inbox.get()) is not None:
+            started = time.monotonic()
+            if unit.kind == "doc":
+                text, after_hash = unit.payload
+                entries = await asyncio.to_thread(
+                    partial(
+                        _doc_vector_entries,
+                        vector_indexer=self.vector_indexer,
+                        project_name=unit.project_name,
+                        doc=unit.label,
+                        change_path=unit.path,
+                        raw_text=text,
+                        after_hash=after_hash,
+                        agent_id="reindex_vector",
+                        metadata=None,
+                    )
+                )
+            else:
+                entries, skipped = _log_entries(unit)
+                self.counts["skipped"] += skipped
+            unit.payload = None
+            self.counts[unit.kind] += 1
+            self.counts["entries"] += len(entries)
+            self.stats["chunk"].add(len(entries), time.monotonic() - started)
+
+            if not self.direct:
+                for entry in entries:
+                    if self.vector_indexer.enqueue_entry(entry):
+                        self.counts["spooled"] += 1
+                entries = []
+
+            for entry in entries:
+                unit.pending += 1
+                await out.put((unit, self.vector_indexer.prepare_entry(entry)))
+            unit.sealed = True
+            if unit.pending == 0:
+                self._finish(unit)
+        await out.put(None)
+
+    async def _embed(self, inbox: asyncio.Queue, out: asyncio.Queue) -> None:
+        finished = False
+        while not finished:
+            item = await inbox.get()
+            if item is None:
+                break
+            batch = [item]
+            # Take whatever is already waiting, up to one full batch
+            while len(batch) < self.batch_size:
+                try:
+                    item = inbox.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
+
+            started = time.monotonic()
+            embeddings = await asyncio.to_thread(
+                self.vector_indexer.encode_texts, [task["text_content"] for _unit, task in batch]
+            )
+            self.stats["embed"].add(len(batch), time.monotonic() - started)
+            await out.put((batch, embeddings))
+        await out.put(None)
+
+    async def _store(self, inbox: asyncio.Queue) -> None:
+        while (item := await inbox.get()) is not None:
+            batch, embeddings = item
+            started = time.monotonic()
+            await asyncio.to_thread(self.vector_indexer.store_batch, [task for _unit, task in batch], embeddings)
+            self.stats["store"].add(len(batch), time.monotonic() - started)
+            for unit, _task in batch:
+                unit.pending -= 1
+                if unit.sealed and unit.pending == 0:
+                    self._finish(unit)
+            self.checkpoint.save()
+
+    def _finish(self, unit: WorkUnit) -> None:
+        self.units_done += 1
+        self.checkpoint.mark_done(unit)
+
+    def eta_seconds(self) -> Optional[float]:
+        """Remaining time from the unit completion rate, once discovery has finished."""
+        if not self.discovery_done or not self.units_done:
+            return None
+        remaining = self.units_total - self.units_resumed - self.units_done
+        return max(0.0, remaining * (time.monotonic() - self._started) / self.units_done)
+
+    def progress_line(self) -> str:
+        eta = self.eta_seconds()
+        total = f"{self.units_total}" if self.discovery_done else f"{self.units_total}+"
+        return (
+            f"[pipeline] units={self.units_done + self.units_resumed}/{total} "
+            + " ".join(stats.describe() for stats in self.stats.values())
+            + (f" eta={eta:.0f}s" if eta is not None else " eta=?")
+        )
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_seconds)
+            print(self.progress_line())
 
 
 async def _run_reindex(
@@ -389,13 +557,11 @@ async def _run_reindex(
     include_logs: bool,
     project_exact: Optional[str],
     project_prefix: Optional[str],
-    wait_for_queue: bool,
-    queue_timeout: Optional[float],
-    progress_every: int,
     rebuild: bool,
-    wait_for_drain: bool,
-    drain_timeout: Optional[float],
-    drain_poll: float,
+    restart: bool,
+    batch_size: Optional[int],
+    queue_depth: int,
+    progress_seconds: float,
 ) -> int:
     config = RepoDiscovery.load_config(repo_root)
     if not (config.plugin_config or {}).get("enabled", False):
@@ -407,22 +573,6 @@ async def _run_reindex(
     if not vector_indexer:
         print("Vector indexer plugin not available or not initialized.")
         return 1
-    baseline_count = 0
-    if wait_for_drain:
-        mapping_path = vector_indexer.mapping_db_path
-        repo_slug = vector_indexer.repo_slug
-        if mapping_path and repo_slug:
-            baseline_count = _get_mapping_count(mapping_path, repo_slug)
-    if rebuild:
-        try:
-            rebuild_result = vector_indexer.rebuild_index()
-            message = rebuild_result.get("message") if isinstance(rebuild_result, dict) else None
-            if message:
-                print(message)
-        except Exception as exc:
-            print(f"Failed to rebuild vector index: {exc}")
-            return 1
-        baseline_count = 0
 
     docs_enabled = bool(config.vector_index_docs)
     logs_enabled = bool(config.vector_index_logs)
@@ -437,55 +587,85 @@ async def _run_reindex(
         print("Nothing to index (both docs/logs disabled or filtered).")
         return 1
 
-    docs_indexed = docs_skipped = 0
-    logs_indexed = logs_skipped = 0
-    if include_docs:
-        docs_indexed, docs_skipped = await _reindex_docs(
-            repo_root=repo_root,
-            config_dev_plans=config.dev_plans_dir,
-            project_exact=project_exact,
-            project_prefix=project_prefix,
-            vector_indexer=vector_indexer,
-            wait_for_queue=wait_for_queue,
-            queue_timeout=queue_timeout,
-            progress_every=progress_every,
-        )
-    if include_logs:
-        logs_indexed, logs_skipped = await _reindex_logs(
-            repo_root=repo_root,
-            config_dev_plans=config.dev_plans_dir,
-            project_exact=project_exact,
-            project_prefix=project_prefix,
-            vector_indexer=vector_indexer,
-            wait_for_queue=wait_for_queue,
-            queue_timeout=queue_timeout,
-            progress_every=progress_every,
-        )
+    scope = {
+        "docs": include_docs,
+        "logs": include_logs,
+        "project": project_exact,
+        "project_prefix": project_prefix,
+        "rebuild": rebuild,
+    }
+    checkpoint_path = repo_root / ".scribe_vectors" / f"{vector_indexer.repo_slug}.reindex.json"
+    checkpoint = ReindexCheckpoint(checkpoint_path, scope)
+    if restart:
+        checkpoint.clear()
+    elif checkpoint.load():
+        print(f"Resuming interrupted reindex: {len(checkpoint.done)} files already stored.")
+
+    if not await asyncio.to_thread(vector_indexer.wait_until_ready, WARMUP_WAIT_SECONDS):
+        print("Vector model failed to load; nothing was indexed.")
+        return 1
+
+    if rebuild and not checkpoint.rebuilt:
+        try:
+            shard_by = getattr(getattr(vector_indexer, "vector_config", None), "shard_by", "none")
+            if project_exact and shard_by == "project":
+                # Only the selected project's shard is cleared and re-indexed
+                rebuild_result = vector_indexer.rebuild_index(
+                    project_slug=project_exact.lower().replace(" ", "-")
+                )
+            else:
+                rebuild_result = vector_indexer.rebuild_index()
+            message = rebuild_result.get("message") if isinstance(rebuild_result, dict) else None
+            if message:
+                print(message)
+        except Exception as exc:
+            print(f"Failed to rebuild vector index: {exc}")
+            return 1
+        # From here on an interrupted rebuild resumes instead of clearing again
+        checkpoint.done.clear()
+        checkpoint.rebuilt = True
+        checkpoint.save(force=True)
+
+    def _units() -> Iterator[Optional[WorkUnit]]:
+        if include_docs:
+            yield from _discover_doc_units(repo_root, project_exact, project_prefix)
+        if include_logs:
+            yield from _discover_log_units(repo_root, config.dev_plans_dir, project_exact, project_prefix)
+
+    if batch_size is None:
+        batch_size = int(getattr(vector_indexer.vector_config, "max_batch_size", 256) or 256)
+    pipeline = ReindexPipeline(
+        vector_indexer=vector_indexer,
+        checkpoint=checkpoint,
+        batch_size=batch_size,
+        queue_depth=queue_depth,
+        progress_seconds=progress_seconds,
+    )
+    try:
+        await pipeline.run(_units())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print(f"Reindex interrupted; rerun the same command to resume. {pipeline.progress_line()}")
+        return 130
+    except Exception as exc:
+        print(f"Reindex failed: {exc}; rerun the same command to resume. {pipeline.progress_line()}")
+        return 1
 
+    checkpoint.clear()
+    print(pipeline.progress_line())
+    counts = pipeline.counts
     print(
-        "Reindex queued.",
-        f"Docs indexed={docs_indexed}, skipped={docs_skipped}.",
-        f"Logs indexed={logs_indexed}, skipped={logs_skipped}.",
+        "Reindex complete.",
+        f"Docs={counts['doc']}, logs={counts['log']}, skipped={counts['skipped']},",
+        f"entries={counts['entries']}, resumed={pipeline.units_resumed}.",
     )
-    if wait_for_drain:
-        expected_new = docs_indexed + logs_indexed
-        ok, current = _wait_for_embedding_drain(
-            vector_indexer=vector_indexer,
-            baseline_count=baseline_count,
-            expected_new=expected_new,
-            timeout=drain_timeout,
-            poll_seconds=drain_poll,
-        )
-        if ok:
-            print(f"[drain] complete: indexed={current}")
-        else:
-            print(f"[drain] timeout: indexed={current}")
+    if counts["spooled"]:
+        print(f"{counts['spooled']} entries were spooled for the server process that owns the index.")
     return 0
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Queue Scribe-managed docs/logs for vector reindexing."
+        description="Reindex Scribe-managed docs/logs into the vector index."
     )
     parser.add_argument(
         "--repo-root",
@@ -505,47 +685,54 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         action="store_true",
         help="Enable safe mode (single-threaded embeddings, smaller batch/queue).",
     )
-    parser.add_argument("--project", help="Restrict to a single dev_plan project name/slug.")
-    parser.add_argument("--project-prefix", help="Restrict to dev_plan projects matching prefix.")
     parser.add_argument(
-        "--wait-for-queue",
-        action="store_true",
-        help="Block reindex until queue has capacity instead of dropping entries.",
+        "--encode-executor",
+        choices=["thread", "process", "inline"],
+        default=None,
+        help="Embedding executor for this run (process uses a shared-memory worker pool).",
     )
     parser.add_argument(
-        "--queue-timeout",
-        type=float,
+        "--encode-workers",
+        type=int,
         default=None,
-        help="Max seconds to wait for queue capacity per entry (default: no timeout).",
+        help="Number of embedding workers for the selected executor.",
     )
+    parser.add_argument("--project", help="Restrict to a single dev_plan project name/slug.")
+    parser.add_argument("--project-prefix", help="Restrict to dev_plan projects matching prefix.")
     parser.add_argument(
-        "--progress-every",
+        "--batch-size",
         type=int,
-        default=500,
-        help="Print progress every N queued entries (default: 500).",
+        default=None,
+        help="Entries per embedding/store batch (default: vector max_batch_size).",
     )
     parser.add_argument(
-        "--rebuild",
-        action="store_true",
-        help="Clear the vector index before reindexing (destructive).",
+        "--pipeline-depth",
+        type=int,
+        default=4,
+        help="Items (batches for the embed stage) buffered between stages (default: 4).",
     )
     parser.add_argument(
-        "--wait-for-drain",
-        action="store_true",
-        help="Wait for embeddings to finish writing before exiting.",
+        "--progress-seconds",
+        type=float,
+        default=10.0,
+        help="Seconds between per-stage throughput/ETA reports; 0 disables (default: 10).",
     )
     parser.add_argument(
-        "--drain-timeout",
-        type=float,
-        default=300.0,
-        help="Max seconds to wait for embedding drain (default: 300).",
+        "--rebuild",
+        action="store_true",
+        help="Clear the vector index before reindexing (destructive).",
     )
     parser.add_argument(
-        "--drain-poll",
-        type=float,
-        default=0.5,
-        help="Seconds between drain checks (default: 0.5).",
+        "--restart",
+        action="store_true",
+        help="Ignore any checkpoint from an interrupted run and start over.",
     )
+    # Options of the former queue-based reindexer; the pipeline always applies
+    # backpressure and stores synchronously, so these no longer do anything.
+    for legacy in ("--wait-for-queue", "--wait-for-drain"):
+        parser.add_argument(legacy, action="store_true", help=argparse.SUPPRESS)
+    for legacy in ("--queue-timeout", "--drain-timeout", "--drain-poll", "--progress-every"):
+        parser.add_argument(legacy, type=float, default=None, help=argparse.SUPPRESS)
     return parser.parse_args(argv)
 
 
@@ -554,6 +741,12 @@ def main(argv: List[str]) -> int:
     if args.safe and not SAFE_MODE:
         _apply_safe_env()
         print("Safe mode enabled: forcing single-threaded embeddings with small batch/queue.")
+    if args.encode_executor:
+        os.environ["SCRIBE_VECTOR_ENCODE_EXECUTOR"] = args.encode_executor
+    if args.encode_workers:
+        os.environ["SCRIBE_VECTOR_ENCODE_WORKERS"] = str(args.encode_workers)
+    if args.wait_for_queue or args.wait_for_drain:
+        print("Note: --wait-for-queue/--wait-for-drain are implied by the reindex pipeline.")
     repo_root = args.repo_root.resolve()
     include_docs = args.docs
     include_logs = args.logs
@@ -566,6 +759,9 @@ def main(argv: List[str]) -> int:
     project_prefix = args.project_prefix
     if project_prefix:
         project_prefix = project_prefix.lower().replace(" ", "-")
+    batch_size = args.batch_size
+    if batch_size is None and (args.safe or SAFE_MODE):
+        batch_size = int(os.environ.get("SCRIBE_VECTOR_BATCH_SIZE", "8"))
     return asyncio.run(
         _run_reindex(
             repo_root,
@@ -573,13 +769,11 @@ def main(argv: List[str]) -> int:
             include_logs=include_logs,
             project_exact=args.project,
             project_prefix=project_prefix,
-            wait_for_queue=args.wait_for_queue,
-            queue_timeout=args.queue_timeout,
-            progress_every=args.progress_every,
             rebuild=args.rebuild,
-            wait_for_drain=args.wait_for_drain,
-            drain_timeout=args.drain_timeout,
-            drain_poll=args.drain_poll,
+            restart=args.restart,
+            batch_size=batch_size,
+            queue_depth=args.pipeline_depth,
+            progress_seconds=args.progress_seconds,
         )
     )
 
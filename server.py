@@ -557,10 +557,26 @@ async def _shutdown() -> None:
             pass
 
 
+async def _on_initialized(_notification: Any) -> None:
+    """Start background plugin warm-up once the client completes the MCP handshake."""
+    try:
+        from scribe_mcp.plugins.registry import get_plugin_registry
+
+        for plugin in get_plugin_registry().plugins.values():
+            start_warmup = getattr(plugin, "start_warmup", None)
+            if callable(start_warmup):
+                start_warmup()
+    except Exception as e:
+        print(f"⚠️  Plugin warm-up failed to start: {e}", file=sys.stderr)
+
+
 if _HAS_LIFECYCLE_HOOKS:
     app.on_startup(_startup)
     app.on_shutdown(_shutdown)
 
+if _MCP_AVAILABLE and hasattr(app, "notification_handlers"):
+    app.notification_handlers[mcp_types.InitializedNotification] = _on_initialized
+
 
 def get_agent_context_manager():
     """Get the global AgentContextManager instance."""
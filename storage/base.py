@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from scribe_mcp.storage.models import ProjectRecord
+from scribe_mcp.utils.bm25 import CorpusStats
 
 
 class ConflictError(Exception):
@@ -264,6 +265,13 @@ class StorageBackend(ABC):
         )
         return len(all_entries)
 
+    async def fetch_term_stats(self, project_name: str, terms: List[str]) -> Optional[CorpusStats]:
+        """
+        BM25 corpus statistics for a project's entries, limited to `terms`.
+        Backends that do not maintain term statistics return None.
+        """
+        return None
+
     # Agent session and project context management
     @abstractmethod
     async def upsert_agent_session(self, agent_id: str, session_id: str, metadata: Optional[Dict[str, Any]]) -> None:
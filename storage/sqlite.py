@@ -16,6 +16,7 @@ from scribe_mcp.storage.models import (
     BenchmarkRecord, ChecklistRecord, PerformanceMetricsRecord,
     DocumentSectionRecord, CustomTemplateRecord, DocumentChangeRecord, SyncStatusRecord
 )
+from scribe_mcp.utils.bm25 import CorpusStats, entry_field_tokens
 from scribe_mcp.utils.time import format_utc, utcnow
 from scribe_mcp.utils.search import message_matches
 
@@ -197,12 +198,8 @@ class SQLiteStorage(StorageBackend):
         elif confidence is None:
             confidence = 1.0
         async with self._write_lock:
-            await self._execute(
-                """
-                INSERT OR IGNORE INTO scribe_entries
-                    (id, project_id, ts, emoji, agent, message, meta, raw_line, sha256, ts_iso, priority, category, tags, confidence)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-                """,
+            await asyncio.to_thread(
+                self._insert_entry_sync,
                 (
                     entry_id,
                     project.id,
@@ -219,6 +216,7 @@ class SQLiteStorage(StorageBackend):
                     tags,
                     confidence,
                 ),
+                entry_field_tokens(message, meta),
             )
             await self._execute(
                 """
@@ -240,6 +238,112 @@ class SQLiteStorage(StorageBackend):
                 ),
             )
 
+    def _insert_entry_sync(self, params: tuple[Any, ...], fields: Dict[str, List[str]]) -> None:
+        """Insert an entry and, if it is new, fold it into the project's term statistics."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO scribe_entries
+                    (id, project_id, ts, emoji, agent, message, meta, raw_line, sha256, ts_iso, priority, category, tags, confidence)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                params,
+            )
+            if cursor.rowcount == 1:
+                self._add_term_stats(conn, params[1], [fields])
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _add_term_stats(conn: sqlite3.Connection, project_id: int, documents: List[Dict[str, List[str]]]) -> None:
+        """Add documents' field lengths and term document frequencies to a project's totals."""
+        doc_freq: Dict[str, int] = {}
+        for fields in documents:
+            for term in {token for tokens in fields.values() for token in tokens}:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+        conn.execute(
+            """
+            INSERT INTO entry_corpus_stats (project_id, doc_count, message_length, meta_length)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(project_id)
+            DO UPDATE SET doc_count = doc_count + excluded.doc_count,
+                          message_length = message_length + excluded.message_length,
+                          meta_length = meta_length + excluded.meta_length;
+            """,
+            (
+                project_id,
+                len(documents),
+                sum(len(fields["message"]) for fields in documents),
+                sum(len(fields["meta"]) for fields in documents),
+            ),
+        )
+        conn.executemany(
+            """
+            INSERT INTO entry_term_stats (project_id, term, doc_freq) VALUES (?, ?, ?)
+            ON CONFLICT(project_id, term) DO UPDATE SET doc_freq = doc_freq + excluded.doc_freq;
+            """,
+            [(project_id, term, count) for term, count in doc_freq.items()],
+        )
+
+    async def fetch_term_stats(self, project_name: str, terms: List[str]) -> Optional[CorpusStats]:
+        """BM25 corpus statistics for a project, limited to the given terms."""
+        await self._initialise()
+        return await asyncio.to_thread(self._fetch_term_stats_sync, project_name, list(dict.fromkeys(terms)))
+
+    def _fetch_term_stats_sync(self, project_name: str, terms: List[str]) -> Optional[CorpusStats]:
+        conn = self._connect()
+        try:
+            corpus = conn.execute(
+                """
+                SELECT c.project_id, c.doc_count, c.message_length, c.meta_length
+                FROM entry_corpus_stats c JOIN scribe_projects p ON p.id = c.project_id
+                WHERE p.name = ?;
+                """,
+                (project_name,),
+            ).fetchone()
+            if not corpus or not corpus["doc_count"]:
+                return None
+            doc_freq = {term: 0 for term in terms}
+            if terms:
+                rows = conn.execute(
+                    f"""
+                    SELECT term, doc_freq FROM entry_term_stats
+                    WHERE project_id = ? AND term IN ({', '.join('?' for _ in terms)});
+                    """,
+                    (corpus["project_id"], *terms),
+                ).fetchall()
+                doc_freq.update({row["term"]: row["doc_freq"] for row in rows})
+            return CorpusStats(
+                doc_count=corpus["doc_count"],
+                total_lengths={"message": corpus["message_length"], "meta": corpus["meta_length"]},
+                doc_freq=doc_freq,
+            )
+        finally:
+            conn.close()
+
+    def _backfill_term_stats_sync(self) -> None:
+        """Build term statistics for entries stored before the statistics tables existed."""
+        conn = self._connect()
+        try:
+            if conn.execute("SELECT 1 FROM entry_corpus_stats LIMIT 1;").fetchone():
+                return
+            documents: Dict[int, List[Dict[str, List[str]]]] = {}
+            for row in conn.execute("SELECT project_id, message, meta FROM scribe_entries;"):
+                try:
+                    meta = json.loads(row["meta"] or "{}")
+                except (TypeError, json.JSONDecodeError):
+                    meta = {}
+                documents.setdefault(row["project_id"], []).append(
+                    entry_field_tokens(row["message"], meta if isinstance(meta, dict) else {})
+                )
+            for project_id, project_documents in documents.items():
+                self._add_term_stats(conn, project_id, project_documents)
+            conn.commit()
+        finally:
+            conn.close()
+
     async def record_doc_change(
         self,
         project: ProjectRecord,
@@ -968,7 +1072,39 @@ class SQLiteStorage(StorageBackend):
                         UNIQUE(project_id, file_path)
                     );
                     """,
+                    # BM25 statistics for entry relevance ranking, maintained on insert
+                    """
+                    CREATE TABLE IF NOT EXISTS entry_corpus_stats (
+                        project_id INTEGER PRIMARY KEY REFERENCES scribe_projects(id) ON DELETE CASCADE,
+                        doc_count INTEGER NOT NULL DEFAULT 0,
+                        message_length INTEGER NOT NULL DEFAULT 0,
+                        meta_length INTEGER NOT NULL DEFAULT 0
+                    );
+                    """,
+                    """
+                    CREATE TABLE IF NOT EXISTS entry_term_stats (
+                        project_id INTEGER NOT NULL REFERENCES scribe_projects(id) ON DELETE CASCADE,
+                        term TEXT NOT NULL,
+                        doc_freq INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (project_id, term)
+                    ) WITHOUT ROWID;
+                    """,
+                    # Content-addressed document history: zlib full snapshots
+                    # (base_hash NULL) or line deltas against base_hash
+                    """
+                    CREATE TABLE IF NOT EXISTS document_versions (
+                        content_hash TEXT PRIMARY KEY,
+                        project_root TEXT,
+                        file_path TEXT,
+                        base_hash TEXT,
+                        depth INTEGER NOT NULL DEFAULT 0,
+                        size INTEGER NOT NULL,
+                        payload BLOB NOT NULL,
+                        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """,
                     # Document Management 2.0 Indexes
+                    "CREATE INDEX IF NOT EXISTS idx_document_versions_file ON document_versions(project_root, file_path);",
                     "CREATE INDEX IF NOT EXISTS idx_document_sections_project ON document_sections(project_id);",
                     "CREATE INDEX IF NOT EXISTS idx_document_sections_updated ON document_sections(updated_at);",
                     "CREATE INDEX IF NOT EXISTS idx_document_changes_project ON document_changes(project_id);",
@@ -1040,6 +1176,7 @@ class SQLiteStorage(StorageBackend):
             await self._ensure_index("CREATE INDEX IF NOT EXISTS idx_entries_priority_ts ON scribe_entries(priority, ts_iso DESC);")
             await self._ensure_index("CREATE INDEX IF NOT EXISTS idx_entries_category_ts ON scribe_entries(category, ts_iso DESC);")
             await self._ensure_index("CREATE INDEX IF NOT EXISTS idx_entries_project_priority_category ON scribe_entries(project_id, priority, category, ts_iso DESC);")
+            await asyncio.to_thread(self._backfill_term_stats_sync)
             self._initialised = True
 
     async def _migrate_document_sections(self) -> None:
@@ -1170,6 +1307,20 @@ class SQLiteStorage(StorageBackend):
         finally:
             conn.close()
 
+    async def _execute_batch(self, operations: List[tuple[str, List[tuple[Any, ...]]]]) -> None:
+        """Run each (query, rows) pair with executemany, all in one transaction."""
+        await asyncio.to_thread(self._execute_batch_sync, operations)
+
+    def _execute_batch_sync(self, operations: List[tuple[str, List[tuple[Any, ...]]]]) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                for query, rows in operations:
+                    if rows:
+                        conn.executemany(query, rows)
+        finally:
+            conn.close()
+
     async def _fetchone(self, query: str, params: tuple[Any, ...]) -> Optional[sqlite3.Row]:
         return await asyncio.to_thread(self._fetchone_sync, query, params)
 
@@ -1458,6 +1609,31 @@ class SQLiteStorage(StorageBackend):
             metadata=json.loads(row["metadata"]) if row["metadata"] else None,
         )
 
+    async def store_performance_metrics(
+        self,
+        *,
+        project_id: int,
+        metrics: List[tuple[str, str, float, str, Optional[Dict[str, Any]]]],
+    ) -> int:
+        """Store (category, name, value, unit, metadata) metrics in one transaction."""
+        await self._initialise()
+        rows = [
+            (project_id, category, name, value, unit, json.dumps(metadata or {}, sort_keys=True))
+            for category, name, value, unit, metadata in metrics
+        ]
+        async with self._write_lock:
+            await self._execute_batch([
+                (
+                    """
+                    INSERT INTO performance_metrics (project_id, metric_category, metric_name,
+                                                   metric_value, metric_unit, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?);
+                    """,
+                    rows,
+                )
+            ])
+        return len(rows)
+
     # Agent session and project context management methods
     async def upsert_agent_session(self, agent_id: str, session_id: str, metadata: Optional[Dict[str, Any]]) -> None:
         """Create or update an agent session (legacy compatibility shim).
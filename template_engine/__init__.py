@@ -2,6 +2,8 @@
 
 from .engine import (
     Jinja2TemplateEngine,
+    get_template_engine,
+    clear_template_engine_cache,
     TemplateEngineError,
     TemplateNotFoundError,
     TemplateValidationError,
@@ -12,6 +14,8 @@ from .engine import (
 
 __all__ = [
     "Jinja2TemplateEngine",
+    "get_template_engine",
+    "clear_template_engine_cache",
     "TemplateEngineError",
     "TemplateNotFoundError",
     "TemplateValidationError",
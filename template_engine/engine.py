@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from jinja2 import (
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     Template,
     TemplateNotFound,
@@ -59,6 +64,24 @@ DEFAULT_VARIABLES = {
     "status": "active",
 }
 
+# Compiled bytecode for registry engines lives under <project_root>/.scribe/cache/
+BYTECODE_CACHE_SUBDIR = Path(".scribe") / "cache" / "jinja2"
+
+# Shared engines kept by get_template_engine
+ENGINE_CACHE_MAX_ENTRIES = 32
+
+# Compiled render_string templates kept per engine
+STRING_TEMPLATE_CACHE_MAX = 128
+
+# Repo config files RepoDiscovery.load_config may read
+REPO_CONFIG_FILES = (
+    Path(".scribe") / "config" / "scribe.yaml",
+    Path(".scribe") / "scribe.yaml",
+    Path(".scribe") / "scribe.yml",
+    Path("docs") / "dev_plans" / "scribe.yaml",
+    Path(".scribe") / "config.json",
+)
+
 # Restricted builtins for security
 RESTRICTED_BUILTINS = {
     "abs": abs,
@@ -110,6 +133,7 @@ class Jinja2TemplateEngine:
         security_mode: str = "sandbox",
         repo_config: Optional["RepoConfig"] = None,
         template_pack: Optional[str] = None,
+        bytecode_cache_dir: Optional[Path] = None,
     ):
         """
         Initialize the Jinja2 template engine.
@@ -118,6 +142,7 @@ class Jinja2TemplateEngine:
             project_root: Root directory of the project
             project_name: Name of the project
             security_mode: Security mode - "sandbox", "immutable", or "none"
+            bytecode_cache_dir: Directory for Jinja2's compiled template cache (disabled when None)
         """
         self.project_root = Path(project_root).resolve() if project_root else Path.cwd().resolve()
         self.project_name = project_name or ""
@@ -141,10 +166,16 @@ class Jinja2TemplateEngine:
 
         # Security mode setup
         self.security_mode = security_mode
+        self.bytecode_cache_dir = bytecode_cache_dir
         self.env = self._create_jinja2_environment()
+        self._string_templates: "OrderedDict[str, Template]" = OrderedDict()
 
-        # Custom variables cache
+        # Custom variables cache, revalidated against variables.json's stat
         self._custom_variables: Optional[Dict[str, Any]] = None
+        self._custom_variables_stamp: Optional[Tuple[int, int]] = None
+
+        # Set by get_template_engine for shared instances
+        self._registry_stamp: Optional[Tuple[Tuple[str, Optional[int]], ...]] = None
 
         template_logger.debug(f"Initialized template engine for project '{project_name}' with {len(self.template_dirs)} template directories")
 
@@ -222,10 +253,21 @@ class Jinja2TemplateEngine:
 
         return template_dirs
 
+    def _create_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        if self.bytecode_cache_dir is None:
+            return None
+        try:
+            Path(self.bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            template_logger.debug(f"Bytecode cache disabled: {exc}")
+            return None
+        return FileSystemBytecodeCache(str(self.bytecode_cache_dir))
+
     def _create_jinja2_environment(self) -> Environment:
         """Create Jinja2 environment with appropriate security settings."""
         # Common environment configuration
         common_kwargs = dict(
+            bytecode_cache=self._create_bytecode_cache(),
             loader=FileSystemLoader([str(d) for d in self.template_dirs]),
             autoescape=False,
             trim_blocks=True,
@@ -303,12 +345,51 @@ class Jinja2TemplateEngine:
         env.globals['include_file'] = include_file
         env.globals['restricted_builtins'] = RESTRICTED_BUILTINS
 
+    def source_stamp(self) -> Tuple[Tuple[str, Optional[int]], ...]:
+        """mtimes of every directory and config file that shapes this engine.
+
+        Directory mtimes change when templates are added or removed, which can
+        change which directory a template name resolves to; edits to existing
+        templates are already picked up by Jinja2's auto-reload.
+        """
+        candidates: List[Path] = [
+            self.project_root / ".scribe" / "templates",
+            self.project_root / "templates",
+        ]
+        if self.repo_config and getattr(self.repo_config, "custom_templates_dir", None):
+            candidates.append(Path(self.repo_config.custom_templates_dir))  # type: ignore[attr-defined]
+        candidates.extend(self.template_dirs)
+        candidates.extend(self.repo_root / name for name in REPO_CONFIG_FILES)
+
+        stamp = []
+        for path in candidates:
+            try:
+                mtime_ns: Optional[int] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            stamp.append((str(path), mtime_ns))
+        return tuple(stamp)
+
+    def for_project(self, project_name: Optional[str]) -> "Jinja2TemplateEngine":
+        """This engine rendering as `project_name`; the environment is shared."""
+        if (project_name or "") == self.project_name:
+            return self
+        clone = copy.copy(self)
+        clone.project_name = project_name or ""
+        clone.project_slug = slugify_project_name(project_name or "")
+        return clone
+
     def load_custom_variables(self) -> Dict[str, Any]:
         """Load custom variables from .scribe/variables.json."""
-        if self._custom_variables is not None:
+        variables_file = self.project_root / ".scribe" / "variables.json"
+        try:
+            stat = variables_file.stat()
+            stamp: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if self._custom_variables is not None and stamp == self._custom_variables_stamp:
             return self._custom_variables
 
-        variables_file = self.project_root / ".scribe" / "variables.json"
         custom_vars = {}
 
         if variables_file.exists():
@@ -322,6 +403,7 @@ class Jinja2TemplateEngine:
                 template_logger.error(f"Error loading variables file {variables_file}: {e}")
 
         self._custom_variables = custom_vars
+        self._custom_variables_stamp = stamp
         return custom_vars
 
     def _build_context(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -476,7 +558,7 @@ class Jinja2TemplateEngine:
             Rendered content
         """
         try:
-            template = self.env.from_string(template_string)
+            template = self._compile_string(template_string)
             context = self._build_context(metadata)
 
             # Render template string (environment already has StrictUndefined configured)
@@ -504,6 +586,18 @@ class Jinja2TemplateEngine:
         except Exception as e:
             raise TemplateRenderError(f"Unexpected error rendering template string: {e}")
 
+    def _compile_string(self, template_string: str) -> Template:
+        """Compile `template_string`, reusing the result for repeated sources."""
+        template = self._string_templates.get(template_string)
+        if template is not None:
+            self._string_templates.move_to_end(template_string)
+            return template
+        template = self.env.from_string(template_string)
+        self._string_templates[template_string] = template
+        while len(self._string_templates) > STRING_TEMPLATE_CACHE_MAX:
+            self._string_templates.popitem(last=False)
+        return template
+
     def validate_template(self, template_name: str) -> Dict[str, Any]:
         """
         Validate a template without rendering it.
@@ -598,3 +692,52 @@ class Jinja2TemplateEngine:
                 break
 
         return info
+
+
+_ENGINE_REGISTRY: "OrderedDict[Tuple[str, str, str], Jinja2TemplateEngine]" = OrderedDict()
+_ENGINE_REGISTRY_LOCK = threading.Lock()
+
+
+def get_template_engine(
+    project_root: Optional[Path] = None,
+    project_name: Optional[str] = None,
+    security_mode: str = "sandbox",
+    template_pack: Optional[str] = None,
+) -> Jinja2TemplateEngine:
+    """Return a shared engine for (project_root, template_pack, security_mode).
+
+    The engine is rebuilt only when a template directory or repo config file
+    changes (see ``Jinja2TemplateEngine.source_stamp``), and compiles templates
+    through a bytecode cache under ``<project_root>/.scribe/cache/jinja2``.
+    """
+    root = Path(project_root).resolve() if project_root else Path.cwd().resolve()
+    key = (str(root), template_pack or "", security_mode.lower())
+
+    with _ENGINE_REGISTRY_LOCK:
+        engine = _ENGINE_REGISTRY.get(key)
+    if engine is not None and engine.source_stamp() == engine._registry_stamp:
+        with _ENGINE_REGISTRY_LOCK:
+            if key in _ENGINE_REGISTRY:
+                _ENGINE_REGISTRY.move_to_end(key)
+        return engine.for_project(project_name)
+
+    engine = Jinja2TemplateEngine(
+        project_root=root,
+        project_name=project_name,
+        security_mode=security_mode,
+        template_pack=template_pack,
+        bytecode_cache_dir=root / BYTECODE_CACHE_SUBDIR,
+    )
+    engine._registry_stamp = engine.source_stamp()
+    with _ENGINE_REGISTRY_LOCK:
+        _ENGINE_REGISTRY[key] = engine
+        _ENGINE_REGISTRY.move_to_end(key)
+        while len(_ENGINE_REGISTRY) > ENGINE_CACHE_MAX_ENTRIES:
+            _ENGINE_REGISTRY.popitem(last=False)
+    return engine
+
+
+def clear_template_engine_cache() -> None:
+    """Drop all shared engines (their bytecode cache files are kept)."""
+    with _ENGINE_REGISTRY_LOCK:
+        _ENGINE_REGISTRY.clear()
@@ -0,0 +1,127 @@
+"""Tests for BM25F relevance scoring and the term statistics kept by SQLiteStorage."""
+
+from datetime import datetime
+
+import pytest
+
+import scribe_mcp.tools.query_entries as qe
+from scribe_mcp.storage.sqlite import SQLiteStorage
+from scribe_mcp.utils.bm25 import CorpusStats, bm25f_scores, entry_field_tokens
+
+
+def _docs(*messages):
+    return [entry_field_tokens(message) for message in messages]
+
+
+def test_rare_terms_outweigh_common_ones():
+    docs = _docs(
+        "deploy finished",
+        "deploy started",
+        "deploy rollback after failure",
+        "unrelated note",
+    )
+    stats = CorpusStats.from_documents(docs, ["deploy", "rollback"])
+    scores = bm25f_scores(docs, "deploy rollback", stats)
+
+    assert scores[2] == max(scores)
+    assert scores[3] == 0.0
+    assert 0.0 < scores[0] < scores[2] < 1.0
+    assert bm25f_scores(docs, "", stats) == [0.0] * 4
+
+
+def test_metadata_matches_count_less_than_message_matches():
+    docs = [
+        entry_field_tokens("cache warmed", {"component": "indexer"}),
+        entry_field_tokens("indexer warmed", {"component": "cache"}),
+    ]
+    scores = bm25f_scores(docs, "indexer", CorpusStats.from_documents(docs, ["indexer"]))
+    assert scores[1] > scores[0] > 0.0
+
+
+async def _insert(storage, project, entry_id, message, meta=None):
+    await storage.insert_entry(
+        entry_id=entry_id,
+        project=project,
+        ts=datetime(2026, 1, 1),
+        emoji="ℹ️",
+        agent="Agent",
+        message=message,
+        meta=meta or {},
+        raw_line=message,
+        sha256=entry_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_storage_maintains_term_statistics_incrementally(tmp_path):
+    storage = SQLiteStorage(tmp_path / "scribe.db")
+    project = await storage.upsert_project(name="proj", repo_root=str(tmp_path), progress_log_path="log.md")
+
+    await _insert(storage, project, "e1", "Index rebuilt", {"phase": "index"})
+    await _insert(storage, project, "e2", "Tests passing")
+    await _insert(storage, project, "e2", "Tests passing")  # duplicate id is ignored
+
+    stats = await storage.fetch_term_stats("proj", ["index", "tests", "missing"])
+    assert stats.doc_count == 2
+    assert stats.total_lengths == {"message": 4, "meta": 1}
+    assert stats.doc_freq == {"index": 1, "tests": 1, "missing": 0}
+    assert await storage.fetch_term_stats("other", ["index"]) is None
+
+
+@pytest.mark.asyncio
+async def test_existing_entries_are_backfilled(tmp_path):
+    storage = SQLiteStorage(tmp_path / "scribe.db")
+    project = await storage.upsert_project(name="proj", repo_root=str(tmp_path), progress_log_path="log.md")
+    await _insert(storage, project, "e1", "alpha beta")
+    await _insert(storage, project, "e2", "beta gamma")
+    await storage._execute("DELETE FROM entry_corpus_stats;", ())
+    await storage._execute("DELETE FROM entry_term_stats;", ())
+
+    reopened = SQLiteStorage(tmp_path / "scribe.db")
+    stats = await reopened.fetch_term_stats("proj", ["beta"])
+    assert stats.doc_count == 2
+    assert stats.doc_freq == {"beta": 2}
+
+
+@pytest.mark.asyncio
+async def test_relevance_threshold_filters_on_bm25(monkeypatch):
+    async def _lines(_path):
+        return [
+            "[ℹ️] [2026-01-01 00:00:00 UTC] [Agent: Codex] [Project: p] Vector shard rebalance finished",
+            "[ℹ️] [2026-01-01 00:00:01 UTC] [Agent: Codex] [Project: p] Updated shard notes",
+            "[ℹ️] [2026-01-01 00:00:02 UTC] [Agent: Codex] [Project: p] Reminder cooldown tuned",
+        ]
+
+    monkeypatch.setattr(qe, "read_all_lines", _lines)
+    monkeypatch.setattr(qe.server_module, "storage_backend", None)
+    search_query = {
+        "search_params": {
+            "message": "shard", "message_mode": "substring", "page": 1, "page_size": 10,
+            "relevance_threshold": 0.3,
+        },
+        "project_context": type("Ctx", (), {"project": {"progress_log": "dummy.log"}})(),
+        "resolved_project": "p",
+        "validation_warnings": [],
+    }
+
+    result = await qe._execute_search_with_fallbacks(search_query, final_config=None)
+
+    assert [e["message"] for e in result["entries"]] == [
+        "Vector shard rebalance finished",
+        "Updated shard notes",
+    ]
+    assert all(0.3 <= e["relevance_score"] <= 1.0 for e in result["entries"])
+
+
+def test_exact_match_passes_a_high_threshold():
+    docs = _docs(
+        "Reminder cooldown tuned",
+        "Vector shard rebalance finished",
+        "Updated shard notes",
+        "Reminder sent",
+    )
+    query = "Reminder cooldown tuned"
+    scores = bm25f_scores(docs, query, CorpusStats.from_documents(docs, ["reminder", "cooldown", "tuned"]))
+
+    assert scores[0] == 1.0
+    assert [score >= 0.8 for score in scores] == [True, False, False, False]
@@ -0,0 +1,135 @@
+"""Tests for the shared parsed-document cache used by manage_docs operations."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management import doc_cache
+from scribe_mcp.doc_management.doc_cache import DocumentCache, document_cache
+from scribe_mcp.doc_management.manager import apply_doc_change
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate the mtime so the cache entry is not racily clean."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+DOC = """---
+title: Plan
+---
+# Plan
+<!-- ID: phase_0 -->
+- [ ] Ship feature
+<!-- ID: phase_1 -->
+```
+# not a header
+```
+## Details
+line
+"""
+
+
+def test_unchanged_documents_are_served_from_memory(tmp_path, monkeypatch):
+    path = tmp_path / "PLAN.md"
+    path.write_text(DOC, encoding="utf-8")
+    _age(path)
+    cache = DocumentCache()
+
+    first = cache.load(path)
+    assert first.parsed.frontmatter_data == {"title": "Plan"}
+    assert [h["title"] for h in first.headers] == ["Plan", "Details"]
+    assert [line for _, line in first.anchor_lines] == ["<!-- ID: phase_0 -->", "<!-- ID: phase_1 -->"]
+    assert first.line_offsets[-1] == len(first.body)
+
+    monkeypatch.setattr(Path, "read_text", lambda *_a, **_k: pytest.fail("re-read a cached document"))
+    assert cache.load(path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changes_are_detected_by_stat_and_racy_hash_check(tmp_path):
+    path = tmp_path / "PLAN.md"
+    path.write_text("alpha\n", encoding="utf-8")
+    cache = DocumentCache()
+    first = cache.load(path)
+
+    # Same size and mtime, different content: only the hash can tell
+    stat = path.stat()
+    path.write_text("omega\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = cache.load(path)
+    assert second is not first and second.text == "omega\n"
+
+    path.write_text("omega, longer\n", encoding="utf-8")
+    assert cache.load(path).text == "omega, longer\n"
+
+    cache.invalidate(path)
+    assert len(cache) == 0
+
+
+def test_stored_documents_are_verified_once_past_the_racy_window(tmp_path, monkeypatch):
+    path = tmp_path / "PLAN.md"
+    path.write_text(DOC, encoding="utf-8")
+    cache = DocumentCache()
+    stored = cache.store(path, DOC)
+
+    reads = []
+    original_read = Path.read_text
+
+    def _counting_read(self, *args, **kwargs):
+        reads.append(self)
+        return original_read(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read)
+    assert cache.load(path) is stored
+    assert len(reads) == 1
+
+    later = stored.mtime_ns + doc_cache.RACY_WINDOW_NS
+    monkeypatch.setattr(doc_cache.time, "time_ns", lambda: later)
+    assert cache.load(path) is stored
+    assert cache.load(path) is stored
+    assert len(reads) == 2
+    assert (cache.hits, cache.misses) == (3, 0)
+
+
+def test_cache_is_bounded(tmp_path):
+    cache = DocumentCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+        cache.load(tmp_path / name)
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_apply_doc_change_reuses_and_refreshes_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_cache, "RACY_WINDOW_NS", 0)
+    document_cache.clear()
+    path = tmp_path / "docs" / "CHECKLIST.md"
+    path.parent.mkdir()
+    path.write_text(DOC, encoding="utf-8")
+    project = {"name": "Cache", "root": str(tmp_path), "docs_dir": str(path.parent), "docs": {"checklist": str(path)}}
+
+    async def _toggle(status):
+        return await apply_doc_change(
+            project, doc="checklist", action="status_update", section="phase_0",
+            content=None, template=None, metadata={"status": status}, dry_run=False,
+        )
+
+    first = await _toggle("done")
+    assert first.success, first.error_message
+    # The written text is cached, so the next edit starts from it without a parse
+    assert document_cache.load(path).text == first.content_written
+
+    second = await _toggle("pending")
+    assert second.success, second.error_message
+    assert second.before_hash == first.after_hash
+    assert "- [ ] Ship feature" in path.read_text(encoding="utf-8")
+
+    # An edit made outside Scribe is picked up
+    path.write_text(path.read_text(encoding="utf-8").replace("Ship feature", "Ship it, really"), encoding="utf-8")
+    third = await _toggle("done")
+    assert "- [x] Ship it, really" in third.content_written
+    document_cache.clear()
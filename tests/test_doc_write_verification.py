@@ -0,0 +1,61 @@
+"""Tests for receipt-based write verification in manage_docs."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import itertools
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management import manager
+from scribe_mcp.utils.files import atomic_write
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def test_atomic_write_returns_a_receipt(tmp_path: Path) -> None:
+    target = tmp_path / "doc.md"
+    receipt = atomic_write(target, "héllo\nworld\n", repo_root=tmp_path)
+
+    assert receipt.size == len("héllo\nworld\n".encode("utf-8")) == target.stat().st_size
+    assert receipt.text_sha256 == _sha("héllo\nworld\n")
+    assert receipt.matches_disk()
+
+    atomic_write(target, "replaced by someone else\n", repo_root=tmp_path)
+    assert not receipt.matches_disk()
+
+
+@pytest.mark.asyncio
+async def test_receipt_verification_does_not_reread(tmp_path: Path, monkeypatch) -> None:
+    target = tmp_path / "doc.md"
+    text = "# Doc\n"
+    receipt = atomic_write(target, text, repo_root=tmp_path)
+    monkeypatch.setattr(Path, "read_text", lambda *_a, **_k: pytest.fail("receipt path re-read the file"))
+
+    assert await manager._verify_file_write(target, text, _sha(text), receipt=receipt, deep=False)
+
+    with open(target, "a", encoding="utf-8") as handle:
+        handle.write("appended in place\n")
+    assert not await manager._verify_file_write(target, text, _sha(text), receipt=receipt, deep=False)
+
+    target.unlink()
+    assert not await manager._verify_file_write(target, text, _sha(text), receipt=receipt, deep=False)
+
+
+def test_deep_verification_is_requested_or_sampled(monkeypatch) -> None:
+    monkeypatch.setattr(manager, "_VERIFIED_WRITES", itertools.count(1))
+    monkeypatch.setattr(
+        manager,
+        "settings",
+        dataclasses.replace(manager.settings, doc_verify_mode="receipt", doc_verify_sample_every=3),
+    )
+
+    assert manager._should_deep_verify({"verify_write": "deep"})
+    assert [manager._should_deep_verify(None) for _ in range(6)] == [False, False, True, False, False, True]
+
+    monkeypatch.setattr(manager, "settings", dataclasses.replace(manager.settings, doc_verify_mode="deep"))
+    assert manager._should_deep_verify({})
@@ -0,0 +1,80 @@
+"""Tests for the content-addressed document version store."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management import version_store
+from scribe_mcp.doc_management.change_logger import ChangeLogger
+from scribe_mcp.doc_management.version_store import (
+    DocumentVersionStore,
+    apply_delta,
+    compute_delta,
+    content_hash,
+)
+from scribe_mcp.storage.sqlite import SQLiteStorage
+
+
+async def _storage(tmp_path: Path) -> SQLiteStorage:
+    storage = SQLiteStorage(tmp_path / "scribe.db")
+    await storage.setup()
+    return storage
+
+
+def _versions(count: int):
+    rng = random.Random(48)
+    lines = [f"- item {n}\n" for n in range(200)]
+    for _ in range(count):
+        lines[rng.randrange(len(lines))] = f"- edited {rng.random()}\n"
+        lines.insert(rng.randrange(len(lines)), "- inserted\n")
+        yield "".join(lines)
+
+
+def test_delta_round_trip():
+    base = "a\nb\nc\nd"
+    for new in ("a\nB\nc\nd", "", "b\nc\nd\ne\n", base):
+        assert apply_delta(base, compute_delta(base, new)) == new
+
+
+@pytest.mark.asyncio
+async def test_versions_are_stored_as_deltas_with_periodic_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setattr(version_store, "SNAPSHOT_INTERVAL", 4)
+    storage = await _storage(tmp_path)
+    store = DocumentVersionStore(storage, tmp_path)
+    doc = tmp_path / "PLAN.md"
+
+    texts = list(_versions(10))
+    hashes = [await store.put(doc, text) for text in texts]
+    assert hashes == [content_hash(text) for text in texts]
+    assert await store.put(doc, texts[3]) == hashes[3]  # stored once
+
+    rows = await storage._fetchall("SELECT depth, base_hash, size, length(payload) AS stored FROM document_versions ORDER BY rowid")
+    assert [row["depth"] for row in rows] == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+    assert all(row["stored"] < row["size"] / 20 for row in rows if row["depth"])
+
+    # A fresh store has nothing in memory and must replay the chains
+    fresh = DocumentVersionStore(storage, tmp_path)
+    for digest, text in zip(hashes, texts):
+        assert await fresh.get(digest) == text
+    assert await fresh.get("0" * 64) is None
+
+
+@pytest.mark.asyncio
+async def test_change_logger_diffs_any_two_logged_versions(tmp_path):
+    storage = await _storage(tmp_path)
+    logger = ChangeLogger(storage, tmp_path)
+    doc = tmp_path / "PLAN.md"
+    first, second, third = "one\ntwo\n", "one\n2\n", "one\n2\nthree\n"
+
+    await logger._store_versions(doc, first, second)
+    await logger._store_versions(doc, second, third)
+
+    diff = await ChangeLogger(storage, tmp_path).get_diff_between_versions(
+        doc, content_hash(first), content_hash(third)
+    )
+    assert diff is not None
+    assert diff.lines_added == ["2\n", "three\n"]
+    assert diff.lines_removed == ["two\n"]
@@ -0,0 +1,112 @@
+"""Tests for stat-first polling and event coalescing in the file watcher."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scribe_mcp.doc_management import file_watcher
+from scribe_mcp.doc_management.file_watcher import DocumentFileHandler, FileSystemWatcher
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    calls = []
+    original = file_watcher._calculate_checksum
+
+    def _counting(path):
+        calls.append(Path(path).name)
+        return original(path)
+
+    monkeypatch.setattr(file_watcher, "_calculate_checksum", _counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_polling_hashes_only_files_whose_stat_changed(tmp_path, hashed):
+    (tmp_path / "docs").mkdir()
+    for name in ("a.md", "b.md", "skip.py"):
+        (tmp_path / "docs" / name).write_text(name, encoding="utf-8")
+        _age(tmp_path / "docs" / name)
+    _age(tmp_path / "docs")
+
+    batches = []
+    watcher = FileSystemWatcher(tmp_path, lambda e: None, enable_watchdog=False, batch_callback=batches.append)
+    await watcher._initialize_file_states()
+    assert sorted(hashed) == ["a.md", "b.md"]
+
+    hashed.clear()
+    await watcher._check_for_changes()
+    assert hashed == [] and batches == []
+
+    (tmp_path / "docs" / "a.md").write_text("changed", encoding="utf-8")
+    (tmp_path / "docs" / "b.md").unlink()
+    await watcher._check_for_changes()
+    assert hashed == ["a.md"]
+    [batch] = batches
+    assert sorted((e.file_path.name, e.event_type) for e in batch) == [("a.md", "modified"), ("b.md", "deleted")]
+    assert batch[0].metadata["relative_path"].startswith("docs")
+    watcher._hash_executor.shutdown()
+
+
+def test_directory_listings_are_reused_until_the_directory_changes(tmp_path, monkeypatch):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "top.md").write_text("", encoding="utf-8")
+    (tmp_path / "nested" / "deeper" / "low.json").write_text("", encoding="utf-8")
+    watcher = FileSystemWatcher(tmp_path, lambda e: None, enable_watchdog=False)
+
+    listed = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(file_watcher.os, "scandir", lambda d: listed.append(d) or original_scandir(d))
+
+    assert sorted(Path(p).name for p in watcher._scan_files()) == ["low.json", "top.md"]
+    assert len(listed) == 3
+    listed.clear()
+    watcher._scan_files()
+    assert listed == []
+
+    (tmp_path / "nested" / "new.txt").write_text("", encoding="utf-8")
+    stat = (tmp_path / "nested").stat()
+    os.utime(tmp_path / "nested", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert str(tmp_path / "nested" / "new.txt") in watcher._scan_files()
+    assert listed == [str(tmp_path / "nested")]
+
+
+def test_watched_patterns_follow_glob_semantics(tmp_path):
+    watcher = FileSystemWatcher(tmp_path, lambda e: None, watched_patterns=["docs/*.md", "**/notes/**/*.txt"])
+    assert watcher._matches_watched_patterns(("docs", "a.md"))
+    assert not watcher._matches_watched_patterns(("docs", "sub", "a.md"))
+    assert watcher._matches_watched_patterns(("notes", "a.txt"))
+    assert watcher._matches_watched_patterns(("x", "notes", "y", "z", "a.txt"))
+
+
+def test_watchdog_bursts_are_coalesced_into_one_batch(tmp_path):
+    target = tmp_path / "doc.md"
+    target.write_text("final", encoding="utf-8")
+    batches = []
+    handler = DocumentFileHandler(lambda e: None, debounce_seconds=60, batch_callback=batches.append)
+
+    def _event(event_type, path, dest=None):
+        return SimpleNamespace(event_type=event_type, src_path=str(path), dest_path=dest, is_directory=False)
+
+    for _ in range(5):
+        handler.on_any_event(_event("modified", target))
+    handler.on_any_event(_event("created", tmp_path / "tmp.md"))
+    handler.on_any_event(_event("deleted", tmp_path / "tmp.md"))
+    handler.on_any_event(_event("modified", tmp_path / "ignored.py"))
+
+    assert handler.flush() == []  # still inside the quiet period
+    handler.flush(force=True)
+    handler.close()
+
+    [batch] = batches
+    assert [(e.file_path.name, e.event_type) for e in batch] == [("doc.md", "modified")]
+    assert batch[0].checksum is not None and batch[0].size_bytes == 5
@@ -0,0 +1,124 @@
+"""Tests for the shared line-level diff engine."""
+
+from __future__ import annotations
+
+import difflib
+import random
+
+from scribe_mcp.doc_management import line_diff
+from scribe_mcp.doc_management.change_logger import ChangeLogger
+from scribe_mcp.doc_management.line_diff import (
+    _myers_matches,
+    diff_lines,
+    diff_texts,
+    similarity,
+    similarity_bound,
+)
+
+
+def _lcs_length(a, b):
+    rows = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            rows[i + 1][j + 1] = rows[i][j] + 1 if x == y else max(rows[i][j + 1], rows[i + 1][j])
+    return rows[-1][-1]
+
+
+def _edited(rng, lines):
+    result = list(lines)
+    for _ in range(rng.randrange(8)):
+        choice = rng.randrange(3)
+        if choice == 0 and result:
+            result.pop(rng.randrange(len(result)))
+        elif choice == 1:
+            result.insert(rng.randrange(len(result) + 1), f"{rng.choice('abcxyz')}\n")
+        elif result:
+            result[rng.randrange(len(result))] = f"{rng.choice('xyz')}\n"
+    return result
+
+
+def test_myers_finds_a_longest_common_subsequence():
+    rng = random.Random(49)
+    for _ in range(500):
+        a = [rng.randrange(3) for _ in range(rng.randrange(12))]
+        b = [rng.randrange(3) for _ in range(rng.randrange(12))]
+        matches = _myers_matches(a, b, 1000)
+        assert len(matches) == _lcs_length(a, b)
+        assert all(a[i] == b[j] for i, j in matches)
+    assert _myers_matches([1, 2, 3], [4, 5, 6], max_cost=2) is None
+
+
+def test_opcodes_cover_both_sides_and_rebuild_new_text():
+    rng = random.Random(7)
+    for _ in range(300):
+        old = [f"{rng.choice('abcdefg')}\n" for _ in range(rng.randrange(30))]
+        new = _edited(rng, old)
+        diff = diff_lines(old, new)
+
+        rebuilt, i, j = [], 0, 0
+        for tag, i1, i2, j1, j2 in diff.opcodes:
+            assert (i1, j1) == (i, j)
+            if tag == "equal":
+                assert old[i1:i2] == new[j1:j2]
+            rebuilt.extend(new[j1:j2])
+            i, j = i2, j2
+        assert (i, j) == (len(old), len(new))
+        assert rebuilt == new
+
+        # Same opcodes render exactly like difflib
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+        if matcher.get_opcodes() == list(diff.opcodes):
+            assert diff.unified_diff() == "".join(difflib.unified_diff(old, new, "old", "new"))
+
+
+def test_change_logger_and_visualizer_share_one_diff(monkeypatch):
+    calls = []
+    original = line_diff.diff_lines
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(line_diff, "diff_lines", _counting)
+    old, new = "one\ntwo\nthree\n", "one\n2\nthree\nfour\n"
+
+    result = ChangeLogger(storage=None, project_root=".")._calculate_diff(old, new)
+    assert result.lines_added == ["2\n", "four\n"]
+    assert result.lines_removed == ["two\n"]
+    assert (result.additions, result.deletions, result.modifications) == (2, 1, 1)
+    assert diff_texts(old, new).unified_diff(lineterm="").startswith("--- old+++ new@@ -1,3 +1,4 @@")
+    assert similarity(old, new) == result.similarity_ratio
+    assert len(calls) == 1
+
+
+def test_similarity_bounds_and_early_exit():
+    assert similarity("test", "test") == 1.0
+    assert similarity("", "text") == 0.0
+    assert 0.0 < similarity("content1", "content2") < 1.0
+
+    base = "".join(f"line {n}\n" for n in range(2000))
+    edited = base.replace("line 1000\n", "changed\n")
+    assert similarity(base, edited) > 0.99
+
+    unrelated = "".join(f"other {n}\n" for n in range(2000))
+    assert similarity_bound(base, unrelated) < line_diff.EARLY_EXIT_SIMILARITY
+    assert similarity(base, unrelated) < line_diff.EARLY_EXIT_SIMILARITY
+    assert (base, unrelated) not in line_diff._DIFF_CACHE
+
+
+def test_near_identical_documents_are_always_diffed():
+    checklist = "".join(f"- [ ] item {n}\n" for n in range(100))
+    ticked = "".join(f"- [{'x' if n % 2 else ' '}] item {n}\n" for n in range(100))
+    assert similarity(checklist, ticked) == diff_texts(checklist, ticked).ratio > 0.95
+
+    all_ticked = checklist.replace("[ ]", "[x]")
+    assert similarity(checklist, all_ticked) == diff_texts(checklist, all_ticked).ratio > 0.9
+
+
+def test_similarity_bound_never_undercuts_the_ratio():
+    rng = random.Random(3)
+    for _ in range(300):
+        old = [f"{rng.choice('abcdefg') * rng.randrange(1, 40)}\n" for _ in range(rng.randrange(1, 60))]
+        new = _edited(rng, old) if rng.random() < 0.5 else [f"{rng.choice('uvwxyz')}\n" for _ in old]
+        old_text, new_text = "".join(old), "".join(new)
+        assert similarity_bound(old_text, new_text) >= diff_texts(old_text, new_text).ratio - 1e-9
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management import manager
+from scribe_mcp.doc_management.manager import apply_doc_change
+from scribe_mcp.utils.frontmatter import parse_frontmatter
+
+ORIGINAL = (
+    "line 1\n"
+    "line 2\n"
+    "line 3\n"
+    "line 4\n"
+    "<!-- ID: tasks -->\n"
+    "- [ ] Write docs\n"
+    "line 7\n"
+    "line 8\n"
+)
+
+
+async def _setup_project(tmp_path: Path) -> dict:
+    project_root = tmp_path / "multi_edit_repo"
+    docs_dir = project_root / ".scribe" / "docs" / "dev_plans" / "test_project"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    checklist_path = docs_dir / "CHECKLIST.md"
+    checklist_path.write_text(ORIGINAL, encoding="utf-8")
+
+    return {
+        "name": "Multi Edit Project",
+        "root": str(project_root),
+        "docs_dir": str(docs_dir),
+        "progress_log": str(docs_dir / "PROGRESS_LOG.md"),
+        "docs": {"checklist": str(checklist_path)},
+        "defaults": {"agent": "QA Bot"},
+    }
+
+
+async def _multi_edit(project: dict, edits: list, dry_run: bool = False):
+    return await apply_doc_change(
+        project,
+        doc="checklist",
+        action="multi_edit",
+        section=None,
+        content=None,
+        template=None,
+        metadata={"edits": edits},
+        dry_run=dry_run,
+    )
+
+
+@pytest.mark.asyncio
+async def test_multi_edit_rebases_snapshot_line_numbers(tmp_path: Path, monkeypatch) -> None:
+    project = await _setup_project(tmp_path)
+    checklist_path = Path(project["docs"]["checklist"])
+    writes = []
+    original_write = manager.async_atomic_write
+
+    async def _counting_write(*args, **kwargs):
+        writes.append(args[0])
+        return await original_write(*args, **kwargs)
+
+    monkeypatch.setattr(manager, "async_atomic_write", _counting_write)
+
+    change = await _multi_edit(
+        project,
+        [
+            {"type": "replace_range", "start_line": 2, "end_line": 2, "content": "two\ntwo and a half"},
+            {"type": "replace_range", "start_line": 3, "end_line": 4, "content": ""},
+            {"type": "status_update", "section": "tasks", "status": "done", "proof": "pr-7"},
+            {"type": "replace_range", "start_line": 8, "end_line": 8, "content": "eight"},
+            {"type": "replace_text", "find": "line 7", "replace": "seven"},
+        ],
+    )
+
+    assert change.success, change.error_message
+    assert len(writes) == 1
+    body = parse_frontmatter(checklist_path.read_text(encoding="utf-8")).body
+    assert body == (
+        "line 1\n"
+        "two\n"
+        "two and a half\n"
+        "<!-- ID: tasks -->\n"
+        "- [x] Write docs | proof=pr-7\n"
+        "seven\n"
+        "eight\n"
+    )
+    assert change.extra["multi_edit"]["edits_applied"] == 5
+    assert [e["line_delta"] for e in change.extra["multi_edit"]["edits"]] == [1, -2, 0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_multi_edit_rebases_patch_hunks(tmp_path: Path) -> None:
+    project = await _setup_project(tmp_path)
+    checklist_path = Path(project["docs"]["checklist"])
+
+    change = await _multi_edit(
+        project,
+        [
+            {"type": "replace_range", "start_line": 1, "end_line": 1, "content": "one\none and a half"},
+            {
+                "type": "apply_patch",
+                "patch": (
+                    "--- before\n+++ after\n"
+                    "@@ -3,2 +3,2 @@\n line 3\n-line 4\n+four\n"
+                    "@@ -8,1 +8,2 @@\n line 8\n+line 9\n"
+                ),
+            },
+            {"type": "replace_range", "start_line": 7, "end_line": 7, "content": "seven"},
+        ],
+    )
+
+    assert change.success, change.error_message
+    body = parse_frontmatter(checklist_path.read_text(encoding="utf-8")).body
+    assert body == (
+        "one\n"
+        "one and a half\n"
+        "line 2\n"
+        "line 3\n"
+        "four\n"
+        "<!-- ID: tasks -->\n"
+        "- [ ] Write docs\n"
+        "seven\n"
+        "line 8\n"
+        "line 9\n"
+    )
+
+    overlap = await _multi_edit(
+        project,
+        [
+            {"type": "replace_range", "start_line": 2, "end_line": 2, "content": "two"},
+            {"type": "apply_patch", "patch": "@@ -2,1 +2,1 @@\n-line 2\n+again\n"},
+        ],
+    )
+    assert not overlap.success
+    assert "MULTI_EDIT_OVERLAP" in overlap.error_message
+
+
+@pytest.mark.asyncio
+async def test_multi_edit_rejects_overlapping_ranges_without_writing(tmp_path: Path) -> None:
+    project = await _setup_project(tmp_path)
+    checklist_path = Path(project["docs"]["checklist"])
+
+    change = await _multi_edit(
+        project,
+        [
+            {"type": "replace_range", "start_line": 2, "end_line": 3, "content": "merged"},
+            {"type": "replace_range", "start_line": 3, "end_line": 4, "content": "again"},
+        ],
+    )
+
+    assert not change.success
+    assert "MULTI_EDIT_OVERLAP" in change.error_message
+    assert change.extra["failed_edit_index"] == 1
+    assert checklist_path.read_text(encoding="utf-8") == ORIGINAL
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("edits", "error"),
+    [
+        ([], "MULTI_EDIT_REQUIRES_EDITS"),
+        ([{"type": "generate_toc"}], "MULTI_EDIT_UNSUPPORTED"),
+        ([{"type": "apply_patch"}], "PATCH_MODE_UNIFIED_REQUIRES_PATCH"),
+        ([{"type": "replace_range", "start_line": 9, "end_line": 9, "content": "x"}], "end_line out of range"),
+    ],
+)
+async def test_multi_edit_validates_edits(tmp_path: Path, edits, error) -> None:
+    project = await _setup_project(tmp_path)
+    change = await _multi_edit(project, edits)
+    assert not change.success
+    assert error in change.error_message
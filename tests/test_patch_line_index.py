@@ -0,0 +1,77 @@
+"""Tests for the line-hash index used to anchor patch hunks."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+from scribe_mcp.doc_management import manager
+
+
+def _brute_force_indices(haystack, needle):
+    return [
+        idx
+        for idx in range(len(haystack) - len(needle) + 1)
+        if haystack[idx : idx + len(needle)] == needle
+    ]
+
+
+def _brute_force_alignments(original_lines, target_lines):
+    alignments = []
+
+    def _dfs(target_index, position, path):
+        if target_index == len(target_lines):
+            alignments.append(path[:])
+            return
+        for offset in (0, 1):
+            candidate = position + offset
+            if candidate < len(original_lines) and manager._line_matches(
+                target_lines[target_index], original_lines[candidate]
+            ):
+                path.append(candidate)
+                _dfs(target_index + 1, candidate + 1, path)
+                path.pop()
+
+    for start, line in enumerate(original_lines):
+        if manager._line_matches(target_lines[0], line):
+            _dfs(1, start + 1, [start])
+    return alignments[0] if len(alignments) == 1 else None
+
+
+def test_sequence_search_matches_a_slice_scan_on_repetitive_documents():
+    rng = random.Random(44)
+    lines = [rng.choice(["- [ ] task\n", "", "## Tasks\n", "- [x] done\n", "note\n"]) for _ in range(300)]
+    lines = [line or "\n" for line in lines] + ["tail"]
+    index = manager._LineIndex(lines)
+
+    for _ in range(200):
+        start = rng.randrange(len(lines))
+        needle = lines[start : start + rng.randint(1, 6)]
+        assert index.find(needle) == _brute_force_indices(lines, needle)
+
+    # Exact matching still distinguishes a missing trailing newline
+    assert index.find(["tail\n"]) == []
+    assert index.find(["absent\n"]) == []
+    assert manager._find_sequence_indices(lines, []) == []
+
+
+def test_gap_alignment_matches_the_depth_first_search():
+    rng = random.Random(7)
+    for _ in range(300):
+        lines = [rng.choice("abcd") + "\n" for _ in range(rng.randint(1, 14))]
+        target = [rng.choice("abcd") + "\n" for _ in range(rng.randint(1, 4))]
+        assert manager._find_alignment_with_one_line_gaps(lines, target) == _brute_force_alignments(lines, target)
+
+
+def test_rebase_anchors_every_hunk_in_one_pass():
+    original = "".join(f"- [ ] item {n % 3}\nbody {n}\n" for n in range(200))
+    patch = "".join(
+        f"@@ -{2 * n + 1},2 +{2 * n + 1},2 @@\n - [ ] item {n % 3}\n-body {n}\n+body {n} (edited)\n"
+        for n in (3, 150)
+    )
+    rebased, info = manager._rebase_patch_to_current_context(original, patch)
+
+    assert info is not None
+    updated, _ = manager._apply_unified_patch(original, rebased)
+    assert "body 3 (edited)\n" in updated and "body 150 (edited)\n" in updated
+    assert list(itertools.islice(manager._LineIndex(original.splitlines(True)).positions[0], 3)) == [0, 6, 12]
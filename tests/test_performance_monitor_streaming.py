@@ -0,0 +1,133 @@
+"""Tests for the bounded, batch-flushing PerformanceMonitor."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management import performance_monitor
+from scribe_mcp.doc_management.performance_monitor import PerformanceMonitor, StreamingQuantile
+from scribe_mcp.storage.sqlite import SQLiteStorage
+
+
+async def _storage(tmp_path: Path) -> SQLiteStorage:
+    storage = SQLiteStorage(tmp_path / "scribe.db")
+    await storage.setup()
+    return storage
+
+
+def test_streaming_quantiles_track_exact_values():
+    rng = random.Random(50)
+    values = [rng.expovariate(10.0) for _ in range(20000)]
+    sketches = {q: StreamingQuantile(q) for q in (0.5, 0.95, 0.99)}
+    for value in values:
+        for sketch in sketches.values():
+            sketch.add(value)
+
+    ordered = sorted(values)
+    for q, sketch in sketches.items():
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.value() == pytest.approx(exact, rel=0.05)
+
+    small = StreamingQuantile(0.5)
+    for value in (3.0, 1.0, 2.0):
+        small.add(value)
+    assert small.value() == 2.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_cover_the_retained_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(performance_monitor, "OPERATION_SAMPLE_WINDOW", 8)
+    monitor = PerformanceMonitor(storage=None, project_root=tmp_path, metrics_retention_hours=1)
+    monitor.flush_interval = 3600
+
+    for n in range(20):
+        operation_id = monitor.track_operation_start("render", f"render_{n}")
+        monitor._active_operations[operation_id] -= n / 1000
+        monitor.track_operation_end(operation_id, "render", success=n % 5 != 0, error=ValueError(str(n)))
+
+    assert len(monitor._operation_times["render"]) == 8
+    metrics = (await monitor.get_operation_metrics())["render"]
+    # Only samples 12-19 are retained; 15 failed
+    assert metrics.total_operations == 8
+    assert metrics.failed_operations == 1
+    assert metrics.min_duration == pytest.approx(0.012, abs=0.005)
+    # Quantiles stream over all 20 samples
+    assert 0.0 <= metrics.p50_duration <= metrics.p95_duration <= metrics.p99_duration <= metrics.max_duration
+
+    # Samples older than the retention window drop out of the counts
+    ends = monitor._operation_end_times["render"]
+    for index in range(5):
+        ends[index] -= 7200
+    await monitor._cleanup_old_metrics()
+    metrics = (await monitor.get_operation_metrics())["render"]
+    assert metrics.total_operations == 3
+    assert metrics.failed_operations == 0
+
+    await monitor.stop_collection()
+    assert monitor._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows_for_retry(tmp_path):
+    class _Unreachable:
+        calls = 0
+
+        async def fetch_project(self, _name):
+            return type("Project", (), {"id": 1})()
+
+        async def store_performance_metrics(self, **_kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise OSError("database is locked")
+
+    storage = _Unreachable()
+    monitor = PerformanceMonitor(storage=storage, project_root=tmp_path)
+    monitor.flush_interval = 3600
+    for _ in range(3):
+        with monitor.create_performance_context("sync"):
+            pass
+
+    assert await monitor.flush_metrics() == 0
+    assert len(monitor._pending_metrics) == 6
+    assert await monitor.flush_metrics() == 6
+    assert not monitor._pending_metrics
+    await monitor.stop_collection()
+
+
+@pytest.mark.asyncio
+async def test_metrics_flush_in_one_batch_with_cached_project(tmp_path):
+    storage = await _storage(tmp_path)
+    project = tmp_path / "project"
+    project.mkdir()
+    monitor = PerformanceMonitor(storage=storage, project_root=project)
+    monitor.flush_interval = 3600
+
+    fetches = []
+    original_fetch = storage.fetch_project
+
+    async def _counting_fetch(name):
+        fetches.append(name)
+        return await original_fetch(name)
+
+    storage.fetch_project = _counting_fetch
+
+    for n in range(5):
+        with monitor.create_performance_context("sync"):
+            pass
+    assert len(monitor._pending_metrics) == 10
+    assert monitor._flush_task is not None
+
+    assert await monitor.flush_metrics() == 10
+    assert await monitor.flush_metrics() == 0
+    monitor.track_operation_end(monitor.track_operation_start("sync"), "sync", success=False)
+    assert await monitor.flush_metrics() == 1
+    assert len(fetches) == 1
+
+    await monitor.stop_collection()
+    rows = await storage._fetchall("SELECT metric_category, metric_name, metadata FROM performance_metrics")
+    assert len(rows) == 11
+    assert {row["metric_name"] for row in rows} == {"sync_duration", "sync_success"}
+    assert all(row["metric_category"] == "operations" and "document_management" in row["metadata"] for row in rows)
@@ -0,0 +1,92 @@
+"""Tests for concurrent cross-project search with a merged top-N page."""
+
+import asyncio
+
+import pytest
+
+import scribe_mcp.tools.query_entries as qe
+
+
+class _Helper:
+    def success_with_entries(self, *, entries, pagination, extra_data, **_kwargs):
+        return {"ok": True, "entries": entries, "pagination": pagination, **extra_data}
+
+
+def _project_results(name, count):
+    # Distinct scores interleave projects in the merged ranking
+    return [
+        {"message": f"{name}-{i}", "relevance_score": round((i * 7 + len(name)) % 97 / 97, 4),
+         "timestamp": f"2026-01-01 00:00:{i:02d} UTC"}
+        for i in range(count)
+    ]
+
+
+async def _search(monkeypatch, projects, *, page, page_size, threshold=0.0):
+    running = {"now": 0, "peak": 0}
+
+    async def _fake_single_project(*, project, **_kwargs):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        return _project_results(project["name"], project["count"])
+
+    monkeypatch.setattr(qe, "_search_single_project", _fake_single_project)
+    monkeypatch.setattr(qe, "token_estimator", None)
+    response = await qe._handle_cross_project_search(
+        projects=projects,
+        search_scope="all_projects",
+        document_types=None,
+        start_bound=None,
+        end_bound=None,
+        message="query",
+        message_mode="substring",
+        case_sensitive=False,
+        agents=None,
+        emojis=None,
+        meta_filters=None,
+        page=page,
+        page_size=page_size,
+        compact=False,
+        fields=None,
+        include_metadata=False,
+        verify_code_references=False,
+        relevance_threshold=threshold,
+        state_snapshot={},
+        helper=_Helper(),
+        context=object(),
+    )
+    return response, running["peak"]
+
+
+def _expected(projects, *, threshold=0.0):
+    everything = []
+    for project in projects:
+        everything.extend(
+            r for r in _project_results(project["name"], project["count"])
+            if r["relevance_score"] >= threshold
+        )
+    everything.sort(key=lambda r: (r["relevance_score"], r["timestamp"]), reverse=True)
+    return [r["message"] for r in everything]
+
+
+@pytest.mark.asyncio
+async def test_merged_page_matches_a_full_sort(monkeypatch):
+    projects = [{"name": f"p{i}", "count": 5 + i} for i in range(20)]
+    response, peak = await _search(monkeypatch, projects, page=3, page_size=7)
+
+    assert [r["message"] for r in response["entries"]] == _expected(projects)[14:21]
+    assert response["total_results_across_projects"] == sum(p["count"] for p in projects)
+    assert response["projects_searched"] == [p["name"] for p in projects]
+    assert 1 < peak <= qe.CROSS_PROJECT_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_threshold_applies_before_per_project_truncation(monkeypatch):
+    projects = [{"name": "alpha", "count": 40}, {"name": "beta", "count": 40}]
+    response, _peak = await _search(monkeypatch, projects, page=2, page_size=5, threshold=0.5)
+
+    expected = _expected(projects, threshold=0.5)
+    assert [r["message"] for r in response["entries"]] == expected[5:10]
+    assert response["total_results_across_projects"] == len(expected)
+    assert all(r["project_name"] in {"alpha", "beta"} for r in response["entries"])
@@ -0,0 +1,95 @@
+"""Tests for the parsed-document cache behind research/architecture/bug searches."""
+
+import os
+
+import pytest
+
+import scribe_mcp.tools.query_entries as qe
+
+ARCHITECTURE = """Preamble without a heading
+# Overview
+The vector index shards by project.
+
+## Storage
+SQLite keeps term statistics.
+## Empty
+
+# Rotation
+Progress logs rotate at the size limit.
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    qe._DOC_SECTION_CACHE.clear()
+    yield
+    qe._DOC_SECTION_CACHE.clear()
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    original = qe.read_all_lines
+
+    async def _counting(path):
+        calls.append(path)
+        return await original(path)
+
+    monkeypatch.setattr(qe, "read_all_lines", _counting)
+    return calls
+
+
+async def _architecture(docs_dir, message=None, mode="substring", case_sensitive=False):
+    results = await qe._search_architecture_documents(
+        docs_dir, None, None, message, mode, case_sensitive, None, None, None
+    )
+    return [r["message"] for r in results]
+
+
+@pytest.mark.asyncio
+async def test_sections_are_parsed_once_until_the_file_changes(tmp_path, reads):
+    guide = tmp_path / "ARCHITECTURE_GUIDE.md"
+    guide.write_text(ARCHITECTURE)
+
+    assert await _architecture(tmp_path) == ["# Overview", "## Storage", "# Rotation"]
+    assert await _architecture(tmp_path, "SQLITE") == ["## Storage"]
+    assert len(reads) == 1
+
+    guide.write_text(ARCHITECTURE + "# Hashing\nRolling hashes align hunks.\n")
+    assert await _architecture(tmp_path, "hunks") == ["# Hashing"]
+    assert len(reads) == 2
+
+    # Same size, new mtime
+    stat = guide.stat()
+    guide.write_text(guide.read_text().replace("hunks", "lines"))
+    os.utime(guide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert await _architecture(tmp_path, "hunks") == []
+    assert len(reads) == 3
+
+
+@pytest.mark.asyncio
+async def test_matching_semantics_are_unchanged(tmp_path, reads):
+    (tmp_path / "ARCHITECTURE_GUIDE.md").write_text(ARCHITECTURE)
+
+    # Partial words at the ends of the needle still match
+    assert await _architecture(tmp_path, "ex shards by proj") == ["# Overview"]
+    assert await _architecture(tmp_path, "index shards") == ["# Overview"]
+    assert await _architecture(tmp_path, "Index shards", case_sensitive=True) == []
+    assert await _architecture(tmp_path, r"rotate\s+at", mode="regex") == ["# Rotation"]
+    assert await _architecture(tmp_path, "missing words here") == []
+    assert await _architecture(tmp_path / "absent") == []
+
+
+@pytest.mark.asyncio
+async def test_research_documents_split_on_top_level_headings(tmp_path, reads):
+    research = tmp_path / "research"
+    research.mkdir()
+    (research / "RESEARCH_A.md").write_text("# Findings\nShard fan-out\n## Detail\nmerge by score\n")
+    (research / "RESEARCH_B.md").write_text("# Notes\nunrelated\n")
+
+    results = await qe._search_research_documents(
+        tmp_path, None, None, "merge by", "substring", False, None, None, None
+    )
+    assert [r["message"] for r in results] == ["# Findings"]
+    assert results[0]["meta"]["document_type"] == "research"
+    assert len(reads) == 2
@@ -0,0 +1,142 @@
+"""Tests for the staged, resumable pipeline in scripts/reindex_vector.py."""
+
+import asyncio
+import importlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def reindex():
+    # The script points SCRIBE_ROOT/SCRIBE_STATE_PATH at the repo on import.
+    saved = dict(os.environ)
+    try:
+        module = importlib.import_module("scribe_mcp.scripts.reindex_vector")
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+    return module
+
+
+class _FakeIndexer:
+    def __init__(self, *, writer=True, fail_after=None):
+        self.writer = writer
+        self.fail_after = fail_after
+        self.encoded_batches = []
+        self.stored = []
+        self.spooled = []
+
+    def owns_index(self):
+        return self.writer
+
+    def prepare_entry(self, entry):
+        return {"entry_id": entry["entry_id"], "text_content": entry["message"]}
+
+    def encode_texts(self, texts):
+        self.encoded_batches.append(len(texts))
+        return [[1.0, 0.0] for _ in texts]
+
+    def store_batch(self, batch, embeddings):
+        if self.fail_after is not None and len(self.stored) >= self.fail_after:
+            raise RuntimeError("disk full")
+        assert len(batch) == len(embeddings)
+        self.stored.extend(task["entry_id"] for task in batch)
+        return len(batch)
+
+    def enqueue_entry(self, entry):
+        self.spooled.append(entry["entry_id"])
+        return True
+
+
+def _write_log(path: Path, count: int) -> None:
+    lines = [
+        f"[ℹ️] [2026-01-03 08:00:{i:02d} UTC] [Agent: Agent] [Project: proj] {path.stem} step {i}"
+        for i in range(count)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _units(reindex, tmp_path: Path, sizes):
+    units = []
+    for idx, count in enumerate(sizes):
+        path = tmp_path / f"LOG_{idx}.md"
+        _write_log(path, count)
+        units.append(reindex.WorkUnit(
+            "log", f"log:{path}", reindex._fingerprint(path), "proj", path, "progress",
+        ))
+    return units
+
+
+def _pipeline(reindex, tmp_path, indexer, *, batch_size=4):
+    checkpoint = reindex.ReindexCheckpoint(tmp_path / "ckpt.json", {"logs": True})
+    checkpoint.load()
+    pipeline = reindex.ReindexPipeline(
+        vector_indexer=indexer,
+        checkpoint=checkpoint,
+        batch_size=batch_size,
+        queue_depth=2,
+        progress_seconds=0,
+    )
+    return pipeline, checkpoint
+
+
+def test_pipeline_embeds_in_bounded_batches(reindex, tmp_path):
+    indexer = _FakeIndexer()
+    units = _units(reindex, tmp_path, [5, 3, 6])
+    pipeline, checkpoint = _pipeline(reindex, tmp_path, indexer)
+
+    asyncio.run(pipeline.run(units))
+
+    assert len(indexer.stored) == 14
+    assert max(indexer.encoded_batches) <= 4
+    assert pipeline.units_done == 3
+    assert pipeline.stats["store"].items == 14
+    assert pipeline.eta_seconds() == 0
+    assert set(checkpoint.done) == {unit.key for unit in units}
+
+
+def test_interrupted_run_resumes_from_checkpoint(reindex, tmp_path):
+    units = _units(reindex, tmp_path, [4, 4, 4])
+    failing = _FakeIndexer(fail_after=4)
+    pipeline, _checkpoint = _pipeline(reindex, tmp_path, failing)
+    with pytest.raises(RuntimeError, match="disk full"):
+        asyncio.run(pipeline.run(units))
+
+    saved = json.loads((tmp_path / "ckpt.json").read_text(encoding="utf-8"))
+    assert list(saved["done"]) == [units[0].key]
+
+    resumed = _FakeIndexer()
+    pipeline, _checkpoint = _pipeline(reindex, tmp_path, resumed)
+    asyncio.run(pipeline.run(units))
+    assert pipeline.units_resumed == 1
+    assert len(resumed.stored) == 8
+
+
+def test_changed_file_is_not_skipped_on_resume(reindex, tmp_path):
+    units = _units(reindex, tmp_path, [2])
+    pipeline, _checkpoint = _pipeline(reindex, tmp_path, _FakeIndexer())
+    asyncio.run(pipeline.run(units))
+
+    _write_log(units[0].path, 3)
+    changed = reindex.WorkUnit(
+        "log", units[0].key, reindex._fingerprint(units[0].path), "proj", units[0].path, "progress",
+    )
+    indexer = _FakeIndexer()
+    pipeline, _checkpoint = _pipeline(reindex, tmp_path, indexer)
+    asyncio.run(pipeline.run([changed]))
+    assert pipeline.units_resumed == 0
+    assert len(indexer.stored) == 3
+
+
+def test_reader_process_spools_instead_of_embedding(reindex, tmp_path):
+    indexer = _FakeIndexer(writer=False)
+    pipeline, _checkpoint = _pipeline(reindex, tmp_path, indexer)
+    asyncio.run(pipeline.run(_units(reindex, tmp_path, [3])))
+
+    assert indexer.encoded_batches == []
+    assert len(indexer.spooled) == 3
+    assert pipeline.counts["spooled"] == 3
+    assert pipeline.units_done == 1
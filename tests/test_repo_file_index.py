@@ -0,0 +1,106 @@
+"""Tests for the repo file-presence index and cached code-reference verification."""
+
+import os
+
+import scribe_mcp.tools.query_entries as qe
+from scribe_mcp.utils.repo_files import RepoFileIndex
+
+
+def _tree(root):
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("")
+    (root / "pkg" / "sub" / "b.py").write_text("")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("")
+    (root / "build").mkdir()
+    (root / "build" / "out.py").write_text("")
+    (root / "notes.log").write_text("")
+    (root / ".gitignore").write_text("# comment\nbuild/\n*.log\n!keep.log\n")
+
+
+def _bump(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_respects_ignore_rules(tmp_path):
+    _tree(tmp_path)
+    index = RepoFileIndex(tmp_path)
+
+    assert index.contains("pkg/a.py")
+    assert index.contains("./pkg/sub/../sub/b.py")
+    assert index.contains(tmp_path / "pkg" / "a.py")
+    assert not index.contains("pkg")
+    assert not index.contains("node_modules/dep.js")
+    assert not index.contains("build/out.py")
+    assert not index.contains("notes.log")
+    assert not index.contains("../outside.py")
+    assert len(index) == 3  # .gitignore, pkg/a.py, pkg/sub/b.py
+
+
+def test_changed_directories_are_relisted(tmp_path):
+    _tree(tmp_path)
+    index = RepoFileIndex(tmp_path, refresh_interval=0)
+    assert index.contains("pkg/sub/b.py")
+
+    (tmp_path / "pkg" / "sub" / "b.py").unlink()
+    (tmp_path / "pkg" / "new").mkdir()
+    (tmp_path / "pkg" / "new" / "c.py").write_text("")
+    _bump(tmp_path / "pkg" / "sub")
+    _bump(tmp_path / "pkg")
+
+    assert not index.contains("pkg/sub/b.py")
+    assert index.contains("pkg/new/c.py")
+
+    (tmp_path / "pkg" / "new" / "c.py").unlink()
+    (tmp_path / "pkg" / "new").rmdir()
+    _bump(tmp_path / "pkg")
+    assert not index.contains("pkg/new/c.py")
+
+
+def test_watcher_events_apply_without_a_sweep(tmp_path):
+    _tree(tmp_path)
+    index = RepoFileIndex(tmp_path, refresh_interval=3600)
+    index.refresh()
+
+    (tmp_path / "pkg" / "d.md").write_text("")
+    index.note_change(tmp_path / "pkg" / "d.md", "created")
+    index.note_change(tmp_path / "build" / "e.md", "created")
+    index.note_change(tmp_path / "pkg" / "a.py", "moved", tmp_path / "pkg" / "z.py")
+
+    assert index.contains("pkg/d.md")
+    assert not index.contains("build/e.md")
+    assert not index.contains("pkg/a.py")
+    assert index.contains("pkg/z.py")
+
+
+def test_code_references_are_checked_against_the_index(tmp_path):
+    (tmp_path / "scribe_mcp" / "tools").mkdir(parents=True)
+    (tmp_path / "scribe_mcp" / "tools" / "query_entries.py").write_text("")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "GUIDE.md").write_text("")
+
+    results = qe._verify_code_references_in_results(
+        [
+            {"message": "Refactored query_entries.py, see GUIDE.md", "meta": {}},
+            {"message": "Removed legacy_module.py and query_entries.py", "emoji": "ℹ️"},
+            {"message": "No references here"},
+        ],
+        tmp_path,
+    )
+
+    assert results[0]["meta"]["code_reference_verification"] == "passed"
+    assert results[1]["meta"]["broken_code_references"] == ["legacy_module.py"]
+    assert results[1]["emoji"] == "⚠️"
+    assert results[2]["meta"]["code_reference_verification"] == "passed"
+
+
+def test_ignored_files_that_exist_are_not_broken_references(tmp_path):
+    _tree(tmp_path)
+
+    results = qe._verify_code_references_in_results(
+        [{"message": "Regenerated build/out.py and gone.py", "meta": {}}],
+        tmp_path,
+    )
+
+    assert results[0]["meta"]["broken_code_references"] == ["gone.py"]
@@ -0,0 +1,88 @@
+"""Tests for the batched, coalescing SyncManager loop."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scribe_mcp.doc_management.file_watcher import FileChangeEvent
+from scribe_mcp.doc_management.sync_manager import SyncManager
+from scribe_mcp.storage.sqlite import SQLiteStorage
+
+
+async def _storage(tmp_path):
+    storage = SQLiteStorage(tmp_path / "scribe.db")
+    await storage.setup()
+    return storage
+
+
+def _counting(storage, name, calls):
+    original = getattr(storage, name)
+
+    async def _wrapped(*args, **kwargs):
+        calls.append(name)
+        return await original(*args, **kwargs)
+
+    return _wrapped
+
+
+@pytest.mark.asyncio
+async def test_pending_files_sync_once_per_tick_in_one_transaction(tmp_path, monkeypatch):
+    storage = await _storage(tmp_path)
+    project = tmp_path / "project"
+    project.mkdir()
+    for name in ("a.md", "b.md", "c.txt"):
+        (project / name).write_text(f"# {name}\n", encoding="utf-8")
+    (project / "skip.py").write_text("", encoding="utf-8")
+
+    manager = SyncManager(storage, project, enable_watcher=False, max_concurrent_reads=2)
+    calls = []
+    monkeypatch.setattr(storage, "_fetchall", _counting(storage, "_fetchall", calls))
+    monkeypatch.setattr(storage, "_execute_batch", _counting(storage, "_execute_batch", calls))
+    monkeypatch.setattr(storage, "_execute", _counting(storage, "_execute", calls))
+
+    for _ in range(3):
+        manager._handle_file_changes(
+            [FileChangeEvent(project / name, "modified") for name in ("a.md", "b.md", "c.txt", "skip.py")]
+        )
+    assert len(manager._pending_syncs) == 4
+
+    await manager._process_pending_syncs()
+
+    assert manager._pending_syncs == {}
+    # One lookup per table for the whole batch, one write transaction
+    assert calls == ["_fetchall", "_fetchall", "_execute_batch"]
+    rows = await storage._fetchall("SELECT file_path, content FROM document_sections ORDER BY file_path")
+    assert [(Path(r["file_path"]).name, r["content"]) for r in rows] == [
+        ("a.md", "# a.md\n"),
+        ("b.md", "# b.md\n"),
+        ("c.txt", "# c.txt\n"),
+    ]
+
+    status = await manager.get_sync_status()
+    assert status["statistics"]["operations_successful"] == 4
+    assert status["statistics"]["batches_total"] == 1
+    assert set(status["sync_lag_seconds"]) == {str(project / n) for n in ("a.md", "b.md", "c.txt", "skip.py")}
+    assert status["statistics"]["max_sync_lag"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_database_state_prefers_sync_status(tmp_path):
+    storage = await _storage(tmp_path)
+    project = tmp_path / "project"
+    project.mkdir()
+    paths = [project / f"{n}.md" for n in range(3)]
+    for path in paths:
+        path.write_text("content\n", encoding="utf-8")
+
+    manager = SyncManager(storage, project, enable_watcher=False)
+    operations = await manager._sync_files(paths[:2])
+    assert all(op.success for op in operations)
+    await storage._execute("DELETE FROM sync_status WHERE file_path = ?", (str(paths[1]),))
+
+    states = await manager._get_database_states(paths)
+    assert states[str(paths[0])]["sync_status"] == "synced"
+    assert states[str(paths[1])]["content"] == "content\n"
+    assert str(paths[2]) not in states
+    assert await manager._get_database_state(paths[2]) is None
@@ -0,0 +1,63 @@
+"""Tests for the shared template engine registry."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from scribe_mcp.template_engine import clear_template_engine_cache, get_template_engine
+
+
+def _bump(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_engines_are_shared_per_root_pack_and_mode(tmp_path: Path) -> None:
+    clear_template_engine_cache()
+    custom = tmp_path / ".scribe" / "templates"
+    custom.mkdir(parents=True)
+    (custom / "NOTE.md").write_text("# {{ project_name }}\n", encoding="utf-8")
+
+    first = get_template_engine(project_root=tmp_path, project_name="Alpha")
+    assert get_template_engine(project_root=tmp_path, project_name="Alpha") is first
+    assert get_template_engine(project_root=tmp_path, security_mode="immutable") is not first
+
+    beta = get_template_engine(project_root=tmp_path, project_name="Beta")
+    assert beta.env is first.env
+    assert beta.render_template("NOTE.md") == "# Beta\n"
+    assert first.render_template("NOTE.md") == "# Alpha\n"
+    assert any((tmp_path / ".scribe" / "cache" / "jinja2").iterdir())
+    clear_template_engine_cache()
+
+
+def test_engines_are_rebuilt_when_template_directories_change(tmp_path: Path) -> None:
+    clear_template_engine_cache()
+    engine = get_template_engine(project_root=tmp_path, project_name="Gamma")
+
+    custom = tmp_path / ".scribe" / "templates"
+    custom.mkdir(parents=True)
+    (custom / "NOTE.md").write_text("custom\n", encoding="utf-8")
+    rebuilt = get_template_engine(project_root=tmp_path, project_name="Gamma")
+    assert rebuilt is not engine
+    assert rebuilt.render_template("NOTE.md") == "custom\n"
+
+    (custom / "OTHER.md").write_text("other\n", encoding="utf-8")
+    _bump(custom)
+    assert get_template_engine(project_root=tmp_path, project_name="Gamma") is not rebuilt
+    clear_template_engine_cache()
+
+
+def test_custom_variables_follow_the_variables_file(tmp_path: Path) -> None:
+    clear_template_engine_cache()
+    variables = tmp_path / ".scribe" / "variables.json"
+    variables.parent.mkdir(parents=True)
+    variables.write_text(json.dumps({"owner": "ops"}), encoding="utf-8")
+    engine = get_template_engine(project_root=tmp_path, project_name="Delta")
+    assert engine.render_string("{{ owner }}") == "ops"
+
+    variables.write_text(json.dumps({"owner": "platform"}), encoding="utf-8")
+    _bump(variables)
+    assert engine.render_string("{{ owner }}") == "platform"
+    clear_template_engine_cache()
@@ -0,0 +1,132 @@
+"""Tests for compact vector encodings, exact re-ranking and content pointers."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+DIM = 8
+
+
+class _FixedQueryModel:
+    def __init__(self, query_vector):
+        self.query_vector = np.asarray(query_vector, dtype="float32").reshape(1, -1)
+
+    def encode(self, texts, **_kwargs):
+        return np.repeat(self.query_vector, len(texts), axis=0)
+
+
+def _make_indexer(tmp_path: Path, **config) -> VectorIndexer:
+    (tmp_path / ".scribe_vectors").mkdir(exist_ok=True)
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="fixed", **config)
+    query = np.zeros(DIM, dtype="float32")
+    query[0] = 1.0
+    indexer.embedding_model = _FixedQueryModel(query)
+    indexer._init_vector_index()
+    indexer._init_mapping_database()
+    return indexer
+
+
+def _store(indexer: VectorIndexer, vectors, *, text="x" * 1000, prefix="e"):
+    vectors = np.asarray(vectors, dtype="float32")
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    start = int(indexer.vector_index.ntotal)
+    batch = [
+        {
+            "entry_id": f"{prefix}-{start + i}",
+            "project_slug": "proj",
+            "text_content": text,
+            "agent_name": "Agent",
+            "timestamp_utc": "2026-01-01 00:00:00 UTC",
+            "metadata_json": json.dumps({"content_type": "doc", "chunk_index": i}),
+            "content_type": "doc",
+            "doc_type": None,
+            "file_path": "/docs/a.md",
+            "embedding_model": "fixed",
+            "vector_dimension": DIM,
+        }
+        for i in range(len(vectors))
+    ]
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(batch, vectors)
+
+    asyncio.run(_run())
+    return vectors
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestVectorCompression:
+    def test_fp16_index_halves_resident_bytes(self, tmp_path):
+        indexer = _make_indexer(tmp_path, compression="fp16")
+        assert indexer.index_metadata.index_type == "IndexScalarQuantizer:fp16"
+
+        rng = np.random.default_rng(0)
+        _store(indexer, rng.normal(size=(20, DIM)))
+        memory = indexer._memory_stats()
+        assert memory["bytes_per_vector"] == DIM * 2
+        assert memory["index_bytes_saved"] == 20 * DIM * 2
+
+        # Persisted encoding survives a reload.
+        reloaded = _make_indexer(tmp_path, compression="fp16")
+        assert reloaded.vector_index.ntotal == 20
+        assert reloaded.index_metadata.index_type == "IndexScalarQuantizer:fp16"
+
+    def test_int8_rerank_returns_exact_scores(self, tmp_path):
+        indexer = _make_indexer(tmp_path, compression="int8", rerank_k=5)
+        rng = np.random.default_rng(1)
+        vectors = _store(indexer, rng.normal(size=(30, DIM)))
+
+        results = indexer.search_similar("q", k=3)
+        exact = vectors[:, 0]
+        expected = np.argsort(-exact)[:3]
+        assert [r["vector_rowid"] for r in results] == list(expected)
+        assert results[0]["similarity_score"] == pytest.approx(float(exact[expected[0]]), abs=1e-5)
+        assert (tmp_path / ".scribe_vectors" / "tmp.f32").stat().st_size == 30 * DIM * 4
+
+    def test_pq_trains_once_enough_vectors_exist(self, tmp_path):
+        indexer = _make_indexer(
+            tmp_path, compression="pq", pq_subquantizers=4, pq_bits=4, pq_train_size=32
+        )
+        rng = np.random.default_rng(2)
+        _store(indexer, rng.normal(size=(16, DIM)))
+        assert indexer.index_metadata.index_type == "IndexFlatIP"
+
+        _store(indexer, rng.normal(size=(32, DIM)))
+        assert indexer.index_metadata.index_type == "IndexPQ"
+        assert indexer.vector_index.ntotal == 48
+        assert indexer._memory_stats()["bytes_per_vector"] == 2
+
+    def test_content_pointer_replaces_text(self, tmp_path):
+        indexer = _make_indexer(tmp_path, store_text_content=False, text_preview_chars=10)
+        _store(indexer, np.eye(DIM)[:2])
+
+        results = indexer.search_similar("q", k=1)
+        assert results[0]["text_content"] == "x" * 10
+        ref = results[0]["content_ref"]
+        assert ref["file_path"] == "/docs/a.md"
+        assert ref["entry_id"] == results[0]["entry_id"]
+
+        entry = indexer.retrieve_by_uuid(results[0]["entry_id"])
+        assert entry["content_ref"]["text_sha256"] == ref["text_sha256"]
+        assert indexer._memory_stats()["text_bytes_saved"] == 2 * 990
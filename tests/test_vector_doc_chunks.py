@@ -0,0 +1,196 @@
+"""Tests for chunk-level change detection when re-embedding documents."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+from scribe_mcp.tools import manage_docs
+
+DIM = 4
+DOC_PATH = "/docs/ARCHITECTURE_GUIDE.md"
+
+
+class _AxisModel:
+    def encode(self, texts, **_kwargs):
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _open(tmp_path: Path) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="axis")
+    indexer.embedding_model = _AxisModel()
+    indexer._claim_index_role()
+    indexer._init_mapping_database()
+    indexer._init_vector_index()
+    return indexer
+
+
+def _embed(indexer: VectorIndexer, chunks, ordinals, version: str) -> None:
+    """Run the chunks at the given ordinals through the embedding path."""
+    hashes = [manage_docs._hash_text(chunk) for chunk in chunks]
+    batch = [
+        indexer._prepare_embedding_task({
+            "entry_id": manage_docs._generate_doc_entry_id(
+                Path(DOC_PATH), hashes[idx], hashes[:idx].count(hashes[idx])
+            ),
+            "project_name": "proj",
+            "message": chunks[idx],
+            "agent": "Agent",
+            "timestamp": "2026-01-01 00:00:00 UTC",
+            "meta": {
+                "content_type": "doc",
+                "file_path": DOC_PATH,
+                "chunk_index": idx,
+                "chunk_total": len(chunks),
+                "chunk_hash": hashes[idx],
+                "sha_after": version,
+            },
+        })
+        for idx in ordinals
+    ]
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._process_embedding_batch(batch)
+
+    asyncio.run(_run())
+
+
+def _plan(indexer: VectorIndexer, chunks, version: str):
+    return indexer.plan_doc_chunks(DOC_PATH, [manage_docs._hash_text(c) for c in chunks], version)
+
+
+def _doc_rows(indexer: VectorIndexer):
+    rows = indexer._db_conn.execute(
+        "SELECT text_content, metadata_json FROM vector_entries WHERE file_path = ?", (DOC_PATH,)
+    ).fetchall()
+    return {row["text_content"]: json.loads(row["metadata_json"])["chunk_index"] for row in rows}
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    indexer = _open(tmp_path)
+    yield indexer
+    indexer._release_writer_lease()
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestDocChunkManifest:
+    def test_unchanged_document_embeds_nothing(self, indexer):
+        chunks = ["# A\n\none", "# B\n\ntwo", "# C\n\nthree"]
+        plan = _plan(indexer, chunks, "v1")
+        assert plan["embed"] == [0, 1, 2]
+        _embed(indexer, chunks, plan["embed"], "v1")
+
+        plan = _plan(indexer, chunks, "v2")
+        assert plan == {"embed": [], "kept": 3, "tombstoned": 0}
+        assert indexer.vector_index.ntotal == 3
+
+    def test_edit_reembeds_only_the_changed_chunk(self, indexer):
+        chunks = ["# A\n\none", "# B\n\ntwo", "# C\n\nthree"]
+        _embed(indexer, chunks, _plan(indexer, chunks, "v1")["embed"], "v1")
+
+        edited = ["# A\n\none", "# B\n\nTWO", "# C\n\nthree"]
+        plan = _plan(indexer, edited, "v2")
+        assert plan == {"embed": [1], "kept": 2, "tombstoned": 1}
+        _embed(indexer, edited, plan["embed"], "v2")
+
+        assert indexer.vector_index.ntotal == 4
+        assert _doc_rows(indexer) == {"# A\n\none": 0, "# B\n\nTWO": 1, "# C\n\nthree": 2}
+        results = indexer.search_similar("q", k=10)
+        assert "# B\n\ntwo" not in {r["text_content"] for r in results}
+        assert len(results) == 3
+
+        status = indexer.get_index_status()["doc_chunks"]
+        assert status["embedded"] == 4
+        assert status["skipped"] == 2
+        assert status["tombstoned"] == 1
+
+    def test_moved_chunks_are_renumbered_not_reembedded(self, indexer):
+        chunks = ["# A\n\none", "# B\n\ntwo"]
+        _embed(indexer, chunks, _plan(indexer, chunks, "v1")["embed"], "v1")
+
+        edited = ["# Intro\n\nnew", "# A\n\none", "# B\n\ntwo"]
+        plan = _plan(indexer, edited, "v2")
+        assert plan["embed"] == [0]
+        _embed(indexer, edited, plan["embed"], "v2")
+        assert _doc_rows(indexer) == {"# Intro\n\nnew": 0, "# A\n\none": 1, "# B\n\ntwo": 2}
+        assert _plan(indexer, edited, "v3")["embed"] == []
+
+    def test_duplicated_chunk_gets_its_own_entry(self, indexer):
+        chunks = ["# A\n\none", "# X\n\nsame"]
+        _embed(indexer, chunks, _plan(indexer, chunks, "v1")["embed"], "v1")
+
+        edited = ["# X\n\nsame", "# X\n\nsame"]
+        plan = _plan(indexer, edited, "v2")
+        assert plan == {"embed": [1], "kept": 1, "tombstoned": 1}
+        _embed(indexer, edited, plan["embed"], "v2")
+
+        manifest = indexer._db_conn.execute(
+            "SELECT ordinal, entry_id FROM doc_chunks WHERE file_path = ? ORDER BY ordinal", (DOC_PATH,)
+        ).fetchall()
+        assert [row["ordinal"] for row in manifest] == [0, 1]
+        assert len({row["entry_id"] for row in manifest}) == 2
+        indexes = indexer._db_conn.execute(
+            "SELECT metadata_json FROM vector_entries WHERE file_path = ?", (DOC_PATH,)
+        ).fetchall()
+        assert sorted(json.loads(row["metadata_json"])["chunk_index"] for row in indexes) == [0, 1]
+        assert len(indexer.search_similar("q", k=10)) == 2
+        assert _plan(indexer, edited, "v3")["embed"] == []
+
+    def test_chunks_from_superseded_revision_are_dropped(self, indexer):
+        chunks = ["# A\n\none"]
+        _plan(indexer, chunks, "v1")
+        _plan(indexer, ["# A\n\nuno"], "v2")
+
+        _embed(indexer, chunks, [0], "v1")
+        assert indexer.vector_index.ntotal == 0
+        assert indexer.get_index_status()["doc_chunks"]["superseded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_index_doc_enqueues_only_planned_chunks(tmp_path):
+    doc = tmp_path / "ARCHITECTURE_GUIDE.md"
+    doc.write_text("# A\n\none\n\n# B\n\ntwo\n", encoding="utf-8")
+
+    indexer = MagicMock()
+    indexer.plan_doc_chunks.return_value = {"embed": [1], "kept": 1, "tombstoned": 0}
+    with patch.object(manage_docs, "_vector_indexing_enabled", return_value=True), \
+            patch.object(manage_docs, "_get_vector_indexer", return_value=indexer):
+        await manage_docs._index_doc_for_vector(
+            project={"name": "proj", "root": str(tmp_path)},
+            doc="architecture",
+            change_path=doc,
+            after_hash="v1",
+            agent_id="Agent",
+            metadata=None,
+        )
+
+    path, hashes, version = indexer.plan_doc_chunks.call_args.args
+    assert path == str(doc) and len(hashes) == 2 and version == "v1"
+    indexer.post_append.assert_called_once()
+    entry = indexer.post_append.call_args.args[0]
+    assert entry["meta"]["chunk_index"] == 1
+    assert entry["meta"]["chunk_hash"] == hashes[1]
@@ -0,0 +1,155 @@
+"""Tests for pluggable embedding backends and the built-in hashed n-gram backend."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# The built-in backend needs only FAISS and NumPy, not sentence-transformers
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import (
+    EMBEDDING_BACKENDS,
+    EmbeddingBackend,
+    HashedNgramBackend,
+    VectorIndexer,
+)
+
+DIM = 128
+
+DOCS = [
+    "Vector index sharding by project with FAISS",
+    "The reminder engine rotates progress logs daily",
+    "Patch hunks are aligned with a rolling hash",
+    "Sharded vector search fans out across project shards",
+]
+
+
+def _open(tmp_path: Path) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="hashed-ngram", encode_executor="inline")
+    indexer._claim_index_role()
+    indexer._init_mapping_database()
+    indexer._load_model_and_index()
+    return indexer
+
+
+def _close(indexer: VectorIndexer) -> None:
+    # Mirrors cleanup(), which flushes backend state before releasing the lease
+    indexer._save_embedding_state(force=True)
+    indexer._release_writer_lease()
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestHashedNgramBackend:
+    def test_vectors_are_normalised_and_deterministic(self):
+        backend = HashedNgramBackend(DIM)
+        vectors = backend.encode(DOCS + [""])
+        assert vectors.shape == (len(DOCS) + 1, DIM)
+        assert vectors.dtype == np.float32
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+        assert np.array_equal(HashedNgramBackend(DIM).encode(DOCS), vectors[:-1])
+
+    def test_backends_must_implement_encode(self):
+        class _NoEncode(EmbeddingBackend):
+            name = "no-encode"
+
+        with pytest.raises(TypeError):
+            _NoEncode(DIM)
+
+    def test_related_text_scores_higher(self):
+        backend = HashedNgramBackend(DIM)
+        scores = backend.encode(DOCS) @ backend.encode_query(["vector shards"])[0]
+        assert set(np.argsort(-scores)[:2]) == {0, 3}
+
+    def test_query_side_idf_discounts_common_terms(self):
+        backend = HashedNgramBackend(DIM)
+        docs = [f"project log entry {word}" for word in ("alpha", "rotation", "gamma", "delta")]
+        vectors = backend.encode(docs)
+        scores = vectors @ backend.encode_query(["project log rotation"])[0]
+        assert int(np.argmax(scores)) == 1
+        # Without document frequencies the shared words dominate less clearly
+        plain = vectors @ HashedNgramBackend(DIM).encode_query(["project log rotation"])[0]
+        assert scores[1] - np.delete(scores, 1).max() > plain[1] - np.delete(plain, 1).max()
+
+    def test_indexer_searches_without_a_transformer_model(self, tmp_path):
+        indexer = _open(tmp_path)
+        try:
+            tasks = [
+                indexer.prepare_entry({"entry_id": f"d{i}", "project_name": "proj", "message": text, "meta": {}})
+                for i, text in enumerate(DOCS)
+            ]
+            indexer.store_batch(tasks, indexer.encode_texts([t["text_content"] for t in tasks]))
+
+            results = indexer.search_similar("rolling hash for patches", k=1)
+            assert results[0]["entry_id"] == "d2"
+            assert indexer.index_metadata.model == "hashed-ngram"
+        finally:
+            _close(indexer)
+
+        # Document frequencies persist next to the index for the next process
+        assert (tmp_path / ".scribe_vectors" / "tmp.embedding.npz").exists()
+        reopened = _open(tmp_path)
+        try:
+            assert reopened.embedding_model._docs == len(DOCS)
+        finally:
+            _close(reopened)
+
+    def test_reindexing_the_same_corpus_keeps_query_vectors(self, tmp_path):
+        indexer = _open(tmp_path)
+        backend = indexer.embedding_model
+
+        def _index(texts):
+            tasks = [
+                indexer.prepare_entry({"entry_id": f"d{i}", "project_name": "proj", "message": text, "meta": {}})
+                for i, text in enumerate(texts)
+            ]
+            indexer.store_batch(tasks, indexer.encode_texts([t["text_content"] for t in tasks]))
+
+        try:
+            _index(DOCS)
+            query = backend.encode_query(["vector shards"])
+            _index(DOCS)
+            assert backend._docs == len(DOCS)
+            assert np.array_equal(backend.encode_query(["vector shards"]), query)
+
+            # Replacing an entry's text swaps its document frequencies
+            _index(DOCS[:-1] + ["An unrelated closing note"])
+            _index(DOCS)
+            assert np.array_equal(backend.encode_query(["vector shards"]), query)
+
+            indexer.rebuild_index()
+            assert backend._docs == 0
+            _index(DOCS)
+            assert np.array_equal(backend.encode_query(["vector shards"]), query)
+        finally:
+            _close(indexer)
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+@pytest.mark.parametrize("model", ["all-MiniLM-L6-v2", "hashed-ngram"])
+def test_builtin_backend_needs_no_sentence_transformers(model):
+    indexer = VectorIndexer()
+    indexer.vector_config = VectorConfig(dimension=DIM, model=model)
+    indexer.repo_root = Path("/nonexistent")
+    indexer.repo_slug = "tmp"
+    with patch("scribe_mcp.plugins.vector_indexer.SENTENCE_TRANSFORMERS_AVAILABLE", False):
+        if model in EMBEDDING_BACKENDS:
+            indexer._init_embedding_model()
+            assert isinstance(indexer.embedding_model, HashedNgramBackend)
+        else:
+            with pytest.raises(RuntimeError, match="hashed-ngram"):
+                indexer._init_embedding_model()
@@ -0,0 +1,115 @@
+"""Tests for VectorIndexer inference executor and adaptive batching."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+
+class _RecordingModel:
+    """Fake embedding model that records the thread it ran on."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.threads = []
+
+    def encode(self, texts, **_kwargs):
+        self.threads.append(threading.current_thread().name)
+        if self.delay:
+            time.sleep(self.delay)
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+
+def _make_indexer(mode: str = "thread", **config) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = SimpleNamespace(
+        encode_executor=mode,
+        encode_workers=1,
+        batch_size=config.get("batch_size", 4),
+        max_batch_size=config.get("max_batch_size", 32),
+        model="fake",
+        dimension=3,
+    )
+    indexer.embedding_model = _RecordingModel(delay=config.get("delay", 0.0))
+    indexer._init_encode_executor()
+    return indexer
+
+
+@pytest.mark.asyncio
+async def test_batch_encoding_runs_on_executor_thread():
+    indexer = _make_indexer("thread", delay=0.2)
+    try:
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        embeddings = await indexer._encode_batch(["a", "b"])
+        ticker.cancel()
+
+        assert len(embeddings) == 2
+        assert indexer.embedding_model.threads[0].startswith("VectorEncode-tmp")
+        # The loop kept running while the model was busy.
+        assert ticks >= 5
+    finally:
+        indexer._shutdown_encode_executor()
+
+
+def test_query_encoding_uses_executor_and_records_timing():
+    indexer = _make_indexer("thread")
+    try:
+        indexer._encode_query("hello")
+        assert indexer.embedding_model.threads[0].startswith("VectorEncode-tmp")
+        assert indexer._encode_timings()["executor"] == "thread"
+        assert indexer._encode_stats["queries"] == 1
+    finally:
+        indexer._shutdown_encode_executor()
+
+
+def test_inline_and_unknown_modes():
+    inline = _make_indexer("inline")
+    assert inline._encode_executor is None
+    inline._encode_query("hello")
+    assert inline.embedding_model.threads == [threading.current_thread().name]
+
+    fallback = _make_indexer("bogus")
+    try:
+        assert fallback._encode_mode == "thread"
+        assert fallback._encode_executor is not None
+    finally:
+        fallback._shutdown_encode_executor()
+
+
+def test_adaptive_batch_size_tracks_queue_depth():
+    indexer = _make_indexer("inline", batch_size=4, max_batch_size=32)
+    indexer.embedding_queue = SimpleNamespace(qsize=lambda: 0)
+    assert indexer._adaptive_batch_size() == 4
+
+    indexer.embedding_queue = SimpleNamespace(qsize=lambda: 10)
+    assert indexer._adaptive_batch_size() == 16
+
+    indexer.embedding_queue = SimpleNamespace(qsize=lambda: 1000)
+    assert indexer._adaptive_batch_size() == 32
+
+
+def test_queue_and_inference_timings_reported_separately():
+    indexer = _make_indexer("inline")
+    now = time.monotonic()
+    batch = [{"enqueued_at": now - 0.5}, {"enqueued_at": now - 0.1}]
+    indexer._record_batch_timings(batch, now, inference_ms=40.0)
+
+    timings = indexer._encode_timings()
+    assert timings["batches"] == 1
+    assert timings["items"] == 2
+    assert timings["queue_wait_ms_max"] == pytest.approx(500.0, abs=1.0)
+    assert timings["queue_wait_ms_avg"] == pytest.approx(300.0, abs=1.0)
+    assert timings["inference_ms_avg"] == pytest.approx(40.0)
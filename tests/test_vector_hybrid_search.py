@@ -0,0 +1,212 @@
+"""Tests for lexical retrieval, reciprocal rank fusion and hybrid search."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+# Try to import vector dependencies - if not available, tests will be skipped
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+from scribe_mcp.utils.search import hybrid_search, reciprocal_rank_fusion
+
+DIM = 4
+
+
+class _AxisModel:
+    def encode(self, texts, **_kwargs):
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _open(tmp_path: Path) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="axis")
+    indexer.embedding_model = _AxisModel()
+    indexer._claim_index_role()
+    indexer._init_mapping_database()
+    indexer._init_vector_index()
+    return indexer
+
+
+def _store(indexer: VectorIndexer, texts, *, project="proj", content_type="log") -> None:
+    batch = [
+        {
+            "entry_id": entry_id,
+            "project_slug": project,
+            "text_content": text,
+            "agent_name": "Agent",
+            "timestamp_utc": "2026-01-01 00:00:00 UTC",
+            "metadata_json": json.dumps({"content_type": content_type}),
+            "content_type": content_type,
+            "embedding_model": "axis",
+            "vector_dimension": DIM,
+        }
+        for entry_id, text in texts.items()
+    ]
+    vectors = np.eye(DIM, dtype="float32")[np.arange(len(batch)) % DIM]
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(batch, vectors)
+
+    asyncio.run(_run())
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    indexer = _open(tmp_path)
+    _store(indexer, {
+        "a": "Rotated the progress log after the size limit",
+        "b": "FAISS shard fan-out merges results by score",
+        "c": "Progress on shard rebalancing",
+    })
+    yield indexer
+    indexer._release_writer_lease()
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestLexicalSearch:
+    def test_keyword_matches_rank_by_bm25(self, indexer):
+        results = indexer.search_lexical("shard merges", k=5)
+        assert [r["entry_id"] for r in results] == ["b", "c"]
+        assert results[0]["lexical_score"] > results[1]["lexical_score"] > 0
+
+    def test_filters_use_the_same_sql_conditions(self, indexer):
+        _store(indexer, {"d": "shard notes for another project"}, project="other")
+        assert {r["entry_id"] for r in indexer.search_lexical("shard", k=5)} == {"b", "c", "d"}
+        scoped = indexer.search_lexical("shard", k=5, filters={"project_slug": "other"})
+        assert [r["entry_id"] for r in scoped] == ["d"]
+
+    def test_replaced_entries_stay_in_sync(self, indexer):
+        _store(indexer, {"b": "Rewritten entry about warm-up"})
+        assert indexer.search_lexical("merges", k=5) == []
+        assert [r["entry_id"] for r in indexer.search_lexical("warm", k=5)] == ["b"]
+
+    def test_existing_rows_are_indexed_when_fts_is_added(self, indexer):
+        with indexer._db_lock:
+            indexer._db_conn.execute("DROP TABLE vector_entries_fts")
+            indexer._db_conn.commit()
+        indexer._init_mapping_database()
+        assert [r["entry_id"] for r in indexer.search_lexical("rotated", k=5)] == ["a"]
+
+    def test_substring_fallback_without_fts5(self, indexer):
+        indexer._fts_available = False
+        results = indexer.search_lexical("SHARD merges", k=5)
+        assert [r["entry_id"] for r in results] == ["b", "c"]
+        assert results[0]["lexical_score"] == 1.0
+
+    def test_hybrid_search_fuses_both_sources(self, indexer):
+        results = asyncio.run(hybrid_search(indexer, "rotated log", 3))
+        assert results[0]["entry_id"] == "a"
+        assert set(results[0]["source_ranks"]) == {"semantic", "lexical"}
+        assert "lexical" in results[0]["source_scores"]
+        assert len({r["entry_id"] for r in results}) == len(results)
+
+
+def test_reciprocal_rank_fusion_deduplicates_and_reports_sources():
+    fused = reciprocal_rank_fusion(
+        {
+            "semantic": [{"entry_id": "x", "similarity_score": 0.9}, {"entry_id": "y", "similarity_score": 0.8}],
+            "lexical": [{"entry_id": "y", "lexical_score": 4.0}, {"entry_id": "z", "lexical_score": 1.0}],
+        },
+        k=60,
+        score_fields={"semantic": "similarity_score", "lexical": "lexical_score"},
+    )
+    assert [item["entry_id"] for item in fused] == ["y", "x", "z"]
+    assert fused[0]["source_ranks"] == {"semantic": 2, "lexical": 1}
+    assert fused[0]["source_scores"] == {"semantic": 0.8, "lexical": 4.0}
+    assert fused[0]["rrf_score"] == round(1 / 62 + 1 / 61, 6)
+
+
+class _FakeIndexer:
+    def __init__(self):
+        self.calls = []
+
+    def search_similar(self, query, k, filters):
+        self.calls.append(("semantic", k))
+        return [{"entry_id": "s", "similarity_score": 0.5}]
+
+    def search_lexical(self, query, k, filters):
+        self.calls.append(("lexical", k))
+        raise RuntimeError("fts unavailable")
+
+
+def test_hybrid_search_bounds_work_and_tolerates_a_failing_source():
+    indexer = _FakeIndexer()
+    results = asyncio.run(hybrid_search(indexer, "q", 5, candidates=1000))
+    assert sorted(indexer.calls) == [("lexical", 200), ("semantic", 200)]
+    assert [r["entry_id"] for r in results] == ["s"]
+
+
+@pytest.mark.asyncio
+async def test_query_entries_hybrid_mode_uses_fused_hits(monkeypatch):
+    import scribe_mcp.tools.query_entries as qe
+
+    class _Indexer:
+        def wait_until_ready(self):
+            return True
+
+        def search_similar(self, query, k, filters):
+            assert filters == {"content_type": "log", "project_slug": "test_project"}
+            return [{"entry_id": "e1", "text_content": "Semantic hit", "agent_name": "Codex",
+                     "timestamp_utc": "2026-01-01 00:00:00 UTC", "metadata_json": "{}", "similarity_score": 0.7}]
+
+        def search_lexical(self, query, k, filters):
+            return []
+
+    async def _no_log_scan(_path):
+        raise AssertionError("hybrid mode must not scan the log file")
+
+    monkeypatch.setattr(qe, "_get_vector_indexer", lambda: _Indexer())
+    monkeypatch.setattr(qe, "read_all_lines", _no_log_scan)
+    search_query = {
+        "search_params": {"message": "meaning", "message_mode": "hybrid", "page": 1, "page_size": 10},
+        "project_context": type("Ctx", (), {"project": {"progress_log": "dummy.log"}})(),
+        "resolved_project": "test_project",
+        "validation_warnings": [],
+    }
+
+    result = await qe._execute_search_with_fallbacks(search_query, final_config=None)
+
+    assert result["ok"] is True
+    assert [entry["id"] for entry in result["entries"]] == ["e1"]
+    assert result["entries"][0]["source_ranks"] == {"semantic": 1}
+
+
+@pytest.mark.asyncio
+async def test_query_entries_hybrid_falls_back_to_substring(monkeypatch):
+    import scribe_mcp.tools.query_entries as qe
+
+    async def _lines(_path):
+        return ["[ℹ️] [2026-01-01 00:00:00 UTC] [Agent: Codex] [Project: test_project] needle here"]
+
+    monkeypatch.setattr(qe, "_get_vector_indexer", lambda: None)
+    monkeypatch.setattr(qe, "read_all_lines", _lines)
+    search_query = {
+        "search_params": {"message": "needle", "message_mode": "hybrid", "page": 1, "page_size": 10},
+        "project_context": type("Ctx", (), {"project": {"progress_log": "dummy.log"}})(),
+        "resolved_project": "test_project",
+        "validation_warnings": [],
+    }
+
+    result = await qe._execute_search_with_fallbacks(search_query, final_config=None)
+
+    assert result["total_found"] == 1
+    assert any("Hybrid search unavailable" in warning for warning in result["validation_warnings"])
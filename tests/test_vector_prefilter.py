@@ -0,0 +1,162 @@
+"""Tests for pre-filtered (candidate subset) vector search."""
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+from scribe_mcp.storage.models import VectorShardMetadata
+from scribe_mcp.utils.time import utcnow
+
+DIM = 4
+
+
+class _AxisModel:
+    """Embeds every text onto the first axis so scores come from stored vectors."""
+
+    def encode(self, texts, **_kwargs):
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _entry(entry_id, project, vector_score, *, content_type="log", doc_type=None, ts="2026-01-01 00:00:00 UTC"):
+    meta = {"content_type": content_type}
+    if doc_type:
+        meta["doc_type"] = doc_type
+    task = {
+        "entry_id": entry_id,
+        "project_slug": project,
+        "text_content": entry_id,
+        "agent_name": "Agent",
+        "timestamp_utc": ts,
+        "metadata_json": json.dumps(meta),
+        "content_type": content_type,
+        "doc_type": doc_type,
+        "file_path": None,
+        "embedding_model": "axis",
+        "vector_dimension": DIM,
+    }
+    vector = np.array([vector_score, np.sqrt(max(0.0, 1 - vector_score ** 2)), 0, 0], dtype="float32")
+    return task, vector
+
+
+@pytest.fixture
+def indexer(tmp_path: Path):
+    vectors_dir = tmp_path / ".scribe_vectors"
+    vectors_dir.mkdir()
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="axis")
+    indexer.embedding_model = _AxisModel()
+    indexer.vector_index = faiss.IndexFlatIP(DIM)
+    indexer.index_metadata = VectorShardMetadata(
+        repo_slug="tmp", dimension=DIM, model="axis", scope="repo-local",
+        created_at=utcnow(), backend="faiss", index_type="IndexFlatIP", total_entries=0,
+    )
+    indexer._init_mapping_database()
+
+    entries = [
+        _entry("alpha-log-1", "alpha", 0.99),
+        _entry("alpha-log-2", "alpha", 0.95),
+        _entry("beta-doc-1", "beta", 0.50, content_type="doc", doc_type="architecture"),
+        _entry("beta-doc-2", "beta", 0.40, content_type="doc", doc_type="checklist",
+               ts="2025-06-01 00:00:00 UTC"),
+        _entry("beta-log-1", "beta", 0.30),
+    ]
+
+    async def _store():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(
+            [task for task, _ in entries], np.vstack([vector for _, vector in entries])
+        )
+
+    asyncio.run(_store())
+    yield indexer
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestVectorPrefilter:
+    def test_prefilter_resolves_rowids_with_sql(self, indexer):
+        assert sorted(indexer._prefilter_rowids({"project_slug": "beta"})) == [2, 3, 4]
+        assert indexer._prefilter_rowids({"doc_type": "architecture"}) == [2]
+        assert sorted(indexer._prefilter_rowids({"project_slug_prefix": "al"})) == [0, 1]
+        assert indexer._prefilter_rowids(
+            {"time_range": {"end": "2025-12-31T00:00:00"}}
+        ) == [3]
+        assert indexer._prefilter_rowids({"project_slugs": []}) == []
+        # Unknown filter keys cannot be expressed in SQL.
+        assert indexer._prefilter_rowids({"custom": "x"}) is None
+
+    @pytest.mark.parametrize("threshold", [4096, 0])
+    def test_filtered_search_only_scores_subset(self, indexer, threshold):
+        indexer.vector_config.prefilter_flat_threshold = threshold
+        results = indexer.search_similar("q", k=2, filters={"project_slug": "beta", "content_type": "doc"})
+        assert [r["entry_id"] for r in results] == ["beta-doc-1", "beta-doc-2"]
+        assert results[0]["similarity_score"] == pytest.approx(0.5, abs=1e-5)
+
+    def test_empty_candidate_set_returns_no_results(self, indexer):
+        assert indexer.search_similar("q", k=3, filters={"project_slug": "missing"}) == []
+
+    def test_unfiltered_search_unchanged(self, indexer):
+        results = indexer.search_similar("q", k=2)
+        assert [r["entry_id"] for r in results] == ["alpha-log-1", "alpha-log-2"]
+
+
+def test_legacy_mapping_table_is_migrated_and_backfilled(tmp_path: Path):
+    vectors_dir = tmp_path / ".scribe_vectors"
+    vectors_dir.mkdir()
+    conn = sqlite3.connect(vectors_dir / "mapping.sqlite")
+    conn.execute("""
+        CREATE TABLE vector_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entry_id TEXT UNIQUE NOT NULL,
+            project_slug TEXT NOT NULL,
+            repo_slug TEXT NOT NULL,
+            vector_rowid INTEGER NOT NULL,
+            text_content TEXT NOT NULL,
+            agent_name TEXT,
+            timestamp_utc TEXT NOT NULL,
+            metadata_json TEXT,
+            embedding_model TEXT,
+            vector_dimension INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute(
+        "INSERT INTO vector_entries (entry_id, project_slug, repo_slug, vector_rowid, text_content, "
+        "agent_name, timestamp_utc, metadata_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ("doc-1", "proj", "tmp", 0, "text", "Agent", "2026-01-01 00:00:00 UTC",
+         json.dumps({"content_type": "doc", "doc_type": "architecture", "file_path": "/x.md"})),
+    )
+    conn.commit()
+    conn.close()
+
+    indexer = VectorIndexer()
+    indexer.repo_root = tmp_path
+    indexer._init_mapping_database()
+    row = indexer._db_conn.execute(
+        "SELECT content_type, doc_type, file_path, timestamp_epoch FROM vector_entries"
+    ).fetchone()
+    indexer._db_conn.close()
+
+    assert (row["content_type"], row["doc_type"], row["file_path"]) == ("doc", "architecture", "/x.md")
+    assert row["timestamp_epoch"] == pytest.approx(1767225600.0)
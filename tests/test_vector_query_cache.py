@@ -0,0 +1,146 @@
+"""Tests for the query embedding cache and the search result cache."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+DIM = 4
+
+
+class _CountingModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **_kwargs):
+        self.calls.extend(texts)
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _open(tmp_path: Path, **config) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="counting", **config)
+    indexer.embedding_model = _CountingModel()
+    indexer._claim_index_role()
+    indexer._init_mapping_database()
+    indexer._init_vector_index()
+    return indexer
+
+
+def _store(indexer: VectorIndexer, count: int, prefix: str) -> None:
+    vectors = np.eye(DIM, dtype="float32")[np.arange(count) % DIM]
+    batch = [
+        {
+            "entry_id": f"{prefix}-{i}",
+            "project_slug": "proj",
+            "text_content": f"{prefix} {i}",
+            "agent_name": "Agent",
+            "timestamp_utc": "2026-01-01 00:00:00 UTC",
+            "metadata_json": json.dumps({"content_type": "log"}),
+            "embedding_model": "counting",
+            "vector_dimension": DIM,
+        }
+        for i in range(count)
+    ]
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(batch, vectors)
+
+    asyncio.run(_run())
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    indexer = _open(tmp_path)
+    _store(indexer, 3, "first")
+    yield indexer
+    indexer._release_writer_lease()
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestQueryCache:
+    def test_repeated_query_is_served_from_cache(self, indexer):
+        first = indexer.search_similar("how  does\tsharding work", k=2)
+        first[0]["entry_id"] = "mutated by caller"
+        second = indexer.search_similar(" how does sharding work ", k=2)
+
+        assert indexer.embedding_model.calls == ["how does sharding work"]
+        assert second[0]["entry_id"] == "first-0"
+        cache = indexer.get_index_status()["query_cache"]
+        assert cache["result_hits"] == 1
+        assert cache["result_hit_rate"] == 0.5
+
+    def test_different_k_or_filters_reuse_the_embedding(self, indexer):
+        indexer.search_similar("query", k=1)
+        indexer.search_similar("query", k=2)
+        indexer.search_similar("query", k=2, filters={"project_slug": "proj"})
+
+        cache = indexer._cache_status()
+        assert len(indexer.embedding_model.calls) == 1
+        assert cache["embedding_hits"] == 2
+        assert cache["result_misses"] == 3
+
+    def test_backend_state_change_invalidates_embeddings(self, indexer):
+        indexer.search_similar("query", k=1)
+        indexer.embedding_model.state_version = 1
+        indexer.search_similar("query", k=2)
+        indexer.search_similar("query", k=3)
+
+        assert indexer.embedding_model.calls == ["query", "query"]
+
+    def test_new_index_generation_invalidates_results(self, indexer):
+        assert len(indexer.search_similar("query", k=10)) == 3
+        _store(indexer, 2, "second")
+
+        assert len(indexer.search_similar("query", k=10)) == 5
+        cache = indexer._cache_status()
+        assert cache["result_hits"] == 0
+        assert cache["invalidations"] == 1
+        assert cache["embedding_hits"] == 1
+
+    def test_results_expire_after_ttl(self, tmp_path):
+        indexer = _open(tmp_path, result_cache_ttl_seconds=0.05)
+        try:
+            _store(indexer, 1, "only")
+            indexer.search_similar("query", k=1)
+            for key, (_expires, results) in list(indexer._result_cache.items()):
+                indexer._result_cache[key] = (0.0, results)
+            indexer.search_similar("query", k=1)
+            assert indexer._cache_status()["result_hits"] == 0
+        finally:
+            indexer._release_writer_lease()
+            indexer._db_conn.close()
+
+    def test_caches_can_be_disabled(self, tmp_path):
+        indexer = _open(tmp_path, cache_size=0, result_cache_size=0)
+        try:
+            _store(indexer, 1, "only")
+            indexer.search_similar("query", k=1)
+            indexer.search_similar("query", k=1)
+            assert len(indexer.embedding_model.calls) == 2
+            assert indexer._cache_status()["results_cached"] == 0
+        finally:
+            indexer._release_writer_lease()
+            indexer._db_conn.close()
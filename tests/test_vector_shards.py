@@ -0,0 +1,157 @@
+"""Tests for per-project vector shards and fan-out search."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+DIM = 4
+
+
+class _AxisModel:
+    def encode(self, texts, **_kwargs):
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _open(tmp_path: Path, **config) -> VectorIndexer:
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="axis", **config)
+    indexer.embedding_model = _AxisModel()
+    indexer._claim_index_role()
+    indexer._init_mapping_database()
+    indexer._init_vector_index()
+    if indexer._shards_enabled():
+        indexer._load_shard_manifest()
+    return indexer
+
+
+def _store(indexer: VectorIndexer, entries) -> None:
+    batch, vectors = [], []
+    for entry_id, project, score in entries:
+        batch.append({
+            "entry_id": entry_id,
+            "project_slug": project,
+            "text_content": entry_id,
+            "agent_name": "Agent",
+            "timestamp_utc": "2026-01-01 00:00:00 UTC",
+            "metadata_json": json.dumps({"content_type": "log"}),
+            "content_type": "log",
+            "embedding_model": "axis",
+            "vector_dimension": DIM,
+        })
+        vectors.append([score, np.sqrt(1 - score ** 2), 0, 0])
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(batch, np.asarray(vectors, dtype="float32"))
+
+    asyncio.run(_run())
+
+
+ENTRIES = [
+    ("alpha-1", "alpha", 0.90),
+    ("alpha-2", "alpha", 0.60),
+    ("beta-1", "beta", 0.95),
+    ("beta-2", "beta", 0.50),
+    ("gamma-1", "gamma", 0.70),
+]
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    indexer = _open(tmp_path, shard_by="project")
+    _store(indexer, ENTRIES)
+    yield indexer
+    indexer._release_writer_lease()
+    indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestVectorShards:
+    def test_appends_are_routed_to_project_shards(self, sharded, tmp_path):
+        assert sharded.vector_index.ntotal == 0
+        assert {key: shard.vector_index.ntotal for key, shard in sharded._shards.items()} == {
+            "alpha": 2, "beta": 2, "gamma": 1,
+        }
+        assert (tmp_path / ".scribe_vectors" / "shards" / "tmp" / "alpha.faiss").exists()
+
+        manifest = json.loads((tmp_path / ".scribe_vectors" / "tmp.shards.json").read_text())
+        assert manifest["shards"]["beta"]["total_entries"] == 2
+        assert sharded._shards["beta"].index_metadata.scope == "project:beta"
+
+        row = sharded._db_conn.execute(
+            "SELECT shard_key, vector_rowid FROM vector_entries WHERE entry_id = 'beta-2'"
+        ).fetchone()
+        assert (row["shard_key"], row["vector_rowid"]) == ("beta", 1)
+        assert sharded.get_index_status()["total_entries"] == 5
+
+    def test_single_project_search_touches_only_its_shard(self, sharded):
+        assert sharded._target_shards({"project_slug": "alpha"}) == [sharded._shards["alpha"]]
+        results = sharded.search_similar("q", k=5, filters={"project_slug": "alpha"})
+        assert [r["entry_id"] for r in results] == ["alpha-1", "alpha-2"]
+        assert {r["shard"] for r in results} == {"alpha"}
+
+    def test_cross_project_search_merges_by_score(self, sharded):
+        results = sharded.search_similar("q", k=3)
+        assert [r["entry_id"] for r in results] == ["beta-1", "alpha-1", "gamma-1"]
+        assert results[0]["similarity_score"] == pytest.approx(0.95, abs=1e-5)
+
+        subset = sharded.search_similar("q", k=10, filters={"project_slugs": ["alpha", "gamma"]})
+        assert [r["entry_id"] for r in subset] == ["alpha-1", "gamma-1", "alpha-2"]
+
+    def test_per_shard_rebuild_leaves_other_shards(self, sharded):
+        result = sharded.rebuild_index(project_slug="alpha")
+        assert result["old_entries_count"] == 2
+        assert sharded._shards["alpha"].vector_index.ntotal == 0
+        assert sharded._shards["beta"].vector_index.ntotal == 2
+        remaining = {
+            row[0] for row in sharded._db_conn.execute("SELECT entry_id FROM vector_entries").fetchall()
+        }
+        assert remaining == {"beta-1", "beta-2", "gamma-1"}
+
+    def test_reader_discovers_shards_from_manifest(self, sharded, tmp_path):
+        reader = _open(tmp_path, shard_by="project")
+        try:
+            assert reader._index_role == "reader"
+            assert set(reader._shards) == {"alpha", "beta", "gamma"}
+            assert all(shard._index_mmapped for shard in reader._shards.values())
+            results = reader.search_similar("q", k=1, filters={"project_slug": "gamma"})
+            assert [r["entry_id"] for r in results] == ["gamma-1"]
+        finally:
+            reader._db_conn.close()
+
+    def test_repo_wide_entries_stay_searchable_after_enabling_shards(self, tmp_path):
+        legacy = _open(tmp_path)
+        _store(legacy, [("old-1", "alpha", 0.80)])
+        legacy._release_writer_lease()
+        legacy._db_conn.close()
+
+        indexer = _open(tmp_path, shard_by="project")
+        try:
+            _store(indexer, [("new-1", "alpha", 0.85)])
+            results = indexer.search_similar("q", k=5, filters={"project_slug": "alpha"})
+            assert [r["entry_id"] for r in results] == ["new-1", "old-1"]
+            assert [r["shard"] for r in results] == ["alpha", None]
+        finally:
+            indexer._release_writer_lease()
+            indexer._db_conn.close()
@@ -0,0 +1,153 @@
+"""Tests for the single-writer / memory-mapped reader index sharing."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+# These tests use a fake model, so they need only FAISS and NumPy
+try:
+    import faiss
+    import numpy as np
+    VECTOR_DEPS_AVAILABLE = True
+except ImportError:
+    VECTOR_DEPS_AVAILABLE = False
+    faiss = None
+    np = None
+
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+DIM = 4
+
+
+class _AxisModel:
+    def encode(self, texts, **_kwargs):
+        out = np.zeros((len(texts), DIM), dtype="float32")
+        out[:, 0] = 1.0
+        return out
+
+
+def _open(tmp_path: Path, **config) -> VectorIndexer:
+    """Open an indexer the way initialize() does, minus the background loop."""
+    indexer = VectorIndexer()
+    indexer.initialized = True
+    indexer.enabled = True
+    indexer.repo_root = tmp_path
+    indexer.repo_slug = "tmp"
+    indexer.vector_config = VectorConfig(dimension=DIM, model="axis", **config)
+    indexer.embedding_model = _AxisModel()
+    indexer._claim_index_role()
+    indexer._init_vector_index()
+    indexer._init_mapping_database()
+    return indexer
+
+
+def _store(indexer: VectorIndexer, count: int, prefix: str) -> None:
+    vectors = np.eye(DIM, dtype="float32")[np.arange(count) % DIM]
+    batch = [
+        {
+            "entry_id": f"{prefix}-{i}",
+            "project_slug": "proj",
+            "text_content": f"{prefix} {i}",
+            "agent_name": "Agent",
+            "timestamp_utc": "2026-01-01 00:00:00 UTC",
+            "metadata_json": json.dumps({"content_type": "log"}),
+            "embedding_model": "axis",
+            "vector_dimension": DIM,
+        }
+        for i in range(count)
+    ]
+
+    async def _run():
+        indexer.queue_lock = asyncio.Lock()
+        await indexer._store_embeddings_batch(batch, vectors)
+
+    asyncio.run(_run())
+
+
+def _close(*indexers: VectorIndexer) -> None:
+    for indexer in indexers:
+        indexer._release_writer_lease()
+        indexer._db_conn.close()
+
+
+@pytest.mark.skipif(not VECTOR_DEPS_AVAILABLE, reason="Vector dependencies not available")
+class TestSharedVectorIndex:
+    def test_second_process_maps_index_read_only(self, tmp_path):
+        writer = _open(tmp_path)
+        _store(writer, 3, "first")
+        reader = _open(tmp_path)
+        try:
+            assert writer._index_role == "writer"
+            assert reader._index_role == "reader"
+            assert reader._index_mmapped
+            # The codes must live in the mapped file, not in a heap copy
+            assert not faiss.downcast_index(reader.vector_index).codes.is_owned
+            assert faiss.downcast_index(writer.vector_index).codes.is_owned
+            assert reader.vector_index.ntotal == 3
+            assert reader._index_generation == writer._index_generation
+        finally:
+            _close(writer, reader)
+
+    def test_reader_remaps_after_new_generation(self, tmp_path):
+        writer = _open(tmp_path)
+        _store(writer, 3, "first")
+        reader = _open(tmp_path)
+        reader._lease_checked_at = float("inf")  # keep it a reader while the writer lives
+        try:
+            _store(writer, 2, "second")
+            results = reader.search_similar("q", k=10)
+            assert reader.vector_index.ntotal == 5
+            assert reader._remap_count == 1
+            assert {r["entry_id"] for r in results} >= {"second-0", "first-0"}
+            assert reader._sharing_status()["generation"] == writer._index_generation
+        finally:
+            _close(writer, reader)
+
+    def test_reader_spools_appends_for_writer(self, tmp_path):
+        writer = _open(tmp_path)
+        reader = _open(tmp_path)
+        reader._lease_checked_at = float("inf")
+        try:
+            reader.post_append({"entry_id": "spooled-1", "project_name": "proj", "message": "hello"})
+            assert reader._sharing_status()["spooled_entries"] == 1
+
+            async def _drain():
+                writer.embedding_queue = asyncio.Queue(maxsize=8)
+                drained = await writer._drain_spool()
+                return drained, writer.embedding_queue.get_nowait()
+
+            drained, task = asyncio.run(_drain())
+            assert drained == 1
+            assert task["entry_id"] == "spooled-1"
+            assert writer._sharing_status()["spooled_entries"] == 0
+        finally:
+            _close(writer, reader)
+
+    def test_reader_promotes_when_writer_exits(self, tmp_path):
+        writer = _open(tmp_path)
+        _store(writer, 2, "first")
+        reader = _open(tmp_path)
+        try:
+            assert reader._index_role == "reader"
+            writer._release_writer_lease()
+            reader._lease_checked_at = 0.0
+            assert reader._maybe_promote_to_writer()
+            assert reader._index_role == "writer"
+            assert not reader._index_mmapped
+            _store(reader, 1, "after")
+            assert reader.vector_index.ntotal == 3
+        finally:
+            _close(writer, reader)
+
+    def test_reader_never_creates_index_files(self, tmp_path):
+        reader = _open(tmp_path, index_access="reader")
+        try:
+            assert reader._index_role == "reader"
+            assert reader.vector_index.ntotal == 0
+            assert not (tmp_path / ".scribe_vectors" / "tmp.faiss").exists()
+            assert not (tmp_path / ".scribe_vectors" / "tmp.meta.json").exists()
+        finally:
+            _close(reader)
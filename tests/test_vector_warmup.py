@@ -0,0 +1,118 @@
+"""Tests for deferred model loading and background warm-up of the vector plugin."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scribe_mcp.config.repo_config import RepoConfig
+from scribe_mcp.config.vector_config import VectorConfig
+from scribe_mcp.plugins.vector_indexer import VectorIndexer
+
+
+def _repo_config(tmp_path: Path) -> RepoConfig:
+    config = MagicMock(spec=RepoConfig)
+    config.repo_root = tmp_path
+    config.repo_slug = "tmp"
+    return config
+
+
+@pytest.fixture
+def lazy_indexer(tmp_path: Path):
+    """Initialize a lazily loading indexer whose model load is gated by an event."""
+    release = threading.Event()
+    processed = []
+
+    def _fake_load(self):
+        assert release.wait(timeout=5)
+        self.embedding_model = object()
+        self.vector_index = object()
+
+    async def _fake_process(self, batch):
+        processed.extend(item["entry_id"] for item in batch)
+
+    vector_config = VectorConfig(lazy_load=True, warmup_timeout_seconds=0.05, batch_size=1)
+    with patch("scribe_mcp.plugins.vector_indexer.FAISS_AVAILABLE", True), \
+            patch("scribe_mcp.plugins.vector_indexer.load_vector_config", return_value=vector_config), \
+            patch.object(VectorIndexer, "_load_model_and_index", _fake_load), \
+            patch.object(VectorIndexer, "_process_embedding_batch", _fake_process):
+        indexer = VectorIndexer()
+        indexer.initialize(_repo_config(tmp_path))
+        yield indexer, release, processed
+        release.set()
+        indexer.cleanup()
+
+
+def test_initialize_defers_model_loading(lazy_indexer):
+    indexer, _release, _processed = lazy_indexer
+    assert indexer.initialized
+    assert indexer.embedding_model is None
+    assert indexer.vector_index is None
+    assert not indexer.is_ready()
+    assert indexer.get_index_status()["warmup"]["state"] == "cold"
+
+
+def test_appends_queue_while_cold_and_drain_after_warmup(lazy_indexer):
+    indexer, release, processed = lazy_indexer
+    indexer.post_append({"entry_id": "e1", "project_slug": "proj", "message": "hello"})
+
+    # The append started warm-up but is held in the queue until the model is loaded.
+    time.sleep(0.2)
+    assert indexer.get_index_status()["warmup"]["state"] == "loading"
+    assert processed == []
+    assert not indexer.wait_until_ready(timeout=0.01)
+
+    release.set()
+    assert indexer.wait_until_ready(timeout=5)
+    deadline = time.monotonic() + 5
+    while not processed and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert processed == ["e1"]
+    assert indexer.is_ready()
+    assert indexer._warmup_status()["state"] == "ready"
+
+
+def test_search_returns_empty_until_warm(lazy_indexer):
+    indexer, _release, _processed = lazy_indexer
+    started = time.monotonic()
+    assert indexer.search_similar("query") == []
+    assert time.monotonic() - started < 2
+    # Searching kicks off the warm-up on its own.
+    assert indexer.get_index_status()["warmup"]["state"] == "loading"
+
+
+def test_failed_warmup_disables_indexer(tmp_path):
+    def _broken_load(self):
+        raise RuntimeError("model download failed")
+
+    vector_config = VectorConfig(lazy_load=True)
+    with patch("scribe_mcp.plugins.vector_indexer.FAISS_AVAILABLE", True), \
+            patch("scribe_mcp.plugins.vector_indexer.load_vector_config", return_value=vector_config), \
+            patch.object(VectorIndexer, "_load_model_and_index", _broken_load):
+        indexer = VectorIndexer()
+        indexer.initialize(_repo_config(tmp_path))
+        try:
+            assert not indexer.wait_until_ready(timeout=5)
+            warmup = indexer._warmup_status()
+            assert warmup["state"] == "failed"
+            assert "model download failed" in warmup["error"]
+            assert not indexer.enabled
+        finally:
+            indexer.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_vector_search_reports_warming_up():
+    from scribe_mcp.tools import vector_search as vector_search_module
+
+    indexer = MagicMock()
+    indexer.initialized = True
+    indexer.wait_until_ready.return_value = False
+    with patch.object(vector_search_module, "_get_vector_indexer", return_value=indexer):
+        result = await vector_search_module.vector_search(query="anything")
+
+    assert result["ok"] is False
+    assert result["warming_up"] is True
+    indexer.search_similar.assert_not_called()
@@ -17,7 +17,7 @@ from scribe_mcp.utils.error_handler import ErrorHandler, HealingErrorHandler
 
 
 # Valid enumerated values for query parameters
-VALID_MESSAGE_MODES = {"substring", "regex", "exact"}
+VALID_MESSAGE_MODES = {"substring", "regex", "exact", "hybrid"}
 VALID_SEARCH_SCOPES = {"project", "global", "all_projects", "research", "bugs", "all"}
 VALID_DOCUMENT_TYPES = {"progress", "research", "architecture", "bugs", "global"}
 
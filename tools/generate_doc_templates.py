@@ -12,7 +12,7 @@ from scribe_mcp import server as server_module
 from scribe_mcp.config.settings import settings
 from scribe_mcp.tools.project_utils import slugify_project_name
 from scribe_mcp.server import app
-from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 from scribe_mcp.templates import TEMPLATE_FILENAMES, load_templates, substitution_context
 from scribe_mcp.shared.base_logging_tool import LoggingToolMixin
 from scribe_mcp.shared.logging_utils import ProjectResolutionError
@@ -103,7 +103,7 @@ async def generate_doc_templates(
 
     engine_error: Exception | None = None
     try:
-        engine = Jinja2TemplateEngine(
+        engine = get_template_engine(
             project_root=settings.project_root,
             project_name=project_name,
             security_mode="sandbox",
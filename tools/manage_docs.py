@@ -7,6 +7,7 @@ import hashlib
 import json
 import re
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Optional, Callable, Awaitable, List
 
@@ -14,6 +15,7 @@ from scribe_mcp import server as server_module
 from scribe_mcp.server import app
 from scribe_mcp.config.repo_config import RepoDiscovery
 from scribe_mcp.config.vector_config import load_vector_config
+from scribe_mcp.doc_management.doc_cache import document_cache
 from scribe_mcp.doc_management.manager import (
     apply_doc_change,
     DocumentOperationError,
@@ -22,6 +24,7 @@ from scribe_mcp.doc_management.manager import (
 )
 from scribe_mcp.tools.append_entry import append_entry
 from scribe_mcp.utils.frontmatter import parse_frontmatter
+from scribe_mcp.utils.search import hybrid_search
 from scribe_mcp.utils.time import format_utc
 from scribe_mcp.shared.logging_utils import (
     LoggingContext,
@@ -109,6 +112,7 @@ def _heal_manage_docs_parameters(
         "generate_toc",
         "status_update",
         "batch",
+        "multi_edit",
         "list_sections",
         "list_checklist_items",
         "create_doc",
@@ -378,8 +382,13 @@ def _chunk_text_for_vector(text: str, max_chars: int = 4000) -> List[str]:
     return chunks
 
 
-def _generate_doc_entry_id(path: Path, chunk_index: int, content_hash: str) -> str:
-    seed = f"{path}|{chunk_index}|{content_hash}"
+def _generate_doc_entry_id(path: Path, content_hash: str, occurrence: int) -> str:
+    """Stable id for the `occurrence`-th chunk with `content_hash` in a document.
+
+    Ids do not depend on the chunk's ordinal, so a chunk embedded at a new
+    position never reuses the id of a kept chunk that moved.
+    """
+    seed = f"{path}|chunk|{content_hash}|{occurrence}"
     return hashlib.sha256(seed.encode("utf-8")).hexdigest()[:32]
 
 
@@ -537,6 +546,8 @@ def _normalize_doc_search_mode(value: Optional[str]) -> str:
         return "fuzzy"
     if normalized in {"semantic", "vector"}:
         return "semantic"
+    if normalized in {"hybrid", "rrf"}:
+        return "hybrid"
     return normalized
 
 
@@ -576,35 +587,18 @@ def _search_doc_lines(
     return results
 
 
-async def _index_doc_for_vector(
+def _doc_vector_entries(
     *,
-    project: Dict[str, Any],
+    vector_indexer: Any,
+    project_name: str,
     doc: str,
     change_path: Path,
+    raw_text: str,
     after_hash: str,
     agent_id: str,
     metadata: Optional[Dict[str, Any]],
-    wait_for_queue: bool = False,
-    queue_timeout: Optional[float] = None,
-) -> None:
-    repo_root = project.get("root")
-    if isinstance(repo_root, str):
-        repo_root = Path(repo_root)
-    if not _vector_indexing_enabled(repo_root):
-        return
-
-    vector_indexer = _get_vector_indexer()
-    if not vector_indexer:
-        return
-
-    if _should_skip_doc_index(doc, change_path):
-        return
-
-    try:
-        raw_text = await asyncio.to_thread(change_path.read_text, encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return
-
+) -> List[Dict[str, Any]]:
+    """Parse and chunk a document, returning entries for the chunks that need embedding."""
     frontmatter = {}
     body = raw_text
     try:
@@ -617,21 +611,36 @@ async def _index_doc_for_vector(
 
     content = body.strip()
     if not content:
-        return
+        return []
 
     title = frontmatter.get("title")
     doc_type = frontmatter.get("doc_type")
     chunks = _chunk_text_for_vector(content)
     if not chunks:
-        return
+        return []
 
     timestamp = format_utc()
-    project_name = project.get("name", "")
     chunk_total = len(chunks)
-
-    for idx, chunk in enumerate(chunks):
-        content_hash = _hash_text(chunk)
-        entry_id = _generate_doc_entry_id(change_path, idx, content_hash)
+    chunk_hashes = [_hash_text(chunk) for chunk in chunks]
+    seen_hashes: Dict[str, int] = {}
+    occurrences = []
+    for content_hash in chunk_hashes:
+        occurrences.append(seen_hashes.get(content_hash, 0))
+        seen_hashes[content_hash] = occurrences[-1] + 1
+
+    # Only chunks the manifest has not seen are embedded; removed ones are tombstoned.
+    pending = range(chunk_total)
+    planner = getattr(vector_indexer, "plan_doc_chunks", None)
+    if callable(planner):
+        plan = planner(str(change_path), chunk_hashes, after_hash)
+        if isinstance(plan, dict) and isinstance(plan.get("embed"), list):
+            pending = plan["embed"]
+
+    entries: List[Dict[str, Any]] = []
+    for idx in pending:
+        chunk = chunks[idx]
+        content_hash = chunk_hashes[idx]
+        entry_id = _generate_doc_entry_id(change_path, content_hash, occurrences[idx])
         message = f"{title}\n\n{chunk}" if title else chunk
         doc_meta = {
             "content_type": "doc",
@@ -641,19 +650,66 @@ async def _index_doc_for_vector(
             "file_path": str(change_path),
             "chunk_index": idx,
             "chunk_total": chunk_total,
+            "chunk_hash": content_hash,
             "sha_after": after_hash,
         }
         if metadata:
             doc_meta["doc_metadata"] = metadata
 
-        entry_data = {
+        entries.append({
             "entry_id": entry_id,
             "project_name": project_name,
             "message": message,
             "agent": agent_id,
             "timestamp": timestamp,
             "meta": doc_meta,
-        }
+        })
+    return entries
+
+
+async def _index_doc_for_vector(
+    *,
+    project: Dict[str, Any],
+    doc: str,
+    change_path: Path,
+    after_hash: str,
+    agent_id: str,
+    metadata: Optional[Dict[str, Any]],
+    wait_for_queue: bool = False,
+    queue_timeout: Optional[float] = None,
+) -> None:
+    repo_root = project.get("root")
+    if isinstance(repo_root, str):
+        repo_root = Path(repo_root)
+    if not _vector_indexing_enabled(repo_root):
+        return
+
+    vector_indexer = _get_vector_indexer()
+    if not vector_indexer:
+        return
+
+    if _should_skip_doc_index(doc, change_path):
+        return
+
+    try:
+        raw_text = await asyncio.to_thread(change_path.read_text, encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return
+
+    entries = await asyncio.to_thread(
+        partial(
+            _doc_vector_entries,
+            vector_indexer=vector_indexer,
+            project_name=project.get("name", ""),
+            doc=doc,
+            change_path=change_path,
+            raw_text=raw_text,
+            after_hash=after_hash,
+            agent_id=agent_id,
+            metadata=metadata,
+        )
+    )
+    for entry_data in entries:
         if wait_for_queue and hasattr(vector_indexer, "enqueue_entry"):
             vector_indexer.enqueue_entry(entry_data, wait=True, timeout=queue_timeout)
         else:
@@ -782,9 +838,9 @@ async def _render_special_template(
 ) -> str:
     """Render a special document template using the shared Jinja2 engine."""
     try:
-        from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+        from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 
-        engine = Jinja2TemplateEngine(
+        engine = get_template_engine(
             project_root=Path(project.get("root", "")),
             project_name=project.get("name", ""),
             security_mode="sandbox",
@@ -957,6 +1013,7 @@ async def manage_docs(
                     "list_sections",
                     "list_checklist_items",
                     "batch",
+                    "multi_edit",
                     "create_doc",
                     "validate_crosslinks",
                     "search",
@@ -1050,7 +1107,7 @@ async def manage_docs(
             return _MANAGE_DOCS_HELPER.apply_context_payload(response, context)
 
         search_mode = _normalize_doc_search_mode(search_meta.get("search_mode"))
-        if search_mode == "semantic":
+        if search_mode in {"semantic", "hybrid"}:
             content_type_raw = search_meta.get("content_type")
             content_type = str(content_type_raw).strip().lower() if content_type_raw is not None else "all"
             repo_root = project.get("root")
@@ -1078,6 +1135,14 @@ async def manage_docs(
             if not vector_indexer:
                 response = {"ok": False, "error": "Vector indexer plugin not available"}
                 return _MANAGE_DOCS_HELPER.apply_context_payload(response, context)
+            if not await asyncio.to_thread(vector_indexer.wait_until_ready):
+                response = {
+                    "ok": False,
+                    "error": "Vector index is still warming up",
+                    "warming_up": True,
+                    "suggestion": "Retry shortly; the embedding model loads in the background after startup",
+                }
+                return _MANAGE_DOCS_HELPER.apply_context_payload(response, context)
 
             filters: Dict[str, Any] = {}
             project_slugs = search_meta.get("project_slugs")
@@ -1101,6 +1166,8 @@ async def manage_docs(
                 }
 
             min_similarity = search_meta.get("min_similarity")
+            # Hybrid results are ranked by fused score; lexical-only hits have no similarity
+            rank_key = "rrf_score" if search_mode == "hybrid" else "similarity_score"
 
             def _apply_similarity_threshold(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                 if min_similarity is None:
@@ -1109,7 +1176,18 @@ async def manage_docs(
                     min_val = float(min_similarity)
                 except (TypeError, ValueError):
                     return items
-                return [r for r in items if r.get("similarity_score", 0) >= min_val]
+                return [
+                    r for r in items
+                    if r.get("similarity_score", 0 if search_mode == "semantic" else min_val) >= min_val
+                ]
+
+            async def _search(k: int, search_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+                if search_mode == "hybrid":
+                    return await hybrid_search(
+                        vector_indexer, query, k, search_filters,
+                        candidates=_parse_int(search_meta.get("candidates")),
+                    )
+                return await asyncio.to_thread(vector_indexer.search_similar, query, k, search_filters)
 
             limits = _resolve_semantic_limits(search_meta=search_meta, repo_root=repo_root)
             if content_type in {"doc", "log"}:
@@ -1120,9 +1198,9 @@ async def manage_docs(
                 else:
                     single_k = limits["log_k_override"] if limits["log_k_override"] is not None else limits["default_log_k"]
                 filters["content_type"] = content_type
-                results = vector_indexer.search_similar(query, single_k, filters)
+                results = await _search(single_k, filters)
                 results = _apply_similarity_threshold(results)
-                results.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
+                results.sort(key=lambda x: x.get(rank_key, 0), reverse=True)
                 for item in results:
                     item["content_type"] = content_type
                 limits_payload = {
@@ -1135,7 +1213,7 @@ async def manage_docs(
                 response = {
                     "ok": True,
                     "action": "search",
-                    "search_mode": "semantic",
+                    "search_mode": search_mode,
                     "query": query,
                     "results_count": len(results),
                     "results": results,
@@ -1148,14 +1226,14 @@ async def manage_docs(
             base_filters = filters.copy()
             doc_filters = {**base_filters, "content_type": "doc"}
             log_filters = {**base_filters, "content_type": "log"}
-            doc_results = _apply_similarity_threshold(
-                vector_indexer.search_similar(query, limits["doc_k"], doc_filters)
-            )
-            log_results = _apply_similarity_threshold(
-                vector_indexer.search_similar(query, limits["log_k"], log_filters)
+            raw_doc_results, raw_log_results = await asyncio.gather(
+                _search(limits["doc_k"], doc_filters),
+                _search(limits["log_k"], log_filters),
             )
-            doc_results.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
-            log_results.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
+            doc_results = _apply_similarity_threshold(raw_doc_results)
+            log_results = _apply_similarity_threshold(raw_log_results)
+            doc_results.sort(key=lambda x: x.get(rank_key, 0), reverse=True)
+            log_results.sort(key=lambda x: x.get(rank_key, 0), reverse=True)
             for item in doc_results:
                 item["content_type"] = "doc"
             for item in log_results:
@@ -1164,7 +1242,7 @@ async def manage_docs(
             response = {
                 "ok": True,
                 "action": "search",
-                "search_mode": "semantic",
+                "search_mode": search_mode,
                 "query": query,
                 "results_count": len(combined),
                 "results": combined,
@@ -1197,14 +1275,13 @@ async def manage_docs(
         results: List[Dict[str, Any]] = []
         for doc_key, path in targets:
             try:
-                raw_text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+                cached_doc = await asyncio.to_thread(document_cache.load, path)
             except (OSError, UnicodeDecodeError):
                 continue
             try:
-                parsed = parse_frontmatter(raw_text)
-                text = parsed.body
+                text = cached_doc.parsed.body
             except ValueError:
-                text = raw_text
+                text = cached_doc.text
             matches = _search_doc_lines(
                 text=text,
                 query=query,
@@ -1241,6 +1318,7 @@ async def manage_docs(
         "append",
         "status_update",
         "apply_patch",
+        "multi_edit",
         "replace_range",
         "replace_text",
         "normalize_headers",
@@ -1364,6 +1442,10 @@ async def manage_docs(
                 "sha_after": change.after_hash,
             }
         )
+        if action == "multi_edit":
+            # One log line for the whole transaction; the edit payloads stay out of it
+            log_meta.pop("edits", None)
+            log_meta["edits_applied"] = (change.extra.get("multi_edit") or {}).get("edits_applied", 0)
         try:
             await append_entry(
                 message=f"Doc update [{doc}] {section or 'full'} via {action}",
@@ -1582,6 +1664,7 @@ Examples:
             "list_sections",
             "list_checklist_items",
             "batch",
+            "multi_edit",
             "create_research_doc",
             "create_bug_report",
             "create_review_report",
@@ -1678,7 +1761,11 @@ Examples:
         print("❌ Error: --start-line and --end-line are required for replace_range")
         return 1
 
-    if args.action not in ["apply_patch", "replace_range", "create_doc", "validate_crosslinks", "normalize_headers", "generate_toc"] and not args.content and not args.template:
+    if args.action == "multi_edit" and not args.metadata:
+        print("❌ Error: --metadata with an 'edits' list is required for multi_edit")
+        return 1
+
+    if args.action not in ["apply_patch", "multi_edit", "replace_range", "create_doc", "validate_crosslinks", "normalize_headers", "generate_toc"] and not args.content and not args.template:
         print("❌ Error: Either --content or --template must be provided")
         return 1
 
@@ -2533,10 +2620,10 @@ async def _render_review_report_template(
 ) -> str:
     """Render review report using Jinja2 template."""
     try:
-        from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+        from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 
         # Initialize template engine
-        engine = Jinja2TemplateEngine(
+        engine = get_template_engine(
             project_root=Path(project.get("root", "")),
             project_name=project.get("name", ""),
             security_mode="sandbox"
@@ -2598,10 +2685,10 @@ async def _render_agent_report_card_template(
 ) -> str:
     """Render agent report card using Jinja2 template."""
     try:
-        from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+        from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 
         # Initialize template engine
-        engine = Jinja2TemplateEngine(
+        engine = get_template_engine(
             project_root=Path(project.get("root", "")),
             project_name=project.get("name", ""),
             security_mode="sandbox"
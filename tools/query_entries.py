@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
 import re
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -16,7 +22,9 @@ from scribe_mcp.tools.constants import STATUS_EMOJI
 from scribe_mcp.tools.project_utils import load_project_config
 from scribe_mcp.utils.config_manager import ConfigManager, validate_enum_value, validate_range, BulletproofFallbackManager
 from scribe_mcp.utils.logs import parse_log_line, read_all_lines
-from scribe_mcp.utils.search import message_matches
+from scribe_mcp.utils.repo_files import RepoFileIndex, get_repo_file_index
+from scribe_mcp.utils.bm25 import CorpusStats, bm25f_scores, entry_field_tokens, tokenize
+from scribe_mcp.utils.search import hybrid_search, message_matches
 from scribe_mcp.utils.time import coerce_range_boundary
 from scribe_mcp.utils.response import create_pagination_info, default_formatter
 from scribe_mcp.utils.tokens import token_estimator
@@ -34,10 +42,17 @@ from scribe_mcp.shared.logging_utils import (
 )
 from scribe_mcp.shared.base_logging_tool import LoggingToolMixin
 
-VALID_MESSAGE_MODES = {"substring", "regex", "exact"}
+VALID_MESSAGE_MODES = {"substring", "regex", "exact", "hybrid"}
 VALID_SEARCH_SCOPES = {"project", "global", "all_projects", "research", "bugs", "all", "sentinel"}
 VALID_DOCUMENT_TYPES = {"progress", "research", "architecture", "bugs", "global", "sentinel_log"}
 
+# Projects searched at once by cross-project queries
+CROSS_PROJECT_CONCURRENCY = 8
+
+# Parsed research/architecture/bug documents, keyed by (path, heading prefix)
+DOC_SECTION_CACHE_MAX = 256
+_DOC_SECTION_CACHE: "OrderedDict[Tuple[Path, str], _ParsedDocument]" = OrderedDict()
+
 # Global configuration manager for parameter handling
 _CONFIG_MANAGER = ConfigManager("query_entries")
 
@@ -638,9 +653,17 @@ async def _execute_search_with_fallbacks(
 
                     log_path = next((p for p in candidates if p.exists()), candidates[0])
 
+            # Hybrid mode retrieves from the vector index instead of scanning the log
+            hybrid_entries = None
+            if search_params.get("message_mode") == "hybrid" and search_params.get("message"):
+                hybrid_entries = await _hybrid_log_entries(search_params, resolved_project)
+                if hybrid_entries is None:
+                    validation_warnings.append("Hybrid search unavailable (vector index not ready); using substring matching")
+                    search_params["message_mode"] = "substring"
+
             # Read log lines with error handling
             try:
-                lines = await read_all_lines(log_path)
+                lines = hybrid_entries if hybrid_entries is not None else await read_all_lines(log_path)
             except Exception as read_error:
                 # Try to heal file reading error
                 healed_read = _EXCEPTION_HEALER.heal_document_operation_error(
@@ -660,13 +683,13 @@ async def _execute_search_with_fallbacks(
             filtered_entries = []
             for line in lines:
                 try:
-                    parsed = parse_log_line(line)
+                    parsed = line if hybrid_entries is not None else parse_log_line(line)
                     if not parsed:
                         continue
 
-                    # Apply message filter
+                    # Apply message filter (hybrid hits were already retrieved by relevance)
                     message = parsed.get("message", "")
-                    if search_params.get("message"):
+                    if search_params.get("message") and hybrid_entries is None:
                         if not message_matches(
                             message,
                             search_params["message"],
@@ -745,13 +768,6 @@ async def _execute_search_with_fallbacks(
                                 # Skip entries with invalid timestamps
                                 continue
 
-                    # Apply relevance threshold (simplified implementation)
-                    if search_params.get("relevance_threshold", 0.0) > 0.0:
-                        # Simple relevance calculation based on message length and content
-                        relevance_score = len(message) / 1000.0  # Normalize to 0-1 range
-                        if relevance_score < search_params["relevance_threshold"]:
-                            continue
-
                     # Entry matches all filters
                     filtered_entries.append(parsed)
 
@@ -765,6 +781,16 @@ async def _execute_search_with_fallbacks(
                         # Skip problematic entry but continue processing
                         continue
 
+            # Apply relevance threshold, scoring all candidates in one pass
+            if search_params.get("relevance_threshold", 0.0) > 0.0:
+                stats = await _project_term_stats(resolved_project, search_params.get("message"))
+                _calculate_bm25_relevance(filtered_entries, search_params.get("message"), stats)
+                filtered_entries = _apply_relevance_scoring(
+                    filtered_entries,
+                    search_params.get("message"),
+                    search_params["relevance_threshold"],
+                )
+
             # Apply priority sorting if requested
             if search_params.get("priority_sort", False):
                 from scribe_mcp.shared.log_enums import get_priority_sort_key
@@ -1034,7 +1060,7 @@ async def query_entries(
         start: Start timestamp filter
         end: End timestamp filter
         message: Message text filter
-        message_mode: How to match message (substring, regex, exact)
+        message_mode: How to match message (substring, regex, exact, hybrid)
         case_sensitive: Case sensitive message matching
         emoji: Filter by emoji(s)
         status: Filter by status(es) (mapped to emojis)
@@ -1266,6 +1292,67 @@ async def query_entries(
                 "pagination": {}
             }
 
+def _get_vector_indexer():
+    try:
+        from scribe_mcp.plugins.registry import get_plugin_registry
+        registry = get_plugin_registry()
+        for plugin in registry.plugins.values():
+            if getattr(plugin, "name", None) == "vector_indexer" and getattr(plugin, "initialized", False):
+                return plugin
+    except Exception:
+        return None
+    return None
+
+
+async def _hybrid_log_entries(
+    search_params: Dict[str, Any],
+    resolved_project: Optional[str],
+) -> Optional[List[Dict[str, Any]]]:
+    """Keyword + semantic hits for the project's indexed log entries, fused by rank.
+
+    Fetches enough hits to fill the requested page; the remaining filters are
+    applied by the caller. Returns None when the vector index is unavailable.
+    """
+    vector_indexer = _get_vector_indexer()
+    if not vector_indexer or not hasattr(vector_indexer, "search_lexical"):
+        return None
+    if not await asyncio.to_thread(vector_indexer.wait_until_ready):
+        return None
+
+    filters: Dict[str, Any] = {"content_type": "log"}
+    if resolved_project and resolved_project != "default":
+        filters["project_slug"] = str(resolved_project).lower().replace(" ", "-")
+    agents = search_params.get("agents") or []
+    if len(agents) == 1:
+        filters["agent_name"] = agents[0]
+    if search_params.get("start") or search_params.get("end"):
+        filters["time_range"] = {"start": search_params.get("start"), "end": search_params.get("end")}
+
+    page = max(1, int(search_params.get("page") or 1))
+    page_size = max(1, int(search_params.get("page_size") or 50))
+    hits = await hybrid_search(vector_indexer, search_params["message"], page * page_size, filters)
+
+    entries: List[Dict[str, Any]] = []
+    for hit in hits:
+        try:
+            meta = json.loads(hit.get("metadata_json") or "{}")
+        except (TypeError, json.JSONDecodeError):
+            meta = {}
+        entries.append({
+            "id": hit.get("entry_id"),
+            "ts": hit.get("timestamp_utc", ""),
+            "emoji": meta.get("emoji", "") if isinstance(meta, dict) else "",
+            "agent": hit.get("agent_name", ""),
+            "project": hit.get("project_slug", ""),
+            "message": hit.get("text_content", ""),
+            "meta": {str(k): str(v) for k, v in meta.items()} if isinstance(meta, dict) else {},
+            "rrf_score": hit.get("rrf_score", 0.0),
+            "source_ranks": hit.get("source_ranks", {}),
+            "source_scores": hit.get("source_scores", {}),
+        })
+    return entries
+
+
 async def _resolve_cross_project_projects(
     search_scope: str,
     document_types: Optional[List[str]],
@@ -1451,29 +1538,43 @@ async def _handle_cross_project_search(
     helper: LoggingToolMixin,
     context: Optional[LoggingContext],
 ) -> Dict[str, Any]:
-    """Handle cross-project search with result aggregation and pagination."""
-    all_results: List[Dict[str, Any]] = []
-    project_context: Dict[str, Dict[str, Any]] = {}
+    """Handle cross-project search with result aggregation and pagination.
 
-    # Search each project and collect results
-    for project in projects:
-        project_results = await _search_single_project(
-            project=project,
-            document_types=document_types,
-            start_bound=start_bound,
-            end_bound=end_bound,
-            message=message,
-            message_mode=message_mode,
-            case_sensitive=case_sensitive,
-            agents=agents,
-            emojis=emojis,
-            meta_filters=meta_filters,
-            verify_code_references=verify_code_references,
-            relevance_threshold=relevance_threshold,
-        )
+    Projects are searched concurrently (at most CROSS_PROJECT_CONCURRENCY at
+    a time). Each keeps only its best ``page * page_size`` results, and the
+    requested page is taken from a k-way merge of those sorted lists.
+    """
+    semaphore = asyncio.Semaphore(CROSS_PROJECT_CONCURRENCY)
+    top_n = max(1, page) * max(1, page_size)
+
+    async def _search_project(project: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
+        async with semaphore:
+            project_results = await _search_single_project(
+                project=project,
+                document_types=document_types,
+                start_bound=start_bound,
+                end_bound=end_bound,
+                message=message,
+                message_mode=message_mode,
+                case_sensitive=case_sensitive,
+                agents=agents,
+                emojis=emojis,
+                meta_filters=meta_filters,
+                verify_code_references=verify_code_references,
+                relevance_threshold=relevance_threshold,
+            )
+
+        # Apply relevance threshold before ranking
+        if relevance_threshold > 0.0:
+            project_results = _apply_relevance_scoring(
+                project_results,
+                message,
+                relevance_threshold
+            )
+        top_results = heapq.nlargest(top_n, project_results, key=_cross_project_rank)
 
-        # Add project context to each result
-        for result in project_results:
+        # Add project context to the results that can still make the page
+        for result in top_results:
             result["project_name"] = project["name"]
             result["project_root"] = project.get("root", "")
             if include_metadata:
@@ -1481,28 +1582,16 @@ async def _handle_cross_project_search(
                     "docs_dir": project.get("docs_dir", ""),
                     "progress_log": project.get("progress_log", ""),
                 }
+        return len(project_results), top_results
 
-        all_results.extend(project_results)
-        project_context[project["name"]] = project
+    searched = await asyncio.gather(*(_search_project(project) for project in projects))
+    project_context = {project["name"]: project for project in projects}
 
-    # Apply relevance scoring and sorting
-    if relevance_threshold > 0.0:
-        all_results = _apply_relevance_scoring(
-            all_results,
-            message,
-            relevance_threshold
-        )
-
-    # Sort by relevance score (descending) then timestamp (most recent first)
-    all_results.sort(key=lambda x: (
-        x.get("relevance_score", 0.0),
-        x.get("timestamp", "")
-    ), reverse=True)
-
-    # Apply pagination
-    total_count = len(all_results)
+    # Merge per-project rankings: relevance score (descending) then timestamp (most recent first)
+    total_count = sum(count for count, _ in searched)
     start_idx, end_idx = _PAGINATION_CALCULATOR.calculate_pagination_indices(page, page_size, total_count)
-    paginated_results = all_results[start_idx:end_idx]
+    merged = heapq.merge(*(top for _, top in searched), key=_cross_project_rank, reverse=True)
+    paginated_results = list(islice(merged, start_idx, end_idx))
 
     # Create pagination info
     pagination_info = create_pagination_info(page, page_size, total_count)
@@ -1555,6 +1644,10 @@ async def _handle_cross_project_search(
     return response
 
 
+def _cross_project_rank(result: Dict[str, Any]) -> Tuple[float, str]:
+    return (result.get("relevance_score", 0.0), result.get("timestamp", ""))
+
+
 async def _search_single_project(
     project: Dict[str, Any],
     document_types: Optional[List[str]],
@@ -1619,10 +1712,11 @@ async def _search_single_project(
 
     # Apply code reference verification if requested
     if verify_code_references:
-        results = _verify_code_references_in_results(results)
+        repo_root = project.get("root")
+        results = _verify_code_references_in_results(results, Path(repo_root) if repo_root else None)
 
-    # Add basic relevance scoring
-    results = _calculate_basic_relevance(results, message)
+    # Add BM25 relevance scoring
+    results = _calculate_bm25_relevance(results, message, await _project_term_stats(project.get("name"), message))
 
     return results
 
@@ -1639,26 +1733,23 @@ async def _search_research_documents(
     meta_filters: Optional[Dict[str, str]],
 ) -> List[Dict[str, Any]]:
     """Search research documents in the research/ subdirectory."""
-    results: List[Dict[str, Any]] = []
     research_dir = docs_dir / "research"
 
     if not research_dir.exists():
-        return results
+        return []
 
-    # Find all research markdown files
-    for research_file in research_dir.glob("RESEARCH_*.md"):
-        try:
-            content = await read_all_lines(research_file)
-            # Parse research documents and extract searchable content
-            research_results = _parse_research_document(
-                research_file, content, start_bound, end_bound,
-                message, message_mode, case_sensitive, agents, emojis, meta_filters
-            )
-            results.extend(research_results)
-        except Exception as e:
-            # Log error but continue with other files
-            continue
+    # Cold documents are read and parsed concurrently
+    research_files = sorted(research_dir.glob("RESEARCH_*.md"))
+    documents = await asyncio.gather(*(_load_document_sections(path, "# ") for path in research_files))
 
+    results: List[Dict[str, Any]] = []
+    for research_file, document in zip(research_files, documents):
+        if document is None:
+            continue
+        results.extend(_search_document_sections(
+            research_file, document, "research", start_bound, end_bound,
+            message, message_mode, case_sensitive, agents, emojis, meta_filters
+        ))
     return results
 
 
@@ -1674,23 +1765,14 @@ async def _search_architecture_documents(
     meta_filters: Optional[Dict[str, str]],
 ) -> List[Dict[str, Any]]:
     """Search architecture guide documents."""
-    results: List[Dict[str, Any]] = []
     arch_file = docs_dir / "ARCHITECTURE_GUIDE.md"
-
-    if not arch_file.exists():
-        return results
-
-    try:
-        content = await read_all_lines(arch_file)
-        arch_results = _parse_markdown_document(
-            arch_file, content, "architecture", start_bound, end_bound,
-            message, message_mode, case_sensitive, agents, emojis, meta_filters
-        )
-        results.extend(arch_results)
-    except Exception:
-        pass
-
-    return results
+    document = await _load_document_sections(arch_file, "#")
+    if document is None:
+        return []
+    return _search_document_sections(
+        arch_file, document, "architecture", start_bound, end_bound,
+        message, message_mode, case_sensitive, agents, emojis, meta_filters
+    )
 
 
 async def _search_bug_documents(
@@ -1705,77 +1787,101 @@ async def _search_bug_documents(
     meta_filters: Optional[Dict[str, str]],
 ) -> List[Dict[str, Any]]:
     """Search bug report documents."""
-    results: List[Dict[str, Any]] = []
     bug_file = docs_dir / "BUG_LOG.md"
+    document = await _load_document_sections(bug_file, "#")
+    if document is None:
+        return []
+    return _search_document_sections(
+        bug_file, document, "bugs", start_bound, end_bound,
+        message, message_mode, case_sensitive, agents, emojis, meta_filters
+    )
 
-    if not bug_file.exists():
-        return results
 
-    try:
-        content = await read_all_lines(bug_file)
-        bug_results = _parse_markdown_document(
-            bug_file, content, "bugs", start_bound, end_bound,
-            message, message_mode, case_sensitive, agents, emojis, meta_filters
-        )
-        results.extend(bug_results)
-    except Exception:
-        pass
+@dataclass
+class _DocumentSection:
+    heading: str
+    lines: List[str]
+    folded: str  # Lower-cased heading and content, for case-insensitive matching
 
-    return results
 
+@dataclass
+class _ParsedDocument:
+    stamp: Tuple[int, int]  # (mtime_ns, size) the sections were parsed from
+    sections: List[_DocumentSection]
+    token_index: Dict[str, List[int]]  # term -> indexes of sections containing it
 
-def _parse_research_document(
-    file_path: Path,
-    content: List[str],
-    start_bound: Optional[datetime],
-    end_bound: Optional[datetime],
-    message: Optional[str],
-    message_mode: str,
-    case_sensitive: bool,
-    agents: Optional[List[str]],
-    emojis: Optional[List[str]],
-    meta_filters: Optional[Dict[str, str]],
-) -> List[Dict[str, Any]]:
-    """Parse research document into searchable entries."""
-    results: List[Dict[str, Any]] = []
 
-    # Extract sections from research document
+def _parse_document_sections(content: List[str], heading_prefix: str) -> List[_DocumentSection]:
+    """Split a markdown document into non-empty sections under headings.
+
+    Research documents split on top-level ``# `` headings only; other
+    documents split on any ``#`` heading.
+    """
+    sections: List[_DocumentSection] = []
     current_section = ""
-    section_content = []
+    section_content: List[str] = []
 
-    for line in content:
-        if line.startswith("# "):
-            # New top-level section
-            if current_section and section_content:
-                result = _create_document_entry(
-                    file_path, current_section, section_content,
-                    "research", start_bound, end_bound, message,
-                    message_mode, case_sensitive, agents, emojis, meta_filters
-                )
-                if result:
-                    results.append(result)
+    def _flush() -> None:
+        if current_section and section_content:
+            full_text = current_section + "\n" + "\n".join(section_content)
+            sections.append(_DocumentSection(current_section, section_content, full_text.lower()))
 
+    for line in content:
+        if line.startswith(heading_prefix):
+            _flush()
             current_section = line.strip()
             section_content = []
         elif line.strip():
             section_content.append(line)
+    _flush()
+    return sections
 
-    # Don't forget the last section
-    if current_section and section_content:
-        result = _create_document_entry(
-            file_path, current_section, section_content,
-            "research", start_bound, end_bound, message,
-            message_mode, case_sensitive, agents, emojis, meta_filters
-        )
-        if result:
-            results.append(result)
 
-    return results
+async def _load_document_sections(path: Path, heading_prefix: str) -> Optional[_ParsedDocument]:
+    """Parsed sections of a document, re-read only when its mtime or size changes."""
+    try:
+        stat = await asyncio.to_thread(path.stat)
+    except OSError:
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (path, heading_prefix)
+    cached = _DOC_SECTION_CACHE.get(key)
+    if cached is not None and cached.stamp == stamp:
+        _DOC_SECTION_CACHE.move_to_end(key)
+        return cached
 
+    try:
+        content = await read_all_lines(path)
+    except Exception:
+        return None
+    sections = _parse_document_sections(content, heading_prefix)
+    token_index: Dict[str, List[int]] = {}
+    for idx, section in enumerate(sections):
+        for term in set(tokenize(section.folded)):
+            token_index.setdefault(term, []).append(idx)
+    document = _ParsedDocument(stamp, sections, token_index)
+    _DOC_SECTION_CACHE[key] = document
+    while len(_DOC_SECTION_CACHE) > DOC_SECTION_CACHE_MAX:
+        _DOC_SECTION_CACHE.popitem(last=False)
+    return document
+
+
+def _whole_word_terms(needle: str) -> List[str]:
+    """Terms of a substring query that can only match whole words in the text.
+
+    A term at either end of the needle may match part of a longer word, so
+    only terms with a non-word character (or another term) on both sides count.
+    """
+    terms: List[str] = []
+    for match in re.finditer(r"\w+", needle):
+        if match.start() > 0 and match.end() < len(needle):
+            terms.append(match.group().lower())
+    return terms
 
-def _parse_markdown_document(
+
+def _search_document_sections(
     file_path: Path,
-    content: List[str],
+    document: _ParsedDocument,
     doc_type: str,
     start_bound: Optional[datetime],
     end_bound: Optional[datetime],
@@ -1786,40 +1892,32 @@ def _parse_markdown_document(
     emojis: Optional[List[str]],
     meta_filters: Optional[Dict[str, str]],
 ) -> List[Dict[str, Any]]:
-    """Parse generic markdown document into searchable entries."""
-    results: List[Dict[str, Any]] = []
+    """Match cached sections, narrowing candidates with the token index first."""
+    candidates = range(len(document.sections))
+    folded_needle = None
+    if message and message_mode == "substring":
+        terms = _whole_word_terms(message)
+        if terms:
+            postings = [set(document.token_index.get(term, ())) for term in terms]
+            candidates = sorted(set.intersection(*postings))
+        if not case_sensitive:
+            folded_needle = message.lower()
 
-    # Split document into sections based on headers
-    current_section = ""
-    section_content = []
-
-    for line in content:
-        if line.startswith("#"):
-            # New section
-            if current_section and section_content:
-                result = _create_document_entry(
-                    file_path, current_section, section_content,
-                    doc_type, start_bound, end_bound, message,
-                    message_mode, case_sensitive, agents, emojis, meta_filters
-                )
-                if result:
-                    results.append(result)
-
-            current_section = line.strip()
-            section_content = []
-        elif line.strip():
-            section_content.append(line)
-
-    # Process final section
-    if current_section and section_content:
+    results: List[Dict[str, Any]] = []
+    for idx in candidates:
+        section = document.sections[idx]
+        section_message = message
+        if folded_needle is not None:
+            if folded_needle not in section.folded:
+                continue
+            section_message = None  # Already matched against the folded text
         result = _create_document_entry(
-            file_path, current_section, section_content,
-            doc_type, start_bound, end_bound, message,
+            file_path, section.heading, section.lines,
+            doc_type, start_bound, end_bound, section_message,
             message_mode, case_sensitive, agents, emojis, meta_filters
         )
         if result:
             results.append(result)
-
     return results
 
 
@@ -1875,25 +1973,36 @@ def _create_document_entry(
     }
 
 
-def _verify_code_references_in_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# File references checked by verify_code_references
+CODE_REFERENCE_PATTERN = re.compile(r"[\w\-/\.]+\.(?:py|js|ts|md|json|yaml|yml|sql|sh|bash|zsh)\b", re.IGNORECASE)
+
+# Directories, relative to the repo root, where a bare file reference may live
+CODE_REFERENCE_LOCATIONS = ("", "scribe_mcp", "scribe_mcp/tools", "scribe_mcp/storage", "docs", "tests")
+
+
+def _verify_code_references_in_results(
+    results: List[Dict[str, Any]],
+    repo_root: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
     """Verify code file references exist and add warnings for broken ones."""
+    index = get_repo_file_index(repo_root or Path.cwd())
+    index.refresh()
+    known: Dict[str, bool] = {}
     updated_results = []
 
     for result in results:
         # Look for file path patterns in the message or content
         text_content = result.get("message", "") + " " + result.get("content", "")
-
-        # Find potential file references
-        import re
-        file_pattern = r'[\w\-/\.]+\.(py|js|ts|md|json|yaml|yml|sql|sh|bash|zsh)$'
-        potential_files = re.findall(file_pattern, text_content, re.IGNORECASE)
+        potential_files = dict.fromkeys(CODE_REFERENCE_PATTERN.findall(text_content))
 
         verified_result = result.copy()
         broken_refs = []
 
         for file_ref in potential_files:
-            # Try to find the file in the current project
-            if not _verify_file_exists(file_ref):
+            exists = known.get(file_ref)
+            if exists is None:
+                exists = known[file_ref] = _verify_file_exists(file_ref, index)
+            if not exists:
                 broken_refs.append(file_ref)
 
         if broken_refs:
@@ -1913,67 +2022,56 @@ def _verify_code_references_in_results(results: List[Dict[str, Any]]) -> List[Di
     return updated_results
 
 
-def _verify_file_exists(file_ref: str) -> bool:
-    """Check if a referenced file exists in the current codebase."""
-    from pathlib import Path
+def _verify_file_exists(file_ref: str, index: RepoFileIndex) -> bool:
+    """Check if a referenced file exists in the current codebase.
 
-    # Try different common locations
-    potential_paths = [
-        Path(file_ref),  # Relative to current
-        Path("scribe_mcp") / file_ref,  # In scribe_mcp
-        Path("scribe_mcp/tools") / file_ref,  # In tools
-        Path("scribe_mcp/storage") / file_ref,  # In storage
-        Path("docs") / file_ref,  # In docs
-        Path("tests") / file_ref,  # In tests
-    ]
+    The index leaves out ignored files, so a miss falls back to a filesystem
+    probe; callers memoise the answer per reference.
+    """
+    if Path(file_ref).is_absolute():
+        return index.contains(file_ref) or Path(file_ref).is_file()
+    candidates = [f"{location}/{file_ref}" if location else file_ref for location in CODE_REFERENCE_LOCATIONS]
+    return any(index.contains(candidate) for candidate in candidates) or any(
+        (index.root / candidate).is_file() for candidate in candidates
+    )
 
-    for path in potential_paths:
-        if path.exists():
-            return True
 
-    return False
+async def _project_term_stats(project_name: Optional[str], query_message: Optional[str]) -> Optional[CorpusStats]:
+    """Stored BM25 statistics for a project, or None to derive them from the candidates."""
+    terms = tokenize(query_message)
+    backend = getattr(server_module, "storage_backend", None)
+    if not terms or not project_name or backend is None:
+        return None
+    try:
+        return await backend.fetch_term_stats(project_name, terms)
+    except Exception:
+        return None
 
 
-def _calculate_basic_relevance(results: List[Dict[str, Any]], query_message: Optional[str]) -> List[Dict[str, Any]]:
-    """Calculate basic relevance scores for search results."""
-    if not query_message:
+def _calculate_bm25_relevance(
+    results: List[Dict[str, Any]],
+    query_message: Optional[str],
+    stats: Optional[CorpusStats] = None,
+) -> List[Dict[str, Any]]:
+    """Score results with normalised BM25F (0.0-1.0) over message/content and metadata."""
+    if not tokenize(query_message):
         # Default relevance for non-message queries
         for result in results:
             result["relevance_score"] = 0.5
         return results
 
-    query_terms = query_message.lower().split()
-
-    for result in results:
-        score = 0.0
-        text = (result.get("message", "") + " " + result.get("content", "")).lower()
-
-        # Score based on term frequency
-        for term in query_terms:
-            if term in text:
-                score += 1.0
-
-        # Bonus for exact phrase matches
-        if query_message.lower() in text:
-            score += 2.0
-
-        # Bonus for recent entries (higher score for newer entries)
-        timestamp = result.get("timestamp", "")
-        if timestamp:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(timestamp.replace(" UTC", ""))
-                days_ago = (datetime.now(dt.tzinfo) - dt).days
-                if isinstance(days_ago, int):
-                    if days_ago <= 7:
-                        score += 0.5
-                    elif days_ago <= 30:
-                        score += 0.25
-            except:
-                pass
-
-        result["relevance_score"] = min(score / len(query_terms) if query_terms else 0.5, 1.0)
-
+    documents = [
+        entry_field_tokens(
+            result.get("message", ""),
+            result.get("meta") if isinstance(result.get("meta"), dict) else None,
+            result.get("content", ""),
+        )
+        for result in results
+    ]
+    if stats is None:
+        stats = CorpusStats.from_documents(documents, tokenize(query_message))
+    for result, score in zip(results, bm25f_scores(documents, query_message, stats)):
+        result["relevance_score"] = score
     return results
 
 
@@ -26,7 +26,7 @@ from scribe_mcp.shared.logging_utils import (
     resolve_log_definition as shared_resolve_log_definition,
     resolve_logging_context,
 )
-from scribe_mcp.template_engine import Jinja2TemplateEngine, TemplateEngineError
+from scribe_mcp.template_engine import TemplateEngineError, get_template_engine
 from scribe_mcp.templates import (
     TEMPLATE_FILENAMES,
     create_rotation_context,
@@ -1477,7 +1477,7 @@ async def _build_template_content(
     template_engine = None
     try:
         project_root = Path(project.get("root", "")) if project.get("root") else Path.cwd()
-        template_engine = Jinja2TemplateEngine(
+        template_engine = get_template_engine(
             project_root=project_root,
             project_name=project["name"],
             security_mode="sandbox",
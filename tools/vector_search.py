@@ -6,6 +6,7 @@ Tools are only registered when the VectorIndexer plugin is active.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from scribe_mcp import server as server_module
@@ -137,8 +138,17 @@ async def vector_search(
             if time_end:
                 filters["time_range"]["end"] = time_end
 
-        # Perform search
-        results = vector_indexer.search_similar(query, k, filters)
+        # The model loads in the background after startup; wait for it without blocking the loop
+        if not await asyncio.to_thread(vector_indexer.wait_until_ready):
+            return {
+                "ok": False,
+                "error": "Vector index is still warming up",
+                "warming_up": True,
+                "suggestion": "Retry shortly; the embedding model loads in the background after startup"
+            }
+
+        # Perform search off the event loop (query encoding runs on the indexer's executor)
+        results = await asyncio.to_thread(vector_indexer.search_similar, query, k, filters)
 
         # Apply similarity threshold if specified
         if min_similarity is not None:
@@ -274,7 +284,7 @@ def _check_index_files(vector_indexer) -> Dict[str, bool]:
     }
 
 
-def rebuild_vector_index() -> Dict[str, Any]:
+def rebuild_vector_index(project_slug: Optional[str] = None) -> Dict[str, Any]:
     """
     Rebuild the entire vector index from scratch.
 
@@ -284,6 +294,9 @@ def rebuild_vector_index() -> Dict[str, Any]:
     3. Re-initialize empty index structures
     4. Optionally, re-index existing log entries (if implemented)
 
+    Args:
+        project_slug: With project sharding enabled, rebuild only this project's shard
+
     Returns:
         Dict with success status, backup information, and new index status
     """
@@ -305,7 +318,10 @@ def rebuild_vector_index() -> Dict[str, Any]:
             backup_info = _backup_existing_index(vector_indexer)
 
         # Perform the rebuild
-        rebuild_result = vector_indexer.rebuild_index()
+        if project_slug:
+            rebuild_result = vector_indexer.rebuild_index(project_slug=project_slug.lower().replace(" ", "-"))
+        else:
+            rebuild_result = vector_indexer.rebuild_index()
 
         # Get new status
         new_status = vector_indexer.get_index_status()
@@ -0,0 +1,121 @@
+"""BM25F relevance scoring for log entries and documents.
+
+Entries have two fields: the message (plus document content) and the
+metadata values. Corpus statistics (document count, field lengths and
+per-term document frequencies) come from the storage backend, which keeps
+them up to date as entries are inserted, or are derived from the candidates
+when no backend statistics are available.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25F field boosts; metadata matches count for half a message match
+FIELD_WEIGHTS: Dict[str, float] = {"message": 1.0, "meta": 0.5}
+
+# Term-frequency saturation and length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-cased word tokens."""
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+def entry_field_tokens(
+    message: Optional[str],
+    meta: Optional[Mapping[str, Any]] = None,
+    content: Optional[str] = None,
+) -> Dict[str, List[str]]:
+    """Split an entry into the tokenised BM25F fields."""
+    message_tokens = tokenize(message)
+    if content:
+        message_tokens.extend(tokenize(content))
+    meta_tokens: List[str] = []
+    for value in (meta or {}).values():
+        meta_tokens.extend(tokenize(str(value)))
+    return {"message": message_tokens, "meta": meta_tokens}
+
+
+@dataclass
+class CorpusStats:
+    """Document count, total field lengths and document frequencies of query terms."""
+
+    doc_count: int = 0
+    total_lengths: Dict[str, int] = field(default_factory=dict)
+    doc_freq: Dict[str, int] = field(default_factory=dict)
+
+    def average_length(self, name: str) -> float:
+        if not self.doc_count:
+            return 0.0
+        return self.total_lengths.get(name, 0) / self.doc_count
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Mapping[str, Sequence[str]]], terms: Iterable[str]) -> "CorpusStats":
+        """Statistics over the given documents, for when no stored statistics exist."""
+        wanted = set(terms)
+        stats = cls(total_lengths={name: 0 for name in FIELD_WEIGHTS}, doc_freq={term: 0 for term in wanted})
+        for fields in documents:
+            stats.doc_count += 1
+            seen = set()
+            for name in FIELD_WEIGHTS:
+                tokens = fields.get(name, ())
+                stats.total_lengths[name] += len(tokens)
+                seen.update(token for token in tokens if token in wanted)
+            for term in seen:
+                stats.doc_freq[term] += 1
+        return stats
+
+
+def bm25f_scores(
+    documents: Sequence[Mapping[str, Sequence[str]]],
+    query: Optional[str],
+    stats: CorpusStats,
+) -> List[float]:
+    """Normalised BM25F scores (0.0-1.0) for each document, in one pass.
+
+    Each term's saturation is scaled by ``k1 + 1``, so one message
+    occurrence at average field length earns the term's full IDF. The sum
+    is divided by the total query IDF and clipped to 1.0: an entry holding
+    every query term once scores about 1.0, which keeps scores comparable
+    across queries and usable as an absolute threshold.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms or not documents:
+        return [0.0] * len(documents)
+
+    doc_count = max(stats.doc_count, 1)
+    idf = {}
+    for term in terms:
+        df = min(stats.doc_freq.get(term, 0), doc_count)
+        idf[term] = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+    max_score = sum(idf.values())
+    averages = {name: stats.average_length(name) or 1.0 for name in FIELD_WEIGHTS}
+    term_index = {term: idx for idx, term in enumerate(terms)}
+
+    scores: List[float] = []
+    for fields in documents:
+        weighted_tf = [0.0] * len(terms)
+        for name, weight in FIELD_WEIGHTS.items():
+            tokens = fields.get(name, ())
+            if not tokens:
+                continue
+            norm = weight / (1.0 - BM25_B + BM25_B * len(tokens) / averages[name])
+            for token in tokens:
+                idx = term_index.get(token)
+                if idx is not None:
+                    weighted_tf[idx] += norm
+        score = sum(
+            idf[term] * tf * (BM25_K1 + 1.0) / (BM25_K1 + tf)
+            for term, tf in zip(terms, weighted_tf)
+            if tf
+        )
+        scores.append(round(min(score / max_score, 1.0), 4) if max_score else 0.0)
+    return scores
@@ -11,6 +11,7 @@ import tempfile
 import time
 from collections import deque
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Union
@@ -280,16 +281,38 @@ class WriteAheadLog:
             os.fsync(f.fileno())
 
 
+@dataclass(frozen=True)
+class WriteReceipt:
+    """What atomic_write put on disk, so callers can verify it without re-reading."""
+
+    path: Path
+    size: int
+    sha256: str  # Hash of the bytes written
+    text_sha256: str  # Hash of the content as UTF-8; differs from sha256 only with CRLF translation
+    inode: int
+    device: int
+
+    def matches_disk(self) -> bool:
+        """True when the file at `path` is still the one written (same inode, device and size)."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_dev, stat.st_size) == (self.inode, self.device, self.size)
+
+
 def atomic_write(
     file_path: Union[str, Path],
     content: str,
     mode: str = 'w',
     repo_root: Optional[Path] = None,
-) -> None:
+) -> WriteReceipt:
     """
     Atomically write content to a file.
 
-    Write to temporary file first, then atomic rename.
+    Write to temporary file first, then atomic rename. The encoded bytes are
+    hashed before writing, and the written size is checked against fstat
+    after fsync.
 
     Note: This function only supports overwrite mode ('w'). For atomic append
     operations, use WriteAheadLog which provides proper WAL-based appending.
@@ -299,6 +322,9 @@ def atomic_write(
         content: Content to write
         mode: Write mode - must be 'w' (overwrite) for atomic operations
 
+    Returns:
+        WriteReceipt describing the written file
+
     Raises:
         AtomicFileError: If atomic operation fails
         ValueError: If mode is not 'w' (only overwrite is atomic)
@@ -320,11 +346,22 @@ def atomic_write(
     # Create temporary file in same directory
     temp_path = file_path.with_suffix(file_path.suffix + '.tmp')
 
+    # Encode once, applying the newline translation text mode would apply
+    data = content.encode('utf-8')
+    text_sha256 = hashlib.sha256(data).hexdigest()
+    sha256 = text_sha256
+    if os.linesep != '\n':
+        data = content.replace('\n', os.linesep).encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+
     try:
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(temp_path, 'wb') as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
+            written = os.fstat(f.fileno())
+        if written.st_size != len(data):
+            raise AtomicFileError(f"short write: {written.st_size} of {len(data)} bytes")
 
         # Atomic rename with retry for Windows compatibility
         for attempt in range(5):
@@ -349,13 +386,22 @@ def atomic_write(
             temp_path.unlink()
         raise AtomicFileError(f"Atomic write failed: {e}")
 
+    return WriteReceipt(
+        path=file_path,
+        size=written.st_size,
+        sha256=sha256,
+        text_sha256=text_sha256,
+        inode=written.st_ino,
+        device=written.st_dev,
+    )
+
 
 async def async_atomic_write(
     file_path: Union[str, Path],
     content: str,
     mode: str = 'w',
     repo_root: Optional[Path] = None,
-) -> None:
+) -> WriteReceipt:
     """
     Asynchronously atomically write content to a file.
 
@@ -370,11 +416,14 @@ async def async_atomic_write(
         content: Content to write
         mode: Write mode - must be 'w' (overwrite) for atomic operations
 
+    Returns:
+        WriteReceipt describing the written file
+
     Raises:
         AtomicFileError: If atomic operation fails
         ValueError: If mode is not 'w' (only overwrite is atomic)
     """
-    await asyncio.to_thread(atomic_write, file_path, content, mode, repo_root)
+    return await asyncio.to_thread(atomic_write, file_path, content, mode, repo_root)
 
 
 def preflight_backup(
@@ -0,0 +1,220 @@
+"""In-memory index of the files present in a repository.
+
+The index is built with a single ``os.scandir`` walk and kept current by
+re-listing only the directories whose mtime changed (adding or removing an
+entry bumps the parent directory's mtime), or by change events from the
+document file watcher. Presence checks are then set lookups instead of a
+filesystem probe per path.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# Directories that are never indexed, whatever the ignore file says
+DEFAULT_IGNORED_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".scribe_vectors",
+})
+
+# Minimum seconds between directory mtime sweeps
+REFRESH_INTERVAL = 2.0
+
+
+def _load_ignore_patterns(root: Path) -> List[Tuple[str, bool, bool]]:
+    """Patterns from the root ``.gitignore`` as (pattern, anchored, dir_only).
+
+    Only the common subset is understood: negations are skipped, a leading
+    ``/`` anchors a pattern to the root and a trailing ``/`` limits it to
+    directories; everything else is matched against the entry name.
+    """
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(("#", "!")):
+            continue
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = line.startswith("/") or "/" in line
+        patterns.append((line.lstrip("/"), anchored, dir_only))
+    return patterns
+
+
+class RepoFileIndex:
+    """Set of repo-relative POSIX paths for the files under ``root``."""
+
+    def __init__(self, root: Union[str, Path], *, refresh_interval: float = REFRESH_INTERVAL):
+        self.root = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self._files: Set[str] = set()
+        # Per listed directory ("" for the root): st_mtime_ns, files and subdirectories
+        self._dir_mtimes: Dict[str, int] = {}
+        self._dir_files: Dict[str, Set[str]] = {}
+        self._subdirs: Dict[str, Set[str]] = {}
+        self._patterns = _load_ignore_patterns(self.root)
+        self._lock = threading.Lock()
+        self._built = False
+        self._checked_at = 0.0
+
+    def _ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if is_dir and name in DEFAULT_IGNORED_DIRS:
+            return True
+        for pattern, anchored, dir_only in self._patterns:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch(rel_path if anchored else name, pattern):
+                return True
+        return False
+
+    def _scan_dir(self, rel_dir: str) -> None:
+        """List one directory, recursing into subdirectories not yet indexed."""
+        path = self.root / rel_dir if rel_dir else self.root
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        try:
+            self._dir_mtimes[rel_dir] = path.stat().st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            self._drop_dir(rel_dir)
+            return
+
+        present_files = set()
+        present_dirs = set()
+        for entry in entries:
+            rel_path = prefix + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                # Symlinked files count as present; symlinked directories are not followed
+                if not is_dir and not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if self._ignored(rel_path, entry.name, is_dir):
+                continue
+            if is_dir:
+                present_dirs.add(rel_path)
+                if rel_path not in self._dir_mtimes:
+                    self._scan_dir(rel_path)
+            else:
+                present_files.add(rel_path)
+
+        # Forget children that disappeared since the last listing
+        self._files.difference_update(self._dir_files.get(rel_dir, set()) - present_files)
+        for child in self._subdirs.get(rel_dir, set()) - present_dirs:
+            self._drop_dir(child)
+        self._files.update(present_files)
+        self._dir_files[rel_dir] = present_files
+        self._subdirs[rel_dir] = present_dirs
+
+    def _drop_dir(self, rel_dir: str) -> None:
+        self._dir_mtimes.pop(rel_dir, None)
+        self._files.difference_update(self._dir_files.pop(rel_dir, set()))
+        for child in self._subdirs.pop(rel_dir, set()):
+            self._drop_dir(child)
+
+    def refresh(self, *, force: bool = False) -> None:
+        """Build the index, or re-list directories whose mtime changed."""
+        with self._lock:
+            now = time.monotonic()
+            if self._built and not force and now - self._checked_at < self.refresh_interval:
+                return
+            self._checked_at = now
+            if not self._built:
+                self._scan_dir("")
+                self._built = True
+                return
+            for rel_dir, mtime_ns in list(self._dir_mtimes.items()):
+                if rel_dir not in self._dir_mtimes:
+                    continue  # Dropped while rescanning its parent
+                path = self.root / rel_dir if rel_dir else self.root
+                try:
+                    changed = path.stat().st_mtime_ns != mtime_ns
+                except OSError:
+                    changed = True
+                if changed:
+                    self._scan_dir(rel_dir)
+
+    def _relative(self, path: Union[str, Path]) -> Optional[str]:
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.resolve().relative_to(self.root)
+            except ValueError:
+                return None
+        rel_path = os.path.normpath(candidate.as_posix()).replace(os.sep, "/")
+        if rel_path.startswith("../") or rel_path == "..":
+            return None
+        return rel_path
+
+    def contains(self, path: Union[str, Path]) -> bool:
+        """True when ``path`` (repo-relative or absolute) is an indexed file."""
+        self.refresh()
+        rel_path = self._relative(path)
+        return rel_path is not None and rel_path in self._files
+
+    def note_change(
+        self,
+        path: Union[str, Path],
+        event_type: str,
+        dest_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Apply a file watcher event without waiting for the next mtime sweep."""
+        if event_type == "moved":
+            self.note_change(path, "deleted")
+            if dest_path:
+                self.note_change(dest_path, "created")
+            return
+        rel_path = self._relative(path)
+        if rel_path is None or not self._built:
+            return
+        with self._lock:
+            parent = rel_path.rsplit("/", 1)[0] if "/" in rel_path else ""
+            if event_type == "deleted":
+                self._files.discard(rel_path)
+                self._dir_files.get(parent, set()).discard(rel_path)
+            elif event_type in {"created", "modified"}:
+                name = rel_path.rsplit("/", 1)[-1]
+                parts = rel_path.split("/")
+                ignored = any(
+                    self._ignored("/".join(parts[: i + 1]), parts[i], True) for i in range(len(parts) - 1)
+                )
+                if not ignored and not self._ignored(rel_path, name, False):
+                    self._files.add(rel_path)
+                    if parent in self._dir_files:
+                        self._dir_files[parent].add(rel_path)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+_INDEXES: Dict[Path, RepoFileIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_repo_file_index(root: Union[str, Path]) -> RepoFileIndex:
+    """Shared index for a repository root."""
+    key = Path(root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = RepoFileIndex(key)
+        return index
@@ -1,9 +1,10 @@
-"""Shared helpers for log searching and filtering."""
+"""Shared helpers for searching, filtering and fusing ranked results."""
 
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 def message_matches(
@@ -38,3 +39,88 @@ def message_matches(
     candidate = needle if case_sensitive else needle.lower()
     target = haystack if case_sensitive else haystack.lower()
     return candidate in target
+
+
+# Reciprocal rank fusion constant; 60 is the value from the original RRF paper
+RRF_K = 60
+
+# Per-source candidate cap for hybrid retrieval
+HYBRID_MAX_CANDIDATES = 200
+
+# Score field each hybrid source reports
+HYBRID_SOURCE_SCORES = {"semantic": "similarity_score", "lexical": "lexical_score"}
+
+
+def reciprocal_rank_fusion(
+    ranked: Dict[str, List[Dict[str, Any]]],
+    *,
+    key: str = "entry_id",
+    k: int = RRF_K,
+    limit: Optional[int] = None,
+    score_fields: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Fuse ranked result lists, deduplicating on `key`.
+
+    Each item scores ``sum(1 / (k + rank))`` over the sources that returned
+    it. Fused items carry ``rrf_score`` plus per-source ``source_ranks`` and
+    ``source_scores`` (from the field named in `score_fields`).
+    """
+    score_fields = score_fields or {}
+    fused: Dict[Any, Dict[str, Any]] = {}
+    for source, items in ranked.items():
+        score_field = score_fields.get(source)
+        for rank, item in enumerate(items, start=1):
+            item_key = item.get(key)
+            if item_key is None:
+                continue
+            merged = fused.get(item_key)
+            if merged is None:
+                merged = fused[item_key] = {**item, "rrf_score": 0.0, "source_ranks": {}, "source_scores": {}}
+            elif source in merged["source_ranks"]:
+                continue
+            else:
+                for field, value in item.items():
+                    merged.setdefault(field, value)
+            merged["rrf_score"] += 1.0 / (k + rank)
+            merged["source_ranks"][source] = rank
+            if score_field and item.get(score_field) is not None:
+                merged["source_scores"][source] = item[score_field]
+
+    results = sorted(
+        fused.values(),
+        key=lambda item: (-item["rrf_score"], min(item["source_ranks"].values())),
+    )
+    for item in results:
+        item["rrf_score"] = round(item["rrf_score"], 6)
+    return results if limit is None else results[:limit]
+
+
+async def hybrid_search(
+    vector_indexer: Any,
+    query: str,
+    k: int,
+    filters: Optional[Dict[str, Any]] = None,
+    *,
+    candidates: Optional[int] = None,
+    rrf_k: int = RRF_K,
+) -> List[Dict[str, Any]]:
+    """Run lexical and semantic retrieval concurrently and fuse them with RRF.
+
+    Each source returns at most `candidates` hits (default ``max(2k, 20)``,
+    capped at HYBRID_MAX_CANDIDATES). A failing source contributes nothing
+    rather than failing the search.
+    """
+    if k <= 0:
+        return []
+    per_source = candidates if candidates is not None else max(2 * k, 20)
+    per_source = max(k, min(per_source, HYBRID_MAX_CANDIDATES))
+    semantic, lexical = await asyncio.gather(
+        asyncio.to_thread(vector_indexer.search_similar, query, per_source, filters),
+        asyncio.to_thread(vector_indexer.search_lexical, query, per_source, filters),
+        return_exceptions=True,
+    )
+    ranked = {
+        "semantic": semantic if isinstance(semantic, list) else [],
+        "lexical": lexical if isinstance(lexical, list) else [],
+    }
+    return reciprocal_rank_fusion(ranked, k=rrf_k, limit=k, score_fields=HYBRID_SOURCE_SCORES)